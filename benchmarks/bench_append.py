@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+Benchmarks adding a few corrections to a large ccc file
+
+Times the full rewrite, parsing the file with ``parse_ccc()`` , appending the
+new corrections and writing it all again with ``write_ccc()`` , against
+``append_collection()`` , which splices them in before the closing root tag.
+The first append scans the file to build its id index, later appends only
+look the new ids up in it.
+
+Usage:
+
+    python benchmarks/bench_append.py [corrections] [appended]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 100000
+APPENDED = 10
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_collection(count, start=0):
+    """Builds a collection of count corrections, ids counting from start"""
+    ids = ['sh{0:07d}'.format(i) for i in range(start, start + count)]
+    return cdl_convert.ColorCollection.from_arrays(
+        ids,
+        slope=[[1.0 + i % 7 * 0.01, 1.02, 0.98] for i in range(count)],
+        offset=[[0.001 * (i % 5), 0.0, -0.002] for i in range(count)],
+        power=[[1.0, 0.99, 1.01] for i in range(count)],
+        sat=[0.9 + i % 3 * 0.01 for i in range(count)],
+    )
+
+
+def rewrite(path, start, appended):
+    """Parses the whole file, adds the corrections and writes it again"""
+    col = cdl_convert.parse_ccc(path)
+    col.append_children(build_collection(appended, start).color_corrections)
+    col._file_out = path
+    cdl_convert.write_ccc(col)
+
+
+def append(path, start, appended):
+    """Splices the corrections into the file"""
+    cdl_convert.append_collection(path, build_collection(appended, start))
+
+
+def measure(label, func, *args):
+    """Prints the time func takes"""
+    start = time.time()
+    func(*args)
+    elapsed = time.time() - start
+    cdl_convert.reset_all()
+    print('{label:>16}: {elapsed:8.4f}s'.format(label=label, elapsed=elapsed))
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+    appended = int(sys.argv[2]) if len(sys.argv) > 2 else APPENDED
+
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'show.ccc')
+        col = build_collection(count)
+        col._file_out = path
+        cdl_convert.write_ccc(col)
+        del col
+        cdl_convert.reset_all()
+        print('{0:>16}: {1:8.1f} MB'.format(
+            'file', os.path.getsize(path) / 1e6
+        ))
+
+        measure('rewrite', rewrite, path, count, appended)
+        measure('first append', append, path, count + appended, appended)
+        measure('append', append, path, count + appended * 2, appended)
+    finally:
+        cdl_convert.reset_all()
+        shutil.rmtree(directory)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
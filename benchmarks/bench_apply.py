@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""
+Benchmarks applying a correction to image arrays with apply_cdl
+
+Applies a correction with every stage active to float32 HD and 4K frames,
+once making a new array for each frame and once writing into the same ``out``
+array, and reports megapixels per second. Applying the same correction one
+pixel at a time in Python, over a small crop, is timed for comparison. A 10
+bit frame of DPX 2K full aperture size is then corrected through the integer
+lookup table path, against converting it to float32 and applying that. The
+best of a few runs is reported.
+
+Usage:
+
+    python benchmarks/bench_apply.py
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+SIZES = [('HD', 1080, 1920), ('4K', 2160, 4096)]
+
+# Runs of each way of applying, the fastest of which is reported
+REPEATS = 5
+
+# Side of the square crop corrected one pixel at a time
+CROP = 64
+
+# Height, width and bit depth of the integer frame
+DPX = (1556, 2048, 10)
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def apply_pixels(image, cdl):
+    """Applies cdl one pixel at a time, as a plain Python loop would"""
+    slope = [float(i) for i in cdl.slope]
+    offset = [float(i) for i in cdl.offset]
+    power = [float(i) for i in cdl.power]
+    sat = float(cdl.sat)
+    out = numpy.empty(image.shape, image.dtype)
+    for row in range(image.shape[0]):
+        for column in range(image.shape[1]):
+            rgb = [
+                min(max(image[row, column, i] * slope[i] + offset[i], 0.0),
+                    1.0) ** power[i]
+                for i in range(3)
+            ]
+            luma = 0.2126 * rgb[0] + 0.7152 * rgb[1] + 0.0722 * rgb[2]
+            out[row, column] = [
+                min(max(luma + sat * (i - luma), 0.0), 1.0) for i in rgb
+            ]
+    return out
+
+
+def measure(label, func, image):
+    """Prints the megapixels per second of the fastest of a few runs"""
+    times = []
+    for _ in range(REPEATS):
+        start = time.time()
+        func(image)
+        times.append(time.time() - start)
+    rate = image.size / 3 / min(times) / 1e6
+    print('{label:>16}: {rate:10.2f} MP/s'.format(label=label, rate=rate))
+    return rate
+
+
+def main():
+    """Runs the benchmark"""
+    cdl = cdl_convert.ColorCorrection('bench')
+    cdl.slope = [1.2, 0.9, 1.05]
+    cdl.offset = [-0.02, 0.01, 0.03]
+    cdl.power = [0.9, 1.1, 1.25]
+    cdl.sat = 0.8
+
+    random = numpy.random.RandomState(0)
+    for label, height, width in SIZES:
+        image = random.random_sample((height, width, 3)).astype(numpy.float32)
+        out = numpy.empty_like(image)
+        measure(
+            '{0} new array'.format(label),
+            lambda frame: cdl_convert.apply_cdl(frame, cdl),
+            image
+        )
+        measure(
+            '{0} out='.format(label),
+            lambda frame: cdl_convert.apply_cdl(frame, cdl, out=out),
+            image
+        )
+
+    crop = random.random_sample((CROP, CROP, 3)).astype(numpy.float32)
+    per_pixel = measure('per pixel', lambda frame: apply_pixels(frame, cdl), crop)
+    vectorized = measure(
+        'vectorized',
+        lambda frame: cdl_convert.apply_cdl(frame, cdl),
+        crop
+    )
+    print('{0:>16}: {1:10.2f}x'.format('speedup', vectorized / per_pixel))
+
+    height, width, bits = DPX
+    codes = random.randint(0, 2 ** bits, (height, width, 3)).astype(
+        numpy.uint16
+    )
+    out = numpy.empty(codes.shape, numpy.float32)
+    for label, sat in [('10 bit', None), ('10 bit sop', 1.0)]:
+        as_float = measure(
+            '{0} as float'.format(label),
+            lambda frame: cdl_convert.apply_cdl(
+                frame.astype(numpy.float32) / (2 ** bits - 1), cdl, sat=sat,
+                out=out
+            ),
+            codes
+        )
+        lookup = measure(
+            '{0} lookup'.format(label),
+            lambda frame: cdl_convert.apply_cdl(
+                frame, cdl, sat=sat, out=out, bits=bits
+            ),
+            codes
+        )
+        print('{0:>16}: {1:10.2f}x'.format('speedup', lookup / as_float))
+
+    cdl_convert.reset_all()
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""
+Benchmarks writing and reading corrections as files or as one archive
+
+Writes every correction as its own ``cc`` file, as the script does for ``cc``
+output, then as members of a ``tar`` and a ``zip`` archive with
+ArchiveWriter. Reports the time taken and the number of files created, then
+the time to parse the corrections back.
+
+Usage:
+
+    python benchmarks/bench_archive.py [corrections] [directory]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 20000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_corrections(count):
+    """Builds count corrections"""
+    corrections = []
+    for i in range(count):
+        cc = cdl_convert.ColorCorrection('sh{0:06d}'.format(i))
+        cc.desc = 'shot {0}'.format(i)
+        cc.slope = [1.0 + i % 7 * 0.01, 1.02, 0.98]
+        cc.offset = [0.001 * (i % 5), 0.0, -0.002]
+        cc.power = [1.0, 0.99, 1.01]
+        cc.sat = 0.9
+        corrections.append(cc)
+    return corrections
+
+
+def write_files(corrections, directory):
+    """Writes a cc file per correction, returning the paths written"""
+    paths = []
+    for cc in corrections:
+        cc.determine_dest('cc', directory)
+        cdl_convert.write_cc(cc)
+        paths.append(cc.file_out)
+    return paths
+
+
+def write_archive(corrections, path):
+    """Writes a cc member per correction, returning the archive path"""
+    with cdl_convert.ArchiveWriter(path) as archive:
+        for cc in corrections:
+            archive.write(cc, 'cc')
+    return path
+
+
+def read_files(paths):
+    """Parses every cc file"""
+    return [cdl_convert.parse_cc(path) for path in paths]
+
+
+def timed(func, *args):
+    """Returns the result of func and how long it took"""
+    start = time.time()
+    result = func(*args)
+    return result, time.time() - start
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+    parent = sys.argv[2] if len(sys.argv) > 2 else None
+
+    directory = tempfile.mkdtemp(dir=parent)
+    try:
+        files = os.path.join(directory, 'files')
+        os.mkdir(files)
+
+        corrections = build_corrections(count)
+        # Build the XML caches, so only writing and reading are timed.
+        for cc in corrections:
+            cc.xml_root
+
+        paths, write_time = timed(write_files, corrections, files)
+        cdl_convert.reset_all()
+        read_time = timed(read_files, paths)[1]
+        print(
+            '{label:>6}: write {write:6.2f}s, parse {read:6.2f}s, '
+            '{files} files'.format(
+                label='files',
+                write=write_time,
+                read=read_time,
+                files=len(os.listdir(files)),
+            )
+        )
+
+        for ext in ['tar', 'zip']:
+            cdl_convert.reset_all()
+            corrections = build_corrections(count)
+            for cc in corrections:
+                cc.xml_root
+            path = os.path.join(directory, 'grades.' + ext)
+            write_time = timed(write_archive, corrections, path)[1]
+            cdl_convert.reset_all()
+            read_time = timed(cdl_convert.parse_archive, path)[1]
+            print(
+                '{label:>6}: write {write:6.2f}s, parse {read:6.2f}s, '
+                '1 file'.format(label=ext, write=write_time, read=read_time)
+            )
+    finally:
+        shutil.rmtree(directory)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
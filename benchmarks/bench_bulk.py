@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""
+Benchmarks building a collection one correction at a time against the bulk
+constructors
+
+The slow path is the one a grading database export takes without the bulk
+constructors: ColorCorrection(id), the slope, offset, power and sat setters
+and append_child() for every record. Each path is timed on a fresh registry
+and reported as microseconds per record.
+
+Usage:
+
+    python benchmarks/bench_bulk.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 100000
+# The slow path is quadratic through append_child, so cap it and scale.
+SLOW_CORRECTIONS = 10000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_columns(count):
+    """Returns ids and value columns for count corrections"""
+    ids = ['sh{0:06d}'.format(i) for i in range(count)]
+    slope = [[1.0 + i % 7 * 0.01, 1.02, 0.98] for i in range(count)]
+    offset = [[0.001 * (i % 5), 0.0, -0.002] for i in range(count)]
+    power = [[1.0, 0.99, 1.01] for i in range(count)]
+    sat = [0.9] * count
+    return ids, slope, offset, power, sat
+
+
+def slow_path(ids, slope, offset, power, sat):
+    """Builds the collection one correction at a time"""
+    col = cdl_convert.ColorCollection()
+    for i, cc_id in enumerate(ids):
+        cc = cdl_convert.ColorCorrection(cc_id)
+        cc.slope = slope[i]
+        cc.offset = offset[i]
+        cc.power = power[i]
+        cc.sat = sat[i]
+        col.append_child(cc)
+    return col
+
+
+def timed(name, count, func, *args):
+    """Runs func on a fresh registry and prints microseconds per record"""
+    cdl_convert.reset_all()
+    start = time.time()
+    col = func(*args)
+    elapsed = time.time() - start
+    assert len(col.color_corrections) == count
+    print(
+        '{name:<24} {count:>7} records {per:>8.2f} us/record'.format(
+            name=name,
+            count=count,
+            per=elapsed / count * 1000000,
+        )
+    )
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+    columns = build_columns(count)
+    slow = min(count, SLOW_CORRECTIONS)
+
+    timed(
+        'slow path', slow, slow_path,
+        *[column[:slow] for column in columns]
+    )
+    timed(
+        'from_arrays', count, cdl_convert.ColorCollection.from_arrays,
+        *columns
+    )
+    timed(
+        'from_records', count, cdl_convert.ColorCollection.from_records,
+        list(zip(*columns))
+    )
+    if numpy is not None:
+        timed(
+            'from_arrays (numpy)', count,
+            cdl_convert.ColorCollection.from_arrays,
+            numpy.array(columns[0]),
+            *[numpy.array(column) for column in columns[1:]]
+        )
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+Benchmarks exporting the same corrections to several formats
+
+Writes every correction of a collection as a ``cc`` , then the collection
+as a ``ccc`` and as a ``cdl`` , like a multi format conversion does. Compares
+cached XML fragments with rebuilding and serializing every element for each
+format, and times a second ``ccc`` export after a few corrections change.
+
+Usage:
+
+    python benchmarks/bench_cache.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 50000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_collection(count):
+    """Builds a collection of count corrections"""
+    corrections = []
+    for i in range(count):
+        cc = cdl_convert.ColorCorrection('sh{0:06d}'.format(i))
+        cc.desc = 'shot {0}'.format(i)
+        cc.slope = [1.0 + i % 7 * 0.01, 1.02, 0.98]
+        cc.offset = [0.001 * (i % 5), 0.0, -0.002]
+        cc.power = [1.0, 0.99, 1.01]
+        cc.sat = 0.9
+        corrections.append(cc)
+    col = cdl_convert.ColorCollection()
+    col.color_corrections = corrections
+    col.set_parentage()
+    return col
+
+
+def export_all(col):
+    """Returns the cc, ccc and cdl text of every correction in col"""
+    outputs = [cc.xml_root for cc in col.color_corrections]
+    col.set_to_ccc()
+    outputs.append(col.xml_root)
+    col.set_to_cdl()
+    outputs.append(col.xml_root)
+    return outputs
+
+
+def reexport(col):
+    """Changes one correction in a hundred, then exports the ccc again"""
+    for cc in col.color_corrections[::100]:
+        cc.sat = 0.8
+    col.set_to_ccc()
+    return col.xml_root
+
+
+def measure(col, cache):
+    """Returns the export timings and outputs with caching on or off"""
+    orig_cache = cdl_convert.ColorCorrection._cache_xml
+    cdl_convert.ColorCorrection._cache_xml = cache
+    try:
+        start = time.time()
+        outputs = export_all(col)
+        export_time = time.time() - start
+        start = time.time()
+        outputs.append(reexport(col))
+        reexport_time = time.time() - start
+    finally:
+        cdl_convert.ColorCorrection._cache_xml = orig_cache
+    return export_time, reexport_time, outputs
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+
+    old_export, old_reexport, old = measure(build_collection(count), False)
+    cdl_convert.reset_all()
+    new_export, new_reexport, new = measure(build_collection(count), True)
+
+    assert old == new
+    print(
+        '{count} corrections as cc, ccc and cdl: rebuilt {old:.2f}s, '
+        'cached {new:.2f}s ({speedup:.1f}x)'.format(
+            count=count,
+            old=old_export,
+            new=new_export,
+            speedup=old_export / new_export,
+        )
+    )
+    print(
+        'ccc again after 1% changed: rebuilt {old:.2f}s, '
+        'cached {new:.2f}s ({speedup:.1f}x)'.format(
+            old=old_reexport,
+            new=new_reexport,
+            speedup=old_reexport / new_reexport,
+        )
+    )
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
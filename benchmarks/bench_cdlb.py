@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+Benchmarks saving and loading a large collection as cdlb and as ccc
+
+Writes a collection with ``write_ccc()`` and ``write_cdlb()`` , then times
+loading it back with ``parse_ccc()`` and ``parse_cdlb()`` , and reading a
+single correction's values from the mapped cdlb file with ``CdlbReader`` ,
+which doesn't build any objects.
+
+Usage:
+
+    python benchmarks/bench_cdlb.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 100000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_collection(count):
+    """Builds a collection of count described corrections"""
+    ids = ['sh{0:06d}'.format(i) for i in range(count)]
+    return cdl_convert.ColorCollection.from_arrays(
+        ids,
+        slope=[[1.0 + i % 7 * 0.01, 1.02, 0.98] for i in range(count)],
+        offset=[[0.001 * (i % 5), 0.0, -0.002] for i in range(count)],
+        power=[[1.0, 0.99, 1.01] for i in range(count)],
+        sat=[0.9 + i % 3 * 0.01 for i in range(count)],
+        desc=[['shot {0}'.format(i)] for i in range(count)],
+    )
+
+
+def measure(label, func, path):
+    """Prints the time func takes on path, resetting members first"""
+    cdl_convert.reset_all()
+    start = time.time()
+    result = func(path)
+    elapsed = time.time() - start
+    print(
+        '{label:>17}: {elapsed:6.2f}s'.format(label=label, elapsed=elapsed)
+    )
+    return result
+
+
+def read_one(path):
+    """Reads the values of the last correction without loading the rest"""
+    with cdl_convert.CdlbReader(path) as reader:
+        return reader.values(len(reader) - 1)
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+
+    directory = tempfile.mkdtemp()
+    try:
+        col = build_collection(count)
+        ccc_path = os.path.join(directory, 'grades.ccc')
+        cdlb_path = os.path.join(directory, 'grades.cdlb')
+
+        col._file_out = ccc_path
+        start = time.time()
+        cdl_convert.write_ccc(col)
+        print('{0:>17}: {1:6.2f}s'.format('write_ccc', time.time() - start))
+        col._file_out = cdlb_path
+        start = time.time()
+        cdl_convert.write_cdlb(col)
+        print('{0:>17}: {1:6.2f}s'.format('write_cdlb', time.time() - start))
+        del col
+
+        for path in (ccc_path, cdlb_path):
+            print('{0:>17}: {1:6.1f} MB'.format(
+                os.path.basename(path), os.path.getsize(path) / 1e6
+            ))
+
+        measure('parse_ccc', cdl_convert.parse_ccc, ccc_path)
+        measure('parse_cdlb', cdl_convert.parse_cdlb, cdlb_path)
+        measure('CdlbReader.values', read_one, cdlb_path)
+    finally:
+        cdl_convert.reset_all()
+        shutil.rmtree(directory)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
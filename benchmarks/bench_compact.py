@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Benchmarks compact XML output against pretty printed output
+
+Compares the size, serialization time and ElementTree parse time of a large
+CCC written with ``xml_root`` and with ``xml_root_compact`` .
+
+Usage:
+
+    python benchmarks/bench_compact.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import sys
+import time
+from xml.etree import ElementTree
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 100000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_collection(count):
+    """Builds a collection of count corrections"""
+    corrections = []
+    for i in range(count):
+        cc = cdl_convert.ColorCorrection('sh{0:06d}'.format(i))
+        cc.desc = 'shot {0}'.format(i)
+        cc.slope = [1.0 + i % 7 * 0.01, 1.02, 0.98]
+        cc.offset = [0.001 * (i % 5), 0.0, -0.002]
+        cc.power = [1.0, 0.99, 1.01]
+        cc.sat = 0.9
+        corrections.append(cc)
+    col = cdl_convert.ColorCollection()
+    col.color_corrections = corrections
+    col.set_parentage()
+    return col
+
+
+def measure(label, col, attribute):
+    """Prints the size, write and parse time of one serialization"""
+    start = time.time()
+    xml = getattr(col, attribute)
+    written = time.time() - start
+    start = time.time()
+    ElementTree.fromstring(xml)
+    parsed = time.time() - start
+    print(
+        '{label:>7}: {size:9d} bytes, serialize {written:.2f}s, '
+        'parse {parsed:.2f}s'.format(
+            label=label,
+            size=len(xml),
+            written=written,
+            parsed=parsed,
+        )
+    )
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+
+    col = build_collection(count)
+    measure('pretty', col, 'xml_root')
+    measure('compact', col, 'xml_root_compact')
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Benchmarks a spreadsheet round trip of a large collection as csv
+
+Times writing a collection with ``write_csv()`` and reading it back with
+``parse_csv()`` , which validates and builds the corrections a chunk of rows
+at a time, against reading the same rows with the ``csv`` module and setting
+each correction's values one at a time through the value setters, as ad hoc
+scripts do.
+
+Usage:
+
+    python benchmarks/bench_csv.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import csv
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 100000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_collection(count):
+    """Builds a collection of count described corrections"""
+    ids = ['sh{0:06d}'.format(i) for i in range(count)]
+    return cdl_convert.ColorCollection.from_arrays(
+        ids,
+        slope=[[1.0 + i % 7 * 0.01, 1.02, 0.98] for i in range(count)],
+        offset=[[0.001 * (i % 5), 0.0, -0.002] for i in range(count)],
+        power=[[1.0, 0.99, 1.01] for i in range(count)],
+        sat=[0.9 + i % 3 * 0.01 for i in range(count)],
+        desc=[['shot {0}'.format(i)] for i in range(count)],
+    )
+
+
+def measure(label, func, *args):
+    """Prints the time func takes"""
+    start = time.time()
+    func(*args)
+    elapsed = time.time() - start
+    cdl_convert.reset_all()
+    print(
+        '{label:>12}: {elapsed:6.2f}s'.format(label=label, elapsed=elapsed)
+    )
+
+
+def setters(path):
+    """Reads the rows with the csv module and sets values one at a time"""
+    corrections = []
+    with open(path) as csv_f:
+        reader = csv.reader(csv_f)
+        next(reader)
+        for row in reader:
+            cc = cdl_convert.ColorCorrection(row[0])
+            cc.slope = row[1:4]
+            cc.offset = row[4:7]
+            cc.power = row[7:10]
+            cc.sat = row[10]
+            cc.desc = row[11]
+            corrections.append(cc)
+    col = cdl_convert.ColorCollection()
+    col.append_children(corrections)
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'grades.csv')
+        col = build_collection(count)
+        col._file_out = path
+        measure('write_csv', cdl_convert.write_csv, col)
+        del col
+
+        measure('parse_csv', cdl_convert.parse_csv, path)
+        measure('setters', setters, path)
+    finally:
+        cdl_convert.reset_all()
+        shutil.rmtree(directory)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""
+Benchmarks writing a collection to several formats in one walk
+
+Writes a cdl of decisions, some of them references, to ``cc`` , ``ccc`` ,
+``cdl`` and ``rcdl`` the way ``main()`` used to, one format after the other,
+then with ``write_fanout()`` , which streams the ``ccc`` and ``cdl`` and
+writes each correction's single files in the same walk. Writing the ``cdl``
+alone is timed for comparison. Each run starts from a freshly built
+collection, so none reuses XML cached by another, and the best of a few runs
+is reported.
+
+Usage:
+
+    python benchmarks/bench_fanout.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 5000
+
+# Runs of each way of writing, the fastest of which is reported
+REPEATS = 3
+
+# One decision in this many references an earlier correction
+REFERENCE_EVERY = 10
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_collection(count):
+    """Builds a cdl of count decisions, some references"""
+    ids = ['sh{0:06d}'.format(i) for i in range(count)]
+    col = cdl_convert.ColorCollection.from_arrays(
+        ids,
+        slope=[[1.0 + i % 7 * 0.01, 1.02, 0.98] for i in range(count)],
+        offset=[[0.001 * (i % 5), 0.0, -0.002] for i in range(count)],
+        sat=[0.9 + i % 3 * 0.01 for i in range(count)],
+    )
+    decisions = []
+    for i, cc in enumerate(col.color_corrections):
+        if i and not i % REFERENCE_EVERY:
+            cc = cdl_convert.ColorCorrectionRef(ids[i - 1])
+        decisions.append(cdl_convert.ColorDecision(cc))
+    col._color_corrections = []
+    col._color_decisions = decisions
+    col.set_parentage()
+    col.set_to_cdl()
+    return col
+
+
+def corrections(col):
+    """Returns the corrections the collection holds, as main() does"""
+    return [
+        decision.cc for decision in col.color_decisions if not decision.is_ref
+    ]
+
+
+def measure(label, func, count, directory):
+    """Prints the best time func takes writing a freshly built collection
+
+    Each run writes to a new directory, so none replaces another's files.
+
+    """
+    times = []
+    for run in range(REPEATS):
+        cdl_convert.reset_all()
+        col = build_collection(count)
+        run_directory = os.path.join(
+            directory, '{0}_{1}'.format(label.replace(' ', '_'), run)
+        )
+        os.mkdir(run_directory)
+        start = time.time()
+        func(col, run_directory)
+        times.append(time.time() - start)
+    elapsed = min(times)
+    print('{label:>12}: {elapsed:6.2f}s'.format(label=label, elapsed=elapsed))
+    return elapsed
+
+
+def write_fanout(col, directory):
+    """Writes every format in one walk"""
+    def write_singles(cdl):
+        """Writes the single files of a correction"""
+        for ext in ['cc', 'rcdl']:
+            cdl.determine_dest(ext, directory)
+            cdl_convert.write.OUTPUT_FORMATS[ext](cdl)
+
+    outputs = {}
+    for ext in ['ccc', 'cdl']:
+        col.determine_dest(directory, ext)
+        outputs[ext] = col.file_out
+    cdl_convert.write_fanout(col, outputs, each=write_singles)
+
+
+def write_each(col, directory):
+    """Writes every format one after the other"""
+    for ext in ['cc', 'ccc', 'cdl', 'rcdl']:
+        if ext in cdl_convert.config.SINGLE_FORMATS:
+            for cdl in corrections(col):
+                cdl.determine_dest(ext, directory)
+                cdl_convert.write.OUTPUT_FORMATS[ext](cdl)
+        else:
+            col.determine_dest(directory, ext)
+            cdl_convert.write.OUTPUT_FORMATS[ext](col)
+
+
+def write_cdl(col, directory):
+    """Writes the cdl alone"""
+    col.determine_dest(directory, 'cdl')
+    cdl_convert.write_cdl(col)
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+
+    directory = tempfile.mkdtemp()
+    try:
+        cdl_only = measure('cdl only', write_cdl, count, directory)
+        each = measure('each format', write_each, count, directory)
+        fanout = measure('write_fanout', write_fanout, count, directory)
+        print('{0:>12}: {1:6.2f}x'.format('speedup', each / fanout))
+        print('{0:>12}: {1:6.2f}x'.format('vs cdl only', fanout / cdl_only))
+    finally:
+        cdl_convert.reset_all()
+        shutil.rmtree(directory)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
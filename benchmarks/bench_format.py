@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""
+Benchmarks formatting correction values as text
+
+Times formatting the 10 values of every correction in a collection with the
+old ``_de_exponent()`` , with ``format_number()`` writing values exactly, and
+with ``format_number()`` rounding to 6 decimal places, both with the cache of
+rounded text and with the cache cleared before every value. Graded shows
+share a small number of distinct values, so most rounded values are found in
+the cache.
+
+Usage:
+
+    python benchmarks/bench_format.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+from cdl_convert.utils import _de_exponent
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 100000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_values(count):
+    """Builds the values of count corrections, as Decimals"""
+    values = []
+    for i in range(count):
+        cc = cdl_convert.ColorCorrection('sh{0:06d}'.format(i))
+        cc.slope = [1.0 + i % 7 * 0.01, 1.02, 0.98]
+        cc.offset = [0.001 * (i % 5), 0.0, -0.002]
+        cc.power = [1.0, 0.99, 1.01]
+        cc.sat = 0.9 + i % 3 * 0.0000001
+        values.extend(cc.slope + cc.offset + cc.power + (cc.sat, ))
+    cdl_convert.reset_all()
+    return values
+
+
+def round_cached(value):
+    """Rounds to 6 decimal places, using the cache"""
+    return cdl_convert.format_number(value, 6)
+
+
+def round_uncached(value):
+    """Rounds to 6 decimal places, with the cache cleared first"""
+    cdl_convert.utils._FORMATTED.clear()
+    return cdl_convert.format_number(value, 6)
+
+
+def measure(label, func, values):
+    """Prints the time taken to format every value"""
+    start = time.time()
+    for value in values:
+        func(value)
+    elapsed = time.time() - start
+    print(
+        '{label:>18}: {elapsed:6.2f}s'.format(label=label, elapsed=elapsed)
+    )
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+
+    values = build_values(count)
+    measure('_de_exponent', _de_exponent, values)
+    measure('format_number', cdl_convert.format_number, values)
+    measure('rounded, uncached', round_uncached, values)
+    measure('rounded, cached', round_cached, values)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Benchmarks reconverting files that mostly haven't changed
+
+Writes a file per correction, changes one correction in a hundred, then
+writes every file again, both as before and with ``skip_unchanged`` . The
+skipping writes still serialize every correction, but only replace the files
+that changed, so the rest keep their modification times for tools that sync
+or rebuild based on them.
+
+Usage:
+
+    python benchmarks/bench_incremental.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 5000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_corrections(count, directory):
+    """Builds count corrections with file_out set in directory"""
+    corrections = []
+    for i in range(count):
+        cc = cdl_convert.ColorCorrection('sh{0:06d}'.format(i))
+        cc.desc = 'shot {0}'.format(i)
+        cc.slope = [1.0 + i % 7 * 0.01, 1.02, 0.98]
+        cc.offset = [0.001 * (i % 5), 0.0, -0.002]
+        cc.power = [1.0, 0.99, 1.01]
+        cc.sat = 0.9
+        cc.determine_dest('cc', directory)
+        corrections.append(cc)
+    return corrections
+
+
+def measure(label, corrections, skip_unchanged):
+    """Rewrites every correction, printing the time and files replaced"""
+    mtimes = [os.stat(cc.file_out).st_mtime for cc in corrections]
+    start = time.time()
+    for cc in corrections:
+        cdl_convert.write_cc(cc, skip_unchanged=skip_unchanged)
+    elapsed = time.time() - start
+    replaced = sum(
+        os.stat(cc.file_out).st_mtime != mtime
+        for cc, mtime in zip(corrections, mtimes)
+    )
+    print(
+        '{label:>15}: {elapsed:6.2f}s, {replaced} files replaced'.format(
+            label=label,
+            elapsed=elapsed,
+            replaced=replaced,
+        )
+    )
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+
+    directory = tempfile.mkdtemp()
+    try:
+        corrections = build_corrections(count, directory)
+        for cc in corrections:
+            cdl_convert.write_cc(cc)
+        for i, cc in enumerate(corrections):
+            # Older modification times, so replaced files show up
+            os.utime(cc.file_out, (1000000000, 1000000000))
+            if not i % 100:
+                cc.sat = 0.8
+
+        measure('skip_unchanged', corrections, True)
+        measure('overwrite', corrections, False)
+    finally:
+        shutil.rmtree(directory)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
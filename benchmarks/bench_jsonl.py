@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""
+Benchmarks exchanging a large collection as JSON Lines and as ccc XML
+
+Times writing a collection with ``write_ccc()`` and ``write_jsonl()`` , and
+reading it back with ``parse_ccc()`` and ``parse_jsonl()`` . Then streams the
+JSON Lines file with ``iter_jsonl()`` , dropping each correction once seen,
+and reports the peak memory of that and of ``parse_ccc()`` where
+``tracemalloc`` is available (Python 3.4 and up).
+
+Usage:
+
+    python benchmarks/bench_jsonl.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import shutil
+import sys
+import tempfile
+import time
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 50000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_collection(count):
+    """Builds a collection of count described corrections"""
+    ids = ['sh{0:06d}'.format(i) for i in range(count)]
+    return cdl_convert.ColorCollection.from_arrays(
+        ids,
+        slope=[[1.0 + i % 7 * 0.01, 1.02, 0.98] for i in range(count)],
+        offset=[[0.001 * (i % 5), 0.0, -0.002] for i in range(count)],
+        power=[[1.0, 0.99, 1.01] for i in range(count)],
+        sat=[0.9 + i % 3 * 0.01 for i in range(count)],
+        desc=[['shot {0}'.format(i)] for i in range(count)],
+    )
+
+
+def measure(label, func, *args):
+    """Prints the time func takes"""
+    start = time.time()
+    func(*args)
+    elapsed = time.time() - start
+    print(
+        '{label:>12}: {elapsed:6.2f}s'.format(label=label, elapsed=elapsed)
+    )
+
+
+def peak_memory(label, func, path):
+    """Prints the peak memory func allocates reading path"""
+    cdl_convert.reset_all()
+    tracemalloc.start()
+    func(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print('{label:>12}: {peak:6.1f} MB peak'.format(label=label, peak=peak / 1e6))
+
+
+def stream(path):
+    """Reads every line without keeping the corrections"""
+    for _ in cdl_convert.iter_jsonl(path):
+        pass
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+
+    directory = tempfile.mkdtemp()
+    try:
+        col = build_collection(count)
+        ccc_path = os.path.join(directory, 'grades.ccc')
+        jsonl_path = os.path.join(directory, 'grades.jsonl')
+
+        col._file_out = ccc_path
+        measure('write_ccc', cdl_convert.write_ccc, col)
+        col._file_out = jsonl_path
+        measure('write_jsonl', cdl_convert.write_jsonl, col)
+        del col
+
+        cdl_convert.reset_all()
+        measure('parse_ccc', cdl_convert.parse_ccc, ccc_path)
+        cdl_convert.reset_all()
+        measure('parse_jsonl', cdl_convert.parse_jsonl, jsonl_path)
+
+        if tracemalloc is not None:
+            peak_memory('parse_ccc', cdl_convert.parse_ccc, ccc_path)
+            peak_memory('iter_jsonl', stream, jsonl_path)
+    finally:
+        cdl_convert.reset_all()
+        shutil.rmtree(directory)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+"""
+Benchmarks baking corrections into 3D and 1D luts
+
+Bakes one correction at 17, 33 and 65 points a side with ``bake_cube()`` ,
+against evaluating and formatting each lattice point in Python. Then bakes
+a collection of shots, many sharing a grade, to a cube file each, once
+baking every shot and once with ``write_cubes()`` , which bakes each
+distinct grade once, in a process per CPU. Finally a correction without
+saturation is baked to a 1D lut, against cubes of it, and a collection of
+such shots is written with and without ``ext_1d`` . The best of a few runs
+is reported, with the size of each lut.
+
+Usage:
+
+    python benchmarks/bench_lut.py [shots] [grades]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+from cdl_convert import lut
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+SIZES = [17, 33, 65]
+
+# Shots in the collection, and how many distinct grades they share
+SHOTS = 300
+GRADES = 60
+
+# Cube size baked for the collection
+COLLECTION_SIZE = 33
+
+# Runs of each way of baking, the fastest of which is reported
+REPEATS = 3
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def bake_python(cdl, size):
+    """Bakes a cube one lattice point at a time, as a plain loop would"""
+    slope = [float(i) for i in cdl.slope]
+    offset = [float(i) for i in cdl.offset]
+    power = [float(i) for i in cdl.power]
+    sat = float(cdl.sat)
+    lines = ['TITLE "{0}"'.format(cdl.id), 'LUT_3D_SIZE {0}'.format(size), '']
+    for blue in range(size):
+        for green in range(size):
+            for red in range(size):
+                rgb = [
+                    min(max(value / (size - 1.0) * slope[i] + offset[i],
+                            0.0), 1.0) ** power[i]
+                    for i, value in enumerate([red, green, blue])
+                ]
+                luma = 0.2126 * rgb[0] + 0.7152 * rgb[1] + 0.0722 * rgb[2]
+                lines.append('{0:.6f} {1:.6f} {2:.6f}'.format(
+                    *[min(max(luma + sat * (i - luma), 0.0), 1.0)
+                      for i in rgb]
+                ))
+    return '\n'.join(lines) + '\n'
+
+
+def build_collection(shots, grades, sat=0.9):
+    """Builds a collection of shots sharing grades, without sat if None"""
+    values = {}
+    if sat is not None:
+        values['sat'] = [sat for i in range(shots)]
+    return cdl_convert.ColorCollection.from_arrays(
+        ['sh{0:05d}'.format(i) for i in range(shots)],
+        slope=[[1.0 + i % grades * 0.01, 1.02, 0.98] for i in range(shots)],
+        offset=[[0.01, 0.0, -0.002] for i in range(shots)],
+        **values
+    )
+
+
+def measure(label, func, *args):
+    """Prints the best time of a few runs of func, from an empty cache"""
+    times = []
+    for _ in range(REPEATS):
+        lut._CUBE_CACHE.clear()
+        start = time.time()
+        func(*args)
+        times.append(time.time() - start)
+    elapsed = min(times)
+    print('{label:>22}: {elapsed:8.4f}s'.format(label=label, elapsed=elapsed))
+    return elapsed
+
+
+def write_each(col, directory):
+    """Bakes and writes every shot's cube, sharing nothing"""
+    for cdl in col.color_corrections:
+        lut._CUBE_CACHE.clear()
+        cdl.determine_dest('cube', directory)
+        cdl_convert.write_cube(cdl, COLLECTION_SIZE)
+
+
+def main():
+    """Runs the benchmark"""
+    shots = int(sys.argv[1]) if len(sys.argv) > 1 else SHOTS
+    grades = int(sys.argv[2]) if len(sys.argv) > 2 else GRADES
+
+    cdl = cdl_convert.ColorCorrection('bench')
+    cdl.slope = [1.2, 0.9, 1.05]
+    cdl.offset = [-0.02, 0.01, 0.03]
+    cdl.power = [0.9, 1.1, 1.25]
+    cdl.sat = 0.8
+
+    python = measure('python 33', bake_python, cdl, 33)
+    for size in SIZES:
+        baked = measure('bake_cube {0}'.format(size), lut.bake_cube, cdl, size)
+        if size == 33:
+            print('{0:>22}: {1:8.2f}x'.format('speedup', python / baked))
+
+    col = build_collection(shots, grades)
+    directory = tempfile.mkdtemp()
+    try:
+        each = measure('each shot', write_each, col, directory)
+        for jobs in sorted(set([1, multiprocessing.cpu_count()])):
+            shared = measure(
+                'write_cubes jobs={0}'.format(jobs),
+                cdl_convert.write_cubes, col, directory, COLLECTION_SIZE,
+                jobs
+            )
+            print('{0:>22}: {1:8.2f}x'.format('speedup', each / shared))
+
+        cdl.sat = 1.0
+        for label, func, size in [
+                ('bake_cube 33', lut.bake_cube, 33),
+                ('bake_cube 65', lut.bake_cube, 65),
+                ('bake_lut_1d 4096', lut.bake_lut_1d, 4096)]:
+            measure(label, func, cdl, size)
+            print('{0:>22}: {1:8d} bytes'.format('size', len(func(cdl, size))))
+
+        col = build_collection(shots, shots, None)
+        cubes = measure(
+            'sop only cubes', cdl_convert.write_cubes, col, directory,
+            COLLECTION_SIZE, 1
+        )
+        luts = measure(
+            'sop only ext_1d', cdl_convert.write_cubes, col, directory,
+            COLLECTION_SIZE, 1, None, 'spi1d'
+        )
+        print('{0:>22}: {1:8.2f}x'.format('speedup', cubes / luts))
+    finally:
+        cdl_convert.reset_all()
+        shutil.rmtree(directory)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Benchmarks merging many per reel collections into one show collection
+
+Builds a number of reel CCCs, each holding its own corrections plus a set of
+corrections shared by every reel, then times merge_collections() with each
+conflict policy and with content dedup. Also checks that repeated merges give
+the same child order.
+
+Usage:
+
+    python benchmarks/bench_merge.py [reels] [corrections per reel]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+REELS = 60
+CORRECTIONS = 2000
+SHARED = 100
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_reels(reels, count):
+    """Builds reels collections of count corrections, some shared"""
+    shared = []
+    for i in range(SHARED):
+        cc = cdl_convert.ColorCorrection('shared{0:04d}'.format(i))
+        cc.slope = [1.1, 1.0, 0.9]
+        shared.append(cc)
+
+    collections = []
+    for reel in range(reels):
+        corrections = list(shared)
+        for i in range(count - SHARED):
+            cc = cdl_convert.ColorCorrection(
+                'r{reel:03d}_sh{i:05d}'.format(reel=reel, i=i)
+            )
+            cc.slope = [1.0 + i % 9 * 0.01, 1.0, 1.0]
+            cc.sat = 1.0 - reel % 4 * 0.1
+            corrections.append(cc)
+        col = cdl_convert.ColorCollection()
+        col.type = 'ccc'
+        # Ids are known to be unique, so skip append_children's checks.
+        col.color_corrections = corrections
+        collections.append(col)
+    return collections
+
+
+def main():
+    """Runs the benchmark"""
+    reels = int(sys.argv[1]) if len(sys.argv) > 1 else REELS
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else CORRECTIONS
+
+    collections = build_reels(reels, count)
+    total = sum(len(col.color_corrections) for col in collections)
+    print('{reels} reels, {total} corrections'.format(reels=reels, total=total))
+
+    orders = []
+    for kwargs in (
+            {'conflict': 'first'},
+            {'conflict': 'last'},
+            {'conflict': 'first', 'dedup_content': True},
+    ):
+        start = time.time()
+        merged = collections[0].merge_collections(collections[1:], **kwargs)
+        elapsed = time.time() - start
+        orders.append([cc.id for cc in merged.color_corrections])
+        print(
+            '{kwargs}: {children} children in {elapsed:.3f}s'.format(
+                kwargs=kwargs,
+                children=len(merged.color_corrections),
+                elapsed=elapsed,
+            )
+        )
+
+    again = collections[0].merge_collections(collections[1:])
+    if [cc.id for cc in again.color_corrections] != orders[0]:
+        print('merge order is not deterministic')
+        return 1
+    return 0
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    sys.exit(main())
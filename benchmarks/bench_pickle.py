@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Benchmarks pickling of the cdl_convert object model
+
+Measures the pickled size of a ColorCorrection and the number of corrections
+per second that make a full round trip through a ProcessPoolExecutor, with
+each worker loading, touching and returning a chunk of corrections.
+
+Usage:
+
+    python benchmarks/bench_pickle.py [corrections] [workers]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+from concurrent.futures import ProcessPoolExecutor
+import os
+import pickle
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 100000
+CHUNK = 1000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_collection(count):
+    """Builds a collection of count corrections with decisions"""
+    decisions = []
+    for i in range(count):
+        cc = cdl_convert.ColorCorrection('sh{0:06d}'.format(i))
+        cc.desc = 'shot {0}'.format(i)
+        cc.slope = [1.0 + i % 7 * 0.01, 1.02, 0.98]
+        cc.offset = [0.001 * (i % 5), 0.0, -0.002]
+        cc.power = [1.0, 0.99, 1.01]
+        cc.sat = 0.9
+        decisions.append(cdl_convert.ColorDecision(
+            cc, cdl_convert.MediaRef('/show/sh{0:06d}.####.exr'.format(i))
+        ))
+    col = cdl_convert.ColorCollection()
+    # Ids are known to be unique, so skip append_children's duplicate checks.
+    col.color_decisions = decisions
+    col.set_parentage()
+    return col
+
+
+def touch(decisions):
+    """Worker: checks the loaded graph resolved and sends it back"""
+    for decision in decisions:
+        assert decision.cc.parent is decision
+        assert cdl_convert.ColorCorrection.members[decision.cc.id]
+    return decisions
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+    col = build_collection(count)
+    decisions = col.color_decisions
+
+    single = pickle.dumps(decisions[0].cc, pickle.HIGHEST_PROTOCOL)
+    print('pickled ColorCorrection: {0} bytes'.format(len(single)))
+
+    start = time.time()
+    data = pickle.dumps(col, pickle.HIGHEST_PROTOCOL)
+    dumped = time.time()
+    cdl_convert.reset_all()
+    pickle.loads(data)
+    loaded = time.time()
+    print(
+        'collection of {count}: {size} bytes, dumps {dumps:.0f}/s, '
+        'loads {loads:.0f}/s'.format(
+            count=count,
+            size=len(data),
+            dumps=count / (dumped - start),
+            loads=count / (loaded - dumped),
+        )
+    )
+
+    chunks = [
+        decisions[i:i + CHUNK] for i in range(0, len(decisions), CHUNK)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Warm up the pool so process start up isn't measured.
+        list(pool.map(touch, chunks[:workers]))
+        start = time.time()
+        returned = sum(len(chunk) for chunk in pool.map(touch, chunks))
+        elapsed = time.time() - start
+
+    print(
+        'pool round trip with {workers} workers: {rate:.0f} '
+        'corrections/s'.format(workers=workers, rate=returned / elapsed)
+    )
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
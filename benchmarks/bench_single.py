@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+Benchmarks writing a file per correction serially and with a thread pool
+
+Writes every correction of a collection to its own ``cc`` file, first one
+after the other with ``write_cc`` as the script did, then with
+``write_single_files`` and several job counts. Point directory at network
+storage to measure it. Otherwise latency adds a sleep to every file open and
+close in ``cdl_convert.write`` , to stand in for NFS round trips on local
+disk.
+
+Usage:
+
+    python benchmarks/bench_single.py [corrections] [latency ms] [directory]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 2000
+LATENCY = 2.0
+JOBS = [1, 4, 8, 16]
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+class SlowFile(object):
+    """A file whose open and close each take latency seconds"""
+
+    def __init__(self, latency, *args):
+        time.sleep(latency)
+        self._latency = latency
+        self._file = open(*args)
+
+    def __enter__(self):
+        return self._file
+
+    def __exit__(self, *args):
+        self._file.close()
+        time.sleep(self._latency)
+
+
+def build_corrections(count):
+    """Builds count corrections"""
+    corrections = []
+    for i in range(count):
+        cc = cdl_convert.ColorCorrection('sh{0:06d}'.format(i))
+        cc.desc = 'shot {0}'.format(i)
+        cc.slope = [1.0 + i % 7 * 0.01, 1.02, 0.98]
+        cc.offset = [0.001 * (i % 5), 0.0, -0.002]
+        cc.power = [1.0, 0.99, 1.01]
+        cc.sat = 0.9
+        corrections.append(cc)
+    return corrections
+
+
+def write_serial(corrections, directory):
+    """The previous script behavior: one write_cc after another"""
+    for cc in corrections:
+        cc.determine_dest('cc', directory)
+        cdl_convert.write_cc(cc)
+
+
+def measure(label, func):
+    """Prints how long func takes"""
+    start = time.time()
+    func()
+    print('{label:>8}: {elapsed:6.2f}s'.format(
+        label=label, elapsed=time.time() - start
+    ))
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else LATENCY
+    parent = sys.argv[3] if len(sys.argv) > 3 else None
+
+    if latency:
+        cdl_convert.write.open = lambda *args: SlowFile(
+            latency / 1000.0, *args
+        )
+
+    corrections = build_corrections(count)
+    # Build the XML caches, so both sides only time the writes.
+    for cc in corrections:
+        cc.xml_root
+
+    print('{count} cc files, {latency} ms latency'.format(
+        count=count, latency=latency
+    ))
+    directory = tempfile.mkdtemp(dir=parent)
+    try:
+        measure('serial', lambda: write_serial(corrections, directory))
+        for jobs in JOBS:
+            measure(
+                '{0} jobs'.format(jobs),
+                lambda: cdl_convert.write_single_files(
+                    corrections, 'cc', directory, jobs
+                )
+            )
+    finally:
+        shutil.rmtree(directory)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Benchmarks ingesting and querying a CollectionStore
+
+Ingests a collection of decisions, each with a media ref, in one
+transaction, spread over several reels, then times lookups by id and media
+ref, a reel query, and a value range query, against building the whole
+collection. Only the rows a query matches are built.
+
+Usage:
+
+    python benchmarks/bench_store.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 100000
+REELS = 100
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_collection(count, start):
+    """Builds a collection of count decisions, ids counting from start"""
+    ids = ['sh{0:07d}'.format(i) for i in range(start, start + count)]
+    col = cdl_convert.ColorCollection.from_arrays(
+        ids,
+        slope=[[1.0 + i % 7 * 0.01, 1.02, 0.98] for i in range(count)],
+        sat=[0.5 + i % 1000 * 0.001 for i in range(count)],
+    )
+    decisions = [
+        cdl_convert.ColorDecision(
+            cc, cdl_convert.MediaRef('/shots/{0}/{0}.####.exr'.format(cc.id))
+        )
+        for cc in col.color_corrections
+    ]
+    col._color_corrections = []
+    col._color_decisions = decisions
+    col.set_parentage()
+    return col
+
+
+def measure(label, func, *args, **kwargs):
+    """Prints the time func takes and how many rows it returned"""
+    start = time.time()
+    result = func(*args, **kwargs)
+    elapsed = time.time() - start
+    print(
+        '{label:>14}: {elapsed:8.4f}s {rows:>8} rows'.format(
+            label=label,
+            elapsed=elapsed,
+            rows=result if isinstance(result, int) else len(result)
+        )
+    )
+    cdl_convert.reset_all()
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+
+    directory = tempfile.mkdtemp()
+    try:
+        with cdl_convert.CollectionStore(
+                os.path.join(directory, 'grades.db')) as store:
+            per_reel = max(count // REELS, 1)
+            elapsed = 0.0
+            for reel in range(0, count, per_reel):
+                col = build_collection(min(per_reel, count - reel), reel)
+                start = time.time()
+                store.ingest(col, reel='R{0:03d}'.format(reel // per_reel))
+                elapsed += time.time() - start
+                cdl_convert.reset_all()
+            print('{0:>14}: {1:8.4f}s {2:>8} rows'.format(
+                'ingest', elapsed, len(store)
+            ))
+
+            shot = 'sh{0:07d}'.format(count // 2)
+            measure('id', lambda: list(store.select(cc_id=shot)))
+            measure('media_ref', lambda: list(store.select(
+                media_ref='/shots/{0}/{0}.####.exr'.format(shot)
+            )))
+            measure('reel', lambda: list(store.select(reel='R007')))
+            measure('sat range', store.count, sat=(0.5, 0.501))
+            measure('everything', lambda: store.collection().all_children)
+    finally:
+        cdl_convert.reset_all()
+        shutil.rmtree(directory)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Benchmarks validate_values() against validating one value at a time
+
+The per value path is what the SopNode and SatNode setters do for every
+correction: _check_setter_value() on slope, offset and power and
+_check_single_value() on sat. validate_values() is timed on python lists
+and, if NumPy is installed, on NumPy arrays.
+
+Usage:
+
+    python benchmarks/bench_validate.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from cdl_convert import SopNode, validate_values
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 200000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def per_value(slope, offset, power, sat):
+    """Validates every value the way the setters do"""
+    node = SopNode(None)
+    for i in range(len(slope)):
+        node._check_setter_value(slope[i], 'slope')
+        node._check_setter_value(offset[i], 'offset', True)
+        node._check_setter_value(power[i], 'power')
+        node._check_single_value(sat[i], 'saturation')
+
+
+def timed(name, count, func, *args):
+    """Prints the values per second func validates"""
+    start = time.time()
+    func(*args)
+    elapsed = time.time() - start
+    print(
+        '{name:<28} {rate:>12.0f} values/s'.format(
+            name=name,
+            rate=count * 10 / elapsed,
+        )
+    )
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+    slope = [[1.0 + i % 97 * 0.01, 1.02, 0.98] for i in range(count)]
+    offset = [[0.001 * (i % 5), 0.0, -0.002] for i in range(count)]
+    power = [[1.0, 0.99, 1.01 + i % 13 * 0.01] for i in range(count)]
+    sat = [0.9 + i % 7 * 0.01 for i in range(count)]
+
+    timed('per value setters checks', count, per_value,
+          slope, offset, power, sat)
+    timed('validate_values (lists)', count, validate_values,
+          slope, offset, power, sat)
+    if numpy is not None:
+        arrays = [numpy.array(column) for column in (slope, offset, power, sat)]
+        timed('validate_values (numpy)', count, validate_values, *arrays)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Benchmarks ColorCorrection.value and dict based grade deduplication
+
+Times building the CdlValue of every correction, reading the cached values
+again, and grouping all corrections by grade in a dict.
+
+Usage:
+
+    python benchmarks/bench_value.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 200000
+GRADES = 1000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_corrections(count):
+    """Builds count corrections sharing GRADES distinct grades"""
+    corrections = []
+    for i in range(count):
+        cc = cdl_convert.ColorCorrection('sh{0:07d}'.format(i))
+        cc.slope = [1.0 + i % GRADES * 0.001, 1.0, 1.0]
+        cc.sat = 0.9
+        corrections.append(cc)
+    return corrections
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+    corrections = build_corrections(count)
+
+    start = time.time()
+    for cc in corrections:
+        cc.value
+    built = time.time()
+    for cc in corrections:
+        cc.value
+    cached = time.time()
+    grades = {}
+    for cc in corrections:
+        grades.setdefault(cc.value.grade, []).append(cc)
+    grouped = time.time()
+
+    print(
+        '{count} corrections: build {build:.0f}/s, cached {cached:.0f}/s, '
+        'grouped into {grades} grades at {grouped:.0f}/s'.format(
+            count=count,
+            build=count / (built - start),
+            cached=count / (cached - built),
+            grades=len(grades),
+            grouped=count / (grouped - cached),
+        )
+    )
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Benchmarks peak memory and time of writing a large ColorCollection
+
+Compares write_ccc and write_cdl, which stream the collection to the file one
+child at a time, with writing the full ``xml_root`` in a single call.
+
+Usage:
+
+    python benchmarks/bench_write.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 100000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_collection(count):
+    """Builds a collection of count corrections"""
+    corrections = []
+    for i in range(count):
+        cc = cdl_convert.ColorCorrection('sh{0:06d}'.format(i))
+        cc.desc = 'shot {0}'.format(i)
+        cc.slope = [1.0 + i % 7 * 0.01, 1.02, 0.98]
+        cc.offset = [0.001 * (i % 5), 0.0, -0.002]
+        cc.power = [1.0, 0.99, 1.01]
+        cc.sat = 0.9
+        corrections.append(cc)
+    col = cdl_convert.ColorCollection()
+    col.color_corrections = corrections
+    col.set_parentage()
+    return col
+
+
+def write_whole(col):
+    """The previous writer: the whole document as one bytes object"""
+    with open(col.file_out, 'wb') as cdl_f:
+        cdl_f.write(col.xml_root)
+
+
+def measure(label, func, col):
+    """Prints the time and peak traced memory of one write"""
+    tracemalloc.start()
+    start = time.time()
+    func(col)
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(
+        '{label:>16}: {elapsed:6.2f}s, peak {peak:8.1f} MiB, '
+        '{size} bytes'.format(
+            label=label,
+            elapsed=elapsed,
+            peak=peak / 1024.0 / 1024.0,
+            size=os.path.getsize(col.file_out),
+        )
+    )
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+
+    col = build_collection(count)
+    directory = tempfile.mkdtemp()
+    col._file_out = os.path.join(directory, 'bench.ccc')
+
+    try:
+        col.set_to_ccc()
+        measure('ccc xml_root', write_whole, col)
+        measure('write_ccc', cdl_convert.write_ccc, col)
+        col.set_to_cdl()
+        measure('cdl xml_root', write_whole, col)
+        measure('write_cdl', cdl_convert.write_cdl, col)
+    finally:
+        os.remove(col.file_out)
+        os.rmdir(directory)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Benchmarks incremental CCC export against building a ColorCollection first
+
+Simulates a producer handing over corrections one at a time (such as rows
+from a database cursor), and compares collecting them into a
+ColorCollection and calling write_ccc with giving each to a CCCWriter as it
+is made. Reports total time and peak traced memory. The writer starts
+writing with the first correction rather than after the last.
+
+Usage:
+
+    python benchmarks/bench_writer.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 100000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def produce(count):
+    """Yields count new corrections, like rows coming off a cursor"""
+    for i in range(count):
+        cc = cdl_convert.ColorCorrection('sh{0:06d}'.format(i))
+        cc.desc = 'shot {0}'.format(i)
+        cc.slope = [1.0 + i % 7 * 0.01, 1.02, 0.98]
+        cc.offset = [0.001 * (i % 5), 0.0, -0.002]
+        cc.power = [1.0, 0.99, 1.01]
+        cc.sat = 0.9
+        yield cc
+
+
+def export_collection(path, count):
+    """Collects every correction, then writes the collection"""
+    col = cdl_convert.ColorCollection()
+    corrections = list(produce(count))
+    col.color_corrections = corrections
+    col.set_parentage()
+    col._file_out = path
+    cdl_convert.write_ccc(col)
+
+
+def export_writer(path, count):
+    """Writes each correction as soon as it is produced"""
+    with cdl_convert.CCCWriter(path) as writer:
+        for correction in produce(count):
+            writer.write(correction)
+
+
+def measure(label, func, path, count):
+    """Prints the total time and peak traced memory of one export"""
+    tracemalloc.start()
+    start = time.time()
+    func(path, count)
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(
+        '{label:>11}: {elapsed:6.2f}s, peak {peak:7.1f} MiB'.format(
+            label=label,
+            elapsed=elapsed,
+            peak=peak / 1024.0 / 1024.0,
+        )
+    )
+    cdl_convert.reset_all()
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'bench.ccc')
+    try:
+        measure('collection', export_collection, path, count)
+        measure('CCCWriter', export_writer, path, count)
+    finally:
+        os.remove(path)
+        os.rmdir(directory)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+Benchmarks XML serialization of a ColorCollection
+
+Times ``xml_root`` on a large CCC, and compares it to the old route of
+dumping the element tree with ElementTree and reparsing it with minidom to
+pretty print it.
+
+Usage:
+
+    python benchmarks/bench_xml.py [corrections]
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import os
+import sys
+import time
+from xml.dom import minidom
+from xml.etree import ElementTree
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CORRECTIONS = 100000
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def build_collection(count):
+    """Builds a collection of count corrections"""
+    corrections = []
+    for i in range(count):
+        cc = cdl_convert.ColorCorrection('sh{0:06d}'.format(i))
+        cc.desc = 'shot {0}'.format(i)
+        cc.slope = [1.0 + i % 7 * 0.01, 1.02, 0.98]
+        cc.offset = [0.001 * (i % 5), 0.0, -0.002]
+        cc.power = [1.0, 0.99, 1.01]
+        cc.sat = 0.9
+        corrections.append(cc)
+    col = cdl_convert.ColorCollection()
+    col.color_corrections = corrections
+    col.set_parentage()
+    return col
+
+
+def minidom_xml_root(node):
+    """The previous serializer: ElementTree dump reparsed by minidom"""
+    xml_string = ElementTree.tostring(node.element, 'UTF-8')
+    return minidom.parseString(xml_string).toprettyxml(
+        indent='    ', encoding='UTF-8'
+    )
+
+
+def main():
+    """Runs the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CORRECTIONS
+
+    col = build_collection(count)
+
+    start = time.time()
+    old = minidom_xml_root(col)
+    old_time = time.time() - start
+
+    start = time.time()
+    new = col.xml_root
+    new_time = time.time() - start
+
+    assert old == new
+    print(
+        '{count} corrections, {size} bytes: minidom {old:.2f}s, '
+        'direct {new:.2f}s ({speedup:.1f}x)'.format(
+            count=count,
+            size=len(new),
+            old=old_time,
+            new=new_time,
+            speedup=old_time / new_time,
+        )
+    )
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    main()
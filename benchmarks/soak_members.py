@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+Soak test for the class level member registries of cdl_convert
+
+Creates and discards ColorCorrection, ColorDecision, MediaRef and
+ColorCollection instances for a large number of cycles without ever calling
+reset_all(), printing the resident set size as it goes. With weakly held
+registries the RSS should stay flat after warm up.
+
+Usage:
+
+    python benchmarks/soak_members.py [cycles]
+
+Exits non-zero if RSS grows by more than 10% between the first and last
+checkpoints.
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+from __future__ import print_function
+
+# Standard Imports
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+CYCLES = 1000000
+CHECKPOINTS = 10
+
+#==============================================================================
+# FUNCTIONS
+#==============================================================================
+
+
+def rss_kb():
+    """Returns the current resident set size in kilobytes"""
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (IOError, OSError):
+        # Not Linux, fall back on the peak RSS.
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def cycle(i):
+    """Builds and discards one small object graph"""
+    cc = cdl_convert.ColorCorrection('soak{0}'.format(i))
+    cc.slope = [1.1, 1.2, 1.3]
+    cc.offset = [0.01, 0.02, 0.03]
+    cc.sat = 0.9
+    cd = cdl_convert.ColorDecision(
+        cc, cdl_convert.MediaRef('/soak/{0}.####.dpx'.format(i))
+    )
+    col = cdl_convert.ColorCollection()
+    col.append_child(cd)
+
+
+def main():
+    """Runs the soak and reports RSS at each checkpoint"""
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else CYCLES
+    step = max(cycles // CHECKPOINTS, 1)
+
+    readings = []
+    start = time.time()
+    for i in range(cycles):
+        cycle(i)
+        if (i + 1) % step == 0:
+            gc.collect()
+            readings.append(rss_kb())
+            print(
+                '{cycles:>9} cycles  {rss:>9} KB RSS  '
+                '{members} live corrections'.format(
+                    cycles=i + 1,
+                    rss=readings[-1],
+                    members=len(cdl_convert.ColorCorrection.members),
+                )
+            )
+
+    print('{0:.1f}s total'.format(time.time() - start))
+
+    growth = float(readings[-1] - readings[0]) / readings[0]
+    print('RSS growth after first checkpoint: {0:.1%}'.format(growth))
+    return 1 if growth > 0.1 else 0
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    sys.exit(main())
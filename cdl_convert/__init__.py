@@ -29,7 +29,10 @@ basic formats to further facilitate the ease of exchange of color data within
 the Film and TV industries.
 
 `cdl_convert` supports parsing ALE, FLEx, CC, CCC, CDL and RCDL. We can write
-out CC, CCC, CDL and RCDL.
+out CC, CCC, CDL and RCDL. Collections can also be saved to and loaded from
+the binary CDLB format, which loads large collections faster than XML,
+exchanged with other services as JSON Lines, and edited in spreadsheets as
+CSV.
 
 **CDLConvert is not associated with the American Society of Cinematographers**
 
@@ -75,16 +78,25 @@ from __future__ import absolute_import, print_function
 
 # cdl_convert imports
 
+from .apply import apply_cdl
 from .collection import ColorCollection
-from .correction import ColorCorrection, SatNode, SopNode
+from .correction import CdlValue, ColorCorrection, SatNode, SopNode
 from .decision import ColorCorrectionRef, ColorDecision, MediaRef
+from .lut import (
+    bake_cube, bake_lut_1d, write_cube, write_cubes, write_lut_1d
+)
 from .parse import (
-    parse_ale, parse_cc, parse_ccc,
-    parse_cdl, parse_file, parse_flex,
-    parse_rnh_cdl
+    CdlbReader, iter_csv, iter_jsonl, parse_ale, parse_archive, parse_cc,
+    parse_ccc, parse_cdl, parse_cdlb, parse_csv, parse_file, parse_flex,
+    parse_jsonl, parse_rnh_cdl
+)
+from .store import CollectionStore
+from .utils import format_number, sanity_check, to_decimal, validate_values
+from .write import (
+    append_collection, ArchiveWriter, CCCWriter, CDLWriter, write_cc,
+    write_ccc, write_cdl, write_cdlb, write_csv, write_fanout, write_jsonl,
+    write_rnh_cdl, write_single_files
 )
-from .utils import sanity_check, to_decimal
-from .write import write_cc, write_ccc, write_cdl, write_rnh_cdl
 
 # ==============================================================================
 # GLOBALS
@@ -104,27 +116,53 @@ __status__ = "Development"
 # ==============================================================================
 
 __all__ = [
+    'append_collection',
+    'apply_cdl',
+    'bake_cube',
+    'bake_lut_1d',
+    'ArchiveWriter',
+    'CCCWriter',
+    'CDLWriter',
+    'CdlbReader',
+    'CdlValue',
     'ColorCorrection',
     'ColorCorrectionRef',
     'ColorCollection',
+    'CollectionStore',
     'ColorDecision',
+    'format_number',
+    'iter_csv',
+    'iter_jsonl',
     'MediaRef',
     'parse_ale',
+    'parse_archive',
     'parse_cc',
     'parse_ccc',
     'parse_cdl',
+    'parse_cdlb',
+    'parse_csv',
     'parse_file',
     'parse_flex',
+    'parse_jsonl',
     'parse_rnh_cdl',
     'reset_all',
     'sanity_check',
     'SatNode',
     'SopNode',
     'to_decimal',
+    'validate_values',
     'write_cc',
     'write_ccc',
     'write_cdl',
+    'write_cdlb',
+    'write_csv',
+    'write_cube',
+    'write_cubes',
+    'write_fanout',
+    'write_jsonl',
+    'write_lut_1d',
     'write_rnh_cdl',
+    'write_single_files',
 ]
 
 # ==============================================================================
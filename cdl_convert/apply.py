@@ -0,0 +1,358 @@
+#!/usr/bin/env python
+"""
+
+CDL Convert Apply
+=================
+
+Evaluates color corrections on image data with NumPy, which must be installed
+to use this module.
+
+## Public Functions
+
+    apply_cdl()
+        Applies the slope, offset, power and saturation of a ColorCorrection
+        to a float or integer array of rgb pixels, in a few whole array
+        operations per block of pixels. Can write into an existing array.
+
+## GLOBALS
+
+    REC709_LUMA
+        The weights of the red, green and blue channels in the luma
+        saturation is applied around.
+
+## License
+
+The MIT License (MIT)
+
+cdl_convert
+Copyright (c) 2015 Sean Wallitsch
+http://github.com/shidarin/cdl_convert/
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+
+from __future__ import absolute_import, print_function
+
+# cdl_convert imports
+
+from .correction import _IDENTITY_SAT, _IDENTITY_SOP
+
+# Optional Imports
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# ==============================================================================
+# GLOBALS
+# ==============================================================================
+
+# Python 3 Compatibility
+
+try:
+    xrange
+except NameError:  # pragma: no cover
+    xrange = range  # pylint: disable=W0622, C0103
+
+# Rec. 709 luma weights of red, green and blue, which the ASC CDL applies
+# saturation around
+REC709_LUMA = (0.2126, 0.7152, 0.0722)
+
+# Pixels processed at a time. A block's values, with the rgb values repeated
+# along it, stay in the CPU cache through every step.
+_BLOCK_PIXELS = 16384
+
+# Integer images deeper than this would need lookup tables too large to be
+# faster than evaluating each value.
+_MAX_LUT_BITS = 16
+
+# ==============================================================================
+# EXPORTS
+# ==============================================================================
+
+__all__ = [
+    'apply_cdl',
+    'REC709_LUMA',
+]
+
+# ==============================================================================
+# PUBLIC FUNCTIONS
+# ==============================================================================
+
+
+def apply_cdl(image, cdl=None, slope=None, offset=None, power=None, sat=None,
+              out=None, bits=None):
+    """Applies an ASC CDL to an array of rgb pixels
+
+    **Args:**
+        image : (numpy.ndarray)
+            Float or unsigned integer pixels of shape ``(..., 3)`` , such as
+            ``(height, width, 3)`` , with red, green and blue last. Integer
+            code values are read as running from 0 to 1 over ``bits`` .
+
+        cdl=None : (:class:`ColorCorrection`|:class:`CdlValue`)
+            The correction to apply. Without one, the identity is applied,
+            changed by any values given below.
+
+        slope=None : ([float, float, float])
+            Rgb slope values, in place of the correction's.
+
+        offset=None : ([float, float, float])
+            Rgb offset values, in place of the correction's.
+
+        power=None : ([float, float, float])
+            Rgb power values, in place of the correction's.
+
+        sat=None : (float)
+            Saturation, in place of the correction's.
+
+        out=None : (numpy.ndarray)
+            A C contiguous float array of the same shape to write into, such
+            as one reused from frame to frame, or ``image`` itself to apply
+            the correction in place. A new array is made if not given.
+
+        bits=None : (int)
+            The bit depth of an integer image, such as 10 for 10 bit pixels
+            held in a ``uint16`` array. Defaults to the depth of its dtype.
+            Greater code values are read as the greatest.
+
+    **Returns:**
+        (numpy.ndarray)
+            ``out`` , holding the corrected pixels. A new array is float64
+            for float64 images and float32 otherwise, integer images
+            included.
+
+    **Raises:**
+        ImportError:
+            If NumPy isn't installed.
+
+        TypeError:
+            If ``image`` doesn't hold floats or unsigned integers, or
+            ``out`` doesn't hold floats.
+
+        ValueError:
+            If ``image`` doesn't hold rgb pixels, ``out`` isn't a C
+            contiguous array of the same shape, or ``bits`` isn't between
+            1 and 16 or is given for a float image.
+
+    Each channel is first given its slope, offset and power, as the ASC CDL
+    defines them::
+
+        out = clamp(in * slope + offset) ** power
+
+    with values clamped between 0 and 1. Saturation is then applied around
+    the Rec. 709 luma of the result::
+
+        luma = 0.2126 * r + 0.7152 * g + 0.0722 * b
+        out = clamp(luma + sat * (out - luma))
+
+    Pixels are processed a block at a time with whole array operations, each
+    writing into ``out`` or a scratch array the size of a block, so the work
+    stays in the CPU cache and memory use doesn't grow with the image. A
+    power or saturation of 1 is skipped.
+
+    An integer image has only ``2 ** bits`` values per channel, so slope,
+    offset and power are evaluated once for each of those into a lookup
+    table, and every pixel's values are looked up in it. Only saturation is
+    evaluated per pixel.
+
+    """
+    if numpy is None:
+        raise ImportError('apply_cdl() requires NumPy.')
+
+    slope, offset, power, sat = _grade(cdl, slope, offset, power, sat)
+
+    image = numpy.asarray(image)
+    if image.dtype.kind not in 'fu':
+        raise TypeError(
+            'Images must hold floats or unsigned integers, not {dtype}.'.format(
+                dtype=image.dtype
+            )
+        )
+    if not image.ndim or image.shape[-1] != 3:
+        raise ValueError(
+            'Images must be of shape (..., 3), not {shape}.'.format(
+                shape=image.shape
+            )
+        )
+
+    if out is None:
+        out = numpy.empty(
+            image.shape, numpy.result_type(image.dtype, numpy.float32)
+        )
+    else:
+        _check_out(out, image.shape)
+
+    dtype = out.dtype
+    values_in = image.reshape(-1)
+    values_out = out.reshape(-1)
+    pixels = len(values_out) // 3
+    block = max(min(pixels, _BLOCK_PIXELS), 1)
+
+    if image.dtype.kind == 'u':
+        bits = _lut_bits(image.dtype, bits)
+        lut = _sop_lut(bits, slope, offset, power, dtype)
+        # Code values are only clamped if the dtype can hold greater ones
+        top = None if bits == image.dtype.itemsize * 8 else 2 ** bits - 1
+        # Where each channel's table starts, added to code values to give
+        # their index in the lookup table
+        indices = numpy.empty(block * 3, numpy.intp)
+        starts = numpy.tile(
+            numpy.arange(0, 3 * 2 ** bits, 2 ** bits, dtype=numpy.intp),
+            block
+        )
+    elif bits is not None:
+        raise ValueError('bits can only be given for integer images.')
+    else:
+        lut = None
+        # Broadcasting a 3 value array along each pixel is many times slower
+        # than operating on two flat arrays, so rgb values are repeated to
+        # the length of a block once, up front.
+        slope = numpy.tile(numpy.asarray(slope, dtype), block)
+        offset = numpy.tile(numpy.asarray(offset, dtype), block)
+        if (power == 1.0).all():
+            power = None
+        else:
+            power = numpy.tile(numpy.asarray(power, dtype), block)
+    if sat == 1.0:
+        weights = None
+    else:
+        weights = numpy.asarray(REC709_LUMA, dtype) * (1.0 - sat)
+        luma = numpy.empty(block, dtype)
+        luma_rgb = numpy.empty(block * 3, dtype)
+
+    for start in xrange(0, pixels, block):
+        end = min(start + block, pixels)
+        size = (end - start) * 3
+        values = values_out[start * 3:end * 3]
+        if lut is not None:
+            block_indices = indices[:size]
+            codes = values_in[start * 3:end * 3]
+            if top is not None:
+                numpy.minimum(codes, top, out=block_indices, dtype=numpy.intp)
+                codes = block_indices
+            numpy.add(
+                codes, starts[:size], out=block_indices, dtype=numpy.intp
+            )
+            numpy.take(lut, block_indices, out=values, mode='clip')
+        else:
+            numpy.multiply(values_in[start * 3:end * 3], slope[:size], values)
+            numpy.add(values, offset[:size], values)
+            numpy.clip(values, 0.0, 1.0, values)
+            if power is not None:
+                numpy.power(values, power[:size], values)
+        if weights is not None:
+            # luma + sat * (out - luma) is sat * out + (1 - sat) * luma
+            block_luma = luma[:end - start]
+            block_luma_rgb = luma_rgb[:size]
+            numpy.dot(values.reshape(-1, 3), weights, block_luma)
+            for channel in xrange(3):
+                block_luma_rgb[channel::3] = block_luma
+            numpy.multiply(values, dtype.type(sat), values)
+            numpy.add(values, block_luma_rgb, values)
+            numpy.clip(values, 0.0, 1.0, values)
+
+    return out
+
+# ==============================================================================
+# PRIVATE FUNCTIONS
+# ==============================================================================
+
+
+def _check_out(out, shape):
+    """Raises if out can't hold the result for an image of shape"""
+    if not isinstance(out, numpy.ndarray) or out.dtype.kind != 'f':
+        raise TypeError('out must be a float array.')
+    if out.shape != shape:
+        raise ValueError(
+            'out must be of shape {shape}, not {out}.'.format(
+                shape=shape, out=out.shape
+            )
+        )
+    if not out.flags.c_contiguous:
+        raise ValueError('out must be C contiguous.')
+
+# ==============================================================================
+
+
+def _grade(cdl, slope, offset, power, sat):
+    """Returns slope, offset and power arrays and the sat of a correction
+
+    Values given replace those of cdl, and cdl defaults to the identity.
+    A :class:`ColorCorrection` is read through its ``value`` , so no empty
+    SOP or SAT nodes are made.
+
+    """
+    if cdl is None:
+        grade = _IDENTITY_SOP + (_IDENTITY_SAT, )
+    else:
+        grade = getattr(cdl, 'value', cdl).grade
+    values = [
+        grade[0:3] if slope is None else slope,
+        grade[3:6] if offset is None else offset,
+        grade[6:9] if power is None else power,
+    ]
+    values = [numpy.array([float(i) for i in value]) for value in values]
+    for value in values:
+        if value.shape != (3, ):
+            raise ValueError(
+                'Slope, offset and power need 3 values, not {0}.'.format(
+                    len(value)
+                )
+            )
+    values.append(float(grade[9] if sat is None else sat))
+    return values
+
+# ==============================================================================
+
+
+def _lut_bits(dtype, bits):
+    """Returns the bit depth of an integer image, raising if out of range"""
+    if bits is None:
+        bits = dtype.itemsize * 8
+    if not 1 <= bits <= _MAX_LUT_BITS:
+        raise ValueError(
+            'Integer images must be from 1 to {max} bits, not {bits}.'.format(
+                max=_MAX_LUT_BITS, bits=bits
+            )
+        )
+    return bits
+
+# ==============================================================================
+
+
+def _sop_lut(bits, slope, offset, power, dtype):
+    """Returns slope, offset and power applied to every code value
+
+    The table is flat, each channel's values following the last's, so the
+    value for a code value is found at ``channel * 2 ** bits + code`` .
+
+    """
+    codes = numpy.arange(2 ** bits, dtype=dtype)
+    codes /= 2 ** bits - 1
+    return apply_cdl(
+        numpy.repeat(codes[:, None], 3, 1), slope=slope, offset=offset,
+        power=power, sat=1.0, out=numpy.empty((len(codes), 3), dtype)
+    ).transpose().reshape(-1)
@@ -43,6 +43,14 @@ more fully realized classes.
             * An ``xml_root`` attribute which returns the same built element
                 as above, but with the required XML header. This XML string
                 is ready to be printed.
+            * ``xml_compact`` and ``xml_root_compact`` attributes which
+                return the same XML without any indenting whitespace.
+            * A ``write_xml_root()`` method which writes the same output as
+                ``xml_root`` (or ``xml_root_compact``) to a stream, one top
+                level child at a time.
+
+        The XML text is written directly from the Element in a single pass,
+        indented exactly as ``minidom`` 's ``toprettyxml`` would.
 
         All of these attributes depend on the ``build_element`` method, which
         must be overridden by classes which inherit this class if the above
@@ -54,6 +62,18 @@ more fully realized classes.
         A base class for Sop and Sat nodes, some basic color value checking
         functionality is included here.
 
+    WeakMemberList
+
+        An ordered, weakly referenced class level member registry. Members
+        keep the index they were registered at, even after earlier members
+        have been garbage collected.
+
+    WeakMemberLists
+
+        A weakly referenced class level member registry mapping a key to a
+        list of instances that share that key. Keys are dropped automatically
+        once their last instance has been garbage collected.
+
 ## License
 
 The MIT License (MIT)
@@ -89,11 +109,15 @@ SOFTWARE.
 from __future__ import absolute_import, print_function
 
 # Standard Imports
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # pragma: no cover
+    from collections import MutableMapping
 from decimal import Decimal
-import re
+from functools import partial
+from itertools import chain
 import sys
-from xml.dom import minidom
-from xml.etree import ElementTree
+import weakref
 
 # cdl_convert Imports
 from . import config
@@ -106,7 +130,35 @@ from .utils import to_decimal
 if sys.version_info[0] >= 3:  # pragma: no cover
     enc = lambda x: bytes(x, 'UTF-8')  # pylint: disable=C0103
 else:  # pragma: no cover
-    enc = lambda x: x  # pylint: disable=C0103
+    # Text from parsed files can be unicode, which must be encoded.
+    enc = lambda x: x.encode('UTF-8') if isinstance(x, unicode) else x  # pylint: disable=C0103,E0602
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+XML_INDENT = '    '
+
+# Our XML output used to be an ElementTree string reparsed and pretty printed
+# by minidom, so we escape and order attributes the way minidom does.
+if sys.version_info >= (3, 13):  # pragma: no cover
+    _TEXT_ESCAPES = (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'))
+    _ATTRIB_ESCAPES = _TEXT_ESCAPES + (
+        ('"', '&quot;'), ('\r', '&#13;'), ('\n', '&#10;'), ('\t', '&#9;')
+    )
+elif sys.version_info[0] >= 3:  # pragma: no cover
+    _TEXT_ESCAPES = (
+        ('&', '&amp;'), ('<', '&lt;'), ('"', '&quot;'), ('>', '&gt;')
+    )
+    _ATTRIB_ESCAPES = _TEXT_ESCAPES
+else:  # pragma: no cover
+    _TEXT_ESCAPES = (
+        ('&', '&amp;'), ('<', '&lt;'), ('"', '&quot;'), ('>', '&gt;')
+    )
+    # Python 2 ElementTree left tabs and carriage returns in attributes
+    # unescaped, so reparsing turned them into spaces.
+    _ATTRIB_ESCAPES = (('\t', ' '), ('\r', ' ')) + _TEXT_ESCAPES
+_SORTED_ATTRIBS = sys.version_info < (3, 8)
+# From 3 to 3.8 ElementTree didn't escape carriage returns in attributes,
+# so reparsing turned them into newlines.
+_ATTRIB_KEEPS_CR = not (3, 0) <= sys.version_info < (3, 9)
 
 # ==============================================================================
 # EXPORTS
@@ -116,7 +168,13 @@ __all__ = [
     'AscColorSpaceBase',
     'AscDescBase',
     'AscXMLBase',
-    'ColorNodeBase'
+    'ColorNodeBase',
+    'compact_xml',
+    'iter_compact_xml',
+    'iter_pretty_xml',
+    'pretty_xml',
+    'WeakMemberList',
+    'WeakMemberLists',
 ]
 
 # ==============================================================================
@@ -313,23 +371,69 @@ class AscXMLBase(object):
         xml : (str)
             A nicely formatted XML string representing the node.
 
+        xml_compact : (str)
+            The same XML as ``xml`` , without any whitespace between
+            elements. Smaller and quicker to write and parse.
+
         xml_root : (str)
             A nicely formatted XML, ready to write to file string representing
             the node. Formatted as an XML root, it includes the xml version and
             encoding tags on the first line.
 
+        xml_root_compact : (str)
+            The same XML as ``xml_root`` , without any whitespace between
+            elements.
+
     **Public Methods:**
 
         build_element()
             A placeholder method to be overridden by inheriting classes,
             calling it will always return None.
 
+        write_xml_root()
+            Writes ``xml_root`` , or ``xml_root_compact`` if ``pretty`` is
+            False, to a binary stream, without holding the whole document as
+            a string.
+
+        xml_fragment()
+            Returns the XML text of the node indented to a given level, for
+            assembling into a larger document.
+
+    Nodes held inside another set ``parent`` to it. The parent is only held
+    weakly, so a container and its children never form a reference cycle
+    and are freed, along with their ids, as soon as they're discarded.
+    ``parent`` is None once the parent has been freed.
+
+    Classes which set ``_cache_xml`` keep the text ``xml_fragment()`` returns
+    until it's invalidated by setting ``_xml_cache`` to None, which their
+    setters must do. Anything that can change without a setter (such as a
+    ``desc`` list changed in place) must be returned by ``_xml_snapshot()``
+    , which is compared on every call.
+
     """
+
+    _cache_xml = False
+    _xml_cache = None
+    # Returns the parent when called, see _weak_ref()
+    _parent = None
+
     def __init__(self):
         super(AscXMLBase, self).__init__()
 
     # Properties ==============================================================
 
+    @property
+    def parent(self):
+        """Returns the node containing this one, if it still exists"""
+        if self._parent is None:
+            return None
+        return self._parent()
+
+    @parent.setter
+    def parent(self, value):
+        """Holds the new parent weakly"""
+        self._parent = _weak_ref(value)
+
     @property
     def element(self):
         """etree style Element representing the node."""
@@ -338,23 +442,38 @@ class AscXMLBase(object):
     @property
     def xml(self):
         """A nicely formatted XML string representing the node"""
-        # We'll take the xml_root attrib, which is ready to write, and just
-        # remove the first line, which is the xml version and encoding.
-        dom_string = self.xml_root.split(enc('\n'))
-        return enc('\n').join(dom_string[1:])
+        return enc(self.xml_fragment())
+
+    @property
+    def xml_compact(self):
+        """An XML string representing the node with no indenting whitespace"""
+        return enc(self.xml_fragment(pretty=False))
 
     @property
     def xml_root(self):
         """A nicely formatted XML string with a root element ready to write"""
-        xml_string = ElementTree.tostring(self.element, 'UTF-8')
-        dom_xml = minidom.parseString(xml_string)
-        dom_string = dom_xml.toprettyxml(indent="    ", encoding='UTF-8')
-        # Fix for ugly dom formatting prior to 2.7, taken from:
-        # http://stackoverflow.com/questions/749796/pretty-printing-xml-in-python
-        if sys.version_info[0] < 3 and sys.version_info[1] < 7:  # pragma: no cover pylint: disable=E0012
-            text_re = re.compile(r'>\n\s+([^<>\s].*?)\n\s+</', re.DOTALL)
-            dom_string = text_re.sub(r'>\g<1></', dom_string)
-        return dom_string
+        return enc(XML_DECLARATION + self.xml_fragment())
+
+    @property
+    def xml_root_compact(self):
+        """A compact XML string with a root element ready to write"""
+        return enc(XML_DECLARATION + self.xml_fragment(pretty=False))
+
+    # Private Methods =========================================================
+
+    def _iter_xml(self, pretty=True):
+        """Yields the chunks of XML that write_xml_root() writes out"""
+        if self._cache_xml:
+            return iter((self.xml_fragment(pretty=pretty), ))
+        if pretty:
+            return iter_pretty_xml(self.element)
+        return iter_compact_xml(self.element)
+
+    # =========================================================================
+
+    def _xml_snapshot(self):  # pylint: disable=R0201
+        """Returns state that invalidates cached XML when it changes"""
+        return None
 
     # Public Methods ==========================================================
 
@@ -362,6 +481,88 @@ class AscXMLBase(object):
         """Placeholder for reference by attributes. Will return None"""
         return None
 
+    # =========================================================================
+
+    def write_xml_root(self, stream, pretty=True):
+        """Writes the same bytes as ``xml_root`` to a binary stream
+
+        **Args:**
+            stream : (file)
+                Any object with a ``write()`` method accepting bytes.
+
+            pretty=True : (bool)
+                If False, writes the same bytes as ``xml_root_compact``
+                instead.
+
+        **Returns:**
+            None
+
+        **Raises:**
+            N/A
+
+        The root element's opening and closing tags and each of its children
+        are written with a separate ``write()`` call, so the full document is
+        never held as a single string. Collections go further and only build
+        the element of each child as it is written.
+
+        """
+        stream.write(enc(XML_DECLARATION))
+        for chunk in self._iter_xml(pretty):
+            stream.write(enc(chunk))
+
+    # =========================================================================
+
+    def xml_fragment(self, level=0, pretty=True):
+        """Returns the XML text of this node, cached if the class allows it
+
+        **Args:**
+            level=0 : (int)
+                How many indents deep the node is. Ignored if not pretty.
+
+            pretty=True : (bool)
+                If False, returns compact XML instead.
+
+        **Returns:**
+            (str)
+                The same text as ``pretty_xml()`` or ``compact_xml()`` of
+                ``element`` .
+
+        **Raises:**
+            N/A
+
+        When cached, the element is only built and serialized once until it
+        changes, and other indent levels are made by indenting that text.
+
+        """
+        if not self._cache_xml:
+            if pretty:
+                return pretty_xml(self.element, level)
+            return compact_xml(self.element)
+
+        snapshot = self._xml_snapshot()
+        cache = self._xml_cache
+        if cache is None or cache[0] != snapshot:
+            cache = self._xml_cache = (snapshot, {})
+        fragments = cache[1]
+
+        if not pretty:
+            if 'compact' not in fragments:
+                fragments['compact'] = compact_xml(self.element)
+            return fragments['compact']
+
+        if 0 not in fragments:
+            element = self.element
+            fragments[0] = pretty_xml(element)
+            # Text holding line breaks can't be indented line by line.
+            fragments['indentable'] = not _has_newlines(element)
+        if not level:
+            return fragments[0]
+        if fragments['indentable']:
+            return _indent(fragments[0], level)
+        if level not in fragments:
+            fragments[level] = pretty_xml(self.element, level)
+        return fragments[level]
+
 # ==============================================================================
 
 
@@ -428,6 +629,15 @@ class ColorNodeBase(AscDescBase, AscXMLBase):  # pylint: disable=R0903
 
     # Private Methods =========================================================
 
+    def _invalidate_parent(self):
+        """Drops the cached CdlValue and XML of our parent, if any"""
+        parent = self.parent
+        if parent is not None:
+            parent._value = None  # pylint: disable=W0212
+            parent._xml_cache = None  # pylint: disable=W0212
+
+    # =========================================================================
+
     @staticmethod
     def _check_single_value(value, name, negative_allow=False):
         """Checks given value for legitimacy.
@@ -470,3 +680,494 @@ class ColorNodeBase(AscDescBase, AscXMLBase):  # pylint: disable=R0903
                     value = Decimal('0.0')
 
         return value
+
+# ==============================================================================
+
+
+class WeakMemberList(object):
+    """Ordered class level member registry holding weak references
+
+    Description
+    ~~~~~~~~~~~
+
+    Replaces the plain list class level registries used to hold every
+    instance ever created. Members are held weakly, so an instance that is
+    no longer referenced anywhere else is garbage collected and disappears
+    from the registry without a call to ``reset_members()``.
+
+    Each member keeps the index it was appended at. Members collected before
+    it do not shift that index, so ``index()`` returns the same value a plain
+    list would have returned.
+
+    **Public Methods:**
+
+        append()
+            Registers a new member at the next index.
+
+        index()
+            Returns the index a member was registered at. Raises
+            ``ValueError`` if the object is not a registered member.
+
+    """
+    def __init__(self, members=None):
+        self._count = 0
+        self._indexes = weakref.WeakKeyDictionary()
+        for member in members or []:
+            self.append(member)
+
+    def __contains__(self, member):
+        try:
+            return member in self._indexes
+        except TypeError:
+            # Unhashable or unreferenceable objects can't be members.
+            return False
+
+    def __iter__(self):
+        members = sorted(self._indexes.items(), key=lambda item: item[1])
+        return iter([member for member, _ in members])
+
+    def __len__(self):
+        return len(self._indexes)
+
+    def __repr__(self):
+        return '{cls}({members})'.format(
+            cls=self.__class__.__name__,
+            members=list(self)
+        )
+
+    # Public Methods ==========================================================
+
+    def append(self, member):
+        """Registers member at the next index"""
+        self._indexes[member] = self._count
+        self._count += 1
+
+    # =========================================================================
+
+    def index(self, member):
+        """Returns the index the member was registered at"""
+        if member not in self:
+            raise ValueError(
+                '{member} is not a registered member'.format(member=member)
+            )
+        return self._indexes[member]
+
+# ==============================================================================
+
+
+class WeakMemberLists(MutableMapping):
+    """Class level member registry mapping keys to lists of weak references
+
+    Description
+    ~~~~~~~~~~~
+
+    Several classes share a registry where a single key (a reference id or
+    a uri) maps to every instance that currently uses that key. This class
+    holds those instances weakly. Once an instance is garbage collected it is
+    removed from its key's list, and the key is removed once its list is
+    empty.
+
+    Indexing returns a new list of the live members registered under a key,
+    so membership must be changed through ``add()`` and ``discard()`` rather
+    than by mutating the returned list. Comparing against a regular
+    dictionary of lists works as expected.
+
+    **Public Methods:**
+
+        add()
+            Registers a member under the given key, after any members already
+            registered there.
+
+        discard()
+            Removes a member from the given key, dropping the key if no
+            members remain. Does nothing if the member isn't registered
+            under that key.
+
+    """
+    def __init__(self, *args, **kwargs):
+        self._refs = {}
+        self.update(*args, **kwargs)
+
+    def __contains__(self, key):
+        return key in self._refs
+
+    def __delitem__(self, key):
+        del self._refs[key]
+
+    def __getitem__(self, key):
+        members = [ref() for ref in self._refs[key]]
+        return [member for member in members if member is not None]
+
+    def __iter__(self):
+        return iter(list(self._refs))
+
+    def __len__(self):
+        return len(self._refs)
+
+    def __repr__(self):
+        return '{cls}({members})'.format(
+            cls=self.__class__.__name__,
+            members=dict(self.items())
+        )
+
+    def __setitem__(self, key, members):
+        self._refs[key] = [self._ref(key, member) for member in members]
+
+    # Private Methods =========================================================
+
+    def _prune(self, key, ref):
+        """Weakref callback removing a collected member from its key"""
+        refs = self._refs.get(key)
+        if refs is None:
+            return
+        try:
+            refs.remove(ref)
+        except ValueError:
+            return
+        if not refs:
+            del self._refs[key]
+
+    # =========================================================================
+
+    def _ref(self, key, member):
+        """Returns a weakref to member which prunes itself from key"""
+        return weakref.ref(member, partial(self._prune, key))
+
+    # Public Methods ==========================================================
+
+    def add(self, key, member):
+        """Registers member under key"""
+        self._refs.setdefault(key, []).append(self._ref(key, member))
+
+    # =========================================================================
+
+    def discard(self, key, member):
+        """Removes member from key if present"""
+        refs = self._refs.get(key)
+        if refs is None:
+            return
+        for i, ref in enumerate(refs):
+            if ref() is member:
+                del refs[i]
+                break
+        if not refs:
+            del self._refs[key]
+
+# ==============================================================================
+# PUBLIC FUNCTIONS
+# ==============================================================================
+
+
+def compact_xml(element):
+    """Returns an element as XML text with no whitespace between elements
+
+    **Args:**
+        element : (<xml.etree.ElementTree.Element>)
+            The element to serialize.
+
+    **Returns:**
+        (str)
+            The element and its children on a single line, with no trailing
+            newline. Elements with no content are self closing.
+
+    **Raises:**
+        N/A
+
+    Parses to the same elements, attributes and text as ``pretty_xml()``
+    does, without the indenting text nodes.
+
+    """
+    parts = []
+    _append_compact(element, parts.append)
+    return ''.join(parts)
+
+# ==============================================================================
+
+
+def iter_compact_xml(element, children=None):
+    """Yields the compact XML of an element in a few large chunks
+
+    **Args:**
+        element : (<xml.etree.ElementTree.Element>)
+            The element to serialize.
+
+        children=None : (iter)
+            Extra child elements, as for ``iter_pretty_xml()`` .
+
+    **Yields:**
+        (str)
+            The opening tag, the full text of each child, and the closing
+            tag. An element without children is yielded whole.
+
+    Joined, the chunks are identical to ``compact_xml()`` of the element with
+    ``children`` appended to it.
+
+    """
+    children = chain(list(element), children or ())
+    first = next(children, None)
+    if first is None:
+        yield compact_xml(element)
+        return
+    yield _open_tag(element, 0, pretty=False)
+    if element.text:
+        yield _escape(element.text, _TEXT_ESCAPES)
+    for child in chain((first,), children):
+        yield compact_xml(child)
+        if child.tail:
+            yield _escape(child.tail, _TEXT_ESCAPES)
+    yield _close_tag(element, 0, pretty=False)
+
+# ==============================================================================
+
+
+def iter_pretty_xml(element, level=0, children=None):
+    """Yields the pretty printed XML of an element in a few large chunks
+
+    **Args:**
+        element : (<xml.etree.ElementTree.Element>)
+            The element to serialize.
+
+        level=0 : (int)
+            How many indents deep the element is.
+
+        children=None : (iter)
+            Extra child elements, serialized after the element's own children.
+            They are pulled one at a time as the chunks are consumed, so a
+            generator can supply them without the full tree ever existing.
+
+    **Yields:**
+        (str)
+            The opening tag line, the full text of each child, and the
+            closing tag line. An element without children is yielded whole.
+
+    Joined, the chunks are identical to ``pretty_xml()`` of the element with
+    ``children`` appended to it.
+
+    """
+    children = chain(list(element), children or ())
+    first = next(children, None)
+    if first is None:
+        yield pretty_xml(element, level)
+        return
+    yield _open_tag(element, level)
+    if element.text:
+        yield _text_xml(element.text, level + 1)
+    for child in chain((first,), children):
+        yield pretty_xml(child, level + 1)
+        if child.tail:
+            yield _text_xml(child.tail, level + 1)
+    yield _close_tag(element, level)
+
+# ==============================================================================
+
+
+def pretty_xml(element, level=0):
+    """Returns an element as pretty printed XML text in a single pass
+
+    **Args:**
+        element : (<xml.etree.ElementTree.Element>)
+            The element to serialize.
+
+        level=0 : (int)
+            How many indents deep the element is.
+
+    **Returns:**
+        (str)
+            The element and its children, indented with 4 spaces per level
+            and ending with a newline. Elements holding only text are kept
+            on one line, elements with no content are self closing.
+
+    **Raises:**
+        N/A
+
+    The output is identical to serializing the element with ElementTree,
+    parsing it with ``minidom`` and calling ``toprettyxml(indent="    ")`` ,
+    without the XML declaration.
+
+    """
+    parts = []
+    _append_pretty(element, level, parts.append)
+    return ''.join(parts)
+
+# ==============================================================================
+# PRIVATE FUNCTIONS
+# ==============================================================================
+
+
+def _append_compact(element, append):
+    """Passes the compact pieces of element and its children to append"""
+    tag = element.tag
+    attrib = _attrib_xml(element)
+    children = list(element)
+    text = element.text
+    if not children and not text:
+        append('<' + tag + attrib + '/>')
+        return
+    append('<' + tag + attrib + '>')
+    if text:
+        append(_escape(text, _TEXT_ESCAPES))
+    for child in children:
+        _append_compact(child, append)
+        if child.tail:
+            append(_escape(child.tail, _TEXT_ESCAPES))
+    append('</' + tag + '>')
+
+# ==============================================================================
+
+
+def _append_pretty(element, level, append):
+    """Passes the pretty printed pieces of element and children to append"""
+    # Strings are concatenated rather than formatted, since that's quicker
+    # and lets unicode text through under python 2.
+    pad = XML_INDENT * level
+    tag = element.tag
+    attrib = _attrib_xml(element)
+    children = list(element)
+    text = element.text
+    if children:
+        append(pad + '<' + tag + attrib + '>\n')
+        if text:
+            append(_text_xml(text, level + 1))
+        for child in children:
+            _append_pretty(child, level + 1, append)
+            if child.tail:
+                append(_text_xml(child.tail, level + 1))
+        append(pad + '</' + tag + '>\n')
+    elif text:
+        append(
+            pad + '<' + tag + attrib + '>' + _escape(text, _TEXT_ESCAPES) +
+            '</' + tag + '>\n'
+        )
+    else:
+        append(pad + '<' + tag + attrib + '/>\n')
+
+# ==============================================================================
+
+
+def _attrib_xml(element):
+    """Returns the attributes of element as they appear in the opening tag"""
+    if not element.attrib:
+        return ''
+    items = element.attrib.items()
+    if _SORTED_ATTRIBS:  # pragma: no cover
+        items = sorted(items)
+    return ''.join(
+        ' ' + name + '="' +
+        _escape(value, _ATTRIB_ESCAPES, not _ATTRIB_KEEPS_CR) + '"'
+        for name, value in items
+    )
+
+# ==============================================================================
+
+
+def _close_tag(element, level, pretty=True):
+    """Returns the closing tag (line, if pretty) of an element"""
+    if not pretty:
+        return '</' + element.tag + '>'
+    return XML_INDENT * level + '</' + element.tag + '>\n'
+
+# ==============================================================================
+
+
+def _escape(text, escapes, newlines=True):
+    """Escapes text for XML, normalizing line endings like a parser would"""
+    if newlines and '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    for char, entity in escapes:
+        if char in text:
+            text = text.replace(char, entity)
+    return text
+
+# ==============================================================================
+
+
+def _has_newlines(element):
+    """Returns True if any text or attribute in the tree holds a line break"""
+    for text in (element.text, element.tail):
+        if text and ('\n' in text or '\r' in text):
+            return True
+    for value in element.attrib.values():
+        if '\n' in value or '\r' in value:
+            return True
+    for child in element:
+        if _has_newlines(child):
+            return True
+    return False
+
+# ==============================================================================
+
+
+def _indent(text, level):
+    """Indents every line of pretty printed text by level more indents"""
+    pad = XML_INDENT * level
+    return pad + text[:-1].replace('\n', '\n' + pad) + '\n'
+
+# ==============================================================================
+
+
+def _iter_wrapped(element, fragments, pretty=True):
+    """Yields a root element's tags around its children and fragments"""
+    if pretty:
+        parts = (pretty_xml(child, 1) for child in element)
+    else:
+        parts = (compact_xml(child) for child in element)
+    parts = chain(parts, fragments)
+    first = next(parts, None)
+    if first is None:
+        yield pretty_xml(element) if pretty else compact_xml(element)
+        return
+    yield _open_tag(element, 0, pretty)
+    yield first
+    for part in parts:
+        yield part
+    yield _close_tag(element, 0, pretty)
+
+# ==============================================================================
+
+
+def _open_tag(element, level, pretty=True):
+    """Returns the opening tag (line, if pretty) of an element with children"""
+    tag = '<' + element.tag + _attrib_xml(element) + '>'
+    if not pretty:
+        return tag
+    return XML_INDENT * level + tag + '\n'
+
+# ==============================================================================
+
+
+def _text_xml(text, level):
+    """Returns a text node between elements on its own indented line"""
+    return _escape(XML_INDENT * level + text + '\n', _TEXT_ESCAPES)
+
+# ==============================================================================
+
+
+def _weak_ref(value):
+    """Returns a callable returning value, holding it weakly if possible
+
+    Values that can't be weakly referenced, such as strings, are held
+    strongly. None is returned for None.
+
+    """
+    if value is None:
+        return None
+    try:
+        return weakref.ref(value)
+    except TypeError:
+        return lambda: value
+
+# ==============================================================================
+
+
+def _wrap_fragments(element, fragments, level=0, pretty=True):
+    """Returns an element's XML around already serialized child fragments
+
+    element must have no text, and its own children are ignored.
+
+    """
+    if not fragments:
+        return pretty_xml(element, level) if pretty else compact_xml(element)
+    return (
+        _open_tag(element, level, pretty) + ''.join(fragments) +
+        _close_tag(element, level, pretty)
+    )
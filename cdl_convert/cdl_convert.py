@@ -144,6 +144,58 @@ def parse_args():
              "formats. This means that a single input CDL will export multiple "
              "CDL files, one per color decision."
     )
+    parser.add_argument(
+        "--compact",
+        action='store_true',
+        help="writes XML formats without indenting or line breaks between "
+             "elements. Files are smaller and faster to write and parse, "  # pylint: disable=C0330
+             "but harder for people to read."  # pylint: disable=C0330
+    )
+    parser.add_argument(
+        "--archive",
+        choices=write.ARCHIVE_FORMATS,
+        help="writes the files of single file formats (such as with "
+             "'--single' or 'cc' output) as members of one archive of this "  # pylint: disable=C0330
+             "format instead of as separate files. The archive is named "  # pylint: disable=C0330
+             "after the input file and saved in the destination."  # pylint: disable=C0330
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of files to write at once when writing a file per "
+             "color correction, such as with '--single' or 'cc' output. "  # pylint: disable=C0330
+             "Corrections are still converted one at a time, but opening "  # pylint: disable=C0330
+             "and writing files overlaps, which helps most on network "  # pylint: disable=C0330
+             "storage. Defaults to 1."  # pylint: disable=C0330
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action='store_true',
+        help="compares each output with the file already at its "
+             "destination and leaves identical files untouched, keeping "  # pylint: disable=C0330
+             "their modification times. Changed files are written to a "  # pylint: disable=C0330
+             "temporary file and renamed into place, so an interrupted "  # pylint: disable=C0330
+             "run never leaves a partial file."  # pylint: disable=C0330
+    )
+    parser.add_argument(
+        "--precision",
+        type=int,
+        help="rounds slope, offset, power and saturation values to this "
+             "many decimal places when writing, such as 6. By default "  # pylint: disable=C0330
+             "values are written with exactly the digits they were read "  # pylint: disable=C0330
+             "with."  # pylint: disable=C0330
+    )
+    parser.add_argument(
+        "--csv-columns",
+        help="comma separated list of field=header pairs naming the columns "
+             "csv files are read from and written to, for spreadsheets whose "  # pylint: disable=C0330
+             "columns aren't named after the fields, such as "  # pylint: disable=C0330
+             "'id=Shot,sat=Saturation'. Fields are: {fields}, and slope, "  # pylint: disable=C0330
+             "offset, power or sop for a column holding 3 or 9 values."  # pylint: disable=C0330
+             "".format(fields=', '.join(parse.CSV_FIELDS))  # pylint: disable=C0330
+    )
 
     args = parser.parse_args()
 
@@ -179,12 +231,54 @@ def parse_args():
     else:
         args.output = ['cc', ]
 
+    if args.jobs < 1:
+        raise ValueError(
+            "The number of jobs: {jobs} must be at least 1".format(
+                jobs=args.jobs
+            )
+        )
+
+    if args.precision is not None and args.precision < 0:
+        raise ValueError(
+            "The precision: {precision} cannot be negative".format(
+                precision=args.precision
+            )
+        )
+
+    if args.csv_columns:
+        columns = {}
+        for pair in args.csv_columns.split(','):
+            field, equals, header = pair.partition('=')
+            if not equals or not field.strip() or not header.strip():
+                raise ValueError(
+                    "The csv column: {pair} is not a field=header "
+                    "pair".format(
+                        pair=pair
+                    )
+                )
+            columns[field.strip()] = header.strip()
+        # Unknown fields raise ValueError here, before anything is parsed
+        parse._csv_layout(columns)  # pylint: disable=W0212
+        args.csv_columns = columns
+
     if not args.destination:
         args.destination = './converted/'
 
     if args.halt:
         config.HALT_ON_ERROR = True
 
+    if args.compact:
+        config.PRETTY_XML = False
+
+    if args.skip_unchanged:
+        config.SKIP_UNCHANGED = True
+
+    if args.precision is not None:
+        config.NUMBER_PRECISION = args.precision
+
+    if args.csv_columns:
+        config.CSV_COLUMNS = args.csv_columns
+
     return args
 
 # ==============================================================================
@@ -221,6 +315,17 @@ def main():  # pylint: disable=R0912
 
     color_decisions = parse.parse_file(filepath, filetype_in)
 
+    # How many files were written, skipped as unchanged or failed to write
+    counts = {'written': 0, 'skipped': 0, 'failed': 0}
+
+    def count_write(written, path):
+        """Counts the result of an OUTPUT_FORMATS function"""
+        if written is False:
+            counts['skipped'] += 1
+            print("Skipped unchanged file {path}".format(path=path))
+        else:
+            counts['written'] += 1
+
     def write_single_file(cdl, ext):
         """Writes a single color correction file"""
         cdl.determine_dest(ext, destination_dir)
@@ -231,19 +336,103 @@ def main():  # pylint: disable=R0912
             )
         )
         if not args.no_output:
-            write.OUTPUT_FORMATS[ext](cdl)
+            count_write(write.OUTPUT_FORMATS[ext](cdl), cdl.file_out)
+
+    def write_single_files(cdls, ext, archive=None):
+        """Writes a file per color correction, counting the results"""
+        if archive:
+            for cdl in cdls:
+                archive.write(cdl, ext)
+                print(
+                    "Writing cdl {id} to {name}".format(
+                        id=cdl.id,
+                        name=cdl.file_out
+                    )
+                )
+            counts['written'] += len(cdls)
+            return
+
+        if args.jobs == 1 or args.no_output:
+            for cdl in cdls:
+                write_single_file(cdl, ext)
+            return
+
+        for cdl in cdls:
+            cdl.determine_dest(ext, destination_dir)
+            print(
+                "Writing cdl {id} to {path}".format(
+                    id=cdl.id,
+                    path=cdl.file_out
+                )
+            )
+        skipped, failures = write.write_single_files(cdls, ext, jobs=args.jobs)
+        for cdl in skipped:
+            print("Skipped unchanged file {path}".format(path=cdl.file_out))
+        for cdl, err in failures:
+            print(
+                "Failed to write cdl {id} to {path}: {error}".format(
+                    id=cdl.id,
+                    path=cdl.file_out,
+                    error=err
+                )
+            )
+        counts['written'] += len(cdls) - len(skipped) - len(failures)
+        counts['skipped'] += len(skipped)
+        counts['failed'] += len(failures)
 
     def write_collection_file(col, ext):
         """Writes a collection file"""
-        col.type = ext
-        col.determine_dest(destination_dir)
+        if ext in ['ccc', 'cdl']:
+            col.type = ext
+        col.determine_dest(destination_dir, ext)
         print(
             "Writing collection to {path}".format(
                 path=col.file_out
             )
         )
         if not args.no_output:
-            write.OUTPUT_FORMATS[ext](col)
+            count_write(write.OUTPUT_FORMATS[ext](col), col.file_out)
+
+    def write_collection_files(col, exts, single_exts, cdls, archive=None):
+        """Writes collection formats, and any single files, in one walk"""
+        outputs = {}
+        for ext in exts:
+            col.determine_dest(destination_dir, ext)
+            outputs[ext] = col.file_out
+            print("Writing collection to {path}".format(path=col.file_out))
+
+        def write_singles(cdl):
+            """Writes a correction in every single file format"""
+            for ext in single_exts:
+                write_single_files([cdl], ext, archive)
+
+        if args.jobs == 1 or archive:
+            # Each correction's files are written as the walk reaches it
+            written = write.write_fanout(col, outputs, each=write_singles)
+        else:
+            written = write.write_fanout(col, outputs)
+            for ext in single_exts:
+                write_single_files(cdls, ext, archive)
+        for ext in exts:
+            count_write(written[ext], outputs[ext])
+
+    def export_collection():
+        """Returns a collection holding what was read, to write from"""
+        if filetype_in in config.COLLECTION_FORMATS:
+            # If we read a collection type, color_decisions is already a
+            # ColorCollection.
+            return color_decisions
+        # If we read a single, non-collection file, we need to create a
+        # collection for exporting.
+        #
+        # Since we only read a single file, we can safely use that filepath
+        # as the input_file.
+        #
+        # If we read a group of files, we would want to default to the
+        # generic collection naming.
+        collection = ColorCollection(input_file=filepath)
+        collection.append_child(color_decisions)
+        return collection
 
     if color_decisions:
         # Sanity Check
@@ -258,30 +447,65 @@ def main():  # pylint: disable=R0912
                 sanity_check(color_decisions)
 
         # Writing
-        for ext in args.output:
-            if ext in config.SINGLE_FORMATS or args.single:
-                if filetype_in in config.COLLECTION_FORMATS:
-                    for color_correct in color_decisions.color_corrections:
-                        write_single_file(color_correct, ext)
-                    for decision in color_decisions.color_decisions:
-                        if not decision.is_ref:
-                            write_single_file(decision.cc, ext)
-                else:
-                    write_single_file(color_decisions, ext)
+        archive = None
+        if args.archive and not args.no_output and (
+                args.single or set(args.output) & set(config.SINGLE_FORMATS)
+        ):
+            # Single files all go into one archive named after the input
+            archive_path = os.path.join(
+                destination_dir,
+                '{name}.{ext}'.format(
+                    name=os.path.splitext(os.path.basename(filepath))[0],
+                    ext=args.archive
+                )
+            )
+            print("Writing single files to {path}".format(path=archive_path))
+            archive = write.ArchiveWriter(archive_path, args.archive)
+        try:
+            if filetype_in in config.COLLECTION_FORMATS:
+                cdls = list(color_decisions.color_corrections)
+                for decision in color_decisions.color_decisions:
+                    if not decision.is_ref:
+                        cdls.append(decision.cc)
             else:
-                if filetype_in in config.COLLECTION_FORMATS:
-                    # If we read a collection type, color_decisions is
-                    # already a ColorCollection.
-                    write_collection_file(color_decisions, ext)
+                cdls = [color_decisions]
+            single_exts = [
+                ext for ext in args.output
+                if ext in config.SINGLE_FORMATS or args.single
+            ]
+
+            # When collection formats that can be streamed are written along
+            # with other formats, they're all written in one walk.
+            fanout_exts = []
+            if len(args.output) > 1 and not args.no_output:
+                fanout_exts = [
+                    ext for ext in args.output
+                    if ext in write.FANOUT_FORMATS and ext not in single_exts
+                ]
+            if fanout_exts:
+                collection = export_collection()
+                write_collection_files(
+                    collection, fanout_exts, single_exts, cdls, archive
+                )
+
+            for ext in args.output:
+                if ext in fanout_exts:
+                    # Leave the type writing each in turn would have left
+                    if ext in ['ccc', 'cdl']:
+                        collection.type = ext
+                elif ext in single_exts:
+                    if not fanout_exts:
+                        write_single_files(cdls, ext, archive)
                 else:
-                    # If we read a single, non-collection file, we need to
-                    # create a collection for exporting.
-                    #
-                    # Since we only read a single file, we can safely use that
-                    # filepath as the input_file.
-                    #
-                    # If we read a group of files, we would want to default to
-                    # the generic collection naming.
-                    collection = ColorCollection(input_file=filepath)
-                    collection.append_child(color_decisions)
-                    write_collection_file(collection, ext)
+                    write_collection_file(export_collection(), ext)
+        finally:
+            if archive:
+                archive.close()
+
+        if not args.no_output:
+            print(
+                "Files written: {written}, skipped as unchanged: {skipped}, "
+                "failed: {failed}".format(**counts)
+            )
+        if counts['failed']:
+            return 1
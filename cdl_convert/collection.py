@@ -55,10 +55,27 @@ from xml.etree import ElementTree
 
 # cdl_convert imports
 
-from .base import AscColorSpaceBase, AscDescBase, AscXMLBase
+from .base import (
+    _iter_wrapped, _wrap_fragments, AscColorSpaceBase, AscDescBase,
+    AscXMLBase, WeakMemberList
+)
 from . import config
-from .correction import ColorCorrection
-from .decision import ColorDecision
+from .correction import ColorCorrection, _sanitize
+from .decision import ColorDecision, MediaRef
+from .utils import validate_values
+
+# ==============================================================================
+# GLOBALS
+# ==============================================================================
+
+# Version of the ASC CDL XML schema we write
+_XMLNS = 'urn:ASC:CDL:v1.01'
+
+# Policies for handling children sharing an id in merge_collections()
+MERGE_CONFLICTS = ('first', 'last', 'error', 'rename')
+
+# Order of the fields of sequence records given to from_records()
+_RECORD_FIELDS = ('id', 'slope', 'offset', 'power', 'sat', 'desc')
 
 # ==============================================================================
 # EXPORTS
@@ -90,6 +107,10 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
             This is currently only used for determining an id value when
             exporting and no file_in attribute is set.
 
+            The list only holds weak references. A garbage collected
+            :class:`ColorCollection` drops out of the list, but the remaining
+            members keep the index they were registered with.
+
     **Attributes:**
 
         all_children : (:class:`ColorCorrection`, :class:`ColorDecision`)
@@ -194,13 +215,26 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
             will be copied, but that the child instances themselves will
             not be.
 
+        from_arrays()
+            Class method that builds a new :class:`ColorCollection` of new
+            :class:`ColorCorrection` from parallel sequences (or NumPy
+            arrays) of ids and values, validating and allocating ids for all
+            of them at once.
+
+        from_records()
+            Class method that builds a new :class:`ColorCollection` like
+            ``from_arrays()`` , from a sequence of records holding the values
+            of one :class:`ColorCorrection` each.
+
         merge_collections()
             Merges all members of a list containing :class:`ColorCollection`
             and the instance this is called on to return a new
             :class:`ColorCollection` that is primarily a copy of this instance,
             but contains all children and description elements from the given
             collections. `input_desc`, `viewing_desc`, `file_in`, and `type`
-            will be set to the values of the parent instance.
+            will be set to the values of the parent instance. Children are
+            kept in first seen order, and ``conflict`` chooses how children
+            sharing a :class:`ColorCorrection` id are resolved.
 
         parse_xml_color_corrections()
             Parses an ElementTree element to find & add all ColorCorrection.
@@ -235,9 +269,15 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
             Switches the ``type`` of this collection to export a ``cdl`` style
             xml collection by default.
 
+        xml_fragment()
+            Returns the XML text of the collection. Children's cached text is
+            joined rather than building the full element tree, so ``xml``
+            and ``xml_root`` reuse any earlier export of the same
+            corrections. Overrides :class:`AscXMLBase` .
+
     """
 
-    members = []
+    members = WeakMemberList()
 
     def __init__(self, input_file=None):
         super(ColorCollection, self).__init__()
@@ -247,10 +287,46 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
         self._file_in = os.path.abspath(input_file) if input_file else None
         self._file_out = None
         self._type = 'ccc'
-        self._xmlns = "urn:ASC:CDL:v1.01"
+        self._xmlns = _XMLNS
 
         ColorCollection.members.append(self)
 
+    # Pickling ================================================================
+
+    def __reduce__(self):
+        """Rebuilds through __init__ so we are registered on load"""
+        return ColorCollection, (), self.__getstate__()
+
+    def __getstate__(self):
+        """Returns only the fields needed to rebuild this collection"""
+        return (
+            self._file_in,
+            self._file_out,
+            self._type,
+            self.input_desc,
+            self.viewing_desc,
+            tuple(self._desc),
+            tuple(self._color_corrections),
+            tuple(self._color_decisions),
+        )
+
+    def __setstate__(self, state):
+        """Restores fields and the parentage of all children"""
+        (
+            self._file_in,
+            self._file_out,
+            self._type,
+            self.input_desc,
+            self.viewing_desc,
+            desc,
+            color_corrections,
+            color_decisions,
+        ) = state
+        self._desc = list(desc)
+        self._color_corrections = list(color_corrections)
+        self._color_decisions = list(color_decisions)
+        self.set_parentage()
+
     # Properties ==============================================================
 
     @property
@@ -354,7 +430,12 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
                             class_name=color_class.__name__
                         )
                     )
-            return list(set(values))
+            # Remove duplicates, keeping the given order.
+            seen = set()
+            return [
+                color for color in values
+                if not (color in seen or seen.add(color))
+            ]
         elif values.__class__ == color_class:
             # If we just got passed the correct class, we'll return it as a
             # one member list.
@@ -370,10 +451,10 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
                 )
             )
 
-    # Public Methods ==========================================================
+    # =========================================================================
 
-    def append_child(self, child):
-        """Appends a given child to the correct list of children"""
+    def _append_child(self, child, ids):
+        """Appends child, checking for duplicates against the set of ids"""
         # We need to make sure not to append a ColorDecision or ColorCorrection
         # if that id attribute already exists as a direct child or a child of a
         # ColorDecision child.
@@ -385,16 +466,19 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
         dup = False
 
         if child.__class__ == ColorCorrection:
-            if child.id in self.id_list:
+            if child.id in ids:
                 dup = True
             else:
                 self._color_corrections.append(child)
+                ids.add(child.id)
 
         elif child.__class__ == ColorDecision:
-            if not child.is_ref and child.cc.id in self.id_list:
+            if not child.is_ref and child.cc.id in ids:
                 dup = True
             else:
                 self._color_decisions.append(child)
+                if not child.is_ref:
+                    ids.add(child.cc.id)
         else:
 
             raise TypeError("Can only append ColorCorrection and "
@@ -416,10 +500,180 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
 
     # =========================================================================
 
+    def _copy_metadata(self):
+        """Returns a new, childless collection with our metadata"""
+        new_col = ColorCollection()
+        new_col.desc = self.desc
+        new_col.file_in = self.file_in if self.file_in else None
+        new_col.input_desc = self.input_desc
+        new_col.viewing_desc = self.viewing_desc
+        new_col.type = self.type
+        return new_col
+
+    # =========================================================================
+
+    def _iter_elements_ccc(self):
+        """Yields the CCC child elements one at a time, building each lazily"""
+        for color_correct in self.color_corrections:
+            yield color_correct.element
+        # We'll need to extract the ColorCorrections from the ColorDecisions
+        for color_decision in self.color_decisions:
+            color_correction = _decision_correction(color_decision)
+            if color_correction:
+                yield color_correction.element
+
+    # =========================================================================
+
+    def _iter_elements_cdl(self):
+        """Yields the CDL child elements one at a time, building each lazily"""
+        ids = set(self.id_list) if self.color_decisions else ()
+        for color_decision in self.color_decisions:
+            yield _decision_element(color_decision, ids)
+
+        if self.color_corrections:
+            # We need to store the ColorDecision member dictionary, so that
+            # we can return it to the state it was in prior to us creating
+            # temporary ColorDecisions
+            color_decisions_members = ColorDecision.members
+
+            for color_correction in self.color_corrections:
+                yield _wrapped_element(color_correction)
+
+            # Now reset the ColorDecision member dictionary to the state it was
+            # in prior to us creating temp ColorDecisions
+            ColorDecision.members = color_decisions_members
+
+    # =========================================================================
+
+    def _iter_fragments_ccc(self, pretty=True):
+        """Yields the XML text of each CCC child at the first indent level"""
+        for color_correct in self.color_corrections:
+            yield color_correct.xml_fragment(1, pretty)
+        for color_decision in self.color_decisions:
+            color_correction = _decision_correction(color_decision)
+            if color_correction:
+                yield color_correction.xml_fragment(1, pretty)
+
+    # =========================================================================
+
+    def _iter_fragments_cdl(self, pretty=True):
+        """Yields the XML text of each CDL child at the first indent level"""
+        ids = set(self.id_list) if self.color_decisions else ()
+        for color_decision in self.color_decisions:
+            yield _decision_fragment(color_decision, ids, pretty)
+        for color_correction in self.color_corrections:
+            yield _wrapped_fragment(color_correction, pretty)
+
+    # =========================================================================
+
+    def _iter_xml(self, pretty=True):
+        """Yields our XML one child at a time, never building the full tree
+
+        Children are written from their cached ``xml_fragment()`` text, so
+        only the root and any ColorDecision descriptions are serialized anew.
+
+        """
+        if self.is_ccc:
+            root_xml = _root_element(self, 'ColorCorrectionCollection')
+            fragments = self._iter_fragments_ccc(pretty)
+        else:
+            root_xml = _root_element(self, 'ColorDecisionList')
+            fragments = self._iter_fragments_cdl(pretty)
+
+        return _iter_wrapped(root_xml, fragments, pretty)
+
+    # =========================================================================
+
+    def _merge_children(self, sources, conflict, dedup_content):
+        """Merges the children of sources into our empty child lists
+
+        Runs in a single pass over all children, keeping first seen order.
+        See ``merge_collections()`` for the arguments.
+
+        """
+        lists = {
+            ColorCorrection: self._color_corrections,
+            ColorDecision: self._color_decisions,
+        }
+        # The same object appearing twice is never a conflict.
+        seen = set()
+        # ColorCorrection id -> (child list, index in that list)
+        ids = {}
+        contents = set()
+
+        for col in sources:
+            for child in col.all_children:
+                if id(child) in seen:
+                    continue
+                seen.add(id(child))
+
+                if child.__class__ == ColorCorrection:
+                    color_correct = child
+                elif child.is_ref:
+                    # References carry no ColorCorrection of their own.
+                    self._color_decisions.append(child)
+                    continue
+                else:
+                    color_correct = child.cc
+
+                if dedup_content and child.__class__ == ColorCorrection:
+                    content = color_correct.value.grade
+                    if content in contents:
+                        continue
+                    contents.add(content)
+
+                children = lists[child.__class__]
+
+                if color_correct.id in ids:
+                    if conflict == 'first':
+                        continue
+                    elif conflict == 'error':
+                        raise ValueError(
+                            "Cannot merge collections, the ColorCorrection "
+                            "id '{id}' is used by more than one "
+                            "child.".format(id=color_correct.id)
+                        )
+                    elif conflict == 'last':
+                        old_list, index = ids[color_correct.id]
+                        if old_list is children:
+                            children[index] = child
+                            continue
+                        # Different child types, so leave a hole to
+                        # filter out and add the new child at the end.
+                        old_list[index] = None
+                    elif conflict == 'rename':
+                        # The source collections keep their child as it is
+                        child = _renamed_copy(
+                            child, _free_id(color_correct.id, ids)
+                        )
+                        if child.__class__ == ColorCorrection:
+                            color_correct = child
+                        else:
+                            color_correct = child.cc
+
+                ids[color_correct.id] = (children, len(children))
+                children.append(child)
+
+        self._color_corrections[:] = [
+            child for child in self._color_corrections if child is not None
+        ]
+        self._color_decisions[:] = [
+            child for child in self._color_decisions if child is not None
+        ]
+
+    # Public Methods ==========================================================
+
+    def append_child(self, child):
+        """Appends a given child to the correct list of children"""
+        return self._append_child(child, set(self.id_list))
+
+    # =========================================================================
+
     def append_children(self, children):
         """Appends an entire list to the correctly list of children"""
+        ids = set(self.id_list)
         for child in children:
-            self.append_child(child)
+            self._append_child(child, ids)
 
     # =========================================================================
 
@@ -434,35 +688,9 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
 
     def build_element_ccc(self):
         """Builds a CCC XML element representing this ColorCollection"""
-        ccc_xml = ElementTree.Element('ColorCorrectionCollection')
-        ccc_xml.attrib = {'xmlns': self.xmlns}
-        if self.input_desc:
-            input_desc = ElementTree.SubElement(ccc_xml, 'InputDescription')
-            input_desc.text = self.input_desc
-        if self.viewing_desc:
-            viewing_desc = ElementTree.SubElement(ccc_xml, 'ViewingDescription')
-            viewing_desc.text = self.viewing_desc
-        for description in self.desc:
-            desc = ElementTree.SubElement(ccc_xml, 'Description')
-            desc.text = description
-        if self.color_corrections:
-            for color_correct in self.color_corrections:
-                ccc_xml.append(color_correct.element)
-        if self.color_decisions:
-            # We'll need to extract the ColorCorrections from the
-            # ColorDecisions
-            for color_decision in self.color_decisions:
-                if color_decision.is_ref:
-                    color_correction = color_decision.cc.cc
-                else:
-                    color_correction = color_decision.cc
-
-                # We do one last check to ensure that we actually have a
-                # returned ColorCorrection, as ColorCorrectionRef will
-                # return None if it's an unresolved reference and no
-                # HALT behavior was set.
-                if color_correction:
-                    ccc_xml.append(color_correction.element)
+        ccc_xml = _root_element(self, 'ColorCorrectionCollection')
+        for color_correct in self._iter_elements_ccc():
+            ccc_xml.append(color_correct)
 
         return ccc_xml
 
@@ -470,51 +698,9 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
 
     def build_element_cdl(self):
         """Builds a CDL XML element representing this ColorCollection"""
-        cdl_xml = ElementTree.Element('ColorDecisionList')
-        cdl_xml.attrib = {'xmlns': self.xmlns}
-        if self.input_desc:
-            input_desc = ElementTree.SubElement(cdl_xml, 'InputDescription')
-            input_desc.text = self.input_desc
-        if self.viewing_desc:
-            viewing_desc = ElementTree.SubElement(cdl_xml, 'ViewingDescription')
-            viewing_desc.text = self.viewing_desc
-        for description in self.desc:
-            desc = ElementTree.SubElement(cdl_xml, 'Description')
-            desc.text = description
-        if self.color_decisions:
-            for color_decision in self.color_decisions:
-                if color_decision.cc.id in self.id_list:
-                    resolve = False
-                else:
-                    try:
-                        color_correction = color_decision.cc.cc
-                    except ValueError:
-                        # ValueError will be raised if we can't resolve the
-                        # reference. This shouldn't be a game-stopper here.
-                        #
-                        # We'll just add the unresolved reference
-                        resolve = False
-                    else:
-                        resolve = True if color_correction else False
-
-                cdl_xml.append(color_decision.build_element(resolve=resolve))
-
-        if self.color_corrections:
-            # We'll create some temporary ColorDecision instances, and place
-            # the ColorCorrects inside of them.
-            #
-            # We need to store the ColorDecision member dictionary, so that
-            # we can return it to the state it was in prior to us creating
-            # these temporary ColorDecisions
-            color_decisions_members = ColorDecision.members
-
-            for color_correction in self.color_corrections:
-                color_decision = ColorDecision(color_correction)
-                cdl_xml.append(color_decision.element)
-
-            # Now reset the ColorDecision member dictionary to the state it was
-            # in prior to us creating temp ColorDecisions
-            ColorDecision.members = color_decisions_members
+        cdl_xml = _root_element(self, 'ColorDecisionList')
+        for color_decision in self._iter_elements_cdl():
+            cdl_xml.append(color_decision)
 
         return cdl_xml
 
@@ -522,19 +708,19 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
 
     def copy_collection(self):
         """Creates and returns a copy of this collection"""
-        new_col = ColorCollection()
-        new_col.desc = self.desc
-        new_col.file_in = self.file_in if self.file_in else None
-        new_col.input_desc = self.input_desc
-        new_col.viewing_desc = self.viewing_desc
-        new_col.type = self.type
+        new_col = self._copy_metadata()
         new_col.append_children(self.all_children)
         return new_col
 
     # =========================================================================
 
-    def determine_dest(self, directory):
-        """Determines the destination file and sets it on the cdl"""
+    def determine_dest(self, directory, ext=None):
+        """Determines the destination file and sets it on the cdl
+
+        The file is named after ``file_in`` , with ``ext`` as its extension,
+        or the collection's ``type`` if ``ext`` isn't given.
+
+        """
         if self.file_in:
             filename = os.path.splitext(os.path.basename(self.file_in))[0]
         else:
@@ -542,37 +728,211 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
                 id=str(ColorCollection.members.index(self)).rjust(3, '0')
             )
 
-        filename = "{file_in}.{ext}".format(file_in=filename, ext=self.type)
+        filename = "{file_in}.{ext}".format(
+            file_in=filename, ext=ext if ext else self.type
+        )
 
         self._file_out = os.path.join(directory, filename)
 
     # =========================================================================
 
-    def merge_collections(self, collections):
-        """Merges multiple collections together and returns a new one"""
-        new_col = self.copy_collection()
+    @classmethod
+    def from_arrays(cls, ids, slope=None, offset=None, power=None, sat=None,
+                    desc=None):
+        """Builds a collection of new ColorCorrections in one step
+
+        **Args:**
+            ids : [str]
+                The ids of the new :class:`ColorCorrection` . Ids are
+                sanitized and deduplicated the same way as when initializing
+                a :class:`ColorCorrection` , or raise a ``ValueError`` if
+                ``HALT_ON_ERROR`` is set.
+
+            slope=None : [[(Decimal|str|float|int)]]
+                One rgb slope per id, given as three values or a single value
+                for all three. An entry of None leaves that correction's
+                slope at the default. Can be a NumPy array of shape (n, 3)
+                or (n, ).
+
+            offset=None : [[(Decimal|str|float|int)]]
+                Like ``slope`` , but negative values are allowed.
+
+            power=None : [[(Decimal|str|float|int)]]
+                Like ``slope`` .
+
+            sat=None : [(Decimal|str|float|int)]
+                One saturation value per id, or None.
+
+            desc=None : [[str]]
+                One list of descriptions, a single description or None per
+                id.
+
+        **Returns:**
+            (:class:`ColorCollection`)
+                A new ccc type collection containing the new
+                :class:`ColorCorrection` in the order of ``ids`` .
+
+        **Raises:**
+            TypeError:
+                If a value given is not a number.
 
-        # We need to move all the children into one big list, so that
-        # we can move it into a set to eliminate duplicates.
-        children = new_col.all_children
-        # Now that all of new_col's children are in the children list,
-        # let's clear out the new_col lists.
-        # We'll repopulate them with the full lists after adding
-        # all the additional children.
-        new_col.color_corrections = []
-        new_col.color_decisions = []
+            ValueError:
+                If a value sequence doesn't have one entry per id, if an rgb
+                entry doesn't have 3 values, or if ``HALT_ON_ERROR`` is set
+                and a value is negative or an id is blank or already used.
 
+        All values are checked with ``validate_values()`` before any
+        :class:`ColorCorrection` is created, and the corrections are built
+        without going through the per value setters or ``append_child()`` .
+        The first problem found is raised.
+
+        """
+        ids = list(_plain(ids))
+        count = len(ids)
+
+        checked = validate_values(slope, offset, power, sat, count)
+        if checked.errors:
+            raise checked.errors[0].error
+        descs = _bulk_column(desc, 'desc', count)
+
+        slopes, offsets, powers, sats = [
+            checked.values[name] for name in ('slope', 'offset', 'power', 'sat')
+        ]
+        corrections = []
+        for i, cc_id in enumerate(_allocate_ids(ids)):
+            sop = (slopes[i], offsets[i], powers[i])
+            if sop == (None, None, None):
+                sop = None
+            corrections.append(
+                ColorCorrection._from_validated(  # pylint: disable=W0212
+                    cc_id, sop, sats[i], descs[i]
+                )
+            )
+
+        new_col = cls()
+        new_col._color_corrections = corrections  # pylint: disable=W0212
+        new_col.set_parentage()
+        return new_col
+
+    # =========================================================================
+
+    @classmethod
+    def from_records(cls, records):
+        """Builds a collection of new ColorCorrections from records
+
+        **Args:**
+            records : [{str: }|()]
+                Each record holds the values for one
+                :class:`ColorCorrection` , either as a mapping with the keys
+                ``id``, ``slope``, ``offset``, ``power``, ``sat`` and
+                ``desc`` , or as a sequence in that order. Only ``id`` is
+                required. A NumPy structured array works as a sequence of
+                sequence records.
+
+        **Returns:**
+            (:class:`ColorCollection`)
+                See ``from_arrays()`` .
+
+        **Raises:**
+            TypeError:
+                If a value given is not a number.
+
+            ValueError:
+                If a sequence record has more fields than listed above, and
+                see ``from_arrays()`` .
+
+        """
+        columns = [[] for field in _RECORD_FIELDS]
+        for record in _plain(records):
+            if hasattr(record, 'get'):
+                values = [record.get(field) for field in _RECORD_FIELDS]
+            else:
+                values = list(record)
+                if len(values) > len(_RECORD_FIELDS):
+                    raise ValueError(
+                        'Record "{record}" has more than the {count} fields '
+                        '{fields}.'.format(
+                            record=record,
+                            count=len(_RECORD_FIELDS),
+                            fields=_RECORD_FIELDS
+                        )
+                    )
+                values.extend([None] * (len(_RECORD_FIELDS) - len(values)))
+            for column, value in zip(columns, values):
+                column.append(value)
+
+        return cls.from_arrays(*columns)
+
+    # =========================================================================
+
+    def merge_collections(self, collections, conflict=None,
+                          dedup_content=False):
+        """Merges multiple collections together and returns a new one
+
+        **Args:**
+            collections : [:class:`ColorCollection`]
+                The collections to merge with this one. This instance is
+                skipped if found in the list.
+
+            conflict=None : (str)
+                What to do when different children share a
+                :class:`ColorCorrection` id:
+
+                    * ``first`` keeps the first child seen.
+                    * ``last`` keeps the last child seen, at the position of
+                        the first one if both are the same type.
+                    * ``error`` raises a ``ValueError``.
+                    * ``rename`` adds a copy of the later child, whose
+                        :class:`ColorCorrection` has a new, unused id. The
+                        child itself is left as it is.
+
+                Defaults to ``error`` if ``HALT_ON_ERROR`` is set, and
+                ``first`` if not.
+
+            dedup_content=False : (bool)
+                If True, direct :class:`ColorCorrection` children with the
+                same SOP and Sat values as an earlier one are dropped, even
+                if their ids differ.
+
+        **Returns:**
+            (:class:`ColorCollection`)
+                A new collection whose metadata is copied from this
+                instance, with the descriptions of all collections and the
+                children of all collections in first seen order. All
+                children are reparented to the new collection.
+
+        **Raises:**
+            ValueError:
+                If ``conflict`` is not a known policy, or is ``error`` and
+                two children share an id.
+
+        The same child object found in several collections is always kept
+        once. This runs in a single pass, in time proportional to the total
+        number of children.
+
+        """
+        if conflict is None:
+            conflict = 'error' if config.HALT_ON_ERROR else 'first'
+        if conflict not in MERGE_CONFLICTS:
+            raise ValueError(
+                "Merge conflict policy must be one of {policies}, not "
+                "'{conflict}'.".format(
+                    policies=MERGE_CONFLICTS,
+                    conflict=conflict
+                )
+            )
+
+        new_col = self._copy_metadata()
+
+        sources = [self]
         for col in collections:
             if col == self:  # Don't add ourselves
                 continue
             new_col.desc.extend(col.desc)
-            children.extend(col.all_children)
+            sources.append(col)
 
-        new_col.append_children(children)
-
-        # Remove duplicates
-        new_col.color_corrections = set(new_col.color_corrections)
-        new_col.color_decisions = set(new_col.color_decisions)
+        new_col._merge_children(sources, conflict, dedup_content)  # pylint: disable=W0212
+        new_col.set_parentage()
 
         return new_col
 
@@ -641,7 +1001,7 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
     @classmethod
     def reset_members(cls):
         """Resets the member list"""
-        cls.members = []
+        cls.members = WeakMemberList()
 
     # =========================================================================
 
@@ -661,3 +1021,211 @@ class ColorCollection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
     def set_to_cdl(self):
         """Switches the type of the ColorCollection to export .cdl style xml"""
         self._type = 'cdl'
+
+    # =========================================================================
+
+    def xml_fragment(self, level=0, pretty=True):
+        """Returns our XML text, built from our children's cached fragments"""
+        if level:
+            return super(ColorCollection, self).xml_fragment(level, pretty)
+        return ''.join(self._iter_xml(pretty))
+
+# ==============================================================================
+# PRIVATE FUNCTIONS
+# ==============================================================================
+
+
+def _allocate_ids(ids, taken=None):
+    """Sanitizes ids and renames blank or used ones, all in a single pass
+
+    taken can hold ids to treat as used besides those registered, and is
+    updated with the ids allocated, so ids can be allocated in batches.
+
+    """
+    halt = config.HALT_ON_ERROR
+    if taken is None:
+        taken = set()
+    counters = {}
+    allocated = []
+    for cc_id in ids:
+        cc_id = _sanitize(cc_id)
+        if not cc_id:
+            if halt:
+                raise ValueError('Blank id given to ColorCorrection.')
+            cc_id = _free_id('', taken, counters)
+        elif cc_id in taken or cc_id in ColorCorrection.members:
+            if halt:
+                raise ValueError(
+                    'Error initiating id to "{id}". This id is already a '
+                    'registered id.'.format(
+                        id=cc_id
+                    )
+                )
+            cc_id = _free_id(cc_id, taken, counters)
+        taken.add(cc_id)
+        allocated.append(cc_id)
+    return allocated
+
+# ==============================================================================
+
+
+def _bulk_column(values, name, count):
+    """Returns values as a list with one entry per id, or a list of None"""
+    if values is None:
+        return [None] * count
+    values = list(_plain(values))
+    if len(values) != count:
+        raise ValueError(
+            'Error building corrections: {length} {name} values given for '
+            '{count} ids. Give one entry per id, using None for missing '
+            'values.'.format(
+                length=len(values),
+                name=name,
+                count=count
+            )
+        )
+    return values
+
+# ==============================================================================
+
+
+def _decision_correction(color_decision):
+    """Returns the ColorCorrection a decision holds or references, or None"""
+    if color_decision.is_ref:
+        # ColorCorrectionRef will return None if it's an unresolved reference
+        # and no HALT behavior was set.
+        return color_decision.cc.cc
+    return color_decision.cc
+
+# ==============================================================================
+
+
+def _decision_element(color_decision, ids):
+    """Builds a CDL decision element, resolving references outside ids"""
+    return color_decision.build_element(
+        resolve=_resolves(color_decision, ids)
+    )
+
+# ==============================================================================
+
+
+def _decision_fragment(color_decision, ids, pretty=True):
+    """Returns a CDL decision's XML text, resolving references outside ids"""
+    return color_decision.xml_fragment(
+        1, pretty, resolve=_resolves(color_decision, ids)
+    )
+
+# ==============================================================================
+
+
+def _free_id(cc_id, taken, counters=None):
+    """Returns a ColorCorrection id based on cc_id that isn't in use
+
+    counters can hold the next number to try for each cc_id, so that many
+    renames of the same id don't each start counting from 1.
+
+    """
+    num = counters.get(cc_id, 1) if counters is not None else 1
+    while True:
+        new_id = '{id}{num:0>3}'.format(id=cc_id, num=num)
+        num += 1
+        if new_id not in ColorCorrection.members and new_id not in taken:
+            if counters is not None:
+                counters[cc_id] = num
+            return new_id
+
+# ==============================================================================
+
+
+def _plain(values):
+    """Converts NumPy arrays and scalars to python lists and types"""
+    return values.tolist() if hasattr(values, 'tolist') else values
+
+# ==============================================================================
+
+
+def _renamed_copy(child, cc_id):
+    """Returns a copy of a correction or decision, its correction given cc_id
+
+    The copy is built from the pickled state of child, so no values are
+    checked again, and child and its nodes are left untouched.
+
+    """
+    if child.__class__ == ColorDecision:
+        input_desc, viewing_desc, desc, color_correct, media_ref = \
+            child.__getstate__()
+    else:
+        color_correct = child
+    new_cc = ColorCorrection(cc_id)
+    new_cc.__setstate__(color_correct.__getstate__())
+    if child.__class__ != ColorDecision:
+        return new_cc
+
+    if media_ref is not None:
+        media_ref = MediaRef(media_ref.ref)
+    new_cd = ColorDecision()
+    new_cd.__setstate__((input_desc, viewing_desc, desc, new_cc, media_ref))
+    return new_cd
+
+# ==============================================================================
+
+
+def _resolves(color_decision, ids):
+    """Returns True if a CDL should write a reference's ColorCorrection"""
+    if not color_decision.is_ref or color_decision.cc.id in ids:
+        return False
+    try:
+        color_correction = color_decision.cc.cc
+    except ValueError:
+        # ValueError will be raised if we can't resolve the
+        # reference. This shouldn't be a game-stopper here.
+        #
+        # We'll just add the unresolved reference
+        return False
+    return True if color_correction else False
+
+# ==============================================================================
+
+
+def _root_element(node, tag):
+    """Builds a childless collection root holding only node's descriptions"""
+    root_xml = ElementTree.Element(tag)
+    root_xml.attrib = {'xmlns': node.xmlns}
+    if node.input_desc:
+        input_desc = ElementTree.SubElement(root_xml, 'InputDescription')
+        input_desc.text = node.input_desc
+    if node.viewing_desc:
+        viewing_desc = ElementTree.SubElement(root_xml, 'ViewingDescription')
+        viewing_desc.text = node.viewing_desc
+    for description in node.desc:
+        desc = ElementTree.SubElement(root_xml, 'Description')
+        desc.text = description
+
+    return root_xml
+
+# ==============================================================================
+
+
+def _wrapped_element(color_correction):
+    """Builds a CDL decision element around a bare ColorCorrection"""
+    orig_parent = color_correction.parent
+    color_decision = ColorDecision(color_correction)
+    # Restore parentage so the temporary decision can be freed
+    color_correction.parent = orig_parent
+    return color_decision.element
+
+# ==============================================================================
+
+
+def _wrapped_fragment(color_correction, pretty=True):
+    """Returns the XML text of a CDL decision around a bare ColorCorrection
+
+    Matches ``_wrapped_element()`` without creating a temporary decision.
+
+    """
+    return _wrap_fragments(
+        ElementTree.Element('ColorDecision'),
+        [color_correction.xml_fragment(2, pretty)],
+        1,
+        pretty,
+    )
@@ -15,6 +15,36 @@ Contains simple configuration parameters.
 
         Default: False
 
+    PRETTY_XML
+        Determines if the write functions and writers produce indented, one
+        element per line XML. Setting this to False writes compact XML with
+        no whitespace between elements, for files only machines will read.
+
+        Default: True
+
+    SKIP_UNCHANGED
+        Determines if the write functions leave an existing file untouched
+        when it already holds exactly what would be written. Other files are
+        then written to a temporary file and renamed into place, so an
+        interrupted write never leaves a partial file behind.
+
+        Default: False
+
+    NUMBER_PRECISION
+        Number of decimal places slope, offset, power and saturation values
+        are rounded to when written. None writes each value with exactly the
+        digits it holds.
+
+        Default: None
+
+    CSV_COLUMNS
+        Maps fields of the ``csv`` format to the headers of the columns
+        holding them, for reading and writing spreadsheets whose columns
+        aren't named after the fields. None names each column after its
+        field.
+
+        Default: None
+
     COLLECTION_FORMATS
         List containing all the formats which are represented by
         ColorCollection.
@@ -73,11 +103,35 @@ SOFTWARE.
 #   If a ColorCorrection is given a duplicate ID
 HALT_ON_ERROR = False
 
-COLLECTION_FORMATS = ['ale', 'ccc', 'cdl', 'edl', 'flex']
+# PRETTY_XML is the default layout of written XML files. Individual calls
+# can still override it with their pretty argument.
+PRETTY_XML = True
+
+# SKIP_UNCHANGED makes the write functions compare what they write with the
+# existing file and skip identical ones, which keeps the modification times
+# of unchanged files for incremental reconversion. Individual calls can still
+# override it with their skip_unchanged argument.
+SKIP_UNCHANGED = False
+
+# NUMBER_PRECISION is the number of decimal places format_number() rounds
+# written values to. None writes values exactly as they were given.
+NUMBER_PRECISION = None
+
+# CSV_COLUMNS maps csv fields, such as 'id' or 'sat', to the headers of the
+# columns holding them. Individual calls can still override it with their
+# columns argument.
+CSV_COLUMNS = None
+
+COLLECTION_FORMATS = [
+    'ale', 'ccc', 'cdl', 'cdlb', 'csv', 'edl', 'flex', 'jsonl', 'tar', 'tgz',
+    'zip'
+]
 SINGLE_FORMATS = ['cc', 'rcdl']
 
 # ==============================================================================
 # EXPORTS
 # ==============================================================================
 
-__all__ = ['HALT_ON_ERROR']
+__all__ = [
+    'HALT_ON_ERROR', 'NUMBER_PRECISION', 'PRETTY_XML', 'SKIP_UNCHANGED'
+]
@@ -9,6 +9,12 @@ and SatNode.
 
 ## Classes
 
+    CdlValue
+
+        Immutable and hashable snapshot of the 10 ASC CDL numbers and the
+        descriptions of a ColorCorrection, for cheap comparisons and dict
+        lookups.
+
     ColorCorrection
 
         The backbone of cdl_convert, everything comes down to the
@@ -63,12 +69,16 @@ from __future__ import absolute_import, print_function
 from decimal import Decimal
 import os
 import re
+from weakref import WeakValueDictionary
 from xml.etree import ElementTree
 
 # cdl_convert imports
 
-from .base import AscColorSpaceBase, AscDescBase, AscXMLBase, ColorNodeBase
+from .base import (
+    AscColorSpaceBase, AscDescBase, AscXMLBase, ColorNodeBase, _weak_ref
+)
 from . import config
+from .utils import format_number
 
 # Python 3 compatibility
 
@@ -77,11 +87,21 @@ try:
 except NameError:  # pragma: no cover
     xrange = range  # pylint: disable=W0622, C0103
 
+# ==============================================================================
+# GLOBALS
+# ==============================================================================
+
+# Values of a ColorCorrection without a SopNode or SatNode
+_IDENTITY_SOP = (Decimal('1.0'), ) * 3 + (Decimal('0.0'), ) * 3 + \
+    (Decimal('1.0'), ) * 3
+_IDENTITY_SAT = Decimal('1.0')
+
 # ==============================================================================
 # EXPORTS
 # ==============================================================================
 
 __all__ = [
+    'CdlValue',
     'ColorCorrection',
     'SatNode',
     'SopNode',
@@ -92,6 +112,172 @@ __all__ = [
 # ==============================================================================
 
 
+class CdlValue(object):
+    """Immutable, hashable snapshot of the 10 ASC CDL numbers
+
+    Description
+    ~~~~~~~~~~~
+
+    Holds the slope, offset, power and saturation of a color correction,
+    along with an optional tuple of descriptions. The values are validated
+    and converted to Decimal exactly like :class:`SopNode` and
+    :class:`SatNode` would, and the content hash is computed once on
+    creation.
+
+    Two instances are equal if all their numbers and descriptions are equal,
+    which makes them usable as dictionary keys for deduplicating and caching
+    grades. To compare the numbers alone, compare ``grade``.
+
+    :class:`ColorCorrection` exposes the current values of a correction as a
+    :class:`CdlValue` through its ``value`` attribute.
+
+    **Attributes:**
+
+        desc : (str)
+            A tuple of the descriptions.
+
+        grade : (Decimal)
+            A tuple of the 10 numbers: slope, offset and power rgb values
+            followed by saturation. Hashable, and ignores the descriptions.
+
+        offset : (Decimal, Decimal, Decimal)
+            The rgb offset values.
+
+        power : (Decimal, Decimal, Decimal)
+            The rgb power values.
+
+        sat : (Decimal)
+            The saturation value.
+
+        slope : (Decimal, Decimal, Decimal)
+            The rgb slope values.
+
+    All attributes are read only. Setting any raises an ``AttributeError``.
+
+    """
+
+    __slots__ = ('_grade', '_desc', '_hash')
+
+    def __init__(self, slope=None, offset=None, power=None, sat=None,
+                 desc=None):
+        """Validates the given values, defaulting to an identity grade
+
+        Values are given the same way as the :class:`SopNode` and
+        :class:`SatNode` attributes, so rgb values can be a single number or
+        three. Validation also follows those nodes, including clamping
+        negative values unless ``HALT_ON_ERROR`` is set.
+
+        """
+        sop = SopNode(None)
+        sat_node = SatNode(None)
+        if slope is not None:
+            sop.slope = slope
+        if offset is not None:
+            sop.offset = offset
+        if power is not None:
+            sop.power = power
+        if sat is not None:
+            sat_node.sat = sat
+
+        self._set(
+            tuple(sop._slope + sop._offset + sop._power + [sat_node._sat]),  # pylint: disable=W0212
+            tuple(desc) if desc else ()
+        )
+
+    # Special Methods =========================================================
+
+    def __delattr__(self, name):
+        raise AttributeError('CdlValue instances are immutable.')
+
+    def __eq__(self, other):
+        if not isinstance(other, CdlValue):
+            return NotImplemented
+        return (
+            self._hash == other._hash and
+            self._grade == other._grade and
+            self._desc == other._desc
+        )
+
+    def __hash__(self):
+        return self._hash
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __reduce__(self):
+        """Rebuilds through the trusted constructor, skipping validation"""
+        return CdlValue._from_grade, (self._grade, self._desc)
+
+    def __repr__(self):
+        return (
+            'CdlValue(slope={slope}, offset={offset}, power={power}, '
+            'sat={sat}, desc={desc})'.format(
+                slope=self.slope,
+                offset=self.offset,
+                power=self.power,
+                sat=self.sat,
+                desc=self.desc,
+            )
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError('CdlValue instances are immutable.')
+
+    # Properties ==============================================================
+
+    @property
+    def desc(self):
+        """Returns the tuple of descriptions"""
+        return self._desc
+
+    @property
+    def grade(self):
+        """Returns the 10 numbers as a single tuple"""
+        return self._grade
+
+    @property
+    def offset(self):
+        """Returns the rgb offset tuple"""
+        return self._grade[3:6]
+
+    @property
+    def power(self):
+        """Returns the rgb power tuple"""
+        return self._grade[6:9]
+
+    @property
+    def sat(self):
+        """Returns the saturation"""
+        return self._grade[9]
+
+    @property
+    def slope(self):
+        """Returns the rgb slope tuple"""
+        return self._grade[0:3]
+
+    # Private Methods =========================================================
+
+    @classmethod
+    def _from_grade(cls, grade, desc):
+        """Builds an instance from 10 already validated Decimals"""
+        value = object.__new__(cls)
+        value._set(grade, desc)  # pylint: disable=W0212
+        return value
+
+    # =========================================================================
+
+    def _set(self, grade, desc):
+        """Sets the slots and precomputes the hash"""
+        object.__setattr__(self, '_grade', grade)
+        object.__setattr__(self, '_desc', desc)
+        object.__setattr__(self, '_hash', hash((grade, desc)))
+
+# ==============================================================================
+
+
 class ColorCorrection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: disable=R0902,R0904
     """The basic class for the ASC CDL
 
@@ -111,6 +297,13 @@ class ColorCorrection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
 
     Order of operations is Slope, Offset, Power, then Saturation.
 
+    Pickling only stores the id, file paths, descriptions and the 10 values.
+    Unpickling goes back through ``__init__``, so the id is registered in
+    ``members`` with the usual duplicate id handling: if the id is already
+    taken (for instance when the original is still alive in the same
+    process), the loaded copy is given a new id, or ``ValueError`` is raised
+    if ``HALT_ON_ERROR`` is set.
+
     **Class Attributes:**
 
         members : {str: :class`ColorCorrection` }
@@ -118,6 +311,10 @@ class ColorCorrection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
             dictionary, with their unique id being the key and the
             :class:`ColorCorrection` being the value.
 
+            The dictionary only holds weak references. Once a
+            :class:`ColorCorrection` is garbage collected, its id is removed
+            and becomes available again.
+
     **Attributes:**
 
         desc : [str]
@@ -162,7 +359,8 @@ class ColorCorrection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
             images. Inherited from :class:`AscColorSpaceBase` .
 
         parent : (:class:`ColorCollection`)
-            The parent node that contains this node.
+            The parent node that contains this node. Held weakly, it's None
+            once the parent is freed.
 
         sat_node : ( :class:`SatNode` )
             Contains a reference to a single instance of :class:`SatNode` ,
@@ -172,6 +370,12 @@ class ColorCorrection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
             Contains a reference to a single instance of :class:`SopNode` ,
             which contains the slope, offset, power values and descriptions.
 
+        value : ( :class:`CdlValue` )
+            An immutable, hashable snapshot of the current 10 numbers and
+            ``desc`` of this correction. Cached until the slope, offset,
+            power or sat values or the descriptions change, so repeated
+            access and comparisons are cheap.
+
         viewing_desc : (str)
             Viewing device, settings and environment. Inherited from
             :class:`AscColorSpaceBase` .
@@ -186,6 +390,11 @@ class ColorCorrection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
             encoding tags on the first line. Inherited from
             :class:`AscXMLBase`.
 
+            The XML text is cached, and only rebuilt after the id, values or
+            any descriptions (including those of the SOP and Sat nodes)
+            change. Writing the same correction as a ``cc`` , inside a
+            ``ccc`` and inside a ``cdl`` builds it once.
+
     **Public Methods:**
 
         build_element()
@@ -219,23 +428,16 @@ class ColorCorrection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
 
     """
 
-    members = {}
+    members = WeakValueDictionary()
+
+    _cache_xml = True
 
     def __init__(self, id, input_file=None):  # pylint: disable=W0622
         """Inits an instance of a ColorCorrection"""
-        super(ColorCorrection, self).__init__()
-
-        # File Attributes
-        self._file_in = os.path.abspath(input_file) if input_file else None
-        self._file_out = None
-
-        # If we're under a ColorCorrectionCollection or ColorDecision node:
-        self.parent = None
-
         # The id is really the only required part of a ColorCorrection node
         # Each ID should be unique
         id = _sanitize(id)
-        if id in ColorCorrection.members.keys():
+        if id in ColorCorrection.members:
             if config.HALT_ON_ERROR:
                 raise ValueError(
                     'Error initiating id to "{id}". This id is already a '
@@ -256,16 +458,48 @@ class ColorCorrection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
                 raise ValueError('Blank id given to ColorCorrection.')
             else:
                 id = str(len(ColorCorrection.members) + 1).rjust(3, '0')
-        self._id = id
 
-        # Register with member dictionary
-        ColorCorrection.members[self._id] = self
+        self._init(id, input_file)
 
-        # ASC_SAT attribute
-        self._sat_node = None
+    # Pickling ================================================================
 
-        # ASC_SOP attributes
-        self._sop_node = None
+    def __reduce__(self):
+        """Rebuilds through __init__ so the id is registered on load"""
+        return ColorCorrection, (self._id, ), self.__getstate__()
+
+    def __getstate__(self):
+        """Returns only the fields needed to rebuild this correction
+
+        ``parent`` is not included. Containers restore it on their own
+        children when they are unpickled.
+
+        """
+        return (
+            self._file_in,
+            self._file_out,
+            self.input_desc,
+            self.viewing_desc,
+            tuple(self._desc),
+            self._sop_node.__getstate__() if self._sop_node else None,
+            self._sat_node.__getstate__() if self._sat_node else None,
+        )
+
+    def __setstate__(self, state):
+        """Restores the fields returned by __getstate__"""
+        (
+            self._file_in,
+            self._file_out,
+            self.input_desc,
+            self.viewing_desc,
+            desc,
+            sop_state,
+            sat_state,
+        ) = state
+        self._desc = list(desc)
+        if sop_state is not None:
+            self.sop_node.__setstate__(sop_state)
+        if sat_state is not None:
+            self.sat_node.__setstate__(sat_state)
 
     # Properties ==============================================================
 
@@ -365,13 +599,129 @@ class ColorCorrection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
         """Makes sure provided sat value is a positive"""
         self.sat_node.sat = sat_value
 
+    @property
+    def value(self):
+        """Returns a :class:`CdlValue` of the current numbers and desc"""
+        desc = tuple(self._desc)
+        # desc is a plain list that can be changed in place, so check it.
+        if self._value is None or self._value.desc != desc:
+            # Use the private nodes so we don't initialize a virgin sop or sat
+            if self._sop_node:
+                sop = self._sop_node
+                grade = sop._slope + sop._offset + sop._power  # pylint: disable=W0212
+            else:
+                grade = _IDENTITY_SOP
+            if self._sat_node:
+                sat = self._sat_node._sat  # pylint: disable=W0212
+            else:
+                sat = _IDENTITY_SAT
+            self._value = CdlValue._from_grade(  # pylint: disable=W0212
+                tuple(grade) + (sat, ), desc
+            )
+        return self._value
+
     # Private Methods =========================================================
 
+    @classmethod
+    def _from_validated(cls, cc_id, sop=None, sat=None, desc=None):
+        """Builds a correction from a free id and already validated values
+
+        **Args:**
+            cc_id : (str)
+                A sanitized id. It's kept even if another correction is
+                registered with it, in which case this one isn't registered.
+
+            sop=None : [[Decimal]]
+                Lists of slope, offset and power Decimals. Any of the three
+                can be None to keep the default.
+
+            sat=None : (Decimal)
+                Saturation value.
+
+            desc=None : ([str]|str)
+                Descriptions, or a single description.
+
+        Used by the bulk constructors of :class:`ColorCollection` , which
+        allocate ids and validate values for many corrections at once, to
+        skip the id checks and the value setters.
+
+        """
+        color_correct = cls.__new__(cls)
+        color_correct._init(cc_id, None)  # pylint: disable=W0212
+        if sop is not None:
+            node = color_correct.sop_node
+            slope, offset, power = sop
+            if slope is not None:
+                node._slope = slope  # pylint: disable=W0212
+            if offset is not None:
+                node._offset = offset  # pylint: disable=W0212
+            if power is not None:
+                node._power = power  # pylint: disable=W0212
+        if sat is not None:
+            color_correct.sat_node._sat = sat  # pylint: disable=W0212
+        if desc:
+            # As the desc setter does, a single description isn't split up
+            if type(desc) not in [list, tuple]:
+                desc = [desc]
+            color_correct._desc = list(desc)  # pylint: disable=W0212
+        return color_correct
+
+    # =========================================================================
+
+    @staticmethod
+    def _hold_refs(cc_id, target):
+        """Points the references to an id at the correction now holding it
+
+        The members registry only holds corrections weakly, so each
+        :class:`ColorCorrectionRef` keeps the correction its id resolves to
+        alive, as a correction built only to be referenced isn't held by
+        anything else. Given None, references let go of the id's old holder.
+
+        """
+        from .decision import ColorCorrectionRef
+        if cc_id in ColorCorrectionRef.members:
+            for ref in ColorCorrectionRef.members[cc_id]:
+                ref._target = target  # pylint: disable=W0212
+
+    # =========================================================================
+
+    def _init(self, cc_id, input_file):
+        """Sets up the attributes and registers the id, if it's free"""
+        super(ColorCorrection, self).__init__()
+
+        # File Attributes
+        self._file_in = os.path.abspath(input_file) if input_file else None
+        self._file_out = None
+
+        # If we're under a ColorCorrectionCollection or ColorDecision node:
+        self.parent = None
+
+        self._id = cc_id
+
+        # Register with member dictionary. An id already taken is only kept
+        # by corrections rebuilt as stored, see _from_validated().
+        if self._id not in ColorCorrection.members:
+            ColorCorrection.members[self._id] = self
+            self._hold_refs(self._id, self)
+
+        # ASC_SAT attribute
+        self._sat_node = None
+
+        # ASC_SOP attributes
+        self._sop_node = None
+
+        # Cached CdlValue, dropped by the SopNode and SatNode setters
+        self._value = None
+        # Cached XML text, dropped by the id and node setters
+        self._xml_cache = None
+
+    # =========================================================================
+
     def _set_id(self, new_id):
         """Changes the id field if the new id is unique"""
         cc_id = _sanitize(new_id)
         # Check if this id is already registered
-        if cc_id in ColorCorrection.members.keys():
+        if cc_id in ColorCorrection.members:
             raise ValueError(
                 'Error setting the id to "{cc_id}". This id is already a '
                 'registered id.'.format(
@@ -379,11 +729,27 @@ class ColorCorrection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
                 )
             )
         else:
-            # Clear the current id from the dictionary
-            ColorCorrection.members.pop(self._id)
+            # Clear the current id from the dictionary, if it's ours
+            if ColorCorrection.members.get(self._id) is self:
+                ColorCorrection.members.pop(self._id)
+                self._hold_refs(self._id, None)
             self._id = cc_id
+            self._xml_cache = None
             # Register the new id with the dictionary
             ColorCorrection.members[self._id] = self
+            self._hold_refs(self._id, self)
+
+    # =========================================================================
+
+    def _xml_snapshot(self):
+        """Returns what the XML depends on that changes without a setter"""
+        # Use the private nodes so we don't initialize a virgin sop or sat
+        sop = tuple(self._sop_node.desc) if self._sop_node else None
+        sat = tuple(self._sat_node.desc) if self._sat_node else None
+        return (
+            tuple(self._desc), self.input_desc, self.viewing_desc, sop, sat,
+            config.NUMBER_PRECISION
+        )
 
     # Public Methods ==========================================================
 
@@ -423,7 +789,7 @@ class ColorCorrection(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: di
     @classmethod
     def reset_members(cls):
         """Resets the class level members dictionary"""
-        cls.members = {}
+        cls.members = WeakValueDictionary()
 
 # ==============================================================================
 
@@ -457,7 +823,7 @@ class SatNode(ColorNodeBase):
 
         parent : ( :class:`ColorCorrection` )
             The parent :class:`ColorCorrection` instance that created this
-            instance.
+            instance. Held weakly, it's None once the parent is freed.
 
         sat : (Decimal)
             The saturation value (to be applied with Rec 709 coefficients) is
@@ -498,15 +864,32 @@ class SatNode(ColorNodeBase):
     def __init__(self, parent):
         super(SatNode, self).__init__()
 
-        self._parent = parent
+        self._parent = _weak_ref(parent)
         self._sat = Decimal('1.0')
 
+    # Pickling ================================================================
+
+    def __reduce__(self):
+        """Pickled alone, a SatNode comes back without a parent"""
+        return SatNode, (None, ), self.__getstate__()
+
+    def __getstate__(self):
+        """Returns the descriptions and the saturation as a string"""
+        return tuple(self._desc), str(self._sat)
+
+    def __setstate__(self, state):
+        """Restores the state returned by __getstate__ without revalidating"""
+        desc, sat = state
+        self._desc = list(desc)
+        self._sat = Decimal(sat)
+        self._invalidate_parent()
+
     # Properties ==============================================================
 
     @property
     def parent(self):
         """Returns which :class:`ColorCorrection` created this SatNode"""
-        return self._parent
+        return super(SatNode, self).parent
 
     @property
     def sat(self):
@@ -524,6 +907,7 @@ class SatNode(ColorNodeBase):
                 raise
             else:
                 self._sat = Decimal(value)
+                self._invalidate_parent()
         else:
             raise TypeError(
                 'Saturation cannot be set directly with objects of type: '
@@ -542,7 +926,7 @@ class SatNode(ColorNodeBase):
             desc = ElementTree.SubElement(sat, 'Description')
             desc.text = description
         op_node = ElementTree.SubElement(sat, 'Saturation')
-        op_node.text = _de_exponent(self.sat)
+        op_node.text = format_number(self.sat)
         return sat
 
 # ==============================================================================
@@ -586,7 +970,7 @@ class SopNode(ColorNodeBase):
 
         parent : ( :class:`ColorCorrection` )
             The parent :class:`ColorCorrection` instance that created this
-            instance.
+            instance. Held weakly, it's None once the parent is freed.
 
         slope : (Decimal, Decimal, Decimal)
             An rgb tuple representing the slope, which changes the slope of the
@@ -648,18 +1032,39 @@ class SopNode(ColorNodeBase):
     def __init__(self, parent):
         super(SopNode, self).__init__()
 
-        self._parent = parent
+        self._parent = _weak_ref(parent)
 
         self._slope = [Decimal('1.0')] * 3
         self._offset = [Decimal('0.0')] * 3
         self._power = [Decimal('1.0')] * 3
 
+    # Pickling ================================================================
+
+    def __reduce__(self):
+        """Pickled alone, a SopNode comes back without a parent"""
+        return SopNode, (None, ), self.__getstate__()
+
+    def __getstate__(self):
+        """Returns the descriptions and the 9 values as strings"""
+        values = self._slope + self._offset + self._power
+        return tuple(self._desc), tuple([str(value) for value in values])
+
+    def __setstate__(self, state):
+        """Restores the state returned by __getstate__ without revalidating"""
+        desc, values = state
+        self._desc = list(desc)
+        values = [Decimal(value) for value in values]
+        self._slope = values[0:3]
+        self._offset = values[3:6]
+        self._power = values[6:9]
+        self._invalidate_parent()
+
     # Properties ==============================================================
 
     @property
     def parent(self):
         """Returns which :class:`ColorCorrection` created this SopNode"""
-        return self._parent
+        return super(SopNode, self).parent
 
     @property
     def slope(self):
@@ -671,6 +1076,7 @@ class SopNode(ColorNodeBase):
         """Runs tests and converts slope rgb values before setting"""
         value = self._check_setter_value(value, 'slope')
         self._slope = value
+        self._invalidate_parent()
 
     @property
     def offset(self):
@@ -682,6 +1088,7 @@ class SopNode(ColorNodeBase):
         """Runs tests and converts offset rgb values before setting"""
         value = self._check_setter_value(value, 'offset', True)
         self._offset = value
+        self._invalidate_parent()
 
     @property
     def power(self):
@@ -693,6 +1100,7 @@ class SopNode(ColorNodeBase):
         """Runs tests and converts power rgb values before setting"""
         value = self._check_setter_value(value, 'power')
         self._power = value
+        self._invalidate_parent()
 
     # Private Methods =========================================================
 
@@ -819,9 +1227,9 @@ class SopNode(ColorNodeBase):
         for i, grade in enumerate([self.slope, self.offset, self.power]):
             op_node = ElementTree.SubElement(sop, fields[i])
             op_node.text = '{valueR} {valueG} {valueB}'.format(
-                valueR=_de_exponent(grade[0]),
-                valueG=_de_exponent(grade[1]),
-                valueB=_de_exponent(grade[2])
+                valueR=format_number(grade[0]),
+                valueG=format_number(grade[1]),
+                valueB=format_number(grade[2])
             )
         return sop
 
@@ -830,52 +1238,6 @@ class SopNode(ColorNodeBase):
 # ==============================================================================
 
 
-def _de_exponent(notation):
-    """Translates scientific notation into non-normalized strings
-
-     Unlike the methods to quantize a Decimal found on the Decimal FAQ, this
-    always works.
-
-    Args:
-        notation : (Decimal|str|int|float)
-            Any numeric value that may or may not be normalized.
-
-    Raises:
-        N/A
-
-    Returns:
-        (str)
-            Returns a quantized value without any scientific notation.
-
-    """
-    notation = str(notation).lower()
-    if 'e' not in notation:
-        return notation
-
-    notation = notation.split('e')
-    # Grab the exponent value
-    digits = int(notation[-1])
-    # Grab the value we'll be adding 0s to
-    value = notation[0]
-
-    if value.startswith('-'):
-        negative = '-'
-        value = value[1:]
-    else:
-        negative = ''
-
-    value = value.replace('.', '')
-
-    if digits < 0:
-        new_value = negative + '0.0' + '0' * (abs(digits) - 2) + value
-    else:
-        zeros = len(value)
-        new_value = negative + value + '0' * (abs(digits) - zeros) + '0.0'
-    return new_value
-
-# ==============================================================================
-
-
 def _sanitize(name):
     """Removes any characters in string name that aren't alnum or in '_.
 
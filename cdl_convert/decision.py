@@ -84,7 +84,10 @@ from xml.etree import ElementTree
 
 # cdl_convert imports
 
-from .base import AscColorSpaceBase, AscDescBase, AscXMLBase
+from .base import (
+    _wrap_fragments, AscColorSpaceBase, AscDescBase, AscXMLBase,
+    compact_xml, pretty_xml, WeakMemberLists
+)
 from . import config
 from .correction import ColorCorrection
 
@@ -130,16 +133,21 @@ class ColorCorrectionRef(AscXMLBase):
             :class:`ColorCorrectionRef` instances that share that ``id``
             value.
 
+            Instances are held weakly, and are removed from the dictionary
+            once garbage collected.
+
     **Attributes:**
 
         cc : (:class:`ColorCorrection`)
             If the stored reference resolves to an existing
             :class:`ColorCorrection`, this attribute will return that node
             using the ``resolve_reference`` method. This attribute is the same
-            as calling that method.
+            as calling that method. The reference keeps that correction alive,
+            even if it's created after the reference.
 
         parent : (:class:`ColorDecision`)
-            The parent :class:`ColorDecision` that contains this node.
+            The parent :class:`ColorDecision` that contains this node. Held
+            weakly, it's None once the parent is freed.
 
         id : (str)
             The :class:`ColorCorrection` id that this reference refers to. If
@@ -183,11 +191,14 @@ class ColorCorrectionRef(AscXMLBase):
 
     """
 
-    members = {}
+    members = WeakMemberLists()
 
     def __init__(self, id):  # pylint: disable=W0622
         super(ColorCorrectionRef, self).__init__()
         self._id = None
+        # The ColorCorrection our id resolves to. Nothing else may hold it,
+        # and the members registry only holds it weakly.
+        self._target = None
         # Bypass cc id existence checks on first set by calling private
         # method directly.
         self._set_id(id)
@@ -197,6 +208,35 @@ class ColorCorrectionRef(AscXMLBase):
         # parent must exist.
         self.parent = None
 
+    # Pickling ================================================================
+
+    def __reduce__(self):
+        """Rebuilds through __init__ so the reference is registered on load"""
+        return ColorCorrectionRef, (self._id, ), self.__getstate__()
+
+    def __getstate__(self):
+        """Returns the resolved ColorCorrection, if any
+
+        Storing the resolved :class:`ColorCorrection` lets the reference
+        follow it if the correction has to be renamed on load because its id
+        was already taken.
+
+        """
+        return ColorCorrection.members.get(self._id)
+
+    def __setstate__(self, state):
+        """Points at and holds on to the loaded ColorCorrection
+
+        The loaded correction is kept alive by this reference until its id
+        is changed, so a reference unpickled without the collection holding
+        its correction still resolves.
+
+        """
+        if state is not None:
+            if state.id != self._id:
+                self._set_id(state.id)
+            self._target = state
+
     # Properties ==============================================================
 
     @property
@@ -227,21 +267,15 @@ class ColorCorrectionRef(AscXMLBase):
 
     def _set_id(self, new_ref):
         """Changes the id field and updates members dictionary"""
-        # The only time it won't be in here is if this is the first time
-        # we set it.
-        if self.id in ColorCorrectionRef.members:
-            ColorCorrectionRef.members[self.id].remove(self)
-            # If the remaining list is empty, we'll pop it out
-            if not ColorCorrectionRef.members[self.id]:
-                ColorCorrectionRef.members.pop(self.id)
-
-        # Check if this id is already registered
-        if new_ref in ColorCorrectionRef.members:
-            ColorCorrectionRef.members[new_ref].append(self)
-        else:
-            ColorCorrectionRef.members[new_ref] = [self]
+        # The only time we won't be registered is if this is the first time
+        # we set it. Emptied keys are dropped by the registry.
+        ColorCorrectionRef.members.discard(self.id, self)
+        ColorCorrectionRef.members.add(new_ref, self)
 
         self._id = new_ref
+        # Hold on to the correction we resolve to, if it exists yet. One
+        # registered later is handed to us by ColorCorrection.
+        self._target = ColorCorrection.members.get(new_ref)
 
     # Public Methods ==========================================================
 
@@ -257,7 +291,7 @@ class ColorCorrectionRef(AscXMLBase):
     @classmethod
     def reset_members(cls):
         """Resets the member list"""
-        cls.members = {}
+        cls.members = WeakMemberLists()
 
     # =========================================================================
 
@@ -334,6 +368,9 @@ class ColorDecision(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: disa
             :class:`ColorDecision` instances that share that ``id``
             value.
 
+            Instances are held weakly, and are removed from the dictionary
+            once garbage collected.
+
     **Attributes:**
 
         cc : (:class:`ColorCorrection` , :class:`ColorCorrectionRef`)
@@ -367,7 +404,8 @@ class ColorDecision(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: disa
             Returns the contained :class:`MediaRef` or None.
 
         parent : (:class:`ColorDecisionList`)
-            The parent node that contains this node.
+            The parent node that contains this node. Held weakly, it's None
+            once the parent is freed.
 
         set_parentage()
             Sets child :class:`ColorCorrection` (or
@@ -428,7 +466,7 @@ class ColorDecision(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: disa
 
     """
 
-    members = {}
+    members = WeakMemberLists()
 
     def __init__(self, color_correct=None, media=None):
         """Inits an instance of ColorDecision"""
@@ -441,6 +479,35 @@ class ColorDecision(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: disa
         if self.cc:
             self.set_parentage()
 
+    # Pickling ================================================================
+
+    def __reduce__(self):
+        """Rebuilds through __init__ so we are registered on load"""
+        return ColorDecision, (), self.__getstate__()
+
+    def __getstate__(self):
+        """Returns only the fields needed to rebuild this decision"""
+        return (
+            self.input_desc,
+            self.viewing_desc,
+            tuple(self._desc),
+            self._cc,
+            self._media_ref,
+        )
+
+    def __setstate__(self, state):
+        """Restores fields, membership and parentage"""
+        (
+            self.input_desc,
+            self.viewing_desc,
+            desc,
+            color_correct,
+            media_ref,
+        ) = state
+        self._desc = list(desc)
+        self._set_cc(color_correct)
+        self.media_ref = media_ref
+
     # Properties ==============================================================
 
     @property
@@ -472,25 +539,32 @@ class ColorDecision(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: disa
 
     # Private Methods =========================================================
 
+    def _build_desc_element(self):
+        """Builds a ColorDecision element holding only the descriptions"""
+        cd_xml = ElementTree.Element('ColorDecision')
+        if self.input_desc:
+            input_desc = ElementTree.SubElement(cd_xml, 'InputDescription')
+            input_desc.text = self.input_desc
+        if self.viewing_desc:
+            viewing_desc = ElementTree.SubElement(cd_xml, 'ViewingDescription')
+            viewing_desc.text = self.viewing_desc
+        for description in self.desc:
+            desc = ElementTree.SubElement(cd_xml, 'Description')
+            desc.text = description
+        return cd_xml
+
+    # =========================================================================
+
     def _set_cc(self, new_cc):
         """Sets cc to new_cc and updates members dictionary"""
         if self.cc:
             # If we have a cc, we've already been added to the member's list,
             # and need to update membership.
-            if self.cc.id in ColorDecision.members:
-                ColorDecision.members[self.cc.id].remove(self)
-                # If the remaining list is empty, we'll pop it out
-                if not ColorDecision.members[self.cc.id]:
-                    ColorDecision.members.pop(self.cc.id)
+            ColorDecision.members.discard(self.cc.id, self)
         if new_cc:
             # It's possible to have new_cc be None, in which case we won't
             # assign this ColorDecision to the member dictionary.
-            #
-            # Check if this id is already registered
-            if new_cc.id in ColorDecision.members:
-                ColorDecision.members[new_cc.id].append(self)
-            else:
-                ColorDecision.members[new_cc.id] = [self]
+            ColorDecision.members.add(new_cc.id, self)
 
             new_cc.parent = self
 
@@ -500,16 +574,7 @@ class ColorDecision(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: disa
 
     def build_element(self, resolve=False):  # pylint: disable=W0221
         """Builds an ElementTree XML element representing this CC"""
-        cd_xml = ElementTree.Element('ColorDecision')
-        if self.input_desc:
-            input_desc = ElementTree.SubElement(cd_xml, 'InputDescription')
-            input_desc.text = self.input_desc
-        if self.viewing_desc:
-            viewing_desc = ElementTree.SubElement(cd_xml, 'ViewingDescription')
-            viewing_desc.text = self.viewing_desc
-        for description in self.desc:
-            desc = ElementTree.SubElement(cd_xml, 'Description')
-            desc.text = description
+        cd_xml = self._build_desc_element()
         # Customary for the Media Ref element to go first (if there is one)
         if self.media_ref:
             cd_xml.append(self.media_ref.element)
@@ -530,6 +595,48 @@ class ColorDecision(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: disa
 
     # =========================================================================
 
+    def xml_fragment(self, level=0, pretty=True, resolve=False):  # pylint: disable=W0221
+        """Returns the XML text of this node from its children's fragments
+
+        **Args:**
+            level=0 : (int)
+                How many indents deep the node is. Ignored if not pretty.
+
+            pretty=True : (bool)
+                If False, returns compact XML instead.
+
+            resolve=False : (bool)
+                If True and this is a reference decision, the referenced
+                :class:`ColorCorrection` is written in place of the
+                reference, as with ``build_element()`` .
+
+        **Returns:**
+            (str)
+                The same text as ``pretty_xml()`` or ``compact_xml()`` of
+                ``build_element(resolve)`` .
+
+        **Raises:**
+            N/A
+
+        The decision itself isn't cached, but its :class:`ColorCorrection`
+        and :class:`MediaRef` are, so only the descriptions are rebuilt.
+
+        """
+        cd_xml = self._build_desc_element()
+        if pretty:
+            fragments = [pretty_xml(child, level + 1) for child in cd_xml]
+        else:
+            fragments = [compact_xml(child) for child in cd_xml]
+        if self.media_ref:
+            fragments.append(self.media_ref.xml_fragment(level + 1, pretty))
+        if resolve and self.is_ref:
+            fragments.append(self.cc.cc.xml_fragment(level + 1, pretty))
+        else:
+            fragments.append(self.cc.xml_fragment(level + 1, pretty))
+        return _wrap_fragments(cd_xml, fragments, level, pretty)
+
+    # =========================================================================
+
     def parse_xml_color_correction(self, xml_element):
         """Parses a Color Decision element to find a ColorCorrection"""
         cc_elem = xml_element.find('ColorCorrection')
@@ -601,7 +708,7 @@ class ColorDecision(AscDescBase, AscColorSpaceBase, AscXMLBase):  # pylint: disa
     @classmethod
     def reset_members(cls):
         """Resets the member list"""
-        cls.members = {}
+        cls.members = WeakMemberLists()
 
     # =========================================================================
 
@@ -651,6 +758,9 @@ class MediaRef(AscXMLBase):
             new key's list. The old key is removed from the dictionary if this
             :class:`MediaRef` was the last member.
 
+            Instances are held weakly, and are removed from the dictionary
+            once garbage collected.
+
     **Attributes:**
 
         directory : (str)
@@ -689,6 +799,7 @@ class MediaRef(AscXMLBase):
         parent : (:class:`ColorDecision`)
             The parent that contains this :class:`MediaRef` object. This should
             normally be a :class:`ColorDecision` , but that is not enforced.
+            Held weakly, it's None once the parent is freed.
 
         path : (str)
             The directory joined with the filename via os.path.join(), if
@@ -748,7 +859,8 @@ class MediaRef(AscXMLBase):
 
     """
 
-    members = {}
+    members = WeakMemberLists()
+    _cache_xml = True
 
     def __init__(self, ref_uri, parent=None):
         super(MediaRef, self).__init__()
@@ -763,6 +875,12 @@ class MediaRef(AscXMLBase):
 
         self._change_membership()
 
+    # Pickling ================================================================
+
+    def __reduce__(self):
+        """Rebuilds from the uri alone, cached sequence data is dropped"""
+        return MediaRef, (self.ref, )
+
     # Properties ==============================================================
 
     @property
@@ -927,21 +1045,10 @@ class MediaRef(AscXMLBase):
 
         """
         if old_ref:
-            try:
-                MediaRef.members[old_ref].remove(self)
-            except (KeyError, ValueError):
-                # Either the key doesn't exist or we're not in the list.
-                # Either way, it doesn't matter to us.
-                pass
-            else:
-                # Now that we're removed, we need to see if the list is empty,
-                # and if so, delete the key ref.
-                if not MediaRef.members[old_ref]:
-                    del MediaRef.members[old_ref]
-        try:
-            MediaRef.members[self.ref].append(self)
-        except KeyError:
-            MediaRef.members[self.ref] = [self]
+            # If the key doesn't exist or we're not in the list, this does
+            # nothing. Emptied keys are dropped by the registry.
+            MediaRef.members.discard(old_ref, self)
+        MediaRef.members.add(self.ref, self)
 
     # =========================================================================
 
@@ -1000,6 +1107,7 @@ class MediaRef(AscXMLBase):
         """Resets cached attributes back to init values"""
         self._is_seq = None
         self._sequences = None
+        self._xml_cache = None
 
     # =========================================================================
 
@@ -1031,4 +1139,4 @@ class MediaRef(AscXMLBase):
     @classmethod
     def reset_members(cls):
         """Resets the class level members dictionary"""
-        cls.members = {}
+        cls.members = WeakMemberLists()
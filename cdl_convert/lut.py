@@ -0,0 +1,548 @@
+#!/usr/bin/env python
+"""
+
+CDL Convert LUT
+===============
+
+Bakes color corrections into lookup table files for viewers and on-set
+systems which don't read the ASC CDL. NumPy must be installed to use this
+module.
+
+## Public Functions
+
+    bake_cube()
+        Returns the text of a 3D ``.cube`` lut of a ColorCorrection, its
+        lattice evaluated in one vectorized pass. Identical grades are only
+        baked once.
+
+    bake_lut_1d()
+        Returns the text of a 1D ``.spi1d`` or ``.cube`` lut of a
+        ColorCorrection which doesn't change saturation.
+
+    write_cube()
+        Writes a given ColorCorrection to disk as a 3D ``.cube`` lut.
+        ``file_out`` should already be set on the ColorCorrection.
+
+    write_cubes()
+        Writes a 3D ``.cube`` lut for each ColorCorrection of a
+        ColorCollection, baking each distinct grade once, in a pool of
+        processes. Corrections which don't change saturation can be written
+        as 1D luts instead.
+
+    write_lut_1d()
+        Writes a given ColorCorrection which doesn't change saturation to
+        disk as a 1D ``.spi1d`` or ``.cube`` lut. ``file_out`` should already
+        be set on the ColorCorrection.
+
+## GLOBALS
+
+    CUBE_CACHE_SIZE
+        How many baked cubes ``bake_cube()`` keeps, the least recently used
+        dropped first.
+
+    CUBE_SIZE
+        The default number of lattice points along each side of a cube.
+
+    LUT_1D_FORMATS
+        The formats 1D luts can be written in.
+
+    LUT_1D_SIZE
+        The default number of entries of a 1D lut.
+
+## License
+
+The MIT License (MIT)
+
+cdl_convert
+Copyright (c) 2015 Sean Wallitsch
+http://github.com/shidarin/cdl_convert/
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+
+from __future__ import absolute_import, print_function
+
+# Standard Imports
+
+from collections import OrderedDict
+import multiprocessing
+import threading
+
+# cdl_convert imports
+
+from .apply import apply_cdl
+from .base import enc
+from .collection import ColorCollection
+from .write import _write_file
+
+# Optional Imports
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# ==============================================================================
+# GLOBALS
+# ==============================================================================
+
+CUBE_CACHE_SIZE = 8
+CUBE_SIZE = 33
+LUT_1D_FORMATS = ['cube', 'spi1d']
+LUT_1D_SIZE = 4096
+
+# The sizes the .cube format allows along each side of a 3D lut, and for
+# the entries of a 1D lut
+_CUBE_SIZES = (2, 256)
+_LUT_1D_SIZES = (2, 65536)
+
+# Baked cube text after the title, by grade and size, oldest first
+_CUBE_CACHE = OrderedDict()
+_CUBE_CACHE_LOCK = threading.Lock()
+
+# ==============================================================================
+# EXPORTS
+# ==============================================================================
+
+__all__ = [
+    'bake_cube',
+    'bake_lut_1d',
+    'CUBE_CACHE_SIZE',
+    'CUBE_SIZE',
+    'LUT_1D_FORMATS',
+    'LUT_1D_SIZE',
+    'write_cube',
+    'write_cubes',
+    'write_lut_1d',
+]
+
+# ==============================================================================
+# PUBLIC FUNCTIONS
+# ==============================================================================
+
+
+def bake_cube(cdl, size=None):
+    """Returns the bytes of a 3D .cube lut of a ColorCorrection
+
+    **Args:**
+        cdl : (:class:`ColorCorrection`)
+            The correction to bake. Its id is written as the lut's title.
+
+        size=None : (int)
+            Lattice points along each side of the cube, commonly 17, 33 or
+            65. Defaults to ``CUBE_SIZE`` .
+
+    **Returns:**
+        (bytes)
+            The ``.cube`` file, ``size ** 3`` rows of output rgb values with
+            red changing fastest.
+
+    **Raises:**
+        ImportError:
+            If NumPy isn't installed.
+
+        ValueError:
+            If ``size`` isn't from 2 to 256.
+
+    Every lattice point is evaluated at once with ``apply_cdl()`` , and the
+    rows are written with 6 decimal places straight into a byte array. The
+    baked rows are kept by the slope, offset, power and saturation they were
+    baked from, so corrections with identical grades, whatever their ids,
+    are only baked once while they stay among the last ``CUBE_CACHE_SIZE``
+    baked.
+
+    """
+    if numpy is None:
+        raise ImportError('bake_cube() requires NumPy.')
+    size = _cube_size(size)
+
+    key = (cdl.value.grade, size)
+    with _CUBE_CACHE_LOCK:
+        rows = _CUBE_CACHE.pop(key, None)
+        if rows is not None:
+            _CUBE_CACHE[key] = rows
+    if rows is None:
+        rows = _bake_rows(key)
+        with _CUBE_CACHE_LOCK:
+            _CUBE_CACHE[key] = rows
+            while len(_CUBE_CACHE) > max(CUBE_CACHE_SIZE, 0):
+                _CUBE_CACHE.popitem(last=False)
+
+    return _cube_title(cdl) + rows
+
+# ==============================================================================
+
+
+def bake_lut_1d(cdl, size=None, ext='spi1d'):
+    """Returns the bytes of a 1D lut of a ColorCorrection without saturation
+
+    **Args:**
+        cdl : (:class:`ColorCorrection`)
+            The correction to bake. It mustn't change saturation.
+
+        size=None : (int)
+            Entries in the lut, evenly spaced from 0 to 1. Defaults to
+            ``LUT_1D_SIZE`` .
+
+        ext='spi1d' : (str)
+            The format of the lut, one of ``LUT_1D_FORMATS`` . A 1D ``cube``
+            has the correction's id as its title.
+
+    **Returns:**
+        (bytes)
+            The lut file, a row of output rgb values per entry.
+
+    **Raises:**
+        ImportError:
+            If NumPy isn't installed.
+
+        ValueError:
+            If the correction changes saturation, ``size`` isn't from 2 to
+            65536, or ``ext`` isn't a 1D lut format.
+
+    Without saturation, each channel's output depends only on its own input,
+    so a curve per channel holds the whole correction in a far smaller file
+    than a 3D lut, with no interpolation between lattice points to blur it.
+    A correction changes saturation if it has a SAT node whose value isn't
+    1. Every entry is evaluated at once with ``apply_cdl()`` .
+
+    """
+    if numpy is None:
+        raise ImportError('bake_lut_1d() requires NumPy.')
+    if ext not in LUT_1D_FORMATS:
+        raise ValueError(
+            "The 1D lut format: {ext} is not supported".format(ext=ext)
+        )
+    size = _lut_1d_size(size)
+    if not _sop_only(cdl):
+        raise ValueError(
+            'The ColorCorrection {id} changes saturation, which a 1D lut '
+            "can't hold.".format(id=cdl.id)
+        )
+
+    if ext == 'cube':
+        header = _cube_title(cdl) + enc(
+            'LUT_1D_SIZE {size}\n\n'.format(size=size)
+        )
+        footer = b''
+    else:
+        header = enc(
+            'Version 1\nFrom 0.0 1.0\nLength {size}\nComponents 3\n'
+            '{{\n'.format(size=size)
+        )
+        footer = b'}\n'
+    return header + _bake_1d_rows(cdl.value.grade, size) + footer
+
+# ==============================================================================
+
+
+def write_cube(cdl, size=None, skip_unchanged=None):
+    """Writes the ColorCorrection to a 3D .cube lut
+
+    The cube has ``size`` lattice points along each side, or ``CUBE_SIZE``
+    if it's None. See ``bake_cube()`` .
+
+    If ``skip_unchanged`` is True, or if it's None and
+    ``config.SKIP_UNCHANGED`` is True, an existing file with the same contents
+    is left untouched, and other files are replaced atomically. Returns False
+    if the file was skipped, otherwise True.
+
+    """
+    return _write_file(cdl.file_out, bake_cube(cdl, size), skip_unchanged)
+
+# ==============================================================================
+
+
+def write_cubes(cdls, directory=None, size=None, jobs=None,
+                skip_unchanged=None, ext_1d=None, size_1d=None):
+    """Writes a .cube lut for each ColorCorrection, baking in processes
+
+    **Args:**
+        cdls : (:class:`ColorCollection`|[:class:`ColorCorrection`])
+            The corrections to bake, one file each. A collection's
+            corrections are those it holds directly, then those held by its
+            decisions that aren't references.
+
+        directory=None : (str)
+            If given, ``determine_dest()`` names each file in this directory
+            before it's written. Otherwise ``file_out`` should already be set
+            on each correction.
+
+        size=None : (int)
+            Lattice points along each side of every cube. Defaults to
+            ``CUBE_SIZE`` .
+
+        jobs=None : (int)
+            How many processes bake at once. Defaults to the number of CPUs.
+            With 1, everything is baked in this process.
+
+        skip_unchanged=None : (bool)
+            Leave files which already hold the same bytes untouched, and
+            replace the others atomically. Defaults to
+            ``config.SKIP_UNCHANGED`` .
+
+        ext_1d=None : (str)
+            If given, one of ``LUT_1D_FORMATS`` , corrections which don't
+            change saturation are written as 1D luts in this format instead
+            of as cubes, with ``determine_dest()`` giving them this
+            extension. See ``bake_lut_1d()`` .
+
+        size_1d=None : (int)
+            Entries in every 1D lut. Defaults to ``LUT_1D_SIZE`` .
+
+    **Returns:**
+        [:class:`ColorCorrection`], [(:class:`ColorCorrection`, Exception)]
+            The corrections whose files were unchanged and skipped, then the
+            corrections which couldn't be written and why, both in the order
+            given. Both are empty if every file was written.
+
+    **Raises:**
+        ImportError:
+            If NumPy isn't installed.
+
+        ValueError:
+            If ``size`` isn't from 2 to 256, ``size_1d`` isn't from 2 to
+            65536, ``ext_1d`` isn't a 1D lut format or ``jobs`` is less
+            than 1.
+
+    Corrections are grouped by their slope, offset, power and saturation
+    first, and each distinct grade is baked only once, however many
+    corrections share it. Baking runs in a pool of processes, each baked
+    grade's files written here as soon as it's returned, so only as many
+    baked cubes are held as the pool has in flight. Files hold the same
+    bytes ``write_cube()`` or ``write_lut_1d()`` writes. 1D luts take so
+    little time to bake that they're baked here, before the cubes.
+
+    """
+    if numpy is None:
+        raise ImportError('write_cubes() requires NumPy.')
+    size = _cube_size(size)
+    if jobs is None:
+        jobs = multiprocessing.cpu_count()
+    if jobs < 1:
+        raise ValueError(
+            "jobs must be at least 1, not {jobs}".format(jobs=jobs)
+        )
+
+    if ext_1d is not None:
+        if ext_1d not in LUT_1D_FORMATS:
+            raise ValueError(
+                "The 1D lut format: {ext} is not supported".format(ext=ext_1d)
+            )
+        size_1d = _lut_1d_size(size_1d)
+
+    if isinstance(cdls, ColorCollection):
+        col = cdls
+        cdls = list(col.color_corrections)
+        cdls.extend(
+            decision.cc for decision in col.color_decisions
+            if not decision.is_ref
+        )
+
+    results = []
+    grades = OrderedDict()
+    for index, cdl in enumerate(cdls):
+        if ext_1d is not None and _sop_only(cdl):
+            if directory is not None:
+                cdl.determine_dest(ext_1d, directory)
+            _write_result(
+                results, index, cdl, bake_lut_1d(cdl, size_1d, ext_1d),
+                skip_unchanged
+            )
+            continue
+        if directory is not None:
+            cdl.determine_dest('cube', directory)
+        grades.setdefault((cdl.value.grade, size), []).append((index, cdl))
+
+    pool = None
+    if jobs > 1 and len(grades) > 1:
+        pool = multiprocessing.Pool(min(jobs, len(grades)))
+        baked = pool.imap(_bake_rows, grades)
+    else:
+        baked = (_bake_rows(key) for key in grades)
+    try:
+        for shared in grades.values():
+            rows = next(baked)
+            for index, cdl in shared:
+                _write_result(
+                    results, index, cdl, _cube_title(cdl) + rows,
+                    skip_unchanged
+                )
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    results.sort(key=lambda result: result[0])
+    skipped = [cdl for _, cdl, err in results if err is None]
+    failures = [(cdl, err) for _, cdl, err in results if err is not None]
+    return skipped, failures
+
+# ==============================================================================
+
+
+def write_lut_1d(cdl, size=None, ext='spi1d', skip_unchanged=None):
+    """Writes the ColorCorrection, without saturation, to a 1D lut
+
+    The lut has ``size`` entries, or ``LUT_1D_SIZE`` if it's None, and is
+    written in ``ext`` , one of ``LUT_1D_FORMATS`` . See ``bake_lut_1d()`` .
+
+    If ``skip_unchanged`` is True, or if it's None and
+    ``config.SKIP_UNCHANGED`` is True, an existing file with the same contents
+    is left untouched, and other files are replaced atomically. Returns False
+    if the file was skipped, otherwise True.
+
+    """
+    return _write_file(
+        cdl.file_out, bake_lut_1d(cdl, size, ext), skip_unchanged
+    )
+
+# ==============================================================================
+# PRIVATE FUNCTIONS
+# ==============================================================================
+
+
+def _bake_1d_rows(grade, size):
+    """Returns the rows of a 1D lut of a grade"""
+    steps = numpy.linspace(0.0, 1.0, size)
+    values = apply_cdl(
+        numpy.repeat(steps[:, None], 3, 1),
+        slope=grade[0:3],
+        offset=grade[3:6],
+        power=grade[6:9],
+        sat=1.0
+    )
+    return _format_rows(values)
+
+# ==============================================================================
+
+
+def _bake_rows(key):
+    """Returns the size and rows of a .cube lut of a (grade, size) key
+
+    Module level so that pool processes can be given it.
+
+    """
+    grade, size = key
+    steps = numpy.linspace(0.0, 1.0, size)
+    blue, green, red = numpy.meshgrid(steps, steps, steps, indexing='ij')
+    lattice = numpy.stack([red, green, blue], -1).reshape(-1, 3)
+    values = apply_cdl(
+        lattice,
+        slope=grade[0:3],
+        offset=grade[3:6],
+        power=grade[6:9],
+        sat=grade[9],
+        out=lattice
+    )
+    return enc('LUT_3D_SIZE {size}\n\n'.format(size=size)) + \
+        _format_rows(values)
+
+# ==============================================================================
+
+
+def _cube_size(size):
+    """Returns size, or CUBE_SIZE if None, raising if .cube can't hold it"""
+    if size is None:
+        size = CUBE_SIZE
+    if not _CUBE_SIZES[0] <= size <= _CUBE_SIZES[1]:
+        raise ValueError(
+            'Cube sizes must be from {min} to {max}, not {size}.'.format(
+                min=_CUBE_SIZES[0], max=_CUBE_SIZES[1], size=size
+            )
+        )
+    return size
+
+# ==============================================================================
+
+
+def _cube_title(cdl):
+    """Returns the TITLE line of a correction's .cube lut"""
+    return enc('TITLE "{id}"\n'.format(id=cdl.id.replace('"', "'")))
+
+# ==============================================================================
+
+
+def _format_rows(values):
+    """Returns rows of values between 0 and 1 as text, to 6 decimal places
+
+    Values that are clamped between 0 and 1 always format to the same 8
+    characters, ``d.dddddd`` , so rather than formatting each with Python,
+    the digits are computed for every value at once and written into a
+    byte array of the rows' text.
+
+    """
+    micros = numpy.rint(values * 1e6).astype(numpy.int64)
+    text = numpy.empty(values.shape + (9, ), numpy.uint8)
+    text[..., 1] = ord('.')
+    text[..., 8] = ord(' ')
+    text[..., -1, 8] = ord('\n')
+    for column in range(7, 1, -1):
+        micros, digits = numpy.divmod(micros, 10)
+        text[..., column] = digits
+        text[..., column] += ord('0')
+    text[..., 0] = micros
+    text[..., 0] += ord('0')
+    return text.tobytes()
+
+# ==============================================================================
+
+
+def _lut_1d_size(size):
+    """Returns size, or LUT_1D_SIZE if None, raising if out of range"""
+    if size is None:
+        size = LUT_1D_SIZE
+    if not _LUT_1D_SIZES[0] <= size <= _LUT_1D_SIZES[1]:
+        raise ValueError(
+            '1D lut sizes must be from {min} to {max}, not {size}.'.format(
+                min=_LUT_1D_SIZES[0], max=_LUT_1D_SIZES[1], size=size
+            )
+        )
+    return size
+
+# ==============================================================================
+
+
+def _sop_only(cdl):
+    """Returns True if the correction doesn't change saturation
+
+    Read through the correction's ``value`` , so no empty SAT node is made.
+
+    """
+    return not cdl.has_sat or cdl.value.sat == 1
+
+# ==============================================================================
+
+
+def _write_result(results, index, cdl, data, skip_unchanged):
+    """Writes data to the correction's file, noting skips and failures"""
+    try:
+        written = _write_file(cdl.file_out, data, skip_unchanged)
+    # Like write_single_files(), one failed file mustn't stop the rest being
+    # written.
+    except Exception as err:  # pylint: disable=W0703
+        results.append((index, cdl, err))
+    else:
+        if not written:
+            results.append((index, cdl, None))
@@ -6,11 +6,21 @@ CDL Convert Parse
 
 Contains parser functions for converting files to cdl_convert objects.
 
+## Classes
+
+    CdlbReader
+        Maps a binary cdlb file into memory and decodes corrections only as
+        they're asked for.
+
 ## Public Functions
 
     parse_ale()
         Parses an ALE EDL file into a ColorCollection set to ccc.
 
+    parse_archive()
+        Parses the cc, ccc, cdl and rcdl members of a tar or zip archive into
+        a ColorCollection set to ccc, without extracting them.
+
     parse_cc()
         Parses an XML CC file into a ColorCorrection.
 
@@ -20,6 +30,22 @@ Contains parser functions for converting files to cdl_convert objects.
     parse_cdl
         Parses an XML CDL file into a ColorCollection set to cdl.
 
+    parse_cdlb()
+        Parses a binary cdlb file into a ColorCollection, exactly as it was
+        written.
+
+    iter_csv()
+        Yields a ColorCorrection for each row of a csv file, validating and
+        building them a chunk of rows at a time.
+
+    iter_jsonl()
+        Yields the ColorCorrection or ColorDecision on each line of a JSON
+        Lines file, one at a time.
+
+    parse_csv()
+        Parses a csv file, such as one exported from a spreadsheet, into a
+        ColorCollection set to ccc.
+
     parse_file()
         Determines which parse function to call based on file extension (or
         provided ext arg) and calls that function. Returns result.
@@ -27,16 +53,29 @@ Contains parser functions for converting files to cdl_convert objects.
     parse_flex()
         Parses a FLEx EDL into a ColorCollection set to ccc.
 
+    parse_jsonl()
+        Parses a JSON Lines file into a ColorCollection.
+
     parse_rnh_cdl
         Parses a Rhythm & Hues Space Separated cdl file, which is based on a
         very early ASC CDL spec, into a single ColorCorrection.
 
 ## GLOBALS
 
+    CSV_FIELDS
+        The fields of a csv file, in the order ``write_csv()`` writes their
+        columns.
+
     INPUT_FORMATS
         A dictionary whose keys are file extensions and values are the above
         functions. Used by ``parse_file()`` to determine what parser to call.
 
+    CDLB_MAGIC
+        The bytes every cdlb file starts with.
+
+    CDLB_VERSION
+        The version of the cdlb layout written, and the newest one read.
+
 ## License
 
 The MIT License (MIT)
@@ -74,34 +113,603 @@ from __future__ import absolute_import, print_function
 # Standard Imports
 
 from ast import literal_eval
+import codecs
+import csv
+from decimal import Decimal
+import io
+import json
+import mmap
 import os
 import re
+import struct
+import sys
+import tarfile
 from xml.etree import ElementTree
+import zipfile
 
 # cdl_convert imports
 
-from . import config, collection, correction
+from . import config, collection, correction, decision, utils
+
+# Python 3 compatibility
+
+try:
+    xrange
+except NameError:  # pragma: no cover
+    xrange = range  # pylint: disable=W0622, C0103
 
 # ==============================================================================
 # EXPORTS
 # ==============================================================================
 
 __all__ = [
+    'CdlbReader',
+    'CSV_FIELDS',
+    'iter_csv',
+    'iter_jsonl',
     'parse_ale',
+    'parse_archive',
     'parse_cc',
     'parse_ccc',
     'parse_cdl',
+    'parse_cdlb',
     'parse_cmx',
+    'parse_csv',
     'parse_file',
     'parse_flex',
+    'parse_jsonl',
     'parse_rnh_cdl'
 ]
 
+# ==============================================================================
+# CLASSES
+# ==============================================================================
+
+
+class CdlbReader(object):
+    """Reads a binary cdlb file, decoding only the parts asked for
+
+    Description
+    ~~~~~~~~~~~
+
+    The file is mapped into memory with ``mmap`` rather than read, so opening
+    it costs almost nothing however many corrections it holds. The values
+    and ids of single corrections can then be looked up without building
+    any objects, and ``load()`` builds the whole :class:`ColorCollection` .
+
+    ::
+
+        with CdlbReader('/show/grades.cdlb') as reader:
+            slope_r = reader.values(reader.ids.index('sh010'))[0]
+
+    See ``write_cdlb()`` for the layout of the file.
+
+    **Args:**
+
+        input_file : (str)
+            The filepath to the cdlb file.
+
+    **Raises:**
+
+        ValueError:
+            If the file isn't a cdlb file, was written by a newer version of
+            the format, or is too short for the tables its header lists.
+
+    **Attributes:**
+
+        closed : (bool)
+            True once the file has been unmapped.
+
+        ids : [str]
+            The id of each :class:`ColorCorrection` in the file, in order.
+            The corrections held by a collection come first, followed by
+            those held by its :class:`ColorDecision` .
+
+    **Public Methods:**
+
+        close()
+            Unmaps the file.
+
+        correction()
+            Builds the :class:`ColorCorrection` at an index.
+
+        load()
+            Builds the :class:`ColorCollection` held by the file.
+
+        values()
+            Returns the slope, offset, power and sat values of the
+            correction at an index.
+
+    """
+
+    def __init__(self, input_file):
+        self._file_in = os.path.abspath(input_file)
+        with open(input_file, 'rb') as cdlb_f:
+            try:
+                self._map = mmap.mmap(
+                    cdlb_f.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:  # An empty file can't be mapped
+                raise ValueError(
+                    "{path} is not a cdlb file.".format(path=input_file)
+                )
+        self._closed = False
+
+        if self._map.size() < _CDLB_HEADER.size or \
+                self._map[:len(CDLB_MAGIC)] != CDLB_MAGIC:
+            self.close()
+            raise ValueError(
+                "{path} is not a cdlb file.".format(path=input_file)
+            )
+        header = _CDLB_HEADER.unpack_from(self._map, 0)
+        if header[1] > CDLB_VERSION:
+            self.close()
+            raise ValueError(
+                "{path} is cdlb version {version}, newer than the supported "
+                "version {supported}.".format(
+                    path=input_file,
+                    version=header[1],
+                    supported=CDLB_VERSION
+                )
+            )
+        (
+            self._string_count, self._desc_count, self._count,
+            self._child_count, self._decision_count,
+            self._strings_pos, self._text_pos, self._descs_pos,
+            self._corrections_pos, self._coefficients_pos,
+            self._exponents_pos, self._decisions_pos,
+        ) = header[3:15]
+        self._collection = header[15:]
+        self._ids = None
+
+        if not self._fits():
+            self.close()
+            raise self._corrupt()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def __len__(self):
+        return self._count
+
+    # Properties ==============================================================
+
+    @property
+    def closed(self):
+        """True once the file has been unmapped"""
+        return self._closed
+
+    @property
+    def ids(self):
+        """The id of each ColorCorrection in the file, decoded once"""
+        if self._ids is None:
+            self._ids = [
+                self._string(self._record(index)[0])
+                for index in xrange(self._count)
+            ]
+        return self._ids
+
+    # Private Methods =========================================================
+
+    def _build_corrections(self, indexes, lookup, descs=None, strings=None):
+        """Builds the ColorCorrections at indexes, allocating ids in bulk"""
+        records = [self._record(index) for index in indexes]
+        # pylint: disable=W0212
+        cc_ids = collection._allocate_ids(
+            [lookup(record[0]) for record in records]
+        )
+        decimals = {}
+        corrections = []
+        for index, record, cc_id in zip(indexes, records, cc_ids):
+            (
+                _, input_desc, viewing_desc, desc_start, desc_count,
+                sop_start, sop_count, sat_start, sat_count, flags
+            ) = record
+            values = self._decimals(index, decimals, strings)
+            sop = sat = None
+            if flags & _CDLB_HAS_SOP:
+                sop = (values[0:3], values[3:6], values[6:9])
+            if flags & _CDLB_HAS_SAT:
+                sat = values[9]
+            color_correct = correction.ColorCorrection._from_validated(
+                cc_id, sop, sat,
+                self._descs(desc_start, desc_count, lookup, descs)
+            )
+            color_correct._file_in = self._file_in
+            color_correct.input_desc = lookup(input_desc)
+            color_correct.viewing_desc = lookup(viewing_desc)
+            if sop_count:
+                color_correct.sop_node._desc = self._descs(
+                    sop_start, sop_count, lookup, descs
+                )
+            if sat_count:
+                color_correct.sat_node._desc = self._descs(
+                    sat_start, sat_count, lookup, descs
+                )
+            corrections.append(color_correct)
+        return corrections
+
+    # =========================================================================
+
+    def _corrupt(self):
+        """Returns the error raised for a truncated or corrupt file"""
+        return ValueError(
+            "{path} is a truncated or corrupt cdlb file.".format(
+                path=self._file_in
+            )
+        )
+
+    # =========================================================================
+
+    def _decimals(self, index, decimals=None, strings=None):
+        """Returns the 10 Decimals packed for the correction at index"""
+        coefficients = _CDLB_COEFFICIENTS.unpack_from(
+            self._map,
+            self._coefficients_pos + index * _CDLB_COEFFICIENTS.size
+        )
+        exponents = _CDLB_EXPONENTS.unpack_from(
+            self._map, self._exponents_pos + index * _CDLB_EXPONENTS.size
+        )
+        if decimals is None:
+            decimals = {}
+        values = []
+        for coefficient, exponent in zip(coefficients, exponents):
+            key = (coefficient, exponent)
+            try:
+                value = decimals[key]
+            except KeyError:
+                if exponent == _CDLB_TEXT_VALUE:
+                    # The coefficient is the index of the value's text
+                    text = strings[coefficient] if strings else \
+                        self._string(coefficient)
+                    value = Decimal(text)
+                else:
+                    value = Decimal(coefficient).scaleb(exponent)
+                decimals[key] = value
+            values.append(value)
+        return values
+
+    # =========================================================================
+
+    def _descs(self, start, count, lookup, descs=None):
+        """Returns the list of descriptions at start of the desc table"""
+        if start + count > self._desc_count:
+            raise self._corrupt()
+        if descs is None:
+            descs = struct.unpack_from(
+                '<{count}I'.format(count=count),
+                self._map,
+                self._descs_pos + start * 4
+            )
+            start = 0
+        return [lookup(index) for index in descs[start:start + count]]
+
+    # =========================================================================
+
+    def _fits(self):
+        """Returns True if every table the header lists is within the file"""
+        size = self._map.size()
+        tables = [
+            (self._strings_pos, (self._string_count + 1) * 8),
+            (self._descs_pos, self._desc_count * 4),
+            (self._corrections_pos, self._count * _CDLB_CORRECTION.size),
+            (self._coefficients_pos, self._count * _CDLB_COEFFICIENTS.size),
+            (self._exponents_pos, self._count * _CDLB_EXPONENTS.size),
+            (self._decisions_pos, self._decision_count * _CDLB_DECISION.size),
+        ]
+        if self._child_count > self._count or \
+                any(pos + length > size for pos, length in tables):
+            return False
+        # The last string offset is the end of the string text
+        text_end = struct.unpack_from(
+            '<Q', self._map, self._strings_pos + self._string_count * 8
+        )[0]
+        return self._text_pos + text_end <= size
+
+    # =========================================================================
+
+    def _load(self):
+        """Builds the ColorCollection held by the file, see load()"""
+        strings = self._strings()
+        lookup = lambda index: None if index == _CDLB_NONE else strings[index]
+        descs = struct.unpack_from(
+            '<{count}I'.format(count=self._desc_count),
+            self._map,
+            self._descs_pos
+        )
+        corrections = self._build_corrections(
+            xrange(self._count), lookup, descs, strings
+        )
+
+        decisions = []
+        for index in xrange(self._decision_count):
+            (
+                input_desc, viewing_desc, desc_start, desc_count, cc_index,
+                ref_id, ref_target, media_ref
+            ) = _CDLB_DECISION.unpack_from(
+                self._map, self._decisions_pos + index * _CDLB_DECISION.size
+            )
+            if cc_index != _CDLB_NONE:
+                color_correct = corrections[cc_index]
+            elif ref_target != _CDLB_NONE:
+                # Follows the correction if it was renamed on load
+                color_correct = decision.ColorCorrectionRef(
+                    corrections[ref_target].id
+                )
+            else:
+                color_correct = decision.ColorCorrectionRef(lookup(ref_id))
+            if media_ref != _CDLB_NONE:
+                media_ref = decision.MediaRef(lookup(media_ref))
+            else:
+                media_ref = None
+            color_decision = decision.ColorDecision(color_correct, media_ref)
+            color_decision.input_desc = lookup(input_desc)
+            color_decision.viewing_desc = lookup(viewing_desc)
+            color_decision.desc = self._descs(
+                desc_start, desc_count, lookup, descs
+            )
+            decisions.append(color_decision)
+
+        collection_type, input_desc, viewing_desc, desc_start, desc_count = \
+            self._collection
+        col = collection.ColorCollection(input_file=self._file_in)
+        col.type = lookup(collection_type)
+        col.input_desc = lookup(input_desc)
+        col.viewing_desc = lookup(viewing_desc)
+        col.desc = self._descs(desc_start, desc_count, lookup, descs)
+        # Ids were already allocated, so the membership checks are skipped
+        col._color_corrections = corrections[:self._child_count]  # pylint: disable=W0212
+        col._color_decisions = decisions  # pylint: disable=W0212
+        col.set_parentage()
+
+        return col
+
+    # =========================================================================
+
+    def _record(self, index):
+        """Returns the fields of the correction record at index"""
+        if not 0 <= index < self._count:
+            raise IndexError(
+                "cdlb correction index {index} out of range".format(
+                    index=index
+                )
+            )
+        return _CDLB_CORRECTION.unpack_from(
+            self._map, self._corrections_pos + index * _CDLB_CORRECTION.size
+        )
+
+    # =========================================================================
+
+    def _string(self, index):
+        """Returns the string at an index of the string table"""
+        if index == _CDLB_NONE:
+            return None
+        if index >= self._string_count:
+            raise self._corrupt()
+        start, end = _CDLB_SPAN.unpack_from(
+            self._map, self._strings_pos + index * 8
+        )
+        return _text(self._map[self._text_pos + start:self._text_pos + end])
+
+    # =========================================================================
+
+    def _strings(self):
+        """Returns every string of the string table"""
+        offsets = struct.unpack_from(
+            '<{count}Q'.format(count=self._string_count + 1),
+            self._map,
+            self._strings_pos
+        )
+        text = self._map[self._text_pos:self._text_pos + offsets[-1]]
+        return [
+            _text(text[start:end]) for start, end in zip(offsets, offsets[1:])
+        ]
+
+    # Public Methods ==========================================================
+
+    def close(self):
+        """Unmaps the file. Does nothing if closed"""
+        if self._closed:
+            return
+        self._closed = True
+        self._map.close()
+
+    # =========================================================================
+
+    def correction(self, index):
+        """Builds the ColorCorrection at an index
+
+        **Args:**
+            index : (int)
+                The position of the correction in ``ids`` .
+
+        **Returns:**
+            (:class:`ColorCorrection`)
+                A new correction with the id, descriptions and values stored.
+                Its id is changed if already taken, as when initializing a
+                :class:`ColorCorrection` . It has no parent.
+
+        **Raises:**
+            IndexError:
+                If there's no correction at index.
+
+        """
+        return self._build_corrections([index], self._string)[0]
+
+    # =========================================================================
+
+    def load(self):
+        """Builds the ColorCollection held by the file
+
+        **Args:**
+            N/A
+
+        **Returns:**
+            (:class:`ColorCollection`)
+                A collection holding everything the written collection held:
+                its type and descriptions, and every :class:`ColorCorrection`
+                and :class:`ColorDecision` with their descriptions, values,
+                :class:`ColorCorrectionRef` and :class:`MediaRef` . The
+                ``file_in`` of the collection and its corrections is the cdlb
+                file.
+
+        **Raises:**
+            ValueError:
+                If the file is corrupt, or if ``HALT_ON_ERROR`` is set and an
+                id in the file is already registered.
+
+        Every string in the file is decoded once, and each distinct value
+        is only converted to a Decimal once.
+
+        """
+        try:
+            return self._load()
+        except IndexError:
+            # An index read from the file is out of range
+            raise self._corrupt()
+
+    # =========================================================================
+
+    def values(self, index):
+        """Returns the values of the ColorCorrection at an index
+
+        **Args:**
+            index : (int)
+                The position of the correction in ``ids`` .
+
+        **Returns:**
+            ((Decimal, Decimal, Decimal), (Decimal, Decimal, Decimal),
+            (Decimal, Decimal, Decimal), Decimal)
+                The slope, offset, power and sat of the correction, with the
+                defaults for any it didn't have set.
+
+        **Raises:**
+            IndexError:
+                If there's no correction at index.
+
+        Only this correction's record is decoded, and no objects are built.
+
+        """
+        flags = self._record(index)[9]
+        values = self._decimals(index)
+        sop = values[:9] if flags & _CDLB_HAS_SOP else \
+            correction._IDENTITY_SOP  # pylint: disable=W0212
+        sat = values[9] if flags & _CDLB_HAS_SAT else \
+            correction._IDENTITY_SAT  # pylint: disable=W0212
+        return tuple(sop[0:3]), tuple(sop[3:6]), tuple(sop[6:9]), sat
+
 # ==============================================================================
 # FUNCTIONS
 # ==============================================================================
 
 
+def iter_csv(input_file, columns=None):
+    """Yields a ColorCorrection for each row of a csv file
+
+    **Args:**
+        input_file : (str)
+            The filepath to the csv file.
+
+        columns=None : {str: str}
+            Maps fields to the header of the column holding them, for columns
+            that aren't named after their field. Defaults to
+            ``config.CSV_COLUMNS`` . See ``write_csv()`` for the fields.
+
+    **Yields:**
+        (:class:`ColorCorrection`)
+            A new correction for each row, in order. Blank rows are skipped.
+
+    **Raises:**
+        TypeError:
+            If a value isn't a number.
+
+        ValueError:
+            If the file has no id column, a ``columns`` field is unknown, a
+            value is invalid, or only some of the rgb columns of a slope,
+            offset or power are filled. Errors in values name their row,
+            counting the header as row 1, as spreadsheets do.
+
+    The first row must be a header. Columns of fields that aren't in the
+    header are left unset, and columns that aren't fields are ignored, so
+    spreadsheets with columns of their own can be read as they are. A
+    :class:`SopNode` is only created for rows with slope, offset or power
+    values, and a :class:`SatNode` for rows with a sat value.
+
+    Rows are read with the standard library ``csv`` module, and converted
+    ``_CSV_CHUNK_SIZE`` at a time: each chunk's values are checked together
+    with ``validate_values()`` and its corrections built without the value
+    setters, as ``ColorCollection.from_arrays()`` does. Memory use doesn't
+    grow with the size of the file unless the caller keeps what's yielded,
+    apart from the ids read so far, which are kept so that a repeated id is
+    renamed even once the correction first given it has been freed.
+
+    """
+    layout = _csv_layout(columns)
+    with _open_csv(input_file) as csv_f:
+        reader = csv.reader(csv_f)
+        header = {}
+        for i, name in enumerate(next(reader, [])):
+            header.setdefault(name.strip(), i)
+        found = [
+            (field, header[name]) for field, name in layout if name in header
+        ]
+        if 'id' not in dict(found):
+            raise ValueError(
+                'The csv file {path} has no "{name}" column.'.format(
+                    path=input_file,
+                    name=dict(layout)['id']
+                )
+            )
+
+        chunk = []
+        taken = set()
+        # The header is row 1
+        for row_number, row in enumerate(reader, 2):
+            if not any(cell.strip() for cell in row):
+                continue
+            chunk.append((row_number, row))
+            if len(chunk) == _CSV_CHUNK_SIZE:
+                for cdl in _csv_chunk(chunk, found, input_file, taken):
+                    yield cdl
+                chunk = []
+        for cdl in _csv_chunk(chunk, found, input_file, taken):
+            yield cdl
+
+# ==============================================================================
+
+
+def iter_jsonl(input_file):
+    """Yields the correction or decision on each line of a JSON Lines file
+
+    **Args:**
+        input_file : (str)
+            The filepath to the JSON Lines file.
+
+    **Yields:**
+        (:class:`ColorCorrection`|:class:`ColorDecision`)
+            A new object for each line, in order. Blank lines and
+            collection header lines are skipped. See ``write_jsonl()`` for
+            the schema of each line.
+
+    **Raises:**
+        ValueError:
+            If a line isn't a JSON object, has an unknown ``type`` , or is
+            missing the ``id`` of a correction or the ``cc`` or ``cc_ref`` of
+            a decision.
+
+    The file is read one line at a time, so memory use doesn't grow with the
+    size of the file unless the caller keeps what's yielded.
+
+    """
+    return _iter_jsonl(input_file)
+
+# ==============================================================================
+
+
 def parse_ale(input_file):  # pylint: disable=R0914
     """Parses an Avid Log Exchange (ALE) file for CDLs
 
@@ -197,6 +805,62 @@ def parse_ale(input_file):  # pylint: disable=R0914
 # ==============================================================================
 
 
+def parse_archive(input_file):
+    """Parses the CDL files inside a tar or zip archive
+
+    **Args:**
+        input_file : (str)
+            The filepath to the archive. Tar archives may be compressed.
+
+    **Returns:**
+        (:class:`ColorCollection`)
+            A collection holding every :class:`ColorCorrection` and
+            :class:`ColorDecision` found in the archive's members.
+
+    **Raises:**
+        ValueError:
+            Bad XML formatting in a member can raise ValueError if missing
+            required elements.
+
+    Members ending in ``.cc``, ``.ccc``, ``.cdl`` and ``.rcdl`` are read
+    straight out of the archive one at a time and parsed as those formats,
+    such as an archive written by :class:`ArchiveWriter` . Other members are
+    skipped. The children of ``ccc`` and ``cdl`` members are added to the
+    returned collection, but their descriptions are not.
+
+    A :class:`ColorCorrection` parsed from a ``cc`` or ``rcdl`` member has a
+    ``file_in`` of the member's name joined to the archive's path.
+
+    """
+    children = []
+    for name, data in _iter_archive(input_file):
+        ext = name.split('.')[-1].lower()
+        if ext not in _ARCHIVE_MEMBER_FORMATS:
+            continue
+        member_path = os.path.join(input_file, name)
+        if ext == 'rcdl':
+            if not isinstance(data, str):
+                # Python 3 reads bytes, which don't split like text
+                data = data.decode('UTF-8')
+            children.append(_parse_rnh_line(data, member_path))
+        elif ext == 'cc':
+            cdl = parse_cc(_xml_root(data))
+            cdl.file_in = member_path
+            children.append(cdl)
+        else:
+            member = INPUT_FORMATS[ext](_xml_root(data))
+            children.extend(member.all_children)
+
+    ccc = collection.ColorCollection()
+    ccc.file_in = input_file
+    # Appending all at once only checks the ids of the collection once.
+    ccc.append_children(children)
+
+    return ccc
+
+# ==============================================================================
+
+
 def parse_cc(input_file):  # pylint: disable=R0912
     """Parses a .cc file for ASC CDL information
 
@@ -343,8 +1007,8 @@ def parse_ccc(input_file):
     """Parses a .ccc file into a :class:`ColorCollection` with type 'ccc'
 
     **Args:**
-        input_file : (str)
-            The filepath to the CCC.
+        input_file : (str|<ElementTree.Element>)
+            The filepath to the CCC or the ``ElementTree.Element`` object.
 
     **Returns:**
         (:class:`ColorCollection`)
@@ -366,7 +1030,11 @@ def parse_ccc(input_file):
     as any relevant hardware devices used to view or grade.
 
     """
-    root = _remove_xmlns(input_file)
+    if type(input_file) is str:
+        root = _remove_xmlns(input_file)
+    else:
+        root = input_file
+        input_file = None
 
     if root.tag != 'ColorCorrectionCollection':
         # This is not a CCC file...
@@ -399,8 +1067,8 @@ def parse_cdl(input_file):
     """Parses a .cdl file into a :class:`ColorCollection` with type 'cdl'
 
     **Args:**
-        input_file : (str)
-            The filepath to the CDL.
+        input_file : (str|<ElementTree.Element>)
+            The filepath to the CDL or the ``ElementTree.Element`` object.
 
     **Returns:**
         (:class:`ColorCollection`)
@@ -423,7 +1091,11 @@ def parse_cdl(input_file):
     as any relevant hardware devices used to view or grade.
 
     """
-    root = _remove_xmlns(input_file)
+    if type(input_file) is str:
+        root = _remove_xmlns(input_file)
+    else:
+        root = input_file
+        input_file = None
 
     if root.tag != 'ColorDecisionList':
         # This is not a CDL file...
@@ -452,6 +1124,32 @@ def parse_cdl(input_file):
 # ==============================================================================
 
 
+def parse_cdlb(input_file):
+    """Parses a binary cdlb file into a ColorCollection
+
+    **Args:**
+        input_file : (str)
+            The filepath to the cdlb file.
+
+    **Returns:**
+        (:class:`ColorCollection`)
+            The collection written to the file, with the same type,
+            descriptions, :class:`ColorCorrection` and
+            :class:`ColorDecision` . See ``CdlbReader.load()`` .
+
+    **Raises:**
+        ValueError:
+            If the file isn't a cdlb file, is truncated or corrupt, or if
+            ``HALT_ON_ERROR`` is set and an id in the file is already
+            registered.
+
+    """
+    with CdlbReader(input_file) as reader:
+        return reader.load()
+
+# ==============================================================================
+
+
 def parse_cmx(input_file):  # pylint: disable=R0912,R0914
     """Parses a CMX EDL file for ASC CDL information.
 
@@ -527,6 +1225,44 @@ def parse_cmx(input_file):  # pylint: disable=R0912,R0914
 # ==============================================================================
 
 
+def parse_csv(input_file, columns=None):
+    """Parses a csv file into a ColorCollection
+
+    **Args:**
+        input_file : (str)
+            The filepath to the csv file.
+
+        columns=None : {str: str}
+            Maps fields to the header of the column holding them. See
+            ``iter_csv()`` .
+
+    **Returns:**
+        (:class:`ColorCollection`)
+            A collection holding a :class:`ColorCorrection` for each row of
+            the file, in order, set to ``ccc`` . csv files don't hold the
+            ``desc`` , ``input_desc`` or ``viewing_desc`` of a collection,
+            so it has none.
+
+    **Raises:**
+        TypeError:
+            See ``iter_csv()`` .
+
+        ValueError:
+            See ``iter_csv()`` .
+
+    """
+    col = collection.ColorCollection(input_file=input_file)
+    # Ids were allocated as each chunk of corrections was built
+    col._color_corrections = list(  # pylint: disable=W0212
+        iter_csv(input_file, columns)
+    )
+    col.set_parentage()
+
+    return col
+
+# ==============================================================================
+
+
 def parse_flex(input_file):  # pylint: disable=R0912,R0914
     """Parses a DaVinci FLEx telecine EDL for ASC CDL information.
 
@@ -680,6 +1416,46 @@ def parse_flex(input_file):  # pylint: disable=R0912,R0914
 # ==============================================================================
 
 
+def parse_jsonl(input_file):
+    """Parses a JSON Lines file into a ColorCollection
+
+    **Args:**
+        input_file : (str)
+            The filepath to the JSON Lines file.
+
+    **Returns:**
+        (:class:`ColorCollection`)
+            A collection holding every :class:`ColorCorrection` and
+            :class:`ColorDecision` in the file, in order, with the
+            descriptions of any collection header. It's set to ``cdl`` if
+            the file has any decisions, otherwise to ``ccc`` .
+
+    **Raises:**
+        ValueError:
+            See ``iter_jsonl()`` .
+
+    """
+    col = collection.ColorCollection(input_file=input_file)
+    corrections = []
+    decisions = []
+    for node in _iter_jsonl(input_file, col):
+        if isinstance(node, decision.ColorDecision):
+            decisions.append(node)
+        else:
+            corrections.append(node)
+
+    if decisions:
+        col.set_to_cdl()
+    # Ids were checked as each correction was created
+    col._color_corrections = corrections  # pylint: disable=W0212
+    col._color_decisions = decisions  # pylint: disable=W0212
+    col.set_parentage()
+
+    return col
+
+# ==============================================================================
+
+
 def parse_rnh_cdl(input_file):
     """Parses a space separated .cdl file for ASC CDL information.
 
@@ -709,28 +1485,398 @@ def parse_rnh_cdl(input_file):
     with open(input_file, 'rU') as cdl_f:
         # We only need to read the first line
         line = cdl_f.readline()
-        line = line.split()
 
-        # The filename without extension will become the id
-        filename = os.path.basename(input_file).split('.')[0]
+    return _parse_rnh_line(line, input_file)
+
+# ==============================================================================
+# PRIVATE FUNCTIONS
+# ==============================================================================
+
+
+def _csv_chunk(chunk, found, input_file, taken):
+    """Validates and builds the ColorCorrections of a chunk of csv rows
+
+    chunk holds the number and cells of each row, and found the field and
+    index of each column read. The chunk is split into a list per field, and
+    every value is checked at once. taken holds the ids of earlier chunks,
+    and is updated with this chunk's.
+
+    """
+    numbers = [row_number for row_number, row in chunk]
+    cells = {}
+    for field, index in found:
+        cells[field] = [
+            row[index].strip() if index < len(row) else ''
+            for row_number, row in chunk
+        ]
+    values = _csv_values(cells, numbers, input_file)
+
+    checked = utils.validate_values(
+        values['slope'], values['offset'], values['power'], values['sat'],
+        len(numbers)
+    )
+    if checked.errors:
+        invalid = checked.errors[0]
+        raise type(invalid.error)(
+            'Invalid {name} on row {row} of {path}: {error}'.format(
+                name=invalid.name,
+                row=numbers[invalid.index],
+                path=input_file,
+                error=invalid.error
+            )
+        )
+
+    slopes, offsets, powers, sats = [
+        checked.values[name] for name in ('slope', 'offset', 'power', 'sat')
+    ]
+    descs = cells.get('desc') or [None] * len(numbers)
+    file_in = os.path.abspath(input_file)
+    # pylint: disable=W0212
+    for i, cc_id in enumerate(collection._allocate_ids(cells['id'], taken)):
+        sop = (slopes[i], offsets[i], powers[i])
+        if sop == (None, None, None):
+            sop = None
+        color_correct = correction.ColorCorrection._from_validated(
+            cc_id, sop, sats[i], descs[i].splitlines() if descs[i] else None
+        )
+        color_correct._file_in = file_in
+        yield color_correct
+
+# ==============================================================================
+
+
+def _csv_layout(columns=None):
+    """Returns the field and header of each column of a csv file, in order
+
+    columns maps fields to headers, defaulting to ``config.CSV_COLUMNS`` .
+    Other fields are their own header. A ``slope`` , ``offset`` or ``power``
+    field takes the place of its three rgb columns, and a ``sop`` field the
+    place of all nine.
+
+    """
+    if columns is None:
+        columns = config.CSV_COLUMNS or {}
+    unknown = [
+        field for field in columns
+        if field not in CSV_FIELDS and field not in _CSV_GROUPS
+    ]
+    if unknown:
+        raise ValueError(
+            'Unknown csv fields: {fields}. Fields are {known}.'.format(
+                fields=', '.join(sorted(unknown)),
+                known=', '.join(list(CSV_FIELDS) + sorted(_CSV_GROUPS))
+            )
+        )
+
+    grouped = {}
+    for group in ('sop', 'slope', 'offset', 'power'):
+        if group in columns:
+            for field in _CSV_GROUPS[group]:
+                if field in grouped:
+                    raise ValueError(
+                        'The csv fields {first} and {second} both hold '
+                        '{field}.'.format(
+                            first=grouped[field],
+                            second=group,
+                            field=field
+                        )
+                    )
+                grouped[field] = group
+
+    layout = []
+    for field in CSV_FIELDS:
+        field = grouped.get(field, field)
+        # The columns of a group are next to each other
+        if layout and layout[-1][0] == field:
+            continue
+        layout.append((field, columns.get(field, field)))
+    return layout
+
+# ==============================================================================
+
+
+def _csv_numbers(cell, count, name, row_number, input_file):
+    """Returns the count numbers in a csv cell, or None if it's empty
+
+    A single number is returned as is for a cell of 3, as it's used for all
+    three rgb values.
+
+    """
+    if not cell:
+        return None
+    numbers = _CSV_NUMBER.findall(cell)
+    if len(numbers) == count:
+        return numbers
+    if count == 3 and len(numbers) == 1:
+        return numbers[0]
+    raise ValueError(
+        'The {name} on row {row} of {path} does not have {count} '
+        'values.'.format(
+            name=name,
+            row=row_number,
+            path=input_file,
+            count=count
+        )
+    )
+
+# ==============================================================================
+
+
+def _csv_values(cells, numbers, input_file):
+    """Returns the slope, offset, power and sat columns of csv cells
+
+    cells holds a list of cells for each field read, and numbers the row
+    number of each. Each column is None if no field holds it, and an entry
+    is None where its cells are empty.
+
+    """
+    values = {'slope': None, 'offset': None, 'power': None, 'sat': None}
+    if 'sop' in cells:
+        sops = [
+            _csv_numbers(cell, 9, 'sop', row_number, input_file)
+            for cell, row_number in zip(cells['sop'], numbers)
+        ]
+        for i, name in enumerate(['slope', 'offset', 'power']):
+            values[name] = [
+                sop[i * 3:i * 3 + 3] if sop else None for sop in sops
+            ]
+
+    for name in ('slope', 'offset', 'power'):
+        if name in cells:
+            values[name] = [
+                _csv_numbers(cell, 3, name, row_number, input_file)
+                for cell, row_number in zip(cells[name], numbers)
+            ]
+        elif any(field in cells for field in _CSV_GROUPS[name]):
+            fields = _CSV_GROUPS[name]
+            channels = [
+                cells.get(field, [''] * len(numbers)) for field in fields
+            ]
+            values[name] = []
+            for rgb, row_number in zip(zip(*channels), numbers):
+                if all(rgb):
+                    values[name].append(list(rgb))
+                elif any(rgb):
+                    raise ValueError(
+                        'The {field} on row {row} of {path} is empty, but '
+                        'other {name} values are given.'.format(
+                            field=fields[list(rgb).index('')],
+                            row=row_number,
+                            path=input_file,
+                            name=name
+                        )
+                    )
+                else:
+                    values[name].append(None)
+
+    if 'sat' in cells:
+        values['sat'] = [cell or None for cell in cells['sat']]
+    return values
+
+# ==============================================================================
+
+
+def _iter_archive(input_file):
+    """Yields the name and bytes of each file in a tar or zip archive"""
+    if zipfile.is_zipfile(input_file):
+        with zipfile.ZipFile(input_file) as archive:
+            for info in archive.infolist():
+                if not info.filename.endswith('/'):
+                    yield info.filename, archive.read(info)
+        return
+
+    # Compression is detected, and members are read in order without seeking
+    archive = tarfile.open(input_file, 'r|*')
+    try:
+        for member in archive:
+            if member.isfile():
+                yield member.name, archive.extractfile(member).read()
+    finally:
+        archive.close()
+
+# ==============================================================================
+
+
+def _json_value(value):
+    """Returns JSON text values as native strings for the value setters"""
+    if isinstance(value, list):
+        return [_json_value(i) for i in value]
+    if sys.version_info[0] < 3 and isinstance(value, unicode):  # pylint: disable=E0602
+        return value.encode('UTF-8')
+    return value
+
+# ==============================================================================
+
+
+def _iter_jsonl(input_file, col=None):
+    """Yields the nodes iter_jsonl() yields, giving headers' fields to col"""
+    with open(input_file, 'rb') as jsonl_f:
+        for line_number, line in enumerate(jsonl_f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line.decode('UTF-8'))
+            except ValueError as err:
+                raise ValueError(
+                    "Invalid JSON on line {line} of {path}: {error}".format(
+                        line=line_number,
+                        path=input_file,
+                        error=err
+                    )
+                )
+            if not isinstance(record, dict):
+                record = None
+            record_type = record.get('type') if record else None
+            if record_type == 'ColorCollection':
+                if col is not None:
+                    _jsonl_collection(record, col)
+            elif record_type == 'ColorCorrection':
+                yield _jsonl_correction(record, input_file, line_number)
+            elif record_type == 'ColorDecision':
+                yield _jsonl_decision(record, input_file, line_number)
+            else:
+                raise ValueError(
+                    "The value on line {line} of {path} is not a "
+                    "ColorCollection, ColorCorrection or ColorDecision "
+                    "object.".format(
+                        line=line_number,
+                        path=input_file
+                    )
+                )
+
+# ==============================================================================
+
+
+def _jsonl_collection(record, col):
+    """Gives col the descriptions in a JSON Lines collection header
+
+    Descriptions are added to those of earlier headers, as in concatenated
+    files, and the color space descriptions of later headers win.
 
-        slope = [line[0], line[1], line[2]]
-        offset = [line[3], line[4], line[5]]
-        power = [line[6], line[7], line[8]]
+    """
+    # Setting desc with a string appends it
+    for desc in record.get('desc') or []:
+        col.desc = desc
+    for attr in ['input_desc', 'viewing_desc']:
+        if record.get(attr) is not None:
+            setattr(col, attr, record[attr])
+
+# ==============================================================================
 
-        sat = line[9]
 
-        cdl = correction.ColorCorrection(filename, input_file)
+def _jsonl_correction(record, input_file, line_number, keep_id=False):
+    """Builds a ColorCorrection from the fields of a JSON Lines record
 
-        cdl.slope = slope
-        cdl.offset = offset
-        cdl.power = power
-        cdl.sat = sat
+    If keep_id is True, the id is kept as stored even if it's already
+    registered, rather than renamed.
+
+    """
+    if not record.get('id'):
+        raise ValueError(
+            "The ColorCorrection on line {line} of {path} has no id.".format(
+                line=line_number,
+                path=input_file
+            )
+        )
+    if keep_id:
+        # pylint: disable=W0212
+        cdl = correction.ColorCorrection._from_validated(record['id'])
+        cdl._file_in = os.path.abspath(input_file) if input_file else None
+    else:
+        cdl = correction.ColorCorrection(record['id'], input_file)
+    cdl.desc = record.get('desc')
+    cdl.input_desc = record.get('input_desc')
+    cdl.viewing_desc = record.get('viewing_desc')
+
+    # Nodes are only created if the record has them
+    for attr in ['slope', 'offset', 'power', 'sat']:
+        if attr in record:
+            setattr(cdl, attr, _json_value(record[attr]))
+    if record.get('sop_desc'):
+        cdl.sop_node.desc = record['sop_desc']
+    if record.get('sat_desc'):
+        cdl.sat_node.desc = record['sat_desc']
 
     return cdl
 
 # ==============================================================================
-# PRIVATE FUNCTIONS
+
+
+def _jsonl_decision(record, input_file, line_number, keep_id=False):
+    """Builds a ColorDecision from the fields of a JSON Lines record
+
+    keep_id is passed on to the correction it holds, see
+    _jsonl_correction().
+
+    """
+    if isinstance(record.get('cc'), dict):
+        color_correct = _jsonl_correction(
+            record['cc'], input_file, line_number, keep_id
+        )
+    elif record.get('cc_ref'):
+        color_correct = decision.ColorCorrectionRef(record['cc_ref'])
+    else:
+        raise ValueError(
+            "The ColorDecision on line {line} of {path} has no cc or "
+            "cc_ref.".format(
+                line=line_number,
+                path=input_file
+            )
+        )
+    media_ref = None
+    if record.get('media_ref'):
+        media_ref = decision.MediaRef(record['media_ref'])
+
+    color_decision = decision.ColorDecision(color_correct, media_ref)
+    color_decision.desc = record.get('desc')
+    color_decision.input_desc = record.get('input_desc')
+    color_decision.viewing_desc = record.get('viewing_desc')
+
+    return color_decision
+
+# ==============================================================================
+
+
+def _open_csv(input_file):
+    """Opens a csv file for the csv module, skipping a UTF-8 byte order mark
+
+    Python 3's csv module reads text, and Python 2's reads bytes.
+
+    """
+    if sys.version_info[0] >= 3:  # pragma: no cover
+        return io.open(input_file, 'r', newline='', encoding='utf-8-sig')
+    else:  # pragma: no cover
+        csv_f = open(input_file, 'rb')
+        if csv_f.read(3) != codecs.BOM_UTF8:
+            csv_f.seek(0)
+        return csv_f
+
+# ==============================================================================
+
+
+def _parse_rnh_line(line, input_file):
+    """Parses the line of a space separated .cdl file into a ColorCorrection"""
+    line = line.split()
+
+    # The filename without extension will become the id
+    filename = os.path.basename(input_file).split('.')[0]
+
+    slope = [line[0], line[1], line[2]]
+    offset = [line[3], line[4], line[5]]
+    power = [line[6], line[7], line[8]]
+
+    sat = line[9]
+
+    cdl = correction.ColorCorrection(filename, input_file)
+
+    cdl.slope = slope
+    cdl.offset = offset
+    cdl.power = power
+    cdl.sat = sat
+
+    return cdl
+
 # ==============================================================================
 
 
@@ -747,6 +1893,24 @@ def _remove_xmlns(input_file):
     return ElementTree.fromstring(xml_string)
 
 # ==============================================================================
+
+
+def _text(raw):
+    """Returns UTF-8 bytes read from a cdlb file as a native string"""
+    if sys.version_info[0] >= 3:
+        return raw.decode('utf-8')
+    return raw
+
+# ==============================================================================
+
+
+def _xml_root(xml_bytes):
+    """Removes the xmlns attribute from XML bytes, then returns the element"""
+    xml_bytes = re.sub(b' xmlns="[^"]+"', b'', xml_bytes, count=1)
+
+    return ElementTree.fromstring(xml_bytes)
+
+# ==============================================================================
 # GLOBALS
 # ==============================================================================
 
@@ -755,11 +1919,73 @@ INPUT_FORMATS = {
     'ccc': parse_ccc,
     'cc': parse_cc,
     'cdl': parse_cdl,
+    'cdlb': parse_cdlb,
+    'csv': parse_csv,
     'edl': parse_cmx,
     'flex': parse_flex,
+    'jsonl': parse_jsonl,
     'rcdl': parse_rnh_cdl,
+    'tar': parse_archive,
+    'tgz': parse_archive,
+    'zip': parse_archive,
 }
 
+# Fields of a csv file, in the order write.write_csv() writes their columns
+CSV_FIELDS = (
+    'id',
+    'slope_r', 'slope_g', 'slope_b',
+    'offset_r', 'offset_g', 'offset_b',
+    'power_r', 'power_g', 'power_b',
+    'sat',
+    'desc',
+)
+
+# Fields holding several values in one csv column, and the fields they hold
+_CSV_GROUPS = {
+    'slope': CSV_FIELDS[1:4],
+    'offset': CSV_FIELDS[4:7],
+    'power': CSV_FIELDS[7:10],
+    'sop': CSV_FIELDS[1:10],
+}
+
+# Rows of a csv file validated and built at a time
+_CSV_CHUNK_SIZE = 1000
+
+# A number in a csv cell of several values, such as ``(1.1 1.0 0.9)``
+_CSV_NUMBER = re.compile(r'[^\s,;()]+')
+
+# Formats parse_archive() reads from archive members
+_ARCHIVE_MEMBER_FORMATS = ['cc', 'ccc', 'cdl', 'rcdl']
+
+# Layout of cdlb files, all little endian. Written by write.write_cdlb().
+CDLB_MAGIC = b'CDLB'
+CDLB_VERSION = 1
+# Magic, version and flags, the number of strings, descs, corrections,
+# collection level corrections and decisions, the offsets of the string
+# offsets, string text, descs, correction records, value coefficients, value
+# exponents and decision records, then the collection's type, input desc,
+# viewing desc and desc span.
+_CDLB_HEADER = struct.Struct('<4sHH5I7Q5I')
+# Id, input desc, viewing desc, then the desc, sop desc and sat desc spans,
+# and _CDLB_HAS flags.
+_CDLB_CORRECTION = struct.Struct('<10I')
+# Input desc, viewing desc, desc span, the index of the held correction, the
+# id string and correction index of a ref, and the media ref string.
+_CDLB_DECISION = struct.Struct('<8I')
+# The slope, offset, power and sat of a correction, each stored as an integer
+# coefficient and a power of ten exponent, so Decimals keep every digit.
+_CDLB_COEFFICIENTS = struct.Struct('<10q')
+_CDLB_EXPONENTS = struct.Struct('<10b')
+# Start and end of a string in the string text
+_CDLB_SPAN = struct.Struct('<2Q')
+_CDLB_HAS_SOP = 1
+_CDLB_HAS_SAT = 2
+# Missing strings and indexes
+_CDLB_NONE = 0xFFFFFFFF
+# Exponent of values that don't fit a coefficient and exponent, such as
+# negative zero or long values. The coefficient is the index of their text.
+_CDLB_TEXT_VALUE = -128
+
 # ==============================================================================
 # PARSE FILE
 # ==============================================================================
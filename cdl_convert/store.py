@@ -0,0 +1,540 @@
+#!/usr/bin/env python
+"""
+
+CDL Convert Store
+=================
+
+A SQLite database of corrections, for keeping every correction of a show
+and querying them without loading them all.
+
+## Classes
+
+    CollectionStore
+        Ingests ColorCollections into a SQLite database in bulk, and serves
+        lookups and range queries by id, reel, media ref, date and value,
+        building only the corrections a query returns.
+
+## GLOBALS
+
+    STORE_COLUMNS
+        The value columns of the store, which ``CollectionStore`` queries
+        take ranges of.
+
+## License
+
+The MIT License (MIT)
+
+cdl_convert
+Copyright (c) 2015 Sean Wallitsch
+http://github.com/shidarin/cdl_convert/
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+
+from __future__ import absolute_import, print_function
+
+# Standard Imports
+
+import calendar
+import json
+import os
+import sqlite3
+import time
+
+# cdl_convert imports
+
+from . import config, parse, write
+from .collection import ColorCollection
+from .correction import _IDENTITY_SAT, _IDENTITY_SOP
+from .decision import ColorDecision
+
+# ==============================================================================
+# GLOBALS
+# ==============================================================================
+
+STORE_COLUMNS = (
+    'slope_r', 'slope_g', 'slope_b',
+    'offset_r', 'offset_g', 'offset_b',
+    'power_r', 'power_g', 'power_b',
+    'sat',
+)
+
+# Version of the table layout, kept in the database's user_version
+_STORE_VERSION = 1
+
+_STORE_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS corrections ("
+    "row INTEGER PRIMARY KEY, "
+    "id TEXT NOT NULL, "
+    "reel TEXT, "
+    "added REAL NOT NULL, "
+    "media_ref TEXT, "
+    "file_in TEXT, "
+    "record TEXT NOT NULL, " +
+    ', '.join(['{0} REAL'.format(column) for column in STORE_COLUMNS]) +
+    ")",
+    "CREATE INDEX IF NOT EXISTS corrections_id ON corrections (id)",
+    "CREATE INDEX IF NOT EXISTS corrections_media_ref "
+    "ON corrections (media_ref)",
+    "CREATE INDEX IF NOT EXISTS corrections_reel ON corrections (reel)",
+    "CREATE INDEX IF NOT EXISTS corrections_added ON corrections (added)",
+)
+
+_STORE_INSERT = (
+    "INSERT INTO corrections (id, reel, added, media_ref, file_in, record, " +
+    ', '.join(STORE_COLUMNS) + ") VALUES (" +
+    ', '.join(['?'] * (len(STORE_COLUMNS) + 6)) + ")"
+)
+
+# Rows fetched from SQLite at a time while building query results
+_STORE_FETCH_SIZE = 1000
+
+# ==============================================================================
+# EXPORTS
+# ==============================================================================
+
+__all__ = [
+    'CollectionStore',
+    'STORE_COLUMNS',
+]
+
+# ==============================================================================
+# CLASSES
+# ==============================================================================
+
+
+class CollectionStore(object):
+    """A SQLite database of corrections with indexed queries
+
+    Description
+    ~~~~~~~~~~~
+
+    Each row of the store is a :class:`ColorCorrection` or a
+    :class:`ColorDecision` , with the id, reel, media ref and date it was
+    added indexed, and the 10 values of its correction held as numbers for
+    range queries. Everything else, including the exact digits of each
+    value, is kept as the row's JSON Lines record (see ``write_jsonl()`` ),
+    so a correction comes back out exactly as it went in.
+
+    ::
+
+        with CollectionStore('/show/grades.db') as store:
+            store.ingest(parse_file('A001.ale'), reel='A001')
+            store.export('/show/warm.ccc', sat=(1.2, None), reel='A001')
+
+    Queries take any of these filters, all of which must match:
+
+        cc_id : (str|[str])
+            The id, or any of a list of ids, of the correction. For a
+            :class:`ColorDecision` , the id of the correction it holds or
+            references.
+
+        reel : (str|[str])
+            The reel, or any of a list of reels, given when ingested.
+
+        media_ref : (str|[str])
+            The exact ref of a :class:`ColorDecision` 's :class:`MediaRef` .
+
+        since : (float|datetime)
+            Rows added at or after this time. A naive datetime is in local
+            time.
+
+        until : (float|datetime)
+            Rows added before this time.
+
+    And the name of any of the ``STORE_COLUMNS`` , such as ``sat`` or
+    ``slope_r`` , given a ``(low, high)`` tuple, where either can be None
+    for an open range. A correction without a :class:`SopNode` or
+    :class:`SatNode` has the default values, and decisions holding a
+    :class:`ColorCorrectionRef` have no values, so never match a range.
+
+    The id, reel, media ref and date filters use indexes. Value ranges are
+    checked row by row, after any indexed filters.
+
+    **Args:**
+
+        path=':memory:' : (str)
+            The database file, created if it doesn't exist.
+
+    **Attributes:**
+
+        path : (str)
+            The database file.
+
+    **Public Methods:**
+
+        close()
+            Closes the database.
+
+        collection()
+            Builds a :class:`ColorCollection` of the rows a query matches.
+
+        count()
+            Returns how many rows a query matches.
+
+        export()
+            Writes the rows a query matches to a collection file.
+
+        ingest()
+            Adds every correction and decision of a collection in a single
+            transaction.
+
+        select()
+            Yields the correction or decision of each row a query matches.
+
+    """
+
+    def __init__(self, path=':memory:'):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        version = self._connection.execute('PRAGMA user_version').fetchone()
+        if version[0] > _STORE_VERSION:
+            self._connection.close()
+            raise ValueError(
+                "{path} is store version {version}, newer than the supported "
+                "version {supported}.".format(
+                    path=path,
+                    version=version[0],
+                    supported=_STORE_VERSION
+                )
+            )
+        with self._connection:
+            for statement in _STORE_SCHEMA:
+                self._connection.execute(statement)
+            self._connection.execute(
+                'PRAGMA user_version = {0}'.format(_STORE_VERSION)
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def __len__(self):
+        return self.count()
+
+    # Private Methods =========================================================
+
+    def _execute(self, columns, filters, order=True):
+        """Returns a cursor over the rows matching the query filters"""
+        where, args = _where(filters)
+        return self._connection.execute(
+            "SELECT {columns} FROM corrections{where}{order}".format(
+                columns=columns,
+                where=where,
+                order=' ORDER BY row' if order else ''
+            ),
+            args
+        )
+
+    # Public Methods ==========================================================
+
+    def close(self):
+        """Closes the database"""
+        self._connection.close()
+
+    # =========================================================================
+
+    def collection(self, **filters):
+        """Builds a ColorCollection of the rows a query matches
+
+        **Args:**
+            filters
+                See the filters listed for :class:`CollectionStore` .
+
+        **Returns:**
+            (:class:`ColorCollection`)
+                A collection holding a new :class:`ColorCorrection` or
+                :class:`ColorDecision` for each row, in the order they were
+                added. It's set to ``cdl`` if any rows are decisions,
+                otherwise to ``ccc`` .
+
+        **Raises:**
+            ValueError:
+                If a filter isn't known.
+
+        Each correction keeps the id it was added with, even if another
+        correction, such as the one ingested, is registered with it. A
+        correction added more than once appears once per row, with the
+        same id.
+
+        """
+        corrections = []
+        decisions = []
+        for node in self.select(**filters):
+            if isinstance(node, ColorDecision):
+                decisions.append(node)
+            else:
+                corrections.append(node)
+
+        col = ColorCollection()
+        if decisions:
+            col.set_to_cdl()
+        col._color_corrections = corrections  # pylint: disable=W0212
+        col._color_decisions = decisions  # pylint: disable=W0212
+        col.set_parentage()
+        return col
+
+    # =========================================================================
+
+    def count(self, **filters):
+        """Returns how many rows a query matches
+
+        **Args:**
+            filters
+                See the filters listed for :class:`CollectionStore` .
+
+        **Returns:**
+            (int)
+                The number of rows, counted without building anything.
+
+        **Raises:**
+            ValueError:
+                If a filter isn't known.
+
+        """
+        return self._execute('COUNT(*)', filters, order=False).fetchone()[0]
+
+    # =========================================================================
+
+    def export(self, path, ext=None, **filters):
+        """Writes the rows a query matches to a collection file
+
+        **Args:**
+            path : (str)
+                The file to write.
+
+            ext=None : (str)
+                The output format, one of the collection formats of
+                ``OUTPUT_FORMATS`` such as ``ccc`` or ``jsonl`` . Defaults to
+                the extension of ``path`` .
+
+            filters
+                See the filters listed for :class:`CollectionStore` .
+
+        **Returns:**
+            (:class:`ColorCollection`)
+                The collection written. See ``collection()`` .
+
+        **Raises:**
+            ValueError:
+                If ``ext`` isn't a collection output format, or a filter
+                isn't known.
+
+        """
+        if ext is None:
+            ext = os.path.splitext(path)[1][1:].lower()
+        if ext not in write.OUTPUT_FORMATS or \
+                ext not in config.COLLECTION_FORMATS:
+            raise ValueError(
+                "The output format: {output} is not a supported collection "
+                "format".format(output=ext)
+            )
+        col = self.collection(**filters)
+        col._file_out = path  # pylint: disable=W0212
+        write.OUTPUT_FORMATS[ext](col)
+        return col
+
+    # =========================================================================
+
+    def ingest(self, cdl, reel=None, date=None):
+        """Adds a collection's corrections and decisions to the store
+
+        **Args:**
+            cdl : (:class:`ColorCollection`|:class:`ColorCorrection`)
+                A collection adds a row for each :class:`ColorCorrection` it
+                holds, then for each :class:`ColorDecision` . A correction or
+                a :class:`ColorDecision` adds a single row.
+
+            reel=None : (str)
+                The reel to file every row under.
+
+            date=None : (float|datetime)
+                When the rows were added, as seconds since the epoch or a
+                datetime, in local time if naive. Defaults to now.
+
+        **Returns:**
+            (int)
+                The number of rows added.
+
+        **Raises:**
+            N/A
+
+        Every row is added in a single transaction, so either all of them
+        are stored or, if anything fails, none are.
+
+        """
+        added = time.time() if date is None else _timestamp(date)
+        nodes = cdl.all_children if isinstance(cdl, ColorCollection) else [cdl]
+        with self._connection:
+            cursor = self._connection.executemany(
+                _STORE_INSERT,
+                (_row(node, reel, added) for node in nodes)
+            )
+        return cursor.rowcount
+
+    # =========================================================================
+
+    def select(self, **filters):
+        """Yields the correction or decision of each row a query matches
+
+        **Args:**
+            filters
+                See the filters listed for :class:`CollectionStore` .
+
+        **Yields:**
+            (:class:`ColorCorrection`|:class:`ColorDecision`)
+                A new object for each row, in the order they were added.
+                Rows are fetched and built a batch at a time, so a query
+                doesn't load the rest of the store.
+
+        **Raises:**
+            ValueError:
+                If a filter isn't known.
+
+        Ids are kept as they were added, see ``collection()`` .
+
+        """
+        cursor = self._execute('record, file_in', filters)
+        while True:
+            rows = cursor.fetchmany(_STORE_FETCH_SIZE)
+            if not rows:
+                return
+            for record, file_in in rows:
+                yield _node(record, file_in)
+
+# ==============================================================================
+# PRIVATE FUNCTIONS
+# ==============================================================================
+
+
+def _node(record, file_in):
+    """Builds the correction or decision of a stored record, keeping its id"""
+    record = json.loads(record)
+    # pylint: disable=W0212
+    if record['type'] == 'ColorDecision':
+        return parse._jsonl_decision(record, file_in, None, keep_id=True)
+    return parse._jsonl_correction(record, file_in, None, keep_id=True)
+
+# ==============================================================================
+
+
+def _row(node, reel, added):
+    """Returns the values a row stores for a correction or decision"""
+    media_ref = None
+    color_correct = node
+    if isinstance(node, ColorDecision):
+        if node.media_ref is not None:
+            media_ref = node.media_ref.ref
+        color_correct = node.cc
+
+    if isinstance(node, ColorDecision) and node.is_ref:
+        file_in = None
+        values = (None, ) * len(STORE_COLUMNS)
+    else:
+        file_in = color_correct.file_in
+        # The private nodes are read so virgin nodes aren't created.
+        sop_node = color_correct._sop_node  # pylint: disable=W0212
+        sat_node = color_correct._sat_node  # pylint: disable=W0212
+        if sop_node is not None:
+            values = sop_node.slope + sop_node.offset + sop_node.power
+        else:
+            values = _IDENTITY_SOP
+        values = tuple(float(value) for value in values) + (float(
+            sat_node.sat if sat_node is not None else _IDENTITY_SAT
+        ), )
+
+    # Exact text, so the stored digits don't depend on NUMBER_PRECISION
+    record = json.dumps(
+        write._jsonl_record(node, exact=True),  # pylint: disable=W0212
+        separators=(',', ':')
+    )
+    return (
+        color_correct.id, reel, added, media_ref, file_in, record
+    ) + values
+
+# ==============================================================================
+
+
+def _timestamp(date):
+    """Returns a datetime or number as seconds since the epoch
+
+    A datetime with a timezone is converted from it, and a naive one is
+    taken to be in local time.
+
+    """
+    if hasattr(date, 'timetuple'):
+        utcoffset = getattr(date, 'utcoffset', None)
+        if utcoffset is not None and utcoffset() is not None:
+            seconds = calendar.timegm(date.utctimetuple())
+        else:
+            seconds = time.mktime(date.timetuple())
+        return seconds + getattr(date, 'microsecond', 0) / 1e6
+    return float(date)
+
+# ==============================================================================
+
+
+def _where(filters):
+    """Returns the WHERE clause and arguments of the query filters"""
+    clauses = []
+    args = []
+    for name in sorted(filters):
+        value = filters[name]
+        if value is None:
+            continue
+        if name in ('cc_id', 'reel', 'media_ref'):
+            column = 'id' if name == 'cc_id' else name
+            if isinstance(value, (list, tuple, set)):
+                value = list(value)
+                clauses.append('{column} IN ({marks})'.format(
+                    column=column, marks=', '.join(['?'] * len(value))
+                ))
+                args.extend(value)
+            else:
+                clauses.append('{column} = ?'.format(column=column))
+                args.append(value)
+        elif name == 'since':
+            clauses.append('added >= ?')
+            args.append(_timestamp(value))
+        elif name == 'until':
+            clauses.append('added < ?')
+            args.append(_timestamp(value))
+        elif name in STORE_COLUMNS:
+            low, high = value
+            if low is not None:
+                clauses.append('{column} >= ?'.format(column=name))
+                args.append(float(low))
+            if high is not None:
+                clauses.append('{column} <= ?'.format(column=name))
+                args.append(float(high))
+        else:
+            raise ValueError(
+                "Unknown store query filter: {name}".format(name=name)
+            )
+    if not clauses:
+        return '', args
+    return ' WHERE ' + ' AND '.join(clauses), args
@@ -8,6 +8,10 @@ Contains basic utility functions for cdl_convert.
 
 ## Public Functions
 
+    format_number()
+        Formats a value as written to files, without scientific notation and
+        optionally rounded to a fixed number of decimal places.
+
     sanity_check()
         Checks the color values of a given ColorCorrection to see if they fall
         within 'sane' values.
@@ -15,6 +19,10 @@ Contains basic utility functions for cdl_convert.
     to_decimal()
         Converts floats, ints, and strings to Decimal() in a predictable way.
 
+    validate_values()
+        Converts and checks whole columns of slope, offset, power and sat
+        values for many corrections in one call.
+
 ## License
 
 The MIT License (MIT)
@@ -51,7 +59,19 @@ from __future__ import absolute_import, print_function
 
 # Standard Imports
 
-from decimal import Decimal, InvalidOperation
+from collections import namedtuple
+from decimal import Decimal, InvalidOperation, ROUND_HALF_EVEN
+
+# cdl_convert imports
+
+from . import config
+
+# Optional Imports
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
 # ==============================================================================
 # GLOBALS
@@ -64,13 +84,35 @@ try:
 except NameError:  # pragma: no cover
     xrange = range  # pylint: disable=W0622, C0103
 
+# The columns handled by validate_values(), the name used in error messages
+# and if negatives are allowed
+_COLUMNS = (
+    ('slope', 'slope', False),
+    ('offset', 'offset', True),
+    ('power', 'power', False),
+    ('sat', 'saturation', False),
+)
+
+# Text of each distinct value and precision given to format_number(). Cleared
+# once it holds FORMAT_CACHE_SIZE entries, like the re module's cache.
+FORMAT_CACHE_SIZE = 65536
+_FORMATTED = {}
+
+# Results of validate_values()
+InvalidValue = namedtuple('InvalidValue', ['name', 'index', 'value', 'error'])
+ValidatedValues = namedtuple('ValidatedValues', ['values', 'clamped', 'errors'])
+
 # ==============================================================================
 # EXPORTS
 # ==============================================================================
 
 __all__ = [
+    'format_number',
+    'InvalidValue',
     'sanity_check',
-    'to_decimal'
+    'to_decimal',
+    'validate_values',
+    'ValidatedValues',
 ]
 
 # ==============================================================================
@@ -78,6 +120,78 @@ __all__ = [
 # ==============================================================================
 
 
+def format_number(value, precision=None, exact=False):
+    """Returns the text of a value as written to files
+
+    **Args:**
+        value : (Decimal|str|float|int)
+            Any numeric value to be written.
+
+        precision=None : (int)
+            Number of decimal places to round the value to. Defaults to
+            ``config.NUMBER_PRECISION`` . If that's also None, the value is
+            written with exactly the digits it was given.
+
+        exact=False : (bool)
+            Write the value with exactly the digits it was given, whatever
+            ``precision`` and ``config.NUMBER_PRECISION`` are.
+
+    **Returns:**
+        (str)
+            The value without scientific notation.
+
+    **Raises:**
+        TypeError:
+            If value given is not a number.
+
+        ValueError:
+            If given a value that isn't an allowed type.
+
+    Rounding is half to even, and rounded values always hold ``precision``
+    decimal places. Rounded text is cached per distinct value, so a
+    collection sharing a few values rounds each of them only once. Values
+    too large to round with ``precision`` places are written exactly.
+
+    """
+    if exact:
+        precision = None
+    elif precision is None:
+        precision = config.NUMBER_PRECISION
+    text = str(value)
+    if precision is None:
+        if 'E' in text or 'e' in text:
+            return _de_exponent(text)
+        return text
+
+    # Keyed on the text, as hashing a new Decimal costs about as much as
+    # rounding it, while equal text always rounds to the same result.
+    key = (text, precision)
+    try:
+        return _FORMATTED[key]
+    except KeyError:
+        pass
+
+    number = to_decimal(value)
+    try:
+        rounded = number.quantize(
+            Decimal(1).scaleb(-precision), rounding=ROUND_HALF_EVEN
+        )
+    except InvalidOperation:
+        text = _de_exponent(str(number))
+    else:
+        # Small negative values round to zero, which shouldn't keep the sign
+        text = str(rounded.copy_abs() if not rounded else rounded)
+        if 'E' in text:
+            text = _de_exponent(text)
+
+    if len(_FORMATTED) >= FORMAT_CACHE_SIZE:
+        _FORMATTED.clear()
+    _FORMATTED[key] = text
+    return text
+
+# ==============================================================================
+
+
 def sanity_check(colcor):
     """Checks values on :class:`ColorCorrection` for sanity.
 
@@ -198,3 +312,362 @@ def to_decimal(value, name='Value'):
         )
 
     return Decimal(value)
+
+# ==============================================================================
+
+
+def validate_values(slope=None, offset=None, power=None, sat=None,
+                    count=None):
+    """Converts and checks columns of values for many corrections at once
+
+    **Args:**
+        slope=None : [[(Decimal|str|float|int)]]
+            One entry per correction, either three values or a single value
+            to use for all three. Entries can be None for values that aren't
+            set. Can also be a NumPy array of shape (count, 3) or (count, ).
+
+        offset=None : [[(Decimal|str|float|int)]]
+            Like slope, but negative values are allowed.
+
+        power=None : [[(Decimal|str|float|int)]]
+            Like slope.
+
+        sat=None : [(Decimal|str|float|int)]
+            One value or None per correction. Can also be a NumPy array of
+            shape (count, ).
+
+        count=None : (int)
+            The number of corrections. Defaults to the length of the first
+            column given.
+
+    **Returns:**
+        (:class:`ValidatedValues`)
+            A namedtuple of:
+
+                values : {str: []}
+                    For each of ``slope``, ``offset``, ``power`` and ``sat``,
+                    a list with one entry per correction: a list of three
+                    Decimals for rgb columns, a Decimal for sat, or None if
+                    the entry wasn't given or is invalid.
+
+                clamped : {str: []}
+                    The same structure as values, with a bool for every value
+                    that says if it was negative and clamped to 0.
+
+                errors : [:class:`InvalidValue`]
+                    A namedtuple for each problem found, of the column
+                    ``name``, the ``index`` of the correction (None if the
+                    column has the wrong length), the ``value`` given and the
+                    ``error``, the ``TypeError`` or ``ValueError`` that setting
+                    that value on a :class:`ColorCorrection` would raise.
+
+    **Raises:**
+        N/A
+
+    Follows the same rules as the :class:`SopNode` and :class:`SatNode`
+    setters: negative slope, power and sat values are clamped to 0, unless
+    ``HALT_ON_ERROR`` is set, in which case they are reported as errors.
+    Instead of stopping at the first bad value, every problem is collected
+    so the caller can report them all or raise the first one.
+
+    ``HALT_ON_ERROR`` is looked up once, repeated values are converted once,
+    and NumPy float and int arrays are checked for shape, negatives and non
+    finite values with array operations.
+
+    """
+    columns = {}
+    for name, column in (
+            ('slope', slope),
+            ('offset', offset),
+            ('power', power),
+            ('sat', sat),
+    ):
+        # Anything but a numeric NumPy array is validated as python values.
+        if column is not None and not _is_numeric_array(column):
+            column = list(
+                column.tolist() if hasattr(column, 'tolist') else column
+            )
+        columns[name] = column
+
+    if count is None:
+        count = 0
+        for name, label, negative_allow in _COLUMNS:
+            if columns[name] is not None:
+                count = len(columns[name])
+                break
+
+    halt = config.HALT_ON_ERROR
+    cache = {}
+    values = {}
+    clamped = {}
+    errors = []
+
+    for name, label, negative_allow in _COLUMNS:
+        column = columns[name]
+        rgb = name != 'sat'
+        if column is None:
+            values[name] = [None] * count
+            clamped[name] = [None] * count
+            continue
+        if len(column) != count:
+            errors.append(InvalidValue(name, None, column, ValueError(
+                'Error validating {name}: {length} values given for {count} '
+                'corrections. Give one entry per correction, using None for '
+                'missing values.'.format(
+                    name=label,
+                    length=len(column),
+                    count=count
+                )
+            )))
+            values[name] = [None] * count
+            clamped[name] = [None] * count
+            continue
+
+        if _is_numeric_array(column):
+            checked = _validate_array(
+                column, name, label, rgb, negative_allow, halt, errors
+            )
+        else:
+            checked = _validate_column(
+                column, name, label, rgb, negative_allow, halt, errors, cache
+            )
+        values[name], clamped[name] = checked
+
+    return ValidatedValues(values, clamped, errors)
+
+# ==============================================================================
+# PRIVATE FUNCTIONS
+# ==============================================================================
+
+
+def _convert(value, name):
+    """Converts a value with to_decimal, rejecting NaN and infinity"""
+    converted = to_decimal(value, name)
+    if not converted.is_finite():
+        raise TypeError(
+            'Error setting {name} with value: "{value}". '
+            'Value is not a number.'.format(
+                name=name,
+                value=value
+            )
+        )
+    return converted
+
+# ==============================================================================
+
+
+def _de_exponent(notation):
+    """Translates scientific notation into non-normalized strings
+
+     Unlike the methods to quantize a Decimal found on the Decimal FAQ, this
+    always works.
+
+    Args:
+        notation : (Decimal|str|int|float)
+            Any numeric value that may or may not be normalized.
+
+    Raises:
+        N/A
+
+    Returns:
+        (str)
+            Returns a quantized value without any scientific notation.
+
+    """
+    notation = str(notation).lower()
+    if 'e' not in notation:
+        return notation
+
+    notation = notation.split('e')
+    # Grab the exponent value
+    digits = int(notation[-1])
+    # Grab the value we'll be adding 0s to
+    value = notation[0]
+
+    if value.startswith('-'):
+        negative = '-'
+        value = value[1:]
+    else:
+        negative = ''
+
+    value = value.replace('.', '')
+
+    if digits < 0:
+        new_value = negative + '0.0' + '0' * (abs(digits) - 2) + value
+    else:
+        zeros = len(value)
+        new_value = negative + value + '0' * (abs(digits) - zeros) + '0.0'
+    return new_value
+
+# ==============================================================================
+
+
+def _is_numeric_array(column):
+    """Returns True if column is a NumPy array of floats or ints"""
+    return (
+        numpy is not None and
+        isinstance(column, numpy.ndarray) and
+        column.dtype.kind in 'fiu'
+    )
+
+# ==============================================================================
+
+
+def _length_error(name, values):
+    """Returns the error for an rgb entry without 3 values"""
+    return ValueError(
+        'Error setting {name} with value: "{values}". '
+        '{name_upper} values given as a list or tuple must have 3 '
+        'elements, one for each color.'.format(
+            name=name,
+            name_upper=name.title(),
+            values=values
+        )
+    )
+
+# ==============================================================================
+
+
+def _negative_error(name, value):
+    """Returns the error for a negative value with HALT_ON_ERROR set"""
+    return ValueError(
+        'Error setting {name} with value: "{value}". '
+        'Values must not be negative'.format(
+            name=name,
+            value=value
+        )
+    )
+
+# ==============================================================================
+
+
+def _validate_array(column, name, label, rgb, negative_allow, halt, errors):
+    """Validates a NumPy float or int column with array operations"""
+    count = len(column)
+    array = column.astype(float)
+    if rgb and array.ndim == 1:
+        array = numpy.repeat(array[:, None], 3, axis=1)
+    shape = (count, 3) if rgb else (count, )
+    if array.shape != shape:
+        errors.append(InvalidValue(name, None, column, _length_error(
+            label, 'array of shape {0}'.format(column.shape)
+        )))
+        return [None] * count, [None] * count
+
+    invalid = ~numpy.isfinite(array)
+    negative = array < 0
+    if negative_allow:
+        negative[:] = False
+    elif halt:
+        invalid |= negative
+        negative[:] = False
+    else:
+        array[negative] = 0.0
+
+    if rgb:
+        invalid = invalid.any(axis=1)
+    for index in numpy.flatnonzero(invalid).tolist():
+        bad = array[index].tolist()
+        if not rgb:
+            bad = [bad]
+        for value in bad:
+            if not numpy.isfinite(value):
+                error = TypeError(
+                    'Error setting {name} with value: "{value}". '
+                    'Value is not a number.'.format(name=label, value=value)
+                )
+                break
+            elif value < 0:
+                error = _negative_error(label, value)
+                break
+        errors.append(InvalidValue(name, index, column[index].tolist(), error))
+
+    # Convert each distinct float once, then map them back with an index.
+    # Using the bit patterns keeps 0.0 and -0.0 apart.
+    bits = numpy.ascontiguousarray(array).view(numpy.int64).ravel()
+    unique, inverse = numpy.unique(bits, return_inverse=True)
+    decimals = numpy.empty(len(unique), dtype=object)
+    # Going through str matches to_decimal for python floats. Narrower
+    # floats are formatted as their own type, so float32 0.1 gives 0.1
+    # rather than the digits of the float64 it widens to.
+    scalar = float
+    if column.dtype.kind == 'f' and column.dtype.itemsize < 8:
+        scalar = column.dtype.type
+    decimals[:] = [
+        Decimal(str(scalar(value)))
+        for value in unique.view(numpy.float64).tolist()
+    ]
+    values = decimals[inverse.ravel()].reshape(array.shape).tolist()
+    clamped = negative.tolist()
+    for index in numpy.flatnonzero(invalid).tolist():
+        values[index] = None
+        clamped[index] = None
+    return values, clamped
+
+# ==============================================================================
+
+
+def _validate_column(column, name, label, rgb, negative_allow, halt, errors,
+                     cache):
+    """Validates a column of python values in a single pass"""
+    zero = Decimal('0.0')
+    cache_get = cache.get
+    values = []
+    clamped = []
+    for index, row in enumerate(column):
+        if row is None:
+            values.append(None)
+            clamped.append(None)
+            continue
+        given = row
+        if hasattr(row, 'tolist'):
+            row = row.tolist()
+        if not rgb:
+            row = (row, )
+        elif type(row) in [list, tuple]:
+            if len(row) != 3:
+                errors.append(
+                    InvalidValue(name, index, given, _length_error(label, row))
+                )
+                values.append(None)
+                clamped.append(None)
+                continue
+        else:
+            row = (row, ) * 3
+
+        decimals = []
+        mask = []
+        try:
+            for value in row:
+                kind = type(value)
+                # Only floats and strings are cached, as they can't be equal
+                # to each other. 0.0 and -0.0 are equal keys but convert to
+                # different Decimals, so zeros aren't cached.
+                if kind is float or kind is str:
+                    decimal = cache_get(value)
+                    if decimal is None:
+                        decimal = _convert(value, label)
+                        if decimal:
+                            cache[value] = decimal
+                else:
+                    decimal = _convert(value, label)
+                negative = not negative_allow and decimal < zero
+                if negative:
+                    if halt:
+                        raise _negative_error(label, decimal)
+                    decimal = zero
+                decimals.append(decimal)
+                mask.append(negative)
+        except (TypeError, ValueError) as err:
+            errors.append(InvalidValue(name, index, given, err))
+            values.append(None)
+            clamped.append(None)
+            continue
+
+        if rgb:
+            values.append(decimals)
+            clamped.append(mask)
+        else:
+            values.append(decimals[0])
+            clamped.append(mask[0])
+    return values, clamped
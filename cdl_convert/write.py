@@ -6,24 +6,72 @@ CDL Convert Write
 
 Functions for writing different types of cdls.
 
+## Classes
+
+    ArchiveWriter
+        Writes the files of many ColorCorrections as members of a single tar
+        or zip archive, streamed to disk without temporary files. Use as a
+        context manager.
+
+    CCCWriter
+        Writes a ``ccc`` file incrementally, one ColorCorrection at a time,
+        without needing a ColorCollection. Use as a context manager.
+
+    CDLWriter
+        Writes a ``cdl`` file incrementally, one ColorDecision or
+        ColorCorrection at a time, without needing a ColorCollection. Use as
+        a context manager.
+
 ## Public Functions
 
+    append_collection()
+        Adds ColorCorrections or ColorDecisions to the end of an existing
+        ``ccc`` or ``cdl`` file without parsing it, checking their ids
+        against those already in the file.
+
     write_cc()
         Writes a given ColorCorrection to disk. ``file_out`` should already be
         set on the ColorCorrection.
 
     write_ccc()
         Writes a given ColorCollection to disk. ``file_out`` should already be
-        set on the ColorCollection.
+        set on the ColorCollection. The file is streamed one child at a time.
 
     write_cdl()
         Writes a given ColorCollection to disk. ``file_out`` should already be
-        set on the ColorCollection.
+        set on the ColorCollection. The file is streamed one child at a time.
+
+    write_cdlb()
+        Writes a given ColorCollection to disk in the binary cdlb format,
+        which ``parse_cdlb()`` loads faster than XML. ``file_out`` should
+        already be set on the ColorCollection.
+
+    write_csv()
+        Writes the ColorCorrections of a given ColorCollection to disk as a
+        csv file, one row per correction, for editing in spreadsheets.
+        Streamed one row at a time.
+
+    write_fanout()
+        Writes a given ColorCollection to several collection formats at once,
+        walking its children a single time and streaming each child to every
+        file. Can call back with each ColorCorrection, to write single files
+        in the same walk.
+
+    write_jsonl()
+        Writes a given ColorCollection, ColorCorrection or ColorDecision to
+        disk as JSON Lines, one correction or decision per line, streamed one
+        line at a time. Can append to an existing file.
 
     write_rnh_cdl()
         Writes a given ColorCorrection to disk. ``file_out`` should already be
         set on the ColorCorrection.
 
+    write_single_files()
+        Writes many ColorCorrections to a file each, serializing them in turn
+        and overlapping the file writes in a pool of threads. Returns the
+        files that were skipped as unchanged and those that failed, rather
+        than stopping at the first failure.
+
 ## License
 
 The MIT License (MIT)
@@ -60,10 +108,48 @@ from __future__ import absolute_import, print_function
 
 # Standard Imports
 
+from collections import OrderedDict
+import csv
+import filecmp
+import hashlib
+from io import BytesIO, TextIOWrapper
+import json
+import mmap
+import os
+try:
+    from queue import Queue
+except ImportError:  # pragma: no cover
+    from Queue import Queue
+import re
+import shutil
+import sqlite3
+import struct
 import sys
+import tarfile
+import threading
+import time
+import uuid
+from xml.sax.saxutils import unescape
+import zipfile
 
 # Local Imports
-from .collection import ColorCollection
+from .base import (
+    _close_tag, _open_tag, AscColorSpaceBase, AscDescBase, compact_xml,
+    pretty_xml, XML_DECLARATION
+)
+from . import config
+from .collection import (
+    _decision_correction, _decision_fragment, _resolves, _root_element,
+    _wrapped_fragment, _XMLNS, ColorCollection
+)
+from .correction import _IDENTITY_SAT, _IDENTITY_SOP, ColorCorrection
+from .decision import ColorDecision
+from .parse import (
+    _CDLB_COEFFICIENTS, _CDLB_CORRECTION, _CDLB_DECISION, _CDLB_EXPONENTS,
+    _CDLB_HAS_SAT, _CDLB_HAS_SOP, _CDLB_HEADER, _CDLB_NONE, _CDLB_TEXT_VALUE,
+    _csv_layout, CDLB_MAGIC, CDLB_VERSION
+)
+from .utils import format_number
 
 # ==============================================================================
 # GLOBALS
@@ -72,24 +158,1278 @@ from .collection import ColorCollection
 if sys.version_info[0] >= 3:  # pragma: no cover
     enc = lambda x: bytes(x, 'UTF-8')  # pylint: disable=C0103
 else:  # pragma: no cover
-    enc = lambda x: x  # pylint: disable=C0103
+    # Text from parsed files can be unicode, which must be encoded.
+    enc = lambda x: x.encode('UTF-8') if isinstance(x, unicode) else x  # pylint: disable=C0103,E0602
+
+# Buffer size for collection writes. Collections are written one child at a
+# time, and a large buffer turns those into few large writes, which matters
+# most on network filesystems (1 MiB matches common NFS rsize/wsize).
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Default number of threads write_single_files() writes files with. Small
+# files are dominated by open and close latency rather than bandwidth, so
+# more writes in flight than CPU cores still pays off on network storage.
+WRITE_JOBS = 8
+
+# Archive formats ArchiveWriter can write
+ARCHIVE_FORMATS = ['tar', 'tgz', 'zip']
+
+# Collection formats write_fanout() streams together in a single walk
+FANOUT_FORMATS = ['ccc', 'cdl', 'csv', 'jsonl']
+
+# os.replace() overwrites an existing file on every platform, but only exists
+# on Python 3.3 and up. os.rename() does the same on POSIX.
+_replace = getattr(os, 'replace', os.rename)  # pylint: disable=C0103
+
+# Bytes at the end of a file searched for the closing root tag on append
+_APPEND_TAIL_SIZE = 64 * 1024
+
+# Root tags append_collection() can add children to
+_ROOT_TAGS = ('ColorCorrectionCollection', 'ColorDecisionList')
+
+# A root with no children, written as a single self closing tag
+_EMPTY_ROOT = re.compile(
+    br'<(ColorCorrectionCollection|ColorDecisionList)\b[^>]*?(/>)'
+)
+
+# The id of each ColorCorrection in a collection. Requiring whitespace after
+# the tag name skips ColorCorrectionRef and ColorCorrectionCollection.
+# Comments and CDATA sections are matched as well so that tags inside them
+# are skipped, and have no id group.
+_ID_PATTERN = re.compile(
+    br'<!--.*?-->|<!\[CDATA\[.*?\]\]>'
+    br'|<ColorCorrection\s[^>]*?\bid\s*=\s*(["\'])(.*?)\1',
+    re.DOTALL
+)
+
+# Version of the id index table layout, kept in the index's user_version
+_ID_INDEX_VERSION = 2
+
+# Ids looked up in the id index per query, below SQLite's variable limit
+_ID_INDEX_BATCH = 500
 
 # ==============================================================================
 # EXPORTS
 # ==============================================================================
 
 __all__ = [
+    'ArchiveWriter',
+    'CCCWriter',
+    'CDLWriter',
+    'append_collection',
     'write_cc',
     'write_ccc',
     'write_cdl',
+    'write_cdlb',
+    'write_csv',
+    'write_fanout',
+    'write_jsonl',
     'write_rnh_cdl',
+    'write_single_files',
 ]
 
+# ==============================================================================
+# CLASSES
+# ==============================================================================
+
+
+class _CollectionWriter(AscDescBase, AscColorSpaceBase):
+    """Base class for writing a collection file one child at a time
+
+    Description
+    ~~~~~~~~~~~
+
+    Subclasses set the root ``_tag`` and provide ``write()`` and
+    ``write_decision()`` , while ``write_fragment()`` writes XML text already
+    built for a child. The XML written is identical to the ``xml_root`` of
+    a :class:`ColorCollection` holding the same descriptions and children,
+    but no collection is created or registered, and only one child's XML is
+    held in memory at a time.
+
+    The file is opened on init. The XML declaration, root tag and the
+    collection descriptions are written with the first child (or on close),
+    so ``desc``, ``input_desc`` and ``viewing_desc`` can be set until then.
+
+    """
+
+    _tag = None
+
+    def __init__(self, path, desc=None, input_desc=None, viewing_desc=None,
+                 pretty=None):
+        super(_CollectionWriter, self).__init__()
+        self.desc = desc
+        self.input_desc = input_desc
+        self.viewing_desc = viewing_desc
+        self._pretty = config.PRETTY_XML if pretty is None else pretty
+        self._xmlns = _XMLNS
+
+        if hasattr(path, 'write'):
+            self._file = path
+            self._owns_file = False
+        else:
+            self._file = open(path, 'wb', WRITE_BUFFER_SIZE)
+            self._owns_file = True
+
+        self._closed = False
+        self._count = 0
+        self._root_xml = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # Don't close the root, so an interrupted export can't pass as a
+            # complete one.
+            self._close_file()
+        return False
+
+    # Properties ==============================================================
+
+    @property
+    def closed(self):
+        """True once the root has been closed"""
+        return self._closed
+
+    @property
+    def count(self):
+        """The number of children written so far"""
+        return self._count
+
+    @property
+    def pretty(self):
+        """True if the XML is indented, False if it's compact"""
+        return self._pretty
+
+    @property
+    def xmlns(self):
+        """Describes the version of the XML schema written by cdl_convert"""
+        return self._xmlns
+
+    # Private Methods =========================================================
+
+    def _close_file(self):
+        """Closes the file if we opened it, and refuses further writes"""
+        self._closed = True
+        if self._owns_file:
+            self._file.close()
+
+    # =========================================================================
+
+    def _start(self, root_xml):
+        """Writes the declaration, root tag and descriptions"""
+        self._file.write(
+            enc(XML_DECLARATION + _open_tag(root_xml, 0, self._pretty))
+        )
+        for child in root_xml:
+            self._file.write(enc(self._serialize(child)))
+        self._root_xml = root_xml
+
+    # =========================================================================
+
+    def _serialize(self, element):
+        """Returns a child of the root as XML text"""
+        if self._pretty:
+            return pretty_xml(element, 1)
+        return compact_xml(element)
+
+    # Public Methods ==========================================================
+
+    def close(self):
+        """Closes the root element and the file. Does nothing if closed"""
+        if self._closed:
+            return
+        if self._root_xml is None:
+            root_xml = _root_element(self, self._tag)
+            if not len(root_xml):
+                # An empty collection is a single self closing tag
+                if self._pretty:
+                    empty = pretty_xml(root_xml)
+                else:
+                    empty = compact_xml(root_xml)
+                self._file.write(enc(XML_DECLARATION + empty))
+                self._close_file()
+                return
+            self._start(root_xml)
+        self._file.write(enc(_close_tag(self._root_xml, 0, self._pretty)))
+        self._close_file()
+
+    # =========================================================================
+
+    def write_fragment(self, fragment):
+        """Writes the XML text of a child of the root as given
+
+        The text must be a whole child element, indented one level if
+        ``pretty`` and ending with a newline, as ``xml_fragment(1, pretty)``
+        returns. It isn't checked, and a :class:`CDLWriter` doesn't remember
+        the ids it holds.
+
+        """
+        if self._closed:
+            raise ValueError('Cannot write to a closed {cls}.'.format(
+                cls=self.__class__.__name__)
+            )
+        if self._root_xml is None:
+            self._start(_root_element(self, self._tag))
+        self._file.write(enc(fragment))
+        self._count += 1
+
+# ==============================================================================
+
+
+class CCCWriter(_CollectionWriter):
+    """Writes a .ccc file incrementally, one ColorCorrection at a time
+
+    Description
+    ~~~~~~~~~~~
+
+    For producers that generate corrections one by one, such as from a
+    database cursor, and don't want to build a :class:`ColorCollection`
+    first. Each correction is written as soon as it's given, so the export
+    starts immediately and memory stays flat however many are written.
+
+    ::
+
+        with CCCWriter('/show/grades.ccc', desc='Reel 1') as writer:
+            for row in cursor:
+                writer.write(build_correction(row))
+
+    The root element is closed when the ``with`` block exits normally, or
+    when ``close()`` is called. If the block raises, the file is closed
+    without closing the root, leaving an incomplete document.
+
+    **Args:**
+
+        path : (str|file)
+            Filepath to write to, or an open binary stream. A stream given is
+            not closed by the writer.
+
+        desc=None : (str|[str])
+            Descriptions of the collection.
+
+        input_desc=None : (str)
+            Input description of the collection.
+
+        viewing_desc=None : (str)
+            Viewing description of the collection.
+
+        pretty=None : (bool)
+            Write indented XML, or compact XML if False. Defaults to
+            ``config.PRETTY_XML`` .
+
+    **Attributes:**
+
+        closed : (bool)
+            True once the root has been closed. Writing then raises
+            ``ValueError`` .
+
+        count : (int)
+            The number of corrections written so far.
+
+        pretty : (bool)
+            If the XML written is indented.
+
+        desc : [str]
+            Descriptions written at the top of the collection. Inherited
+            from :class:`AscDescBase` .
+
+        input_desc : (str)
+            Inherited from :class:`AscColorSpaceBase` .
+
+        viewing_desc : (str)
+            Inherited from :class:`AscColorSpaceBase` .
+
+        xmlns : (str)
+            The ASC XML Schema version written.
+
+    **Public Methods:**
+
+        close()
+            Closes the root element and the file.
+
+        write()
+            Writes a :class:`ColorCorrection` .
+
+        write_decision()
+            Writes the :class:`ColorCorrection` a :class:`ColorDecision`
+            holds or references. Unresolved references are skipped.
+
+        write_fragment()
+            Writes the XML text of a child already built, such as the
+            ``xml_fragment()`` of a :class:`ColorCorrection` , as given.
+
+    """
+
+    _tag = 'ColorCorrectionCollection'
+
+    # Public Methods ==========================================================
+
+    def write(self, correction):
+        """Writes a ColorCorrection"""
+        self.write_fragment(correction.xml_fragment(1, self._pretty))
+
+    # =========================================================================
+
+    def write_decision(self, decision):
+        """Writes the ColorCorrection a ColorDecision holds or references"""
+        correction = _decision_correction(decision)
+        if correction:
+            self.write(correction)
+
+# ==============================================================================
+
+
+class CDLWriter(_CollectionWriter):
+    """Writes a .cdl file incrementally, one ColorDecision at a time
+
+    Description
+    ~~~~~~~~~~~
+
+    The ``cdl`` counterpart of :class:`CCCWriter` , taking the same
+    arguments. :class:`ColorDecision` are written as given, and bare
+    :class:`ColorCorrection` are wrapped in a :class:`ColorDecision` without
+    changing their ``parent`` .
+
+    As when writing a :class:`ColorCollection` , a
+    :class:`ColorCorrectionRef` is written with its correction resolved
+    inline, unless that correction was already written to this file or
+    can't be found. Only the ids written are remembered for this.
+
+    **Public Methods:**
+
+        close()
+            Closes the root element and the file.
+
+        write()
+            Writes a :class:`ColorCorrection` inside a new
+            :class:`ColorDecision` .
+
+        write_decision()
+            Writes a :class:`ColorDecision` .
+
+        write_fragment()
+            Writes the XML text of a child already built, as given.
+
+    """
+
+    _tag = 'ColorDecisionList'
+
+    def __init__(self, path, desc=None, input_desc=None, viewing_desc=None,
+                 pretty=None):
+        super(CDLWriter, self).__init__(
+            path, desc, input_desc, viewing_desc, pretty
+        )
+        self._ids = set()
+
+    # Public Methods ==========================================================
+
+    def write(self, correction):
+        """Writes a ColorCorrection wrapped in a ColorDecision"""
+        self.write_fragment(_wrapped_fragment(correction, self._pretty))
+        self._ids.add(correction.id)
+
+    # =========================================================================
+
+    def write_decision(self, decision):
+        """Writes a ColorDecision"""
+        self.write_fragment(
+            _decision_fragment(decision, self._ids, self._pretty)
+        )
+        if not decision.is_ref:
+            self._ids.add(decision.cc.id)
+
+# ==============================================================================
+
+
+class ArchiveWriter(object):
+    """Writes a file per ColorCorrection into a single tar or zip archive
+
+    Description
+    ~~~~~~~~~~~
+
+    Writing a file per correction (``cc`` output or ``--single`` ) can mean
+    tens of thousands of small files. This writes the same files, with the
+    same names ``determine_dest()`` gives them, as members of one archive
+    instead, so only a single file is created.
+
+    ::
+
+        with ArchiveWriter('/show/grades.tgz') as archive:
+            for cdl in collection.color_corrections:
+                archive.write(cdl, 'cc')
+
+    Each member is serialized and added as it's given. Tar archives are
+    written as a stream, never seeking, so ``path`` may also be a pipe or
+    socket. Nothing is written to temporary files. The archive is finished
+    when the ``with`` block exits, even if it raises, so every member
+    written can still be read.
+
+    **Args:**
+
+        path : (str|file)
+            Filepath to write to, or an open binary stream. A stream given is
+            not closed by the writer.
+
+        archive_format=None : (str)
+            One of ``ARCHIVE_FORMATS`` : ``tar``, ``tgz`` (a gzipped tar) or
+            ``zip``. Required if ``path`` is a stream, otherwise defaults to
+            the format matching the extension of ``path`` .
+
+        pretty=None : (bool)
+            Write indented XML, or compact XML if False. Defaults to
+            ``config.PRETTY_XML`` .
+
+    **Attributes:**
+
+        archive_format : (str)
+            The format of the archive being written.
+
+        closed : (bool)
+            True once the archive has been finished. Writing then raises
+            ``ValueError`` .
+
+        count : (int)
+            The number of members written so far.
+
+    **Public Methods:**
+
+        close()
+            Finishes the archive and closes the file.
+
+        write()
+            Writes a :class:`ColorCorrection` in one of the
+            ``OUTPUT_FORMATS`` as a member of the archive.
+
+    """
+
+    def __init__(self, path, archive_format=None, pretty=None):
+        if archive_format is None:
+            archive_format = _archive_format(path)
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(
+                "The archive format: {archive} is not supported".format(
+                    archive=archive_format
+                )
+            )
+        self._archive_format = archive_format
+        self._pretty = config.PRETTY_XML if pretty is None else pretty
+
+        if archive_format == 'zip':
+            self._archive = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+        else:
+            mode = 'w|gz' if archive_format == 'tgz' else 'w|'
+            if hasattr(path, 'write'):
+                self._archive = tarfile.open(fileobj=path, mode=mode)
+            else:
+                self._archive = tarfile.open(path, mode)
+
+        self._closed = False
+        self._count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    # Properties ==============================================================
+
+    @property
+    def archive_format(self):
+        """The format of the archive being written"""
+        return self._archive_format
+
+    @property
+    def closed(self):
+        """True once the archive has been finished"""
+        return self._closed
+
+    @property
+    def count(self):
+        """The number of members written so far"""
+        return self._count
+
+    # Private Methods =========================================================
+
+    def _add(self, name, data):
+        """Adds bytes to the archive as a file called name"""
+        if self._archive_format == 'zip':
+            info = zipfile.ZipInfo(name, time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self._archive.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = time.time()
+            info.mode = 0o644
+            self._archive.addfile(info, BytesIO(data))
+
+    # Public Methods ==========================================================
+
+    def close(self):
+        """Finishes the archive and closes the file. Does nothing if closed"""
+        if self._closed:
+            return
+        self._closed = True
+        self._archive.close()
+
+    # =========================================================================
+
+    def write(self, cdl, ext):
+        """Writes a ColorCorrection as an archive member
+
+        **Args:**
+            cdl : (:class:`ColorCorrection`)
+                The correction to write.
+
+            ext : (str)
+                The output format, one of the keys of ``OUTPUT_FORMATS`` .
+
+        **Returns:**
+            None
+
+        **Raises:**
+            ValueError:
+                If the writer is closed, or ``ext`` isn't a known output
+                format.
+
+        The member holds the same bytes the matching ``OUTPUT_FORMATS``
+        function writes. ``determine_dest()`` is called without a directory,
+        so the correction's ``file_out`` is set to the member's name.
+
+        """
+        if self._closed:
+            raise ValueError('Cannot write to a closed ArchiveWriter.')
+        if ext not in _DUMP_FORMATS:
+            raise ValueError(
+                "The output format: {output} is not supported".format(
+                    output=ext
+                )
+            )
+        data = _DUMP_FORMATS[ext](cdl, self._pretty)
+        cdl.determine_dest(ext, '')
+        self._add(cdl.file_out, data)
+        self._count += 1
+
+# ==============================================================================
+
+
+class _PendingFile(object):
+    """A binary file being written, which is only in place once closed
+
+    Description
+    ~~~~~~~~~~~
+
+    Unless ``skip_unchanged`` , the file is simply opened at ``path`` .
+    Otherwise it's a temporary file beside ``path`` , which ``close()``
+    either renames over ``path`` or, if ``compare`` finds ``path`` already
+    holds the same bytes, removes. ``discard()`` removes it instead, so
+    ``path`` is never left half written.
+
+    The file written is ``file`` .
+
+    """
+
+    def __init__(self, path, skip_unchanged, buffering=None, compare=True):
+        args = () if buffering is None else (buffering, )
+        self._path = path
+        self._compare = compare
+
+        if not skip_unchanged:
+            self._temp_path = None
+            self.file = open(path, 'wb', *args)
+            return
+
+        directory, filename = os.path.split(path)
+        self._temp_path = os.path.join(
+            directory,
+            '.{name}.{uid}.tmp'.format(name=filename, uid=uuid.uuid4().hex)
+        )
+        # Unlike tempfile.mkstemp(), which always creates a file only the
+        # owner can read, this creates the file with the same permissions
+        # open() would.
+        temp_fd = os.open(
+            self._temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666
+        )
+        try:
+            self.file = os.fdopen(temp_fd, 'wb', *args)
+        except BaseException:
+            os.close(temp_fd)
+            os.remove(self._temp_path)
+            raise
+
+    # Public Methods ==========================================================
+
+    def close(self):
+        """Closes the file and puts it in place
+
+        Returns False if the file at path already held the same bytes and
+        was left untouched, otherwise True.
+
+        """
+        if self._temp_path is None:
+            self.file.close()
+            return True
+
+        try:
+            self.file.close()
+            if os.path.isfile(self._path):
+                if self._compare and filecmp.cmp(
+                        self._temp_path, self._path, shallow=False):
+                    os.remove(self._temp_path)
+                    return False
+                shutil.copymode(self._path, self._temp_path)
+            _replace(self._temp_path, self._path)
+        except BaseException:
+            self.discard()
+            raise
+        return True
+
+    # =========================================================================
+
+    def discard(self):
+        """Closes the file, removing it if it's temporary"""
+        self.file.close()
+        if self._temp_path is not None and os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
 # ==============================================================================
 # PRIVATE FUNCTIONS
 # ==============================================================================
 
 
+def _append_fragments(tag, children, taken, pretty):
+    """Returns the XML of children for a root tag and the ids they add
+
+    taken holds the ids already in the file that children refer to or reuse.
+    References already in the file are kept as references in a ``cdl`` and
+    left out of a ``ccc`` . Raises ``ValueError`` naming every id that would
+    be written twice.
+
+    """
+    known = set(taken)
+    fragments = []
+    added = []
+    duplicates = []
+    for child in children:
+        if tag == 'ColorDecisionList':
+            if isinstance(child, ColorDecision):
+                inline = not child.is_ref or _resolves(child, known)
+                fragment = _decision_fragment(child, known, pretty)
+                cc_id = child.cc.id
+            else:
+                inline = True
+                fragment = _wrapped_fragment(child, pretty)
+                cc_id = child.id
+        else:
+            if isinstance(child, ColorDecision):
+                if child.is_ref and child.cc.id in known:
+                    continue
+                child = _decision_correction(child)
+                if not child:
+                    continue
+            inline = True
+            fragment = child.xml_fragment(1, pretty)
+            cc_id = child.id
+        if inline:
+            if cc_id in known:
+                duplicates.append(cc_id)
+            known.add(cc_id)
+            added.append(cc_id)
+        fragments.append(fragment)
+
+    if duplicates:
+        raise ValueError(
+            'ColorCorrection ids are already in the collection: '
+            '{ids}'.format(ids=', '.join(duplicates))
+        )
+    return fragments, added
+
+# ==============================================================================
+
+
+def _archive_format(path):
+    """Returns the archive format matching the extension of a filepath"""
+    if hasattr(path, 'write'):
+        raise ValueError(
+            'An archive_format is required when writing to a stream.'
+        )
+    name = os.path.basename(path).lower()
+    if name.endswith('.zip'):
+        return 'zip'
+    elif name.endswith('.tgz') or name.endswith('.tar.gz'):
+        return 'tgz'
+    elif name.endswith('.tar'):
+        return 'tar'
+    raise ValueError(
+        "No archive format matches the file: {path}".format(path=path)
+    )
+
+# ==============================================================================
+
+
+def _cdlb_value(value, add_string, cache):
+    """Returns the coefficient and exponent a cdlb file stores a Decimal as"""
+    parts = value.as_tuple()
+    try:
+        return cache[parts]
+    except KeyError:
+        pass
+    sign, digits, exponent = parts
+    if isinstance(exponent, int) and -127 <= exponent <= 127 and \
+            len(digits) <= 18 and (any(digits) or not sign):
+        coefficient = int(''.join([str(digit) for digit in digits]))
+        stored = (-coefficient if sign else coefficient, exponent)
+    else:
+        # Specials, negative zero and values too long for the packed arrays
+        stored = (add_string(str(value)), _CDLB_TEXT_VALUE)
+    cache[parts] = stored
+    return stored
+
+# ==============================================================================
+
+
+def _copy_head(path, length, out_f):
+    """Copies the first length bytes of the file at path to out_f"""
+    with open(path, 'rb') as cdl_f:
+        while length:
+            chunk = cdl_f.read(min(length, WRITE_BUFFER_SIZE))
+            if not chunk:
+                break
+            out_f.write(chunk)
+            length -= len(chunk)
+
+# ==============================================================================
+
+
+def _csv_row(cdl, fields):
+    """Returns the cells of a ColorCorrection for the csv fields given"""
+    # The private nodes are read so virgin nodes aren't created.
+    sop_node = cdl._sop_node  # pylint: disable=W0212
+    sat_node = cdl._sat_node  # pylint: disable=W0212
+    values = {}
+    if sop_node is not None:
+        for name in ['slope', 'offset', 'power']:
+            values[name] = [
+                format_number(value) for value in getattr(sop_node, name)
+            ]
+
+    row = []
+    for field in fields:
+        if field == 'id':
+            row.append(cdl.id)
+        elif field == 'desc':
+            row.append('\n'.join(cdl.desc))
+        elif field == 'sat':
+            row.append(format_number(sat_node.sat) if sat_node else '')
+        elif not values:
+            row.append('')
+        elif field == 'sop':
+            row.append(''.join(
+                '(' + ' '.join(values[name]) + ')'
+                for name in ['slope', 'offset', 'power']
+            ))
+        elif field in values:
+            row.append(' '.join(values[field]))
+        else:
+            name, channel = field.rsplit('_', 1)
+            row.append(values[name]['rgb'.index(channel)])
+    return row
+
+# ==============================================================================
+
+
+def _csv_writer(csv_f, columns=None):
+    """Writes the csv header to a binary file
+
+    Returns a function writing the row of a ColorCorrection, then one to call
+    once every row is written, which leaves csv_f open.
+
+    """
+    layout = _csv_layout(columns)
+    fields = [field for field, header in layout]
+
+    # Python 3's csv module writes text, and Python 2's writes bytes.
+    if sys.version_info[0] >= 3:  # pragma: no cover
+        text_f = TextIOWrapper(csv_f, encoding='UTF-8', newline='')
+        cell = lambda x: x
+    else:  # pragma: no cover
+        text_f = csv_f
+        cell = enc
+
+    writer = csv.writer(text_f)
+    writer.writerow([cell(header) for field, header in layout])
+
+    def write_row(color_correct):
+        """Writes the row of a ColorCorrection"""
+        writer.writerow(
+            [cell(value) for value in _csv_row(color_correct, fields)]
+        )
+
+    def finish():
+        """Flushes the rows, leaving the binary file open for the caller"""
+        if text_f is not csv_f:
+            text_f.flush()
+            text_f.detach()
+
+    return write_row, finish
+
+# ==============================================================================
+
+
+def _dump_cc(cdl, pretty):
+    """Returns the bytes write_cc() writes for a ColorCorrection"""
+    return cdl.xml_root if pretty else cdl.xml_root_compact
+
+# ==============================================================================
+
+
+def _dump_ccc(cdl, pretty):
+    """Returns the bytes write_ccc() writes, all at once"""
+    return _dump_collection(cdl, 'ccc', pretty)
+
+# ==============================================================================
+
+
+def _dump_cdl(cdl, pretty):
+    """Returns the bytes write_cdl() writes, all at once"""
+    return _dump_collection(cdl, 'cdl', pretty)
+
+# ==============================================================================
+
+
+def _dump_cdlb(cdl, pretty=None):  # pylint: disable=W0613
+    """Returns the bytes write_cdlb() writes, all at once"""
+    if not isinstance(cdl, ColorCollection):
+        cdl = _temp_container(cdl)
+    cdlb_f = BytesIO()
+    _write_cdlb(cdl, cdlb_f)
+    return cdlb_f.getvalue()
+
+# ==============================================================================
+
+
+def _dump_collection(cdl, collection_type, pretty):
+    """Returns the XML root of cdl as a collection of the given type"""
+    if not isinstance(cdl, ColorCollection):
+        cdl = _temp_container(cdl)
+
+    orig_type = cdl.type
+    cdl.type = collection_type
+    try:
+        return cdl.xml_root if pretty else cdl.xml_root_compact
+    finally:
+        cdl.type = orig_type
+
+# ==============================================================================
+
+
+def _dump_csv(cdl, pretty=None):  # pylint: disable=W0613
+    """Returns the bytes write_csv() writes, all at once"""
+    csv_f = BytesIO()
+    _write_csv(cdl, csv_f)
+    return csv_f.getvalue()
+
+# ==============================================================================
+
+
+def _dump_jsonl(cdl, pretty=None):  # pylint: disable=W0613
+    """Returns the bytes write_jsonl() writes, all at once"""
+    return b''.join(_iter_jsonl_lines(cdl))
+
+# ==============================================================================
+
+
+def _dump_rnh_cdl(cdl, pretty=None):  # pylint: disable=W0613
+    """Returns the bytes write_rnh_cdl() writes for a ColorCorrection"""
+    values = list(cdl.slope)
+    values.extend(cdl.offset)
+    values.extend(cdl.power)
+    values.append(cdl.sat)
+    values = [format_number(i) for i in values]
+
+    return enc(' '.join(values))
+
+# ==============================================================================
+
+
+def _ends_line(path):
+    """Returns True if the file at path ends with a newline"""
+    with open(path, 'rb') as cdl_f:
+        cdl_f.seek(-1, os.SEEK_END)
+        return cdl_f.read(1) == b'\n'
+
+# ==============================================================================
+
+
+def _fan_out(col, files, pretty, each):  # pylint: disable=R0912
+    """Writes the children of col to each format's open file in one walk"""
+    ccc_writer = cdl_writer = write_row = finish_csv = None
+    if 'ccc' in files:
+        ccc_writer = CCCWriter(
+            files['ccc'], col.desc, col.input_desc, col.viewing_desc, pretty
+        )
+    if 'cdl' in files:
+        cdl_writer = CDLWriter(
+            files['cdl'], col.desc, col.input_desc, col.viewing_desc, pretty
+        )
+    if 'csv' in files:
+        write_row, finish_csv = _csv_writer(files['csv'])
+    jsonl_f = files.get('jsonl')
+    if jsonl_f and _has_descs(col):
+        jsonl_f.write(_jsonl_line(col))
+
+    decisions = col.color_decisions
+    ids = set(col.id_list) if decisions else ()
+    # A cdl lists its decisions before its bare corrections, so those are
+    # held back until every decision is written.
+    wrapped = []
+
+    for color_correct in col.color_corrections:
+        if ccc_writer:
+            ccc_writer.write(color_correct)
+        if cdl_writer:
+            fragment = _wrapped_fragment(color_correct, pretty)
+            if decisions:
+                wrapped.append(fragment)
+            else:
+                cdl_writer.write_fragment(fragment)
+        if write_row:
+            write_row(color_correct)
+        if jsonl_f:
+            jsonl_f.write(_jsonl_line(color_correct))
+        if each:
+            each(color_correct)
+
+    for color_decision in decisions:
+        if ccc_writer or write_row:
+            color_correct = _decision_correction(color_decision)
+            if color_correct and ccc_writer:
+                ccc_writer.write(color_correct)
+            if color_correct and write_row:
+                write_row(color_correct)
+        if cdl_writer:
+            cdl_writer.write_fragment(
+                _decision_fragment(color_decision, ids, pretty)
+            )
+        if jsonl_f:
+            jsonl_f.write(_jsonl_line(color_decision))
+        if each and not color_decision.is_ref:
+            each(color_decision.cc)
+
+    for fragment in wrapped:
+        cdl_writer.write_fragment(fragment)
+
+    for writer in [ccc_writer, cdl_writer]:
+        if writer:
+            writer.close()
+    if finish_csv:
+        finish_csv()
+
+# ==============================================================================
+
+
+def _has_descs(node):
+    """Returns True if node has a desc, input_desc or viewing_desc"""
+    return bool(node.desc) or node.input_desc is not None or \
+        node.viewing_desc is not None
+
+# ==============================================================================
+
+
+def _holds(path, data):
+    """Returns True if the file at path holds exactly the bytes data"""
+    if os.path.getsize(path) != len(data):
+        return False
+    with open(path, 'rb') as cdl_f:
+        return cdl_f.read() == data
+
+# ==============================================================================
+
+
+def _id_index(path, index_path):
+    """Opens the id index of a collection file, rebuilding it if stale
+
+    The index is a SQLite database of every ColorCorrection id in the file at
+    path, along with the size, modification time and hash of the end of the
+    file when they were read. If those no longer match, the ids are read
+    again from the file.
+
+    """
+    connection = sqlite3.connect(index_path)
+    try:
+        version = connection.execute('PRAGMA user_version').fetchone()[0]
+        if version != _ID_INDEX_VERSION:
+            with connection:
+                connection.execute('DROP TABLE IF EXISTS ids')
+                connection.execute('DROP TABLE IF EXISTS signature')
+                connection.execute('CREATE TABLE ids (id TEXT PRIMARY KEY)')
+                connection.execute(
+                    'CREATE TABLE signature '
+                    '(size INTEGER, mtime REAL, tail TEXT)'
+                )
+                connection.execute(
+                    "INSERT INTO signature VALUES (-1, 0, '')"
+                )
+                connection.execute(
+                    'PRAGMA user_version = {0}'.format(_ID_INDEX_VERSION)
+                )
+
+        signature = _signature(path)
+        stored = connection.execute(
+            'SELECT size, mtime, tail FROM signature'
+        ).fetchone()
+        if tuple(stored) != signature:
+            with connection:
+                connection.execute('DELETE FROM ids')
+                connection.executemany(
+                    'INSERT OR IGNORE INTO ids VALUES (?)',
+                    ((cc_id, ) for cc_id in _scan_ids(path))
+                )
+                connection.execute(
+                    'UPDATE signature SET size = ?, mtime = ?, tail = ?',
+                    signature
+                )
+    except BaseException:
+        connection.close()
+        raise
+    return connection
+
+# ==============================================================================
+
+
+def _indexed(connection, ids):
+    """Returns the set of ids which are in an id index"""
+    ids = list(set(ids))
+    found = set()
+    for start in range(0, len(ids), _ID_INDEX_BATCH):
+        batch = ids[start:start + _ID_INDEX_BATCH]
+        found.update(
+            row[0] for row in connection.execute(
+                'SELECT id FROM ids WHERE id IN ({marks})'.format(
+                    marks=', '.join(['?'] * len(batch))
+                ),
+                batch
+            )
+        )
+    return found
+
+# ==============================================================================
+
+
+def _iter_csv_corrections(cdl):
+    """Yields each ColorCorrection a csv file of cdl holds, as a ccc would"""
+    if isinstance(cdl, ColorCollection):
+        for color_correct in cdl.color_corrections:
+            yield color_correct
+        decisions = cdl.color_decisions
+    elif isinstance(cdl, ColorDecision):
+        decisions = [cdl]
+    else:
+        yield cdl
+        return
+    for color_decision in decisions:
+        color_correct = _decision_correction(color_decision)
+        if color_correct:
+            yield color_correct
+
+# ==============================================================================
+
+
+def _iter_jsonl_lines(cdl):
+    """Yields the JSON Lines line of each correction and decision in cdl"""
+    if isinstance(cdl, ColorCollection):
+        if _has_descs(cdl):
+            yield _jsonl_line(cdl)
+        nodes = cdl.all_children
+    else:
+        nodes = [cdl]
+    for node in nodes:
+        yield _jsonl_line(node)
+
+# ==============================================================================
+
+
+def _jsonl_line(node):
+    """Returns the JSON Lines line of a node, as bytes"""
+    # Plain ASCII output is the same bytes on Python 2 and 3
+    return enc(
+        json.dumps(_jsonl_record(node), separators=(',', ':')) + '\n'
+    )
+
+# ==============================================================================
+
+
+def _jsonl_record(node, exact=False):
+    """Returns the JSON Lines fields of a correction, decision or collection
+
+    A collection's record holds only its descriptions. Values are turned into
+    text by ``format_number()`` , with their exact digits if exact, whatever
+    ``config.NUMBER_PRECISION`` is.
+
+    """
+    record = OrderedDict()
+    if isinstance(node, ColorDecision):
+        record['type'] = 'ColorDecision'
+        if node.is_ref:
+            record['cc_ref'] = node.cc.id
+        else:
+            cc_record = _jsonl_record(node.cc, exact)
+            del cc_record['type']
+            record['cc'] = cc_record
+        if node.media_ref is not None:
+            record['media_ref'] = node.media_ref.ref
+    elif isinstance(node, ColorCollection):
+        record['type'] = 'ColorCollection'
+    else:
+        record['type'] = 'ColorCorrection'
+        record['id'] = node.id
+        # The private nodes are read so virgin nodes aren't created.
+        sop_node = node._sop_node  # pylint: disable=W0212
+        sat_node = node._sat_node  # pylint: disable=W0212
+        if sop_node is not None:
+            for attr in ['slope', 'offset', 'power']:
+                record[attr] = [
+                    format_number(value, exact=exact)
+                    for value in getattr(sop_node, attr)
+                ]
+            if sop_node.desc:
+                record['sop_desc'] = list(sop_node.desc)
+        if sat_node is not None:
+            record['sat'] = format_number(sat_node.sat, exact=exact)
+            if sat_node.desc:
+                record['sat_desc'] = list(sat_node.desc)
+    if node.desc:
+        record['desc'] = list(node.desc)
+    if node.input_desc is not None:
+        record['input_desc'] = node.input_desc
+    if node.viewing_desc is not None:
+        record['viewing_desc'] = node.viewing_desc
+    return record
+
+# ==============================================================================
+
+
+def _rollback(path):
+    """Undoes an append to path that was interrupted, if there was one
+
+    The journal holds the offset the append started at and the bytes which
+    followed it, which are written back there.
+
+    """
+    journal = _sidecar(path, 'journal')
+    if not os.path.isfile(journal):
+        return
+    with open(journal, 'rb') as journal_f:
+        offset, tail = journal_f.read().split(b'\n', 1)
+    with open(path, 'r+b') as cdl_f:
+        cdl_f.seek(int(offset))
+        cdl_f.write(tail)
+        cdl_f.truncate()
+        cdl_f.flush()
+        os.fsync(cdl_f.fileno())
+    os.remove(journal)
+
+# ==============================================================================
+
+
+def _scan_ids(path):
+    """Yields the id of every ColorCorrection in the XML file at path"""
+    if not os.path.getsize(path):
+        return
+    with open(path, 'rb') as cdl_f:
+        data = mmap.mmap(cdl_f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            for match in _ID_PATTERN.finditer(data):
+                if match.group(2) is None:
+                    # A comment or CDATA section
+                    continue
+                yield unescape(
+                    match.group(2).decode('UTF-8'),
+                    {'&quot;': '"', '&apos;': "'"}
+                )
+        finally:
+            data.close()
+
+# ==============================================================================
+
+
+def _sidecar(path, kind):
+    """Returns the path of a hidden file kept beside path"""
+    directory, filename = os.path.split(path)
+    return os.path.join(
+        directory, '.{name}.{kind}'.format(name=filename, kind=kind)
+    )
+
+# ==============================================================================
+
+
+def _signature(path):
+    """Returns the size, modification time and a hash of the end of a file
+
+    Only the last ``_APPEND_TAIL_SIZE`` bytes are hashed, which is where
+    appends change the file.
+
+    """
+    stat = os.stat(path)
+    with open(path, 'rb') as cdl_f:
+        cdl_f.seek(max(stat.st_size - _APPEND_TAIL_SIZE, 0))
+        tail = hashlib.sha1(cdl_f.read()).hexdigest()
+    return stat.st_size, stat.st_mtime, tail
+
+# ==============================================================================
+
+
+def _splice_point(path):
+    """Finds where children are added to the collection file at path
+
+    **Returns:**
+        (str, int, bytes, bool)
+            The root tag, the offset children are written at, the bytes from
+            there to the end of the file, and if the file is indented.
+
+    **Raises:**
+        ValueError:
+            If the end of the file isn't the end of a collection.
+
+    Only the last ``_APPEND_TAIL_SIZE`` bytes are read. The offset is that of
+    the closing root tag, or of the ``/>`` of a root with no children.
+
+    """
+    size = os.path.getsize(path)
+    start = max(size - _APPEND_TAIL_SIZE, 0)
+    with open(path, 'rb') as cdl_f:
+        cdl_f.seek(start)
+        tail = cdl_f.read()
+
+    for tag in _ROOT_TAGS:
+        position = tail.rfind(enc('</' + tag + '>'))
+        if position != -1:
+            return (
+                tag, start + position, tail[position:],
+                tail[position - 1:position] == b'\n'
+            )
+
+    match = _EMPTY_ROOT.search(tail)
+    if match:
+        position = match.start(2)
+        return (
+            match.group(1).decode('UTF-8'), start + position, tail[position:],
+            tail[position + 2:position + 3] == b'\n'
+        )
+
+    raise ValueError(
+        'Could not find the end of a ColorCorrectionCollection or '
+        'ColorDecisionList at the end of {path}'.format(path=path)
+    )
+
+# ==============================================================================
+
+
 def _temp_container(cdl):
     """Builds a temporary collection container for a single cdl file."""
     temp_cdl = ColorCollection()
@@ -100,59 +1440,860 @@ def _temp_container(cdl):
     return temp_cdl
 
 # ==============================================================================
+
+
+def _write_cdlb(col, cdlb_f):  # pylint: disable=R0914
+    """Writes a ColorCollection to an open binary file in the cdlb layout
+
+    The file starts with a fixed size header giving the counts and offsets
+    of each section, then holds a table of every distinct string, the lists
+    of descriptions as indexes into that table, a fixed size record per
+    :class:`ColorCorrection` , their values packed as arrays of integer
+    coefficients and exponents, and a fixed size record per
+    :class:`ColorDecision` . Sections start on 8 byte boundaries, so the
+    reader can unpack any record straight from the mapped file.
+
+    """
+    strings = {}
+    texts = []
+
+    def add_string(text):
+        """Returns the index of text in the string table, adding it"""
+        if text is None:
+            return _CDLB_NONE
+        try:
+            return strings[text]
+        except KeyError:
+            strings[text] = len(texts)
+            texts.append(text)
+            return strings[text]
+
+    descs = []
+
+    def desc_span(desc):
+        """Adds a list of descriptions, returning their start and count"""
+        start = len(descs)
+        descs.extend([add_string(text) for text in desc])
+        return start, len(desc)
+
+    # Corrections held by decisions follow those held by the collection.
+    corrections = list(col.color_corrections)
+    for color_decision in col.color_decisions:
+        if not color_decision.is_ref:
+            corrections.append(color_decision.cc)
+    indexes = {}
+    for index, color_correct in enumerate(corrections):
+        indexes.setdefault(id(color_correct), index)
+
+    records = bytearray()
+    coefficients = bytearray()
+    exponents = bytearray()
+    cache = {}
+    for color_correct in corrections:
+        # The private nodes are read so virgin nodes aren't created.
+        sop_node = color_correct._sop_node  # pylint: disable=W0212
+        sat_node = color_correct._sat_node  # pylint: disable=W0212
+        flags = 0
+        sop_span = sat_span = (0, 0)
+        if sop_node is not None:
+            flags |= _CDLB_HAS_SOP
+            sop_span = desc_span(sop_node.desc)
+            values = list(
+                sop_node._slope + sop_node._offset + sop_node._power  # pylint: disable=W0212
+            )
+        else:
+            values = list(_IDENTITY_SOP)
+        if sat_node is not None:
+            flags |= _CDLB_HAS_SAT
+            sat_span = desc_span(sat_node.desc)
+            values.append(sat_node._sat)  # pylint: disable=W0212
+        else:
+            values.append(_IDENTITY_SAT)
+        records += _CDLB_CORRECTION.pack(
+            *((
+                add_string(color_correct.id),
+                add_string(color_correct.input_desc),
+                add_string(color_correct.viewing_desc),
+            ) + desc_span(color_correct.desc) + sop_span + sat_span +
+              (flags, ))
+        )
+        stored = [_cdlb_value(value, add_string, cache) for value in values]
+        coefficients += _CDLB_COEFFICIENTS.pack(*[i[0] for i in stored])
+        exponents += _CDLB_EXPONENTS.pack(*[i[1] for i in stored])
+
+    decisions = bytearray()
+    for color_decision in col.color_decisions:
+        cc_index = ref_id = ref_target = media_ref = _CDLB_NONE
+        if color_decision.is_ref:
+            ref_id = add_string(color_decision.cc.id)
+            target = ColorCorrection.members.get(color_decision.cc.id)
+            ref_target = indexes.get(id(target), _CDLB_NONE)
+        else:
+            cc_index = indexes[id(color_decision.cc)]
+        if color_decision.media_ref is not None:
+            media_ref = add_string(color_decision.media_ref.ref)
+        decisions += _CDLB_DECISION.pack(
+            *((
+                add_string(color_decision.input_desc),
+                add_string(color_decision.viewing_desc),
+            ) + desc_span(color_decision.desc) +
+              (cc_index, ref_id, ref_target, media_ref))
+        )
+
+    collection_record = (
+        add_string(col.type),
+        add_string(col.input_desc),
+        add_string(col.viewing_desc),
+    ) + desc_span(col.desc)
+
+    text = bytearray()
+    offsets = [0]
+    for string in texts:
+        text += enc(string)
+        offsets.append(len(text))
+
+    sections = [
+        struct.pack('<{count}Q'.format(count=len(offsets)), *offsets),
+        text,
+        struct.pack('<{count}I'.format(count=len(descs)), *descs),
+        records,
+        coefficients,
+        exponents,
+        decisions,
+    ]
+    positions = []
+    position = _CDLB_HEADER.size
+    for section in sections:
+        position += -position % 8
+        positions.append(position)
+        position += len(section)
+
+    cdlb_f.write(
+        _CDLB_HEADER.pack(
+            *((CDLB_MAGIC, CDLB_VERSION, 0, len(texts), len(descs),
+               len(corrections), len(col.color_corrections),
+               len(col.color_decisions)) +
+              tuple(positions) + collection_record)
+        )
+    )
+    position = _CDLB_HEADER.size
+    for start, section in zip(positions, sections):
+        cdlb_f.write(b'\0' * (start - position))
+        cdlb_f.write(section)
+        position = start + len(section)
+
+# ==============================================================================
+
+
+def _write_csv(cdl, csv_f, columns=None):
+    """Writes the header and a row per ColorCorrection to a binary file"""
+    write_row, finish = _csv_writer(csv_f, columns)
+    for color_correct in _iter_csv_corrections(cdl):
+        write_row(color_correct)
+    finish()
+
+# ==============================================================================
+
+
+def _write_file(path, data, skip_unchanged=None, buffering=None):
+    """Writes bytes, or whatever a callable writes, to a binary file
+
+    **Args:**
+        path : (str)
+            The file to write.
+
+        data : (bytes|callable)
+            The contents of the file, or a callable which writes them to the
+            open file it's given.
+
+        skip_unchanged=None : (bool)
+            Leave path untouched if it already holds exactly these contents.
+            Defaults to ``config.SKIP_UNCHANGED`` .
+
+        buffering=None : (int)
+            Buffer size to open the file with, or the default if None.
+
+    **Returns:**
+        (bool)
+            True if the file was written, False if it was unchanged and
+            skipped.
+
+    When skipping unchanged files, bytes are compared with the file before
+    anything is written. The contents are otherwise written to a temporary
+    file beside path, which is either renamed over path or, if a callable
+    wrote the same contents, removed. Renaming is atomic, so path is never
+    left half written, and collections are still streamed rather than held
+    in memory.
+
+    """
+    if skip_unchanged is None:
+        skip_unchanged = config.SKIP_UNCHANGED
+
+    if skip_unchanged and not callable(data) and os.path.isfile(path) and \
+            _holds(path, data):
+        return False
+
+    # Bytes already known to differ from the file needn't be compared again
+    pending = _PendingFile(path, skip_unchanged, buffering, callable(data))
+    try:
+        if callable(data):
+            data(pending.file)
+        else:
+            pending.file.write(data)
+    except BaseException:
+        pending.discard()
+        raise
+    return pending.close()
+
+# ==============================================================================
+
+
+def _write_journal(path, offset, tail):
+    """Records how to undo an append to path before it starts
+
+    The journal is renamed into place once complete, so it's never found half
+    written.
+
+    """
+    journal = _sidecar(path, 'journal')
+    temp_path = journal + '.tmp'
+    with open(temp_path, 'wb') as journal_f:
+        journal_f.write(enc('{0}\n'.format(offset)) + tail)
+        journal_f.flush()
+        os.fsync(journal_f.fileno())
+    _replace(temp_path, journal)
+    return journal
+
+# ==============================================================================
+
+
+def _write_worker(pending, results, skip_unchanged):
+    """Writes queued (index, cdl, path, data) items until given None"""
+    while True:
+        item = pending.get()
+        if item is None:
+            return
+        index, cdl, path, data = item
+        try:
+            written = _write_file(path, data, skip_unchanged)
+        # Every failure must be reported, and a dead worker would leave
+        # the main thread blocked on a full queue.
+        except Exception as err:  # pylint: disable=W0703
+            results.append((index, cdl, err))
+        else:
+            if not written:
+                results.append((index, cdl, None))
+
+# ==============================================================================
 # PUBLIC FUNCTIONS
 # ==============================================================================
 
 
-def write_cc(cdl):
-    """Writes the ColorCorrection to a .cc file"""
-    with open(cdl.file_out, 'wb') as cdl_f:
-        cdl_f.write(cdl.xml_root)
+def append_collection(path, children, pretty=None, index=False,
+                      in_place=False):
+    """Adds children to the end of an existing .ccc or .cdl file
+
+    **Args:**
+        path : (str)
+            An existing ``ccc`` or ``cdl`` file. Which it is is read from its
+            root tag, not its extension.
+
+        children : (:class:`ColorCollection`|[:class:`ColorDecision`])
+            What to add, in order, as a collection or a list of
+            :class:`ColorCorrection` and :class:`ColorDecision` . The
+            children of a collection are taken from ``all_children`` .
+            They're written as ``CCCWriter`` or ``CDLWriter`` would write
+            them, so a ``ccc`` gets the :class:`ColorCorrection` a
+            :class:`ColorDecision` holds or references, and a ``cdl`` gets
+            bare corrections wrapped in a :class:`ColorDecision` .
+
+        pretty=None : (bool)
+            Write indented XML, or compact XML if False. Defaults to matching
+            the file.
+
+        index=False : (bool)
+            Keep the ids of the file in an index beside it, so they're only
+            read from the file when it changed since the last append.
+
+        in_place=False : (bool)
+            Write over the end of the file itself instead of replacing it
+            with a copy. See the limits below.
+
+    **Returns:**
+        (int)
+            The number of children written.
+
+    **Raises:**
+        ValueError:
+            If the file doesn't end with a collection root, or if a
+            :class:`ColorCorrection` id to be written is already in the file
+            or written twice. Nothing is written then.
+
+    Rather than parsing and rewriting the whole file, the children's XML is
+    spliced in before the closing root tag. Only the end of the file is read
+    to find the root tag. The result is the file ``write_ccc()`` or
+    ``write_cdl()`` writes for the whole collection.
+
+    By default the bytes before the closing root tag are copied to a
+    temporary file beside the file, the children and root tag are written
+    after them, and the copy is renamed over the file, keeping its
+    permissions. Readers see either the old or the new file, and the file is
+    left untouched if writing fails or the process dies, though the time
+    taken grows with the size of the file.
+
+    With ``in_place`` , the children's XML is written over the closing root
+    tag of the file itself, followed by that tag again, so the time taken
+    depends only on what's added. Before the file is changed, the bytes
+    being overwritten are saved to a hidden ``.<filename>.journal`` file,
+    which is put back if writing fails. This isn't atomic: other processes
+    reading the file during the append can see it half written, and if the
+    process dies while writing, the file stays broken until the next
+    ``append_collection()`` to it puts the journal back. ``parse_ccc()`` and
+    ``parse_cdl()`` don't check for a journal.
+
+    Either way, other processes must not write the file during an append.
+
+    Ids are checked against an index of every :class:`ColorCorrection` id in
+    the file, skipping any in comments. With ``index`` , this is a SQLite
+    database kept in a hidden ``.<filename>.ids`` file beside the file,
+    which is updated as children are added, and rebuilt by scanning the file
+    when the file's size, modification time or the hash of its last 64 KiB
+    don't match the last append. Otherwise the file is scanned every time,
+    which is still much faster than parsing it. A
+    :class:`ColorCorrectionRef` to an id in the file is kept as a reference.
+
+    """
+    if isinstance(children, ColorCollection):
+        children = children.all_children
+    elif isinstance(children, (ColorCorrection, ColorDecision)):
+        children = [children]
+    else:
+        children = list(children)
+
+    _rollback(path)
+    tag, offset, tail, indented = _splice_point(path)
+    if pretty is None:
+        pretty = indented
+
+    index_path = _sidecar(path, 'ids') if index else ':memory:'
+    connection = _id_index(path, index_path)
+    try:
+        taken = _indexed(
+            connection,
+            [
+                child.cc.id if isinstance(child, ColorDecision) else child.id
+                for child in children
+            ]
+        )
+        fragments, added = _append_fragments(tag, children, taken, pretty)
+        if not fragments:
+            return 0
+
+        data = enc(''.join(fragments))
+        if tail.startswith(b'/>'):
+            # Open the empty root, then close it where it ended
+            opening = b'>\n' if pretty else b'>'
+            data = opening + data + enc('</' + tag + '>') + tail[2:]
+        else:
+            data += tail
+
+        if in_place:
+            journal = _write_journal(path, offset, tail)
+            try:
+                with open(path, 'r+b') as cdl_f:
+                    cdl_f.seek(offset)
+                    cdl_f.write(data)
+                    cdl_f.flush()
+                    os.fsync(cdl_f.fileno())
+            except BaseException:
+                _rollback(path)
+                raise
+            os.remove(journal)
+        else:
+            pending = _PendingFile(path, True, compare=False)
+            try:
+                _copy_head(path, offset, pending.file)
+                pending.file.write(data)
+                pending.file.flush()
+                os.fsync(pending.file.fileno())
+            except BaseException:
+                pending.discard()
+                raise
+            pending.close()
+
+        with connection:
+            connection.executemany(
+                'INSERT OR IGNORE INTO ids VALUES (?)',
+                ((cc_id, ) for cc_id in added)
+            )
+            connection.execute(
+                'UPDATE signature SET size = ?, mtime = ?, tail = ?',
+                _signature(path)
+            )
+    finally:
+        connection.close()
+
+    return len(fragments)
 
 # ==============================================================================
 
 
-def write_ccc(cdl):
-    """Writes the ColorCollection to a .ccc file"""
+def write_cc(cdl, pretty=None, skip_unchanged=None):
+    """Writes the ColorCorrection to a .cc file
+
+    Compact XML is written if ``pretty`` is False, or if it's None and
+    ``config.PRETTY_XML`` is False.
+
+    If ``skip_unchanged`` is True, or if it's None and
+    ``config.SKIP_UNCHANGED`` is True, an existing file with the same contents
+    is left untouched, and other files are replaced atomically. Returns False
+    if the file was skipped, otherwise True.
+
+    """
+    if pretty is None:
+        pretty = config.PRETTY_XML
+    return _write_file(cdl.file_out, _dump_cc(cdl, pretty), skip_unchanged)
+
+# ==============================================================================
+
+
+def write_ccc(cdl, pretty=None, skip_unchanged=None):
+    """Writes the ColorCollection to a .ccc file
+
+    Compact XML is written if ``pretty`` is False, or if it's None and
+    ``config.PRETTY_XML`` is False.
+
+    If ``skip_unchanged`` is True, or if it's None and
+    ``config.SKIP_UNCHANGED`` is True, an existing file with the same contents
+    is left untouched, and other files are replaced atomically. Returns False
+    if the file was skipped, otherwise True.
+
+    """
+    if pretty is None:
+        pretty = config.PRETTY_XML
     if not isinstance(cdl, ColorCollection):
         cdl = _temp_container(cdl)
 
     collection_type = cdl.type
     cdl.set_to_ccc()
-    with open(cdl.file_out, 'wb') as cdl_f:
-        cdl_f.write(cdl.xml_root)
-    cdl.type = collection_type
+    try:
+        return _write_file(
+            cdl.file_out,
+            lambda cdl_f: cdl.write_xml_root(cdl_f, pretty),
+            skip_unchanged,
+            WRITE_BUFFER_SIZE
+        )
+    finally:
+        cdl.type = collection_type
 
 # ==============================================================================
 
 
-def write_cdl(cdl):
-    """Writes the ColorCollection to a .cdl file"""
+def write_cdl(cdl, pretty=None, skip_unchanged=None):
+    """Writes the ColorCollection to a .cdl file
+
+    Compact XML is written if ``pretty`` is False, or if it's None and
+    ``config.PRETTY_XML`` is False.
+
+    If ``skip_unchanged`` is True, or if it's None and
+    ``config.SKIP_UNCHANGED`` is True, an existing file with the same contents
+    is left untouched, and other files are replaced atomically. Returns False
+    if the file was skipped, otherwise True.
+
+    """
+    if pretty is None:
+        pretty = config.PRETTY_XML
     if not isinstance(cdl, ColorCollection):
         cdl = _temp_container(cdl)
 
     collection_type = cdl.type
     cdl.set_to_cdl()
-    with open(cdl.file_out, 'wb') as cdl_f:
-        cdl_f.write(cdl.xml_root)
-    cdl.type = collection_type
+    try:
+        return _write_file(
+            cdl.file_out,
+            lambda cdl_f: cdl.write_xml_root(cdl_f, pretty),
+            skip_unchanged,
+            WRITE_BUFFER_SIZE
+        )
+    finally:
+        cdl.type = collection_type
 
 # ==============================================================================
 
 
-def write_rnh_cdl(cdl):
-    """Writes the ColorCorrection to a space separated .cdl file"""
+def write_cdlb(cdl, skip_unchanged=None):
+    """Writes the ColorCollection to a binary .cdlb file
 
-    values = list(cdl.slope)
-    values.extend(cdl.offset)
-    values.extend(cdl.power)
-    values.append(cdl.sat)
-    values = [str(i) for i in values]
+    Everything the collection holds is written, and ``parse_cdlb()`` reads
+    it back exactly, faster than parsing XML. A single
+    :class:`ColorCorrection` is written as a collection holding it. See
+    ``CdlbReader`` to read single corrections without loading the rest.
+
+    If ``skip_unchanged`` is True, or if it's None and
+    ``config.SKIP_UNCHANGED`` is True, an existing file with the same contents
+    is left untouched, and other files are replaced atomically. Returns False
+    if the file was skipped, otherwise True.
+
+    """
+    if not isinstance(cdl, ColorCollection):
+        cdl = _temp_container(cdl)
 
-    ss_cdl = ' '.join(values)
+    return _write_file(
+        cdl.file_out,
+        lambda cdlb_f: _write_cdlb(cdl, cdlb_f),
+        skip_unchanged,
+        WRITE_BUFFER_SIZE
+    )
 
-    with open(cdl.file_out, 'wb') as cdl_f:
-        cdl_f.write(enc(ss_cdl))
+# ==============================================================================
+
+
+def write_csv(cdl, skip_unchanged=None, columns=None):
+    """Writes ColorCorrections to a csv file, one row each
+
+    **Args:**
+        cdl : (:class:`ColorCollection`|:class:`ColorCorrection`)
+            A collection writes a row for each :class:`ColorCorrection` it
+            holds, then for the correction each :class:`ColorDecision` holds
+            or references, as a ``ccc`` would. A correction is written as a
+            single row.
+
+        skip_unchanged=None : (bool)
+            Leave an existing file with the same contents untouched, and
+            replace other files atomically. Defaults to
+            ``config.SKIP_UNCHANGED`` .
+
+        columns=None : {str: str}
+            Maps fields to the header to write for their column. Defaults to
+            ``config.CSV_COLUMNS`` .
+
+    **Returns:**
+        (bool)
+            False if the file was unchanged and skipped, otherwise True.
+
+    **Raises:**
+        ValueError:
+            If a ``columns`` field is unknown, or two fields hold the same
+            values.
+
+    The first row is a header naming each column, and each correction is
+    written on its own row, streamed with the standard library ``csv``
+    module as Excel writes it, encoded as UTF-8. By default the columns are
+    the fields::
+
+        id, slope_r, slope_g, slope_b, offset_r, offset_g, offset_b,
+        power_r, power_g, power_b, sat, desc
+
+    Each column is headed by its field, unless ``columns`` gives it another
+    header, such as ``{'id': 'Shot', 'sat': 'Saturation'}`` . Mapping the
+    ``slope`` , ``offset`` or ``power`` field replaces its three rgb columns
+    with one of three space separated values, and mapping ``sop`` replaces
+    all nine with one in the ``(1.1 1.0 0.9)(0.0 0.0 0.0)(1.0 1.0 1.0)``
+    style of ALE files. ``parse_csv()`` reads files back with the same
+    ``columns`` .
+
+    Values are written as ``format_number()`` gives them. The cells of a
+    correction without a :class:`SopNode` or :class:`SatNode` are left empty,
+    and descriptions are written in one cell, a line each. Only these fields
+    are written: the ``desc`` , ``input_desc`` and ``viewing_desc`` of a
+    collection are lost, as are the ``input_desc`` and ``viewing_desc`` of
+    each correction and the descriptions of its nodes.
+
+    """
+    return _write_file(
+        cdl.file_out,
+        lambda csv_f: _write_csv(cdl, csv_f, columns),
+        skip_unchanged,
+        WRITE_BUFFER_SIZE
+    )
+
+# ==============================================================================
+
+
+def write_fanout(cdl, outputs, pretty=None, skip_unchanged=None, each=None):
+    """Writes a ColorCollection to several formats in one walk of its children
+
+    **Args:**
+        cdl : (:class:`ColorCollection`|:class:`ColorCorrection`)
+            The collection to write. A correction is written as a collection
+            holding only it.
+
+        outputs : {str: str}
+            Maps each format to write, any of ``FANOUT_FORMATS`` , to the
+            path of its file.
+
+        pretty=None : (bool)
+            Write indented XML, or compact XML if False. Defaults to
+            ``config.PRETTY_XML`` .
+
+        skip_unchanged=None : (bool)
+            Leave files which already hold the same bytes untouched, and
+            replace the others atomically. Defaults to
+            ``config.SKIP_UNCHANGED`` .
+
+        each=None : (callable)
+            Called with each :class:`ColorCorrection` the collection holds,
+            once each, as the walk reaches it, such as to write a file per
+            correction in the same pass. References aren't passed.
+
+    **Returns:**
+        {str: bool}
+            Maps each format to False if its file was unchanged and skipped,
+            otherwise True.
+
+    **Raises:**
+        ValueError:
+            If a format isn't one of ``FANOUT_FORMATS`` .
+
+    Writing a collection to several formats one after the other walks its
+    children, resolves its references and builds their text once per format.
+    Here every file is open at once and each child is taken in turn: the
+    correction a decision holds or references is found once, its XML is
+    built once for the ``ccc`` and ``cdl`` , and it's written to every file
+    before the walk moves on. Each file holds the same bytes the matching
+    ``OUTPUT_FORMATS`` function writes, with ``csv`` columns from
+    ``config.CSV_COLUMNS`` , and the collection's ``type`` isn't changed.
+
+    If anything raises, every file is discarded, leaving existing files as
+    they were when ``skip_unchanged`` is on.
+
+    """
+    for ext in outputs:
+        if ext not in FANOUT_FORMATS:
+            raise ValueError(
+                "The output format: {output} can't be written by "
+                "write_fanout()".format(output=ext)
+            )
+    if pretty is None:
+        pretty = config.PRETTY_XML
+    if skip_unchanged is None:
+        skip_unchanged = config.SKIP_UNCHANGED
+    if not isinstance(cdl, ColorCollection):
+        cdl = _temp_container(cdl)
+
+    pending = OrderedDict()
+    try:
+        for ext, path in outputs.items():
+            pending[ext] = _PendingFile(
+                path, skip_unchanged, WRITE_BUFFER_SIZE
+            )
+        _fan_out(
+            cdl,
+            dict((ext, pending[ext].file) for ext in pending),
+            pretty,
+            each
+        )
+    except BaseException:
+        for pending_file in pending.values():
+            pending_file.discard()
+        raise
+
+    written = {}
+    try:
+        for ext in list(pending):
+            written[ext] = pending.pop(ext).close()
+    except BaseException:
+        for pending_file in pending.values():
+            pending_file.discard()
+        raise
+    return written
+
+# ==============================================================================
+
+
+def write_jsonl(cdl, skip_unchanged=None, append=False):
+    """Writes corrections and decisions to a JSON Lines file
+
+    **Args:**
+        cdl : (:class:`ColorCollection`|:class:`ColorCorrection`)
+            A collection writes a line for each :class:`ColorCorrection` it
+            holds, then for each :class:`ColorDecision` . A correction is
+            written as a single line.
+
+        skip_unchanged=None : (bool)
+            Leave an existing file with the same contents untouched, and
+            replace other files atomically. Defaults to
+            ``config.SKIP_UNCHANGED`` .
+
+        append=False : (bool)
+            Add the lines to the end of ``file_out`` , creating it if needed,
+            rather than replacing it. ``skip_unchanged`` is ignored.
+
+    **Returns:**
+        (bool)
+            False if the file was unchanged and skipped, otherwise True.
+
+    **Raises:**
+        TypeError:
+            If given a :class:`ColorDecision` , which has no ``file_out`` to
+            write to. Write a collection holding it instead.
+
+    Each line is a JSON object, written and read one at a time, so neither
+    writing nor ``parse_jsonl()`` needs the whole file in memory. Values are
+    strings of exactly the digits held, or rounded by
+    ``config.NUMBER_PRECISION`` , so no precision is lost to floats. Fields
+    which are empty or None are left out. A :class:`ColorCorrection` line::
+
+        {"type": "ColorCorrection", "id": "sh010",
+         "slope": ["1.1", "1.0", "0.9"], "offset": ["0.0", "0.0", "0.0"],
+         "power": ["1.0", "1.0", "1.0"], "sop_desc": ["Sop description"],
+         "sat": "0.8", "sat_desc": ["Sat description"],
+         "desc": ["First description"], "input_desc": "LogC",
+         "viewing_desc": "Rec709"}
+
+    ``slope`` , ``offset`` and ``power`` are only written if the correction
+    has a :class:`SopNode` , and ``sat`` if it has a :class:`SatNode` . A
+    :class:`ColorDecision` line holds either the fields of its correction
+    under ``cc`` , or the id of a :class:`ColorCorrectionRef` as
+    ``cc_ref`` , and the ref of its :class:`MediaRef` if it has one::
+
+        {"type": "ColorDecision", "cc_ref": "sh010",
+         "media_ref": "/shots/sh010/sh010.####.dpx",
+         "desc": ["Decision description"], "input_desc": "LogC",
+         "viewing_desc": "Rec709"}
+
+    A collection with a ``desc`` , ``input_desc`` or ``viewing_desc`` first
+    writes them as a header line, which ``parse_jsonl()`` gives the
+    collection it returns::
+
+        {"type": "ColorCollection", "desc": ["Collection description"],
+         "input_desc": "LogC", "viewing_desc": "Rec709"}
+
+    Every line ends with a newline, so files can simply be concatenated.
+
+    """
+    if isinstance(cdl, ColorDecision):
+        raise TypeError(
+            'A ColorDecision has no file_out, write a ColorCollection '
+            'holding it instead.'
+        )
+    path = cdl.file_out
+    write = lambda jsonl_f: jsonl_f.writelines(_iter_jsonl_lines(cdl))
+
+    if not append:
+        return _write_file(path, write, skip_unchanged, WRITE_BUFFER_SIZE)
+
+    # Don't join our first line onto an unterminated last line
+    unterminated = os.path.isfile(path) and os.path.getsize(path) and \
+        not _ends_line(path)
+    with open(path, 'ab', WRITE_BUFFER_SIZE) as jsonl_f:
+        if unterminated:
+            jsonl_f.write(b'\n')
+        write(jsonl_f)
+    return True
+
+# ==============================================================================
+
+
+def write_rnh_cdl(cdl, skip_unchanged=None):
+    """Writes the ColorCorrection to a space separated .cdl file
+
+    If ``skip_unchanged`` is True, or if it's None and
+    ``config.SKIP_UNCHANGED`` is True, an existing file with the same contents
+    is left untouched, and other files are replaced atomically. Returns False
+    if the file was skipped, otherwise True.
+
+    """
+    return _write_file(cdl.file_out, _dump_rnh_cdl(cdl), skip_unchanged)
+
+# ==============================================================================
+
+
+def write_single_files(cdls, ext, directory=None, jobs=None, pretty=None,
+                       skip_unchanged=None):
+    """Writes each ColorCorrection to its own file using a pool of threads
+
+    **Args:**
+        cdls : [:class:`ColorCorrection`]
+            The corrections to write, one file each.
+
+        ext : (str)
+            The output format, one of the keys of ``OUTPUT_FORMATS`` .
+
+        directory=None : (str)
+            If given, ``determine_dest()`` names each file in this directory
+            before it's written. Otherwise ``file_out`` should already be set
+            on each correction.
+
+        jobs=None : (int)
+            How many files to write at once. Defaults to ``WRITE_JOBS`` .
+
+        pretty=None : (bool)
+            Write indented XML, or compact XML if False. Defaults to
+            ``config.PRETTY_XML`` .
+
+        skip_unchanged=None : (bool)
+            Leave files which already hold the same bytes untouched, and
+            replace the others atomically. Defaults to
+            ``config.SKIP_UNCHANGED`` .
+
+    **Returns:**
+        [:class:`ColorCorrection`], [(:class:`ColorCorrection`, Exception)]
+            The corrections whose files were unchanged and skipped, then the
+            corrections which couldn't be named, serialized or written and
+            why, both in the order given. Both are empty if every file was
+            written.
+
+    **Raises:**
+        ValueError:
+            If ``ext`` isn't a known output format or ``jobs`` is less than 1.
+
+    Files hold the same bytes the matching ``OUTPUT_FORMATS`` function
+    writes. Each correction is serialized on the calling thread, so nothing
+    the corrections share is touched by more than one thread, and only the
+    opening, writing and closing of files runs in the pool. At most twice
+    ``jobs`` serialized files wait to be written at any time, however many
+    corrections are given.
+
+    """
+    if ext not in _DUMP_FORMATS:
+        raise ValueError(
+            "The output format: {output} is not supported".format(output=ext)
+        )
+    if jobs is None:
+        jobs = WRITE_JOBS
+    if jobs < 1:
+        raise ValueError(
+            "jobs must be at least 1, not {jobs}".format(jobs=jobs)
+        )
+    if pretty is None:
+        pretty = config.PRETTY_XML
+    if skip_unchanged is None:
+        skip_unchanged = config.SKIP_UNCHANGED
+    dump = _DUMP_FORMATS[ext]
+
+    pending = Queue(jobs * 2)
+    results = []
+    workers = []
+    for _ in range(jobs):
+        worker = threading.Thread(
+            target=_write_worker, args=(pending, results, skip_unchanged)
+        )
+        worker.daemon = True
+        worker.start()
+        workers.append(worker)
+
+    try:
+        for index, cdl in enumerate(cdls):
+            try:
+                if directory is not None:
+                    cdl.determine_dest(ext, directory)
+                data = dump(cdl, pretty)
+            # Reported like a failure to write, so the other files still are
+            except Exception as err:  # pylint: disable=W0703
+                results.append((index, cdl, err))
+                continue
+            pending.put((index, cdl, cdl.file_out, data))
+    finally:
+        for _ in workers:
+            pending.put(None)
+        for worker in workers:
+            worker.join()
+
+    results.sort(key=lambda result: result[0])
+    skipped = [cdl for _, cdl, err in results if err is None]
+    failures = [(cdl, err) for _, cdl, err in results if err is not None]
+    return skipped, failures
 
 # ==============================================================================
 # GLOBALS
@@ -162,5 +2303,19 @@ OUTPUT_FORMATS = {
     'cc': write_cc,
     'ccc': write_ccc,
     'cdl': write_cdl,
+    'cdlb': write_cdlb,
+    'csv': write_csv,
+    'jsonl': write_jsonl,
     'rcdl': write_rnh_cdl,
 }
+
+# Functions returning the bytes each of the OUTPUT_FORMATS writes
+_DUMP_FORMATS = {
+    'cc': _dump_cc,
+    'ccc': _dump_ccc,
+    'cdl': _dump_cdl,
+    'cdlb': _dump_cdlb,
+    'csv': _dump_csv,
+    'jsonl': _dump_jsonl,
+    'rcdl': _dump_rnh_cdl,
+}
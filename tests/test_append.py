@@ -0,0 +1,415 @@
+#!/usr/bin/env python
+"""
+Tests appending to existing collection files with cdl_convert
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+# Standard Imports
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Grab our test's path and append the cdL_convert root directory
+
+# There has to be a better method than:
+# 1) Getting our current directory
+# 2) Splitting into list
+# 3) Splicing out the last 3 entries (filepath, test dir, tools dir)
+# 4) Joining
+# 5) Appending to our Python path.
+
+sys.path.append('/'.join(os.path.realpath(__file__).split('/')[:-2]))
+
+import cdl_convert
+
+#==============================================================================
+# TEST CLASSES
+#==============================================================================
+
+# append_collection ===========================================================
+
+
+class TestAppendCollection(unittest.TestCase):
+    """Tests children are spliced into existing ccc and cdl files"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'show.ccc')
+        self.expected = os.path.join(self.directory, 'expected.ccc')
+
+    #==========================================================================
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def build(self, ids):
+        """Returns a collection of corrections with the given ids"""
+        return cdl_convert.ColorCollection.from_arrays(
+            ids,
+            slope=[[1.0 + i * 0.1, 1.0, 0.9] for i in range(len(ids))],
+            sat=[0.5 + i * 0.1 for i in range(len(ids))],
+        )
+
+    #==========================================================================
+
+    def read(self, path=None):
+        """Returns the bytes of a file, the test file by default"""
+        with open(path or self.path, 'rb') as cdl_f:
+            return cdl_f.read()
+
+    #==========================================================================
+
+    def write(self, ids, path=None, writer=cdl_convert.write_ccc, **kwargs):
+        """Writes a collection of ids, then frees them"""
+        col = self.build(ids)
+        col._file_out = path or self.path
+        writer(col, **kwargs)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testCcc(self):
+        """Tests the file matches writing the whole collection at once"""
+        self.write(['sh010', 'sh020'])
+        self.write(['sh010', 'sh020', 'sh030', 'sh040'], self.expected)
+
+        col = self.build(['sh010', 'sh020', 'sh030', 'sh040'])
+        self.assertEqual(
+            2,
+            cdl_convert.append_collection(self.path, col.all_children[2:])
+        )
+
+        self.assertEqual(
+            self.read(self.expected),
+            self.read()
+        )
+        # No index, journal or temporary file is left beside the file
+        self.assertEqual(
+            ['expected.ccc', 'show.ccc'],
+            sorted(os.listdir(self.directory))
+        )
+
+    #==========================================================================
+
+    def testAtomic(self):
+        """Tests the file is replaced rather than changed under readers"""
+        self.write(['sh010'])
+        before = self.read()
+
+        with open(self.path, 'rb') as reader:
+            cdl_convert.append_collection(self.path, self.build(['sh020']))
+
+            self.assertEqual(
+                before,
+                reader.read()
+            )
+
+        self.assertTrue(
+            b'id="sh020"' in self.read()
+        )
+
+    #==========================================================================
+
+    def testCdl(self):
+        """Tests corrections are wrapped and references to the file kept"""
+        self.path = os.path.join(self.directory, 'show.cdl')
+        self.write(['sh010'], writer=cdl_convert.write_cdl)
+
+        cc = cdl_convert.ColorCorrection('sh020')
+        cc.sat = 0.5
+        ref = cdl_convert.ColorDecision(
+            cdl_convert.ColorCorrectionRef('sh010')
+        )
+        cdl_convert.append_collection(self.path, [cc, ref])
+        cdl_convert.reset_all()
+        col = cdl_convert.parse_cdl(self.path)
+
+        self.assertEqual(
+            ['sh010', 'sh020', 'sh010'],
+            [decision.cc.id for decision in col.color_decisions]
+        )
+        self.assertEqual(
+            [False, False, True],
+            [decision.is_ref for decision in col.color_decisions]
+        )
+
+    #==========================================================================
+
+    def testComments(self):
+        """Tests ids inside comments aren't taken as ids in the file"""
+        self.write(['sh010'])
+        data = self.read().replace(
+            b'</ColorCorrectionCollection>',
+            b'<!-- <ColorCorrection id="sh020"> -->\n'
+            b'</ColorCorrectionCollection>'
+        )
+        with open(self.path, 'wb') as cdl_f:
+            cdl_f.write(data)
+
+        for index in [False, True]:
+            self.assertEqual(
+                1,
+                cdl_convert.append_collection(
+                    self.path, self.build(['sh0{0}0'.format(2 + index)]),
+                    index=index
+                )
+            )
+            cdl_convert.reset_all()
+
+    #==========================================================================
+
+    def testCompact(self):
+        """Tests compact files stay compact"""
+        self.write(['sh010'], pretty=False)
+        self.write(['sh010', 'sh020'], self.expected, pretty=False)
+
+        col = self.build(['sh010', 'sh020'])
+        cdl_convert.append_collection(self.path, [col.color_corrections[1]])
+
+        self.assertEqual(
+            self.read(self.expected),
+            self.read()
+        )
+
+    #==========================================================================
+
+    def testDuplicates(self):
+        """Tests ids in the file or given twice leave the file untouched"""
+        self.write(['sh010', 'sh020'])
+        before = self.read()
+
+        sh020 = self.build(['sh010', 'sh020']).color_corrections[1]
+        sh030 = cdl_convert.ColorCorrection('sh030')
+        sh030.sat = 0.5
+        # A ccc gets the correction of a decision, so sh030 is written twice
+        for children, cc_id in [
+                ([sh030, sh020], 'sh020'),
+                ([sh030, cdl_convert.ColorDecision(sh030)], 'sh030')]:
+            try:
+                cdl_convert.append_collection(self.path, children)
+            except ValueError as err:
+                self.assertTrue(
+                    cc_id in str(err)
+                )
+            else:
+                self.fail('No ValueError raised for: {0}'.format(cc_id))
+
+        self.assertEqual(
+            before,
+            self.read()
+        )
+
+    #==========================================================================
+
+    def testEmptyRoot(self):
+        """Tests a collection with no children is opened"""
+        for pretty in [True, False]:
+            self.write([], pretty=pretty)
+            self.write(['sh010'], self.expected, pretty=pretty)
+
+            cdl_convert.append_collection(self.path, self.build(['sh010']))
+            cdl_convert.reset_all()
+
+            self.assertEqual(
+                self.read(self.expected),
+                self.read()
+            )
+
+    #==========================================================================
+
+    def testIndex(self):
+        """Tests the index is kept beside the file and follows its content"""
+        self.write(['sh010', 'sh020'])
+        cdl_convert.append_collection(
+            self.path, self.build(['sh030']), index=True
+        )
+
+        self.assertEqual(
+            ['.show.ccc.ids', 'show.ccc'],
+            sorted(os.listdir(self.directory))
+        )
+
+        # Same size and modification time, but a different id
+        stat = os.stat(self.path)
+        data = self.read().replace(b'"sh020"', b'"sh025"')
+        with open(self.path, 'wb') as cdl_f:
+            cdl_f.write(data)
+        os.utime(self.path, (stat.st_atime, stat.st_mtime))
+        cdl_convert.reset_all()
+
+        self.assertRaises(
+            ValueError,
+            cdl_convert.append_collection,
+            self.path,
+            cdl_convert.ColorCorrection('sh025'),
+            index=True
+        )
+        cdl_convert.reset_all()
+        self.assertEqual(
+            1,
+            cdl_convert.append_collection(
+                self.path, self.build(['sh020']), index=True
+            )
+        )
+
+    #==========================================================================
+
+    def testInPlace(self):
+        """Tests writing over the end of the file leaves no journal"""
+        self.write(['sh010'])
+        self.write(['sh010', 'sh020'], self.expected)
+        before = os.stat(self.path)
+
+        col = self.build(['sh010', 'sh020'])
+        cdl_convert.append_collection(
+            self.path, [col.color_corrections[1]], in_place=True
+        )
+
+        self.assertEqual(
+            self.read(self.expected),
+            self.read()
+        )
+        self.assertEqual(
+            before.st_ino,
+            os.stat(self.path).st_ino
+        )
+        self.assertEqual(
+            ['expected.ccc', 'show.ccc'],
+            sorted(os.listdir(self.directory))
+        )
+
+    #==========================================================================
+
+    def testNoIndex(self):
+        """Tests the file is scanned without keeping an index"""
+        self.write(['sh010'])
+
+        cdl_convert.append_collection(
+            self.path, cdl_convert.ColorCorrection('sh020'), index=False
+        )
+
+        self.assertEqual(
+            ['show.ccc'],
+            sorted(os.listdir(self.directory))
+        )
+        self.assertRaises(
+            ValueError,
+            cdl_convert.append_collection,
+            self.path,
+            cdl_convert.ColorCorrection('sh010'),
+            index=False
+        )
+
+    #==========================================================================
+
+    def testNotACollection(self):
+        """Tests files which don't end with a collection raise ValueError"""
+        cc = cdl_convert.ColorCorrection('sh010')
+        cc._file_out = self.path
+        cdl_convert.write_cc(cc)
+
+        self.assertRaises(
+            ValueError,
+            cdl_convert.append_collection,
+            self.path,
+            cdl_convert.ColorCorrection('sh020')
+        )
+
+    #==========================================================================
+
+    def testReferencesInCcc(self):
+        """Tests a ccc skips references to its own corrections"""
+        self.write(['sh010'])
+        self.write(['sh010', 'sh020'], self.expected)
+
+        sh020 = cdl_convert.ColorCorrection('sh020')
+        sh020.slope = [1.1, 1.0, 0.9]
+        sh020.sat = 0.6
+        decisions = [
+            cdl_convert.ColorDecision(cdl_convert.ColorCorrectionRef('sh010')),
+            cdl_convert.ColorDecision(cdl_convert.ColorCorrectionRef('sh020')),
+        ]
+
+        self.assertEqual(
+            1,
+            cdl_convert.append_collection(self.path, decisions)
+        )
+        self.assertEqual(
+            self.read(self.expected),
+            self.read()
+        )
+
+    #==========================================================================
+
+    def testRollback(self):
+        """Tests an interrupted append is undone by the next one"""
+        self.write(['sh010'])
+        self.write(['sh010', 'sh020'], self.expected)
+        before = self.read()
+        offset = before.rfind(b'</ColorCorrectionCollection>')
+
+        cdl_convert.write._write_journal(self.path, offset, before[offset:])
+        with open(self.path, 'r+b') as cdl_f:
+            cdl_f.seek(offset)
+            cdl_f.write(b'    <ColorCorrection id="half')
+            cdl_f.truncate()
+
+        col = self.build(['sh010', 'sh020'])
+        cdl_convert.append_collection(self.path, [col.color_corrections[1]])
+
+        self.assertEqual(
+            self.read(self.expected),
+            self.read()
+        )
+
+    #==========================================================================
+
+    def testStaleIndex(self):
+        """Tests the index is rebuilt when the file changed since"""
+        self.write(['sh010'])
+        cdl_convert.append_collection(
+            self.path, self.build(['sh020']), index=True
+        )
+        cdl_convert.reset_all()
+        self.write(['sh030', 'sh040', 'sh050'])
+
+        cdl_convert.append_collection(
+            self.path, self.build(['sh010']), index=True
+        )
+        cdl_convert.reset_all()
+
+        self.assertEqual(
+            ['sh030', 'sh040', 'sh050', 'sh010'],
+            [cc.id for cc in cdl_convert.parse_ccc(self.path).all_children]
+        )
+        cdl_convert.reset_all()
+        self.assertRaises(
+            ValueError,
+            cdl_convert.append_collection,
+            self.path,
+            cdl_convert.ColorCorrection('sh040'),
+            index=True
+        )
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    unittest.main()
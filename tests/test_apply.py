@@ -0,0 +1,377 @@
+#!/usr/bin/env python
+"""
+Tests applying corrections to image arrays with apply_cdl
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+# Standard Imports
+import os
+import sys
+import unittest
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Grab our test's path and append the cdL_convert root directory
+
+# There has to be a better method than:
+# 1) Getting our current directory
+# 2) Splitting into list
+# 3) Splicing out the last 3 entries (filepath, test dir, tools dir)
+# 4) Joining
+# 5) Appending to our Python path.
+
+sys.path.append('/'.join(os.path.realpath(__file__).split('/')[:-2]))
+
+import cdl_convert
+
+#==============================================================================
+# TEST CLASSES
+#==============================================================================
+
+# apply_cdl() =================================================================
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestApplyCdl(unittest.TestCase):
+    """Tests the vectorized apply matches the ASC CDL per pixel"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.cdl = cdl_convert.ColorCorrection('sh010')
+        self.cdl.slope = [1.2, 0.9, 1.05]
+        self.cdl.offset = [-0.02, 0.01, 0.03]
+        self.cdl.power = [0.9, 1.1, 1.25]
+        self.cdl.sat = 0.8
+
+        # Values from below 0 to above 1, so clamping is exercised
+        self.image = numpy.linspace(-0.25, 1.25, 7 * 5 * 3).reshape(7, 5, 3)
+        # 10 bit code values from black to white
+        self.codes = numpy.linspace(0, 1023, 8 * 5 * 3).astype(
+            numpy.uint16
+        ).reshape(8, 5, 3)
+
+    #==========================================================================
+
+    def tearDown(self):
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def reference(self, image, slope, offset, power, sat):
+        """Applies a correction one pixel at a time"""
+        def clamp(value):
+            """Clamps value between 0 and 1"""
+            return min(max(value, 0.0), 1.0)
+
+        out = numpy.empty(image.shape)
+        for index in numpy.ndindex(image.shape[:-1]):
+            rgb = [
+                clamp(image[index][i] * slope[i] + offset[i]) ** power[i]
+                for i in range(3)
+            ]
+            luma = 0.2126 * rgb[0] + 0.7152 * rgb[1] + 0.0722 * rgb[2]
+            out[index] = [clamp(luma + sat * (i - luma)) for i in rgb]
+        return out
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testBadBits(self):
+        """Tests bit depths without a usable lookup table raise"""
+        for bits in [0, 17]:
+            self.assertRaises(
+                ValueError,
+                cdl_convert.apply_cdl,
+                self.codes,
+                self.cdl,
+                bits=bits
+            )
+        self.assertRaises(
+            ValueError,
+            cdl_convert.apply_cdl,
+            self.codes.astype(numpy.uint32),
+            self.cdl
+        )
+        self.assertRaises(
+            ValueError,
+            cdl_convert.apply_cdl,
+            self.image,
+            self.cdl,
+            bits=10
+        )
+
+    #==========================================================================
+
+    def testBadImage(self):
+        """Tests images which aren't float or unsigned rgb pixels raise"""
+        self.assertRaises(
+            ValueError,
+            cdl_convert.apply_cdl,
+            numpy.zeros((4, 4)),
+            self.cdl
+        )
+        self.assertRaises(
+            TypeError,
+            cdl_convert.apply_cdl,
+            numpy.zeros((4, 4, 3), numpy.int16),
+            self.cdl
+        )
+
+    #==========================================================================
+
+    def testBadOut(self):
+        """Tests out arrays which can't hold the result raise"""
+        self.assertRaises(
+            ValueError,
+            cdl_convert.apply_cdl,
+            self.image,
+            self.cdl,
+            out=numpy.empty((5, 7, 3))
+        )
+        self.assertRaises(
+            ValueError,
+            cdl_convert.apply_cdl,
+            self.image,
+            self.cdl,
+            out=numpy.empty((5, 7, 3)).transpose(1, 0, 2)
+        )
+        self.assertRaises(
+            TypeError,
+            cdl_convert.apply_cdl,
+            self.image,
+            self.cdl,
+            out=numpy.empty((7, 5, 3), numpy.int32)
+        )
+
+    #==========================================================================
+
+    def testBlocks(self):
+        """Tests images larger than a block match the reference"""
+        with mock.patch('cdl_convert.apply._BLOCK_PIXELS', 4):
+            out = cdl_convert.apply_cdl(self.image, self.cdl)
+
+        numpy.testing.assert_allclose(
+            self.reference(
+                self.image, [1.2, 0.9, 1.05], [-0.02, 0.01, 0.03],
+                [0.9, 1.1, 1.25], 0.8
+            ),
+            out
+        )
+
+    #==========================================================================
+
+    def testCdlValue(self):
+        """Tests a correction's values can be given in place of it"""
+        numpy.testing.assert_array_equal(
+            cdl_convert.apply_cdl(self.image, self.cdl),
+            cdl_convert.apply_cdl(self.image, self.cdl.value)
+        )
+
+    #==========================================================================
+
+    def testDtype(self):
+        """Tests float32 images stay float32 and others become float64"""
+        self.assertEqual(
+            numpy.float32,
+            cdl_convert.apply_cdl(
+                self.image.astype(numpy.float32), self.cdl
+            ).dtype
+        )
+        self.assertEqual(
+            numpy.float32,
+            cdl_convert.apply_cdl(
+                self.image.astype(numpy.float16), self.cdl
+            ).dtype
+        )
+        self.assertEqual(
+            numpy.float64,
+            cdl_convert.apply_cdl(self.image, self.cdl).dtype
+        )
+
+    #==========================================================================
+
+    def testIdentity(self):
+        """Tests the identity only clamps the image"""
+        numpy.testing.assert_array_equal(
+            numpy.clip(self.image, 0.0, 1.0),
+            cdl_convert.apply_cdl(self.image)
+        )
+
+    #==========================================================================
+
+    def testInteger(self):
+        """Tests integer images match their code values as floats"""
+        for bits in [8, 10, 12, 16]:
+            codes = (
+                self.codes.astype(numpy.int64) * (2 ** bits - 1) // 1023
+            ).astype(numpy.uint16)
+            expected = cdl_convert.apply_cdl(
+                codes / (2.0 ** bits - 1), self.cdl
+            )
+
+            out = cdl_convert.apply_cdl(codes, self.cdl, bits=bits)
+
+            self.assertEqual(
+                numpy.float32,
+                out.dtype
+            )
+            numpy.testing.assert_allclose(
+                expected,
+                out,
+                rtol=1e-5,
+                atol=1e-6
+            )
+
+    #==========================================================================
+
+    def testIntegerBlocks(self):
+        """Tests integer images larger than a block match the float path"""
+        out = numpy.empty(self.codes.shape)
+
+        with mock.patch('cdl_convert.apply._BLOCK_PIXELS', 4):
+            cdl_convert.apply_cdl(self.codes, self.cdl, out=out, bits=10)
+
+        numpy.testing.assert_allclose(
+            cdl_convert.apply_cdl(self.codes / 1023.0, self.cdl),
+            out
+        )
+
+    #==========================================================================
+
+    def testIntegerBits(self):
+        """Tests integer depth defaults to the dtype's and is clamped to"""
+        codes = numpy.array([[0, 128, 255], [1000, 1023, 4095]], numpy.uint16)
+
+        numpy.testing.assert_allclose(
+            cdl_convert.apply_cdl(codes / 65535.0, self.cdl),
+            cdl_convert.apply_cdl(codes, self.cdl, out=numpy.empty((2, 3)))
+        )
+        numpy.testing.assert_allclose(
+            cdl_convert.apply_cdl(
+                numpy.minimum(codes, 1023) / 1023.0, self.cdl
+            ),
+            cdl_convert.apply_cdl(
+                codes, self.cdl, out=numpy.empty((2, 3)), bits=10
+            )
+        )
+        numpy.testing.assert_allclose(
+            cdl_convert.apply_cdl(codes[0] / 255.0, self.cdl),
+            cdl_convert.apply_cdl(
+                codes[0].astype(numpy.uint8), self.cdl,
+                out=numpy.empty(3)
+            )
+        )
+
+    #==========================================================================
+
+    def testInPlace(self):
+        """Tests the image can be corrected in place"""
+        expected = cdl_convert.apply_cdl(self.image, self.cdl)
+
+        out = cdl_convert.apply_cdl(self.image, self.cdl, out=self.image)
+
+        self.assertTrue(out is self.image)
+        numpy.testing.assert_array_equal(
+            expected,
+            self.image
+        )
+
+    #==========================================================================
+
+    def testNoVirginNodes(self):
+        """Tests applying a bare correction doesn't give it nodes"""
+        cdl = cdl_convert.ColorCorrection('bare')
+
+        cdl_convert.apply_cdl(self.image, cdl)
+
+        self.assertFalse(cdl.has_sop)
+        self.assertFalse(cdl.has_sat)
+
+    #==========================================================================
+
+    def testOut(self):
+        """Tests the result is written into and returned as out"""
+        out = numpy.empty(self.image.shape, numpy.float32)
+
+        result = cdl_convert.apply_cdl(self.image, self.cdl, out=out)
+
+        self.assertTrue(result is out)
+        numpy.testing.assert_allclose(
+            cdl_convert.apply_cdl(self.image, self.cdl),
+            out,
+            rtol=1e-6
+        )
+
+    #==========================================================================
+
+    def testOverrides(self):
+        """Tests values given replace those of the correction"""
+        out = cdl_convert.apply_cdl(
+            self.image, self.cdl, power=[1.0, 1.0, 1.0], sat=1.5
+        )
+
+        numpy.testing.assert_allclose(
+            self.reference(
+                self.image, [1.2, 0.9, 1.05], [-0.02, 0.01, 0.03],
+                [1.0, 1.0, 1.0], 1.5
+            ),
+            out
+        )
+        self.assertRaises(
+            ValueError,
+            cdl_convert.apply_cdl,
+            self.image,
+            self.cdl,
+            slope=[1.0, 1.0]
+        )
+
+    #==========================================================================
+
+    def testReference(self):
+        """Tests a correction matches applying it one pixel at a time"""
+        numpy.testing.assert_allclose(
+            self.reference(
+                self.image, [1.2, 0.9, 1.05], [-0.02, 0.01, 0.03],
+                [0.9, 1.1, 1.25], 0.8
+            ),
+            cdl_convert.apply_cdl(self.image, self.cdl)
+        )
+
+    #==========================================================================
+
+    def testShapes(self):
+        """Tests a single pixel and a flat list of pixels are corrected"""
+        pixels = self.image.reshape(-1, 3)
+        expected = cdl_convert.apply_cdl(pixels, self.cdl)
+
+        numpy.testing.assert_array_equal(
+            expected[4],
+            cdl_convert.apply_cdl(pixels[4], self.cdl)
+        )
+        numpy.testing.assert_array_equal(
+            expected.reshape(self.image.shape),
+            cdl_convert.apply_cdl(self.image, self.cdl)
+        )
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    unittest.main()
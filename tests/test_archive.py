@@ -0,0 +1,350 @@
+#!/usr/bin/env python
+"""
+Tests the archive related functions of cdl_convert
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+# Standard Imports
+from io import BytesIO
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+# Grab our test's path and append the cdL_convert root directory
+
+# There has to be a better method than:
+# 1) Getting our current directory
+# 2) Splitting into list
+# 3) Splicing out the last 3 entries (filepath, test dir, tools dir)
+# 4) Joining
+# 5) Appending to our Python path.
+
+sys.path.append('/'.join(os.path.realpath(__file__).split('/')[:-2]))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+if sys.version_info[0] >= 3:
+    enc = lambda x: bytes(x, 'UTF-8')
+else:
+    enc = lambda x: x
+
+#==============================================================================
+# TEST CLASSES
+#==============================================================================
+
+# ArchiveWriter ===============================================================
+
+
+class TestArchiveWriter(unittest.TestCase):
+    """Tests writing corrections as members of an archive"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.directory = tempfile.mkdtemp()
+        self.cdls = []
+        for i in range(3):
+            cdl = cdl_convert.ColorCorrection('sh{0:03d}'.format(i))
+            cdl.desc = 'Shot {0}'.format(i)
+            cdl.slope = (1.014, 1.0 + i / 100.0, 0.62)
+            cdl.sat = 1.09
+            self.cdls.append(cdl)
+
+    #==========================================================================
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def members(self, path):
+        """Returns the names and bytes of an archive's members, in order"""
+        if zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as archive:
+                return [
+                    (info.filename, archive.read(info))
+                    for info in archive.infolist()
+                ]
+        archive = tarfile.open(path)
+        try:
+            return [
+                (member.name, archive.extractfile(member).read())
+                for member in archive.getmembers()
+            ]
+        finally:
+            archive.close()
+
+    #==========================================================================
+
+    def write(self, path, archive_format=None, pretty=None):
+        """Writes every correction as a cc and the first as a rcdl"""
+        archive = cdl_convert.ArchiveWriter(path, archive_format, pretty)
+        with archive:
+            for cdl in self.cdls:
+                archive.write(cdl, 'cc')
+            archive.write(self.cdls[0], 'rcdl')
+        return archive
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def test_bad_format(self):
+        """Tests unknown archive formats raise ValueError"""
+        path = os.path.join(self.directory, 'grades.rar')
+        self.assertRaises(
+            ValueError,
+            cdl_convert.ArchiveWriter,
+            path
+        )
+        self.assertRaises(
+            ValueError,
+            cdl_convert.ArchiveWriter,
+            path, 'rar'
+        )
+        self.assertRaises(
+            ValueError,
+            cdl_convert.ArchiveWriter,
+            BytesIO()
+        )
+
+    #==========================================================================
+
+    def test_closed(self):
+        """Tests writing after the archive is finished raises ValueError"""
+        archive = self.write(os.path.join(self.directory, 'grades.zip'))
+
+        self.assertTrue(
+            archive.closed
+        )
+        self.assertRaises(
+            ValueError,
+            archive.write,
+            self.cdls[0], 'cc'
+        )
+
+    #==========================================================================
+
+    def test_compact(self):
+        """Tests pretty=False writes compact XML members"""
+        path = os.path.join(self.directory, 'grades.tar')
+        self.write(path, pretty=False)
+
+        self.assertEqual(
+            [cdl.xml_root_compact for cdl in self.cdls],
+            [data for name, data in self.members(path)[:3]]
+        )
+
+    #==========================================================================
+
+    def test_formats(self):
+        """Tests each format is chosen by extension and holds the members"""
+        expected = [
+            ('{0}.cc'.format(cdl.id), cdl.xml_root) for cdl in self.cdls
+        ]
+        expected.append(('sh000.rcdl', enc(
+            '1.014 1.0 0.62 0.0 0.0 0.0 1.0 1.0 1.0 1.09'
+        )))
+
+        for filename, archive_format in [
+                ('grades.tar', 'tar'),
+                ('grades.tgz', 'tgz'),
+                ('grades.tar.gz', 'tgz'),
+                ('grades.ZIP', 'zip')]:
+            path = os.path.join(self.directory, filename)
+            archive = self.write(path)
+
+            self.assertEqual(
+                archive_format,
+                archive.archive_format
+            )
+            self.assertEqual(
+                4,
+                archive.count
+            )
+            self.assertEqual(
+                expected,
+                self.members(path)
+            )
+
+        self.assertEqual(
+            'sh000.rcdl',
+            self.cdls[0].file_out
+        )
+
+    #==========================================================================
+
+    def test_streams(self):
+        """Tests writing to a stream, which is left open"""
+        for archive_format in ['tar', 'tgz', 'zip']:
+            stream = BytesIO()
+            self.write(stream, archive_format)
+
+            self.assertFalse(
+                stream.closed
+            )
+
+            path = os.path.join(self.directory, 'stream')
+            with open(path, 'wb') as archive_file:
+                archive_file.write(stream.getvalue())
+            self.assertEqual(
+                4,
+                len(self.members(path))
+            )
+
+# parse_archive ===============================================================
+
+
+class TestParseArchive(unittest.TestCase):
+    """Tests parsing the members of an archive"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.directory = tempfile.mkdtemp()
+        self.values = [
+            ('sh000', ['Shot 0'], (1.014, 1.0, 0.62), 1.09),
+            ('sh001', ['Shot 1'], (1.2, 1.1, 0.9), 0.8),
+        ]
+
+    #==========================================================================
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def build(self):
+        """Returns new corrections holding our values"""
+        cdls = []
+        for cc_id, desc, slope, sat in self.values:
+            cdl = cdl_convert.ColorCorrection(cc_id)
+            cdl.desc = desc
+            cdl.slope = slope
+            cdl.sat = sat
+            cdls.append(cdl)
+        return cdls
+
+    #==========================================================================
+
+    def parsed_values(self, cdls):
+        """Returns the id, desc, slope and sat of corrections as floats"""
+        return [
+            (
+                cdl.id,
+                cdl.desc,
+                tuple(float(value) for value in cdl.slope),
+                float(cdl.sat)
+            )
+            for cdl in cdls
+        ]
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def test_cc(self):
+        """Tests cc members of every archive format are parsed"""
+        for filename in ['grades.tar', 'grades.tgz', 'grades.zip']:
+            path = os.path.join(self.directory, filename)
+            with cdl_convert.ArchiveWriter(path) as archive:
+                for cdl in self.build():
+                    archive.write(cdl, 'cc')
+            cdl_convert.reset_all()
+
+            parsed = cdl_convert.parse_file(path)
+
+            self.assertEqual(
+                os.path.abspath(path),
+                parsed.file_in
+            )
+            self.assertEqual(
+                self.values,
+                self.parsed_values(parsed.color_corrections)
+            )
+            self.assertEqual(
+                os.path.join(os.path.abspath(path), 'sh000.cc'),
+                parsed.color_corrections[0].file_in
+            )
+            cdl_convert.reset_all()
+
+    #==========================================================================
+
+    def test_collections(self):
+        """Tests ccc and cdl members add their children, other files skip"""
+        col = cdl_convert.ColorCollection()
+        col.append_children(self.build())
+        col.desc = 'Not kept'
+        path = os.path.join(self.directory, 'grades.zip')
+        with zipfile.ZipFile(path, 'w') as archive:
+            archive.writestr('README.txt', 'Not a cdl')
+            col.set_to_ccc()
+            archive.writestr('grades.ccc', col.xml_root)
+            col.set_to_cdl()
+            archive.writestr('sub/grades.cdl', col.xml_root)
+        cdl_convert.reset_all()
+
+        parsed = cdl_convert.parse_archive(path)
+
+        self.assertEqual(
+            self.values,
+            self.parsed_values(parsed.color_corrections)
+        )
+        # The second copies are renamed, as usual for duplicate ids
+        self.assertEqual(
+            ['sh000001', 'sh001001'],
+            [decision.cc.id for decision in parsed.color_decisions]
+        )
+        self.assertEqual(
+            [],
+            parsed.desc
+        )
+
+    #==========================================================================
+
+    def test_rnh_cdl(self):
+        """Tests rcdl members take their id from the member name"""
+        path = os.path.join(self.directory, 'grades.tgz')
+        with cdl_convert.ArchiveWriter(path) as archive:
+            for cdl in self.build():
+                archive.write(cdl, 'rcdl')
+        cdl_convert.reset_all()
+
+        parsed = cdl_convert.parse_archive(path)
+
+        self.assertEqual(
+            [
+                (cc_id, [], slope, sat)
+                for cc_id, desc, slope, sat in self.values
+            ],
+            self.parsed_values(parsed.color_corrections)
+        )
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    unittest.main()
@@ -18,6 +18,7 @@ try:
 except ImportError:
     import mock
 import os
+import shutil
 import sys
 import tempfile
 import unittest
@@ -890,6 +891,331 @@ class TestWriteCCNoSat(TestWriteCCFull):
         self.target_xml_root = enc(CC_NO_SAT_WRITE)
         self.target_xml = enc('\n'.join(CC_NO_SAT_WRITE.split('\n')[1:]))
 
+# write_single_files ==========================================================
+
+
+class TestWriteSingleFiles(unittest.TestCase):
+    """Tests writing a file per correction with a pool of threads"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.directory = tempfile.mkdtemp()
+        self.cdls = []
+        for i in range(20):
+            cdl = cdl_convert.ColorCorrection('sh{0:03d}'.format(i))
+            cdl.desc = 'Shot {0}'.format(i)
+            cdl.slope = (1.014, 1.0 + i / 100.0, 0.62)
+            cdl.sat = 1.09
+            self.cdls.append(cdl)
+
+    #==========================================================================
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def read(self, path):
+        """Returns the bytes of a file"""
+        with open(path, 'rb') as cdl_f:
+            return cdl_f.read()
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def test_bad_ext(self):
+        """Tests an unknown output format raises ValueError"""
+        self.assertRaises(
+            ValueError,
+            cdl_convert.write_single_files,
+            self.cdls, 'ale', self.directory
+        )
+
+    #==========================================================================
+
+    def test_bad_jobs(self):
+        """Tests fewer than one job raises ValueError"""
+        self.assertRaises(
+            ValueError,
+            cdl_convert.write_single_files,
+            self.cdls, 'cc', self.directory, 0
+        )
+
+    #==========================================================================
+
+    def test_compact(self):
+        """Tests pretty=False writes compact XML"""
+        cdl_convert.write_single_files(
+            self.cdls, 'cc', self.directory, pretty=False
+        )
+        for cdl in self.cdls:
+            self.assertEqual(
+                cdl.xml_root_compact,
+                self.read(cdl.file_out)
+            )
+
+    #==========================================================================
+
+    def test_failures(self):
+        """Tests every file that can't be written is returned in order"""
+        missing = os.path.join(self.directory, 'missing')
+        for i, cdl in enumerate(self.cdls):
+            parent = missing if i % 3 else self.directory
+            cdl._file_out = os.path.join(parent, cdl.id + '.cc')
+
+        skipped, failures = cdl_convert.write_single_files(
+            self.cdls, 'cc', jobs=3
+        )
+
+        self.assertEqual(
+            [cdl for i, cdl in enumerate(self.cdls) if i % 3],
+            [cdl for cdl, err in failures]
+        )
+        for cdl, err in failures:
+            self.assertTrue(isinstance(err, EnvironmentError))
+        for cdl in self.cdls[::3]:
+            self.assertEqual(
+                cdl.xml_root,
+                self.read(cdl.file_out)
+            )
+
+    #==========================================================================
+
+    def test_failures_serializing(self):
+        """Tests a correction that can't be serialized is a failure"""
+        dump = cdl_convert.write._DUMP_FORMATS['cc']
+
+        def broken_dump(cdl, pretty):
+            """Fails for the second correction"""
+            if cdl is self.cdls[1]:
+                raise ValueError('Cannot serialize.')
+            return dump(cdl, pretty)
+
+        cdl_convert.write._DUMP_FORMATS['cc'] = broken_dump
+        try:
+            skipped, failures = cdl_convert.write_single_files(
+                self.cdls, 'cc', self.directory, jobs=2
+            )
+        finally:
+            cdl_convert.write._DUMP_FORMATS['cc'] = dump
+
+        self.assertEqual(
+            [self.cdls[1]],
+            [cdl for cdl, err in failures]
+        )
+        self.assertTrue(
+            isinstance(failures[0][1], ValueError)
+        )
+        for cdl in self.cdls[:1] + self.cdls[2:]:
+            self.assertEqual(
+                cdl.xml_root,
+                self.read(cdl.file_out)
+            )
+
+    #==========================================================================
+
+    def test_formats(self):
+        """Tests files match those written by OUTPUT_FORMATS"""
+        for ext in ['cc', 'ccc', 'cdl', 'rcdl']:
+            skipped, failures = cdl_convert.write_single_files(
+                self.cdls, ext, self.directory, jobs=4
+            )
+            self.assertEqual(
+                ([], []),
+                (skipped, failures)
+            )
+            for cdl in self.cdls:
+                self.assertEqual(
+                    os.path.join(
+                        self.directory, '{0}.{1}'.format(cdl.id, ext)
+                    ),
+                    cdl.file_out
+                )
+                written = self.read(cdl.file_out)
+                cdl_convert.write.OUTPUT_FORMATS[ext](cdl)
+                self.assertEqual(
+                    self.read(cdl.file_out),
+                    written
+                )
+
+    #==========================================================================
+
+    def test_parentage(self):
+        """Tests collection formats leave the parents of corrections alone"""
+        col = cdl_convert.ColorCollection()
+        col.append_children(self.cdls)
+
+        cdl_convert.write_single_files(self.cdls, 'ccc', self.directory)
+
+        for cdl in self.cdls:
+            self.assertEqual(
+                col,
+                cdl.parent
+            )
+
+# skip_unchanged ==============================================================
+
+
+class TestWriteSkipUnchanged(unittest.TestCase):
+    """Tests skipping unchanged files and replacing changed ones atomically"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.directory = tempfile.mkdtemp()
+        self.cdl = cdl_convert.ColorCorrection('sh010')
+        self.cdl.slope = (1.014, 1.0, 0.62)
+        self.cdl.sat = 1.09
+        self.cdl._file_out = os.path.join(self.directory, 'sh010.cc')
+
+    #==========================================================================
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        cdl_convert.config.SKIP_UNCHANGED = False
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def read(self, path):
+        """Returns the bytes of a file"""
+        with open(path, 'rb') as cdl_f:
+            return cdl_f.read()
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def test_changed(self):
+        """Tests changed files are replaced, keeping their permissions"""
+        cdl_convert.write_cc(self.cdl)
+        os.chmod(self.cdl.file_out, 0o640)
+        self.cdl.sat = 0.5
+
+        self.assertTrue(
+            cdl_convert.write_cc(self.cdl, skip_unchanged=True)
+        )
+        self.assertEqual(
+            self.cdl.xml_root,
+            self.read(self.cdl.file_out)
+        )
+        self.assertEqual(
+            0o640,
+            os.stat(self.cdl.file_out).st_mode & 0o777
+        )
+        self.assertEqual(
+            ['sh010.cc'],
+            os.listdir(self.directory)
+        )
+
+    #==========================================================================
+
+    def test_config(self):
+        """Tests config.SKIP_UNCHANGED is the default for every format"""
+        cdl_convert.config.SKIP_UNCHANGED = True
+        for ext in ['cc', 'ccc', 'cdl', 'rcdl']:
+            self.cdl.determine_dest(ext, self.directory)
+            write = cdl_convert.write.OUTPUT_FORMATS[ext]
+
+            self.assertTrue(
+                write(self.cdl)
+            )
+            self.assertFalse(
+                write(self.cdl)
+            )
+            self.assertTrue(
+                write(self.cdl, skip_unchanged=False)
+            )
+
+    #==========================================================================
+
+    def test_failure(self):
+        """Tests a failed write leaves the old file and no temporary file"""
+        cdl_convert.write_cc(self.cdl)
+        original = self.read(self.cdl.file_out)
+        self.cdl.sat = 0.5
+
+        with mock.patch.object(
+                cdl_convert.write, '_dump_cc', side_effect=lambda *args: None
+        ):
+            self.assertRaises(
+                TypeError,
+                cdl_convert.write_cc,
+                self.cdl, skip_unchanged=True
+            )
+
+        self.assertEqual(
+            original,
+            self.read(self.cdl.file_out)
+        )
+        self.assertEqual(
+            ['sh010.cc'],
+            os.listdir(self.directory)
+        )
+
+    #==========================================================================
+
+    def test_unchanged(self):
+        """Tests identical files are left untouched"""
+        self.assertTrue(
+            cdl_convert.write_cc(self.cdl, skip_unchanged=True)
+        )
+        os.utime(self.cdl.file_out, (1000000000, 1000000000))
+        inode = os.stat(self.cdl.file_out).st_ino
+
+        self.assertFalse(
+            cdl_convert.write_cc(self.cdl, skip_unchanged=True)
+        )
+        self.assertEqual(
+            (1000000000, inode),
+            (
+                int(os.stat(self.cdl.file_out).st_mtime),
+                os.stat(self.cdl.file_out).st_ino
+            )
+        )
+        self.assertEqual(
+            ['sh010.cc'],
+            os.listdir(self.directory)
+        )
+
+    #==========================================================================
+
+    def test_write_single_files(self):
+        """Tests write_single_files returns the skipped corrections in order"""
+        cdls = [self.cdl]
+        for i in range(5):
+            cdls.append(cdl_convert.ColorCorrection('sh{0:03d}'.format(i)))
+        cdl_convert.write_single_files(cdls, 'cc', self.directory)
+        for cdl in cdls[::2]:
+            cdl.sat = 0.5
+
+        skipped, failures = cdl_convert.write_single_files(
+            cdls, 'cc', self.directory, jobs=3, skip_unchanged=True
+        )
+
+        self.assertEqual(
+            (cdls[1::2], []),
+            (skipped, failures)
+        )
+        for cdl in cdls:
+            self.assertEqual(
+                cdl.xml_root,
+                self.read(cdl.file_out)
+            )
+
 #==============================================================================
 # FUNCTIONS
 #==============================================================================
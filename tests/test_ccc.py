@@ -17,6 +17,7 @@ try:
     from unittest import mock
 except ImportError:
     import mock
+from io import BytesIO
 import os
 import sys
 import tempfile
@@ -35,6 +36,7 @@ from xml.etree import ElementTree
 sys.path.append('/'.join(os.path.realpath(__file__).split('/')[:-2]))
 
 import cdl_convert
+from cdl_convert.write import WRITE_BUFFER_SIZE
 
 #==============================================================================
 # GLOBALS
@@ -783,6 +785,48 @@ class TestWriteCCCFull(unittest.TestCase):
 
     #==========================================================================
 
+    def test_write_compact(self):
+        """Tests config.PRETTY_XML False writes compact XML"""
+        mockOpen = mock.mock_open()
+
+        self.ccc._file_out = 'bobs_big_file.ccc'
+        cdl_convert.config.PRETTY_XML = False
+
+        try:
+            with mock.patch(builtins + '.open', mockOpen, create=True):
+                cdl_convert.write_ccc(self.ccc)
+        finally:
+            cdl_convert.config.PRETTY_XML = True
+
+        collection_type = self.ccc.type
+        self.ccc.set_to_ccc()
+
+        self.assertEqual(
+            self.ccc.xml_root_compact,
+            b''.join(call[0][0] for call in mockOpen().write.call_args_list)
+        )
+
+        self.ccc.type = collection_type
+
+    #==========================================================================
+
+    def test_write_xml_root(self):
+        """Tests streaming writes without building the collection element"""
+        stream = BytesIO()
+
+        with mock.patch.object(
+                cdl_convert.ColorCollection, 'build_element'
+        ) as build_element:
+            self.ccc.write_xml_root(stream)
+
+        self.assertFalse(build_element.called)
+        self.assertEqual(
+            self.target_xml_root,
+            stream.getvalue()
+        )
+
+    #==========================================================================
+
     def test_write(self):
         """Tests writing the ccc itself"""
         mockOpen = mock.mock_open()
@@ -792,9 +836,14 @@ class TestWriteCCCFull(unittest.TestCase):
         with mock.patch(builtins + '.open', mockOpen, create=True):
             cdl_convert.write_ccc(self.ccc)
 
-        mockOpen.assert_called_once_with('bobs_big_file.ccc', 'wb')
+        mockOpen.assert_called_once_with(
+            'bobs_big_file.ccc', 'wb', WRITE_BUFFER_SIZE
+        )
 
-        mockOpen().write.assert_called_once_with(self.target_xml_root)
+        self.assertEqual(
+            self.target_xml_root,
+            b''.join(call[0][0] for call in mockOpen().write.call_args_list)
+        )
 
 
 class TestWriteCCCFullAsCDL(TestWriteCCCFull):
@@ -840,9 +889,14 @@ class TestWriteCCCFullAsCDL(TestWriteCCCFull):
         with mock.patch(builtins + '.open', mockOpen, create=True):
             cdl_convert.write_cdl(self.ccc)
 
-        mockOpen.assert_called_once_with('bobs_big_file.cdl', 'wb')
+        mockOpen.assert_called_once_with(
+            'bobs_big_file.cdl', 'wb', WRITE_BUFFER_SIZE
+        )
 
-        mockOpen().write.assert_called_once_with(self.target_xml_root)
+        self.assertEqual(
+            self.target_xml_root,
+            b''.join(call[0][0] for call in mockOpen().write.call_args_list)
+        )
 
 
 class TestWriteCCCOdd(TestWriteCCCFull):
@@ -893,6 +947,219 @@ class TestWriteCCCOddAsCDL(TestWriteCCCFullAsCDL):
         self.target_xml_root = enc(CCC_ODD_WRITE_CDL)
         self.target_xml = enc('\n'.join(CCC_ODD_WRITE_CDL.split('\n')[1:]))
 
+class TestCCCWriter(unittest.TestCase):
+    """Tests writing a CCC's corrections one at a time with the writers
+
+    This is an integration style test. If parse_ccc stops working, this stops
+    working.
+
+    """
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        # Build our ccc
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+            f.write(enc(CCC_FULL))
+            self.filename = f.name
+
+        self.ccc = cdl_convert.parse_ccc(self.filename)
+        self.out_file = self.filename + '.out'
+
+    #==========================================================================
+
+    def tearDown(self):
+        os.remove(self.filename)
+        if os.path.exists(self.out_file):
+            os.remove(self.out_file)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def write(self, writer):
+        """Writes all of our corrections with writer, then closes it"""
+        with writer:
+            for correction in self.ccc.color_corrections:
+                writer.write(correction)
+
+    #==========================================================================
+
+    def writer(self, writer_class, path, pretty=None):
+        """Returns a writer with our ccc's descriptions"""
+        return writer_class(
+            path,
+            desc=self.ccc.desc,
+            input_desc=self.ccc.input_desc,
+            viewing_desc=self.ccc.viewing_desc,
+            pretty=pretty,
+        )
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def test_ccc(self):
+        """Tests CCCWriter writes the same file as write_ccc"""
+        self.write(self.writer(cdl_convert.CCCWriter, self.out_file))
+
+        with open(self.out_file, 'rb') as f:
+            self.assertEqual(
+                enc(CCC_FULL_WRITE),
+                f.read()
+            )
+
+    #==========================================================================
+
+    def test_cdl(self):
+        """Tests CDLWriter writes the same file as write_cdl"""
+        parents = [cc.parent for cc in self.ccc.color_corrections]
+
+        self.write(self.writer(cdl_convert.CDLWriter, self.out_file))
+
+        with open(self.out_file, 'rb') as f:
+            self.assertEqual(
+                enc(CCC_FULL_WRITE_CDL),
+                f.read()
+            )
+        self.assertEqual(
+            parents,
+            [cc.parent for cc in self.ccc.color_corrections]
+        )
+
+    #==========================================================================
+
+    def test_closed(self):
+        """Tests writing after close raises, and closing twice is harmless"""
+        stream = BytesIO()
+        writer = cdl_convert.CCCWriter(stream)
+        writer.write(self.ccc.color_corrections[0])
+
+        self.assertFalse(writer.closed)
+        self.assertEqual(
+            1,
+            writer.count
+        )
+
+        writer.close()
+        writer.close()
+
+        self.assertTrue(writer.closed)
+        self.assertTrue(
+            stream.getvalue().endswith(enc('</ColorCorrectionCollection>\n'))
+        )
+        # Streams we're handed are left open
+        self.assertFalse(stream.closed)
+
+        self.assertRaises(
+            ValueError,
+            writer.write,
+            self.ccc.color_corrections[0]
+        )
+
+    #==========================================================================
+
+    def test_compact(self):
+        """Tests compact writers match a collection's compact XML"""
+        for writer_class, collection_type in (
+                (cdl_convert.CCCWriter, 'ccc'), (cdl_convert.CDLWriter, 'cdl')
+        ):
+            stream = BytesIO()
+            writer = self.writer(writer_class, stream, pretty=False)
+            self.write(writer)
+            self.ccc.type = collection_type
+
+            self.assertFalse(writer.pretty)
+            self.assertEqual(
+                self.ccc.xml_root_compact,
+                stream.getvalue()
+            )
+
+    #==========================================================================
+
+    def test_empty(self):
+        """Tests an empty writer matches an empty collection"""
+        stream = BytesIO()
+        cdl_convert.CCCWriter(stream).close()
+
+        self.assertEqual(
+            cdl_convert.ColorCollection().xml_root,
+            stream.getvalue()
+        )
+
+    #==========================================================================
+
+    def test_exception(self):
+        """Tests the root is left open if the with block raises"""
+        def interrupted():
+            with cdl_convert.CCCWriter(self.out_file) as writer:
+                writer.write(self.ccc.color_corrections[0])
+                raise RuntimeError('cursor died')
+
+        self.assertRaises(
+            RuntimeError,
+            interrupted
+        )
+
+        with open(self.out_file, 'rb') as f:
+            text = f.read()
+
+        self.assertTrue(
+            text.endswith(enc('</ColorCorrection>\n'))
+        )
+        self.assertFalse(
+            enc('</ColorCorrectionCollection>') in text
+        )
+
+    #==========================================================================
+
+    def test_fragments(self):
+        """Tests fragments already built are written as given"""
+        for pretty in [True, False]:
+            stream = BytesIO()
+            with self.writer(cdl_convert.CCCWriter, stream, pretty) as writer:
+                for correction in self.ccc.color_corrections:
+                    writer.write_fragment(correction.xml_fragment(1, pretty))
+
+            self.assertEqual(
+                len(self.ccc.color_corrections),
+                writer.count
+            )
+            self.assertEqual(
+                self.ccc.xml_root if pretty else self.ccc.xml_root_compact,
+                stream.getvalue()
+            )
+
+    #==========================================================================
+
+    def test_no_collection(self):
+        """Tests the writers don't create a ColorCollection"""
+        members = len(cdl_convert.ColorCollection.members)
+
+        self.write(self.writer(cdl_convert.CCCWriter, BytesIO()))
+        self.write(self.writer(cdl_convert.CDLWriter, BytesIO()))
+
+        self.assertEqual(
+            members,
+            len(cdl_convert.ColorCollection.members)
+        )
+
+    #==========================================================================
+
+    def test_streams(self):
+        """Tests each correction is written before the next is given"""
+        stream = BytesIO()
+        with cdl_convert.CCCWriter(stream) as writer:
+            for correction in self.ccc.color_corrections:
+                writer.write(correction)
+                self.assertTrue(
+                    stream.getvalue().endswith(
+                        enc('</ColorCorrection>\n')
+                    )
+                )
+
 #==============================================================================
 # RUNNER
 #==============================================================================
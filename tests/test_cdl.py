@@ -16,6 +16,7 @@ try:
     from unittest import mock
 except ImportError:
     import mock
+from io import BytesIO
 import os
 import sys
 import tempfile
@@ -34,6 +35,7 @@ from xml.etree import ElementTree
 sys.path.append('/'.join(os.path.realpath(__file__).split('/')[:-2]))
 
 import cdl_convert
+from cdl_convert.write import WRITE_BUFFER_SIZE
 
 #==============================================================================
 # GLOBALS
@@ -1063,6 +1065,23 @@ class TestWriteCDLFull(unittest.TestCase):
 
     #==========================================================================
 
+    def test_write_xml_root(self):
+        """Tests streaming writes without building the collection element"""
+        stream = BytesIO()
+
+        with mock.patch.object(
+                cdl_convert.ColorCollection, 'build_element'
+        ) as build_element:
+            self.cdl.write_xml_root(stream)
+
+        self.assertFalse(build_element.called)
+        self.assertEqual(
+            self.target_xml_root,
+            stream.getvalue()
+        )
+
+    #==========================================================================
+
     def test_write(self):
         """Tests writing the cdl itself"""
         mockOpen = mock.mock_open()
@@ -1072,9 +1091,14 @@ class TestWriteCDLFull(unittest.TestCase):
         with mock.patch(builtins + '.open', mockOpen, create=True):
             cdl_convert.write_cdl(self.cdl)
 
-        mockOpen.assert_called_once_with('bobs_big_file.cdl', 'wb')
+        mockOpen.assert_called_once_with(
+            'bobs_big_file.cdl', 'wb', WRITE_BUFFER_SIZE
+        )
 
-        mockOpen().write.assert_called_once_with(self.target_xml_root)
+        self.assertEqual(
+            self.target_xml_root,
+            b''.join(call[0][0] for call in mockOpen().write.call_args_list)
+        )
 
 
 class TestWriteCDLFullAsCCC(TestWriteCDLFull):
@@ -1122,9 +1146,14 @@ class TestWriteCDLFullAsCCC(TestWriteCDLFull):
         with mock.patch(builtins + '.open', mockOpen, create=True):
             cdl_convert.write_ccc(self.cdl)
 
-        mockOpen.assert_called_once_with('bobs_big_file.cdl', 'wb')
+        mockOpen.assert_called_once_with(
+            'bobs_big_file.cdl', 'wb', WRITE_BUFFER_SIZE
+        )
 
-        mockOpen().write.assert_called_once_with(self.target_xml_root)
+        self.assertEqual(
+            self.target_xml_root,
+            b''.join(call[0][0] for call in mockOpen().write.call_args_list)
+        )
 
 
 class TestWriteCDLOddAsCCC(TestWriteCDLFullAsCCC):
@@ -1220,12 +1249,97 @@ class TestWriteCDLOddReferenceFix(TestWriteCDLFull):
         with mock.patch(builtins + '.open', mockOpen, create=True):
             cdl_convert.write_cdl(self.cdl)
 
-        mockOpen.assert_called_once_with('bobs_big_file.cdl', 'wb')
+        mockOpen.assert_called_once_with(
+            'bobs_big_file.cdl', 'wb', WRITE_BUFFER_SIZE
+        )
 
-        mockOpen().write.assert_called_once_with(self.target_xml_root)
+        self.assertEqual(
+            self.target_xml_root,
+            b''.join(call[0][0] for call in mockOpen().write.call_args_list)
+        )
 
         cdl_convert.config.HALT_ON_ERROR = False
 
+class TestCDLWriter(unittest.TestCase):
+    """Tests writing a CDL's decisions one at a time with CDLWriter
+
+    This is an integration style test. If parse_cdl stops working, this stops
+    working.
+
+    """
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+
+        self.filenames = []
+        for xml in (CDL_FULL, CDL_ODD):
+            with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+                f.write(enc(xml))
+                self.filenames.append(f.name)
+
+    #==========================================================================
+
+    def tearDown(self):
+        for filename in self.filenames:
+            os.remove(filename)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def write(self, writer_class, filename):
+        """Parses a cdl and writes its decisions with the writer class"""
+        cdl = cdl_convert.parse_cdl(filename)
+        stream = BytesIO()
+        with writer_class(stream, cdl.desc, cdl.input_desc,
+                          cdl.viewing_desc) as writer:
+            for decision in cdl.color_decisions:
+                writer.write_decision(decision)
+
+        return stream.getvalue()
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def test_ccc(self):
+        """Tests writing decisions with CCCWriter matches write_ccc"""
+        self.assertEqual(
+            enc(CDL_FULL_WRITE_CCC),
+            self.write(cdl_convert.CCCWriter, self.filenames[0])
+        )
+
+    #==========================================================================
+
+    def test_ccc_odd(self):
+        """Tests CCCWriter skips unresolved references like write_ccc"""
+        self.assertEqual(
+            enc(CDL_ODD_WRITE_CCC),
+            self.write(cdl_convert.CCCWriter, self.filenames[1])
+        )
+
+    #==========================================================================
+
+    def test_cdl(self):
+        """Tests writing decisions with CDLWriter matches write_cdl"""
+        self.assertEqual(
+            enc(CDL_FULL_WRITE),
+            self.write(cdl_convert.CDLWriter, self.filenames[0])
+        )
+
+    #==========================================================================
+
+    def test_cdl_odd(self):
+        """Tests CDLWriter keeps unresolved references like write_cdl"""
+        self.assertEqual(
+            enc(CDL_ODD_WRITE),
+            self.write(cdl_convert.CDLWriter, self.filenames[1])
+        )
+
 #==============================================================================
 # RUNNER
 #==============================================================================
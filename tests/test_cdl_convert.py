@@ -28,6 +28,12 @@ except ImportError:
 import sys
 import unittest
 
+# Optional Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Grab our test's path and append the cdL_convert root directory
 
 # There has to be a better method than:
@@ -42,7 +48,8 @@ sys.path.append('/'.join(os.path.realpath(__file__).split('/')[:-2]))
 import cdl_convert
 from cdl_convert import cdl_convert as main
 from cdl_convert import parse, utils, write
-from cdl_convert.correction import _de_exponent, _sanitize
+from cdl_convert.correction import _sanitize
+from cdl_convert.utils import _de_exponent
 
 #==============================================================================
 # TEST CLASSES
@@ -124,6 +131,131 @@ class TestDeExponent(unittest.TestCase):
             _de_exponent(value)
         )
 
+# format_number() =============================================================
+
+
+class TestFormatNumber(unittest.TestCase):
+    """Tests formatting values exactly or to a fixed precision"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def tearDown(self):
+        cdl_convert.config.NUMBER_PRECISION = None
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testCached(self):
+        """Tests rounded text is cached per value and precision"""
+        value = Decimal('0.123456789')
+
+        self.assertEqual(
+            '0.1235',
+            cdl_convert.format_number(value, 4)
+        )
+        self.assertEqual(
+            '0.1235',
+            cdl_convert.utils._FORMATTED[('0.123456789', 4)]
+        )
+
+        # An equal value is looked up rather than rounded again
+        cdl_convert.utils._FORMATTED[('0.123456789', 4)] = 'cached'
+        try:
+            self.assertEqual(
+                'cached',
+                cdl_convert.format_number(Decimal('0.123456789'), 4)
+            )
+        finally:
+            cdl_convert.utils._FORMATTED.clear()
+
+    #==========================================================================
+
+    def testConfig(self):
+        """Tests precision defaults to config.NUMBER_PRECISION"""
+        cdl_convert.config.NUMBER_PRECISION = 2
+
+        self.assertEqual(
+            '1.02',
+            cdl_convert.format_number(Decimal('1.015'))
+        )
+        self.assertEqual(
+            '1.015',
+            cdl_convert.format_number(Decimal('1.015'), 3)
+        )
+
+    #==========================================================================
+
+    def testExact(self):
+        """Tests values are written with their own digits by default"""
+        for value, text in [
+                (Decimal('1.0'), '1.0'),
+                (Decimal('1.00'), '1.00'),
+                (Decimal('-0.002'), '-0.002'),
+                (Decimal('1.13E-17'), '0.0000000000000000113'),
+                (Decimal('7.62837283133E+28'),
+                 '76283728313300000000000000000.0'),
+                (0.0000998, '0.0000998')]:
+            self.assertEqual(
+                text,
+                cdl_convert.format_number(value)
+            )
+
+    #==========================================================================
+
+    def testExactOverridesPrecision(self):
+        """Tests exact keeps the digits given whatever the precision"""
+        cdl_convert.config.NUMBER_PRECISION = 2
+
+        self.assertEqual(
+            '0.0000000000000000113',
+            cdl_convert.format_number(Decimal('1.13E-17'), exact=True)
+        )
+        self.assertEqual(
+            '0.123456',
+            cdl_convert.format_number(Decimal('0.123456'), 4, exact=True)
+        )
+        self.assertEqual(
+            '0.12',
+            cdl_convert.format_number(Decimal('0.123456'))
+        )
+    #==========================================================================
+
+    def testPrecision(self):
+        """Tests values are rounded half to even to fixed decimal places"""
+        for value, text in [
+                (Decimal('1.0'), '1.000000'),
+                (Decimal('0.1234565'), '0.123456'),
+                (Decimal('0.1234575'), '0.123458'),
+                (Decimal('-0.0000001'), '0.000000'),
+                (Decimal('1.13E-17'), '0.000000'),
+                (1.5, '1.500000'),
+                ('0.9', '0.900000'),
+                (2, '2.000000')]:
+            self.assertEqual(
+                text,
+                cdl_convert.format_number(value, 6)
+            )
+        self.assertEqual(
+            '0.00000000',
+            cdl_convert.format_number(Decimal('0.0'), 8)
+        )
+        self.assertEqual(
+            '2',
+            cdl_convert.format_number(Decimal('1.5'), 0)
+        )
+
+    #==========================================================================
+
+    def testTooLarge(self):
+        """Tests values too large to round are written exactly"""
+        self.assertEqual(
+            '76283728313300000000000000000.0',
+            cdl_convert.format_number(Decimal('7.62837283133E+28'), 6)
+        )
+
 # _sanitize() =================================================================
 
 
@@ -461,6 +593,164 @@ class TestParseArgs(unittest.TestCase):
 
     #==========================================================================
 
+    def testCompact(self):
+        """Tests that providing the --compact flag turns off PRETTY_XML"""
+        self.assertTrue(
+            cdl_convert.config.PRETTY_XML
+        )
+
+        sys.argv = ['scriptname', 'inputFile', '--compact']
+
+        main.parse_args()
+
+        self.assertFalse(
+            cdl_convert.config.PRETTY_XML
+        )
+
+        cdl_convert.config.PRETTY_XML = True
+
+    #==========================================================================
+
+    def testSkipUnchanged(self):
+        """Tests that --skip-unchanged turns on SKIP_UNCHANGED"""
+        self.assertFalse(
+            cdl_convert.config.SKIP_UNCHANGED
+        )
+
+        sys.argv = ['scriptname', 'inputFile', '--skip-unchanged']
+
+        main.parse_args()
+
+        self.assertTrue(
+            cdl_convert.config.SKIP_UNCHANGED
+        )
+
+        cdl_convert.config.SKIP_UNCHANGED = False
+
+    #==========================================================================
+
+    def testJobs(self):
+        """Tests that --jobs is read as an int, defaulting to 1"""
+        sys.argv = ['scriptname', 'inputFile']
+
+        args = main.parse_args()
+
+        self.assertEqual(
+            1,
+            args.jobs
+        )
+
+        sys.argv = ['scriptname', 'inputFile', '--jobs', '8']
+
+        args = main.parse_args()
+
+        self.assertEqual(
+            8,
+            args.jobs
+        )
+
+    #==========================================================================
+
+    def testArchive(self):
+        """Tests that --archive accepts only archive formats"""
+        sys.argv = ['scriptname', 'inputFile', '--archive', 'tgz']
+
+        args = main.parse_args()
+
+        self.assertEqual(
+            'tgz',
+            args.archive
+        )
+
+        sys.argv = ['scriptname', 'inputFile', '--archive', 'rar']
+        sys.stderr, stderr = StringIO(), sys.stderr
+        try:
+            self.assertRaises(
+                SystemExit,
+                main.parse_args
+            )
+        finally:
+            sys.stderr = stderr
+
+    #==========================================================================
+
+    def testBadJobs(self):
+        """Tests that fewer than 1 job raises ValueError"""
+        sys.argv = ['scriptname', 'inputFile', '-j', '0']
+
+        self.assertRaises(
+            ValueError,
+            main.parse_args
+        )
+
+    #==========================================================================
+
+    def testPrecision(self):
+        """Tests that --precision sets NUMBER_PRECISION"""
+        self.assertEqual(
+            None,
+            cdl_convert.config.NUMBER_PRECISION
+        )
+
+        sys.argv = ['scriptname', 'inputFile', '--precision', '6']
+
+        main.parse_args()
+
+        self.assertEqual(
+            6,
+            cdl_convert.config.NUMBER_PRECISION
+        )
+
+        cdl_convert.config.NUMBER_PRECISION = None
+
+    #==========================================================================
+
+    def testBadPrecision(self):
+        """Tests that a negative precision raises ValueError"""
+        sys.argv = ['scriptname', 'inputFile', '--precision', '-1']
+
+        self.assertRaises(
+            ValueError,
+            main.parse_args
+        )
+
+    #==========================================================================
+
+    def testCsvColumns(self):
+        """Tests that --csv-columns sets CSV_COLUMNS"""
+        self.assertEqual(
+            None,
+            cdl_convert.config.CSV_COLUMNS
+        )
+
+        sys.argv = [
+            'scriptname', 'inputFile', '--csv-columns',
+            'id=Shot, sop=ASC_SOP'
+        ]
+
+        main.parse_args()
+
+        self.assertEqual(
+            {'id': 'Shot', 'sop': 'ASC_SOP'},
+            cdl_convert.config.CSV_COLUMNS
+        )
+
+        cdl_convert.config.CSV_COLUMNS = None
+
+    #==========================================================================
+
+    def testBadCsvColumns(self):
+        """Tests that bad or unknown csv columns raise ValueError"""
+        for columns in ['id', 'hue=Hue', 'sop=ASC_SOP,slope=Slope']:
+            sys.argv = ['scriptname', 'inputFile', '--csv-columns', columns]
+
+            self.assertRaises(
+                ValueError,
+                main.parse_args
+            )
+
+    #==========================================================================
+
     def testSanityCheck(self):
         """Tests the sanity check --check flag to be set"""
 
@@ -883,6 +1173,38 @@ class TestMain(unittest.TestCase):
 
     #==========================================================================
 
+    @mock.patch('cdl_convert.write_cdlb')
+    @mock.patch('cdl_convert.parse_rnh_cdl')
+    def testDetermineDestCalledCdlb(self, mockParse, mockWrite):
+        """Tests that a cdlb file is named by extension, keeping the type"""
+
+        mockParse.return_value = self.ccc
+        sys.argv = ['scriptname', 'file.flex', '-o', 'cdlb']
+
+        destination_dir = os.path.abspath('./converted/')
+
+        mockInputs = dict(self.inputFormats)
+        mockInputs['flex'] = mockParse
+        parse.INPUT_FORMATS = mockInputs
+
+        mockOutputs = dict(self.outputFormats)
+        mockOutputs['cdlb'] = mockWrite
+        write.OUTPUT_FORMATS = mockOutputs
+
+        main.main()
+
+        mockWrite.assert_called_once_with(self.ccc)
+        self.assertEqual(
+            os.path.join(destination_dir, 'testcdl.cdlb'),
+            self.ccc.file_out
+        )
+        self.assertEqual(
+            'ccc',
+            self.ccc.type
+        )
+
+    #==========================================================================
+
     @mock.patch('cdl_convert.write_cdl')
     @mock.patch('cdl_convert.parse_cdl')
     def testSingleCollectionExport(self, mockParse, mockWrite):
@@ -1177,7 +1499,7 @@ class TestMain(unittest.TestCase):
 
         mockParse.assert_called_once_with(os.path.join(os.getcwd(), 'file.cc'))
         # Determine dest should have set a file_out
-        mockDest.assert_called_once_with('/fakepath')
+        mockDest.assert_called_once_with('/fakepath', 'ccc')
         # But the write should never have been called.
         self.assertFalse(
             mockWrite.called
@@ -1296,6 +1618,201 @@ class TestMain(unittest.TestCase):
             [mock.call(self.cdl), mock.call(self.cdl), mock.call(self.cdl)]
         )
 
+    #==========================================================================
+
+    @mock.patch('cdl_convert.write.ArchiveWriter')
+    @mock.patch('cdl_convert.write_cc')
+    @mock.patch('cdl_convert.parse_ccc')
+    def testArchiveWriteSingleFiles(self, mockParse, mockWrite, mockArchive):
+        """Tests that --archive writes single files into one archive"""
+        cc1 = cdl_convert.ColorCorrection(id='cc1')
+        cc2 = cdl_convert.ColorCorrection(id='cc2')
+        self.ccc.append_children([cc1, cc2])
+        mockParse.return_value = self.ccc
+
+        sys.argv = [
+            'scriptname', 'grades.ccc', '-o', 'cc,rcdl', '--archive', 'zip'
+        ]
+
+        mockInputs = dict(self.inputFormats)
+        mockInputs['ccc'] = mockParse
+        parse.INPUT_FORMATS = mockInputs
+
+        mockOutputs = dict(self.outputFormats)
+        mockOutputs['cc'] = mockWrite
+        write.OUTPUT_FORMATS = mockOutputs
+
+        main.main()
+
+        mockArchive.assert_called_once_with(
+            os.path.join(os.path.abspath('./converted/'), 'grades.zip'),
+            'zip'
+        )
+        mockArchive.return_value.write.assert_has_calls(
+            [
+                mock.call(cc1, 'cc'), mock.call(cc2, 'cc'),
+                mock.call(cc1, 'rcdl'), mock.call(cc2, 'rcdl'),
+            ]
+        )
+        mockArchive.return_value.close.assert_called_once_with()
+        self.assertFalse(
+            mockWrite.called
+        )
+
+    #==========================================================================
+
+    @mock.patch('cdl_convert.write.write_single_files')
+    @mock.patch('cdl_convert.parse_ccc')
+    def testJobsWriteSingleFiles(self, mockParse, mockWriteFiles):
+        """Tests that --jobs writes single files in parallel"""
+        cc1 = cdl_convert.ColorCorrection(id='cc1')
+        cc2 = cdl_convert.ColorCorrection(id='cc2')
+        self.ccc.append_children([cc1, cc2])
+        mockParse.return_value = self.ccc
+        mockWriteFiles.return_value = ([], [])
+
+        sys.argv = ['scriptname', 'file.ccc', '-o', 'cc', '--jobs', '4']
+
+        mockInputs = dict(self.inputFormats)
+        mockInputs['ccc'] = mockParse
+        parse.INPUT_FORMATS = mockInputs
+
+        self.assertEqual(
+            None,
+            main.main()
+        )
+
+        mockWriteFiles.assert_called_once_with([cc1, cc2], 'cc', jobs=4)
+
+        destination_dir = os.path.abspath('./converted/')
+        self.assertEqual(
+            os.path.join(destination_dir, 'cc1.cc'),
+            cc1.file_out
+        )
+
+    #==========================================================================
+
+    @mock.patch('cdl_convert.write.write_single_files')
+    @mock.patch('cdl_convert.parse_ccc')
+    def testJobsWriteFailures(self, mockParse, mockWriteFiles):
+        """Tests that files which failed to write are reported"""
+        cc1 = cdl_convert.ColorCorrection(id='cc1')
+        cc2 = cdl_convert.ColorCorrection(id='cc2')
+        self.ccc.append_children([cc1, cc2])
+        mockParse.return_value = self.ccc
+        mockWriteFiles.return_value = ([], [(cc2, IOError('Disk full'))])
+
+        sys.argv = ['scriptname', 'file.ccc', '-o', 'cc', '-j', '2']
+
+        mockInputs = dict(self.inputFormats)
+        mockInputs['ccc'] = mockParse
+        parse.INPUT_FORMATS = mockInputs
+
+        self.assertEqual(
+            1,
+            main.main()
+        )
+
+        self.assertTrue(
+            'Failed to write cdl cc2 to {path}: Disk full'.format(
+                path=cc2.file_out
+            ) in sys.stdout.getvalue()
+        )
+        self.assertTrue(
+            'Files written: 1, skipped as unchanged: 0, failed: 1'
+            in sys.stdout.getvalue()
+        )
+
+    #==========================================================================
+
+    @mock.patch('cdl_convert.write_cc')
+    @mock.patch('cdl_convert.parse_ccc')
+    def testSkipUnchangedCounts(self, mockParse, mockWrite):
+        """Tests that skipped and written files are counted"""
+        cc1 = cdl_convert.ColorCorrection(id='cc1')
+        cc2 = cdl_convert.ColorCorrection(id='cc2')
+        cc3 = cdl_convert.ColorCorrection(id='cc3')
+        self.ccc.append_children([cc1, cc2, cc3])
+        mockParse.return_value = self.ccc
+        mockWrite.side_effect = [True, False, True]
+
+        sys.argv = ['scriptname', 'file.ccc', '-o', 'cc', '--skip-unchanged']
+
+        mockInputs = dict(self.inputFormats)
+        mockInputs['ccc'] = mockParse
+        parse.INPUT_FORMATS = mockInputs
+
+        mockOutputs = dict(self.outputFormats)
+        mockOutputs['cc'] = mockWrite
+        write.OUTPUT_FORMATS = mockOutputs
+
+        try:
+            self.assertEqual(
+                None,
+                main.main()
+            )
+        finally:
+            cdl_convert.config.SKIP_UNCHANGED = False
+
+        self.assertTrue(
+            'Skipped unchanged file {path}'.format(
+                path=cc2.file_out
+            ) in sys.stdout.getvalue()
+        )
+        self.assertTrue(
+            'Files written: 2, skipped as unchanged: 1, failed: 0'
+            in sys.stdout.getvalue()
+        )
+
+    #==========================================================================
+
+    @mock.patch('cdl_convert.write.write_fanout')
+    @mock.patch('cdl_convert.write_cc')
+    @mock.patch('cdl_convert.parse_ccc')
+    def testFanoutWrites(self, mockParse, mockWrite, mockFanout):
+        """Tests collection and single formats are written in one walk"""
+        cc1 = cdl_convert.ColorCorrection(id='cc1')
+        cc2 = cdl_convert.ColorCorrection(id='cc2')
+        self.ccc.append_children([cc1, cc2])
+        mockParse.return_value = self.ccc
+
+        def walk(col, outputs, each=None):
+            """Passes each correction on, as write_fanout would"""
+            for cdl in col.color_corrections:
+                each(cdl)
+            return dict((ext, True) for ext in outputs)
+        mockFanout.side_effect = walk
+
+        sys.argv = ['scriptname', 'file.ccc', '-o', 'cc,cdl,ccc']
+
+        mockInputs = dict(self.inputFormats)
+        mockInputs['ccc'] = mockParse
+        parse.INPUT_FORMATS = mockInputs
+
+        mockOutputs = dict(self.outputFormats)
+        mockOutputs['cc'] = mockWrite
+        write.OUTPUT_FORMATS = mockOutputs
+
+        main.main()
+
+        destination_dir = os.path.abspath('./converted/')
+        self.assertEqual(
+            {
+                'ccc': os.path.join(destination_dir, 'testcdl.ccc'),
+                'cdl': os.path.join(destination_dir, 'testcdl.cdl'),
+            },
+            mockFanout.call_args[0][1]
+        )
+        mockWrite.assert_has_calls([mock.call(cc1), mock.call(cc2)])
+        self.assertEqual(
+            'ccc',
+            self.ccc.type
+        )
+        self.assertTrue(
+            'Files written: 4, skipped as unchanged: 0, failed: 0'
+            in sys.stdout.getvalue()
+        )
+
 # Test Classes ================================================================
 
 # TimeCodeSegment is from my SMTPE Timecode gist at:
@@ -1676,6 +2193,192 @@ class TestToDecimal(unittest.TestCase):
             value
         )
 
+
+class TestValidateValues(unittest.TestCase):
+    """Tests validating whole columns of values at once"""
+
+    def tearDown(self):
+        cdl_convert.config.HALT_ON_ERROR = False
+
+    def testConversion(self):
+        """Tests values convert like to_decimal and the SopNode setters"""
+        result = utils.validate_values(
+            slope=[[1, '1.2', 1.3], 2, None],
+            offset=[-0.1, None, ('0', '-0.0', 0.5)],
+            sat=['0.5', 1, None],
+        )
+
+        self.assertEqual(
+            [decimalize(1.0, 1.2, 1.3), decimalize(2.0, 2.0, 2.0), None],
+            result.values['slope']
+        )
+        self.assertEqual(
+            [decimalize(-0.1, -0.1, -0.1), None, decimalize(0.0, -0.0, 0.5)],
+            result.values['offset']
+        )
+        self.assertEqual(
+            [None] * 3,
+            result.values['power']
+        )
+        self.assertEqual(
+            [Decimal('0.5'), Decimal('1.0'), None],
+            result.values['sat']
+        )
+        self.assertEqual(
+            [],
+            result.errors
+        )
+        # The string representation must match the one value at a time path
+        self.assertEqual(
+            '-0.0',
+            str(result.values['offset'][2][1])
+        )
+
+    def testClamped(self):
+        """Tests that negatives are clamped and flagged in the mask"""
+        result = utils.validate_values(
+            slope=[[-1, 1, 1], [1, 1, 1]],
+            offset=[[-1, -1, -1], None],
+            sat=[0.5, -0.5],
+        )
+
+        self.assertEqual(
+            [decimalize(0.0, 1.0, 1.0), decimalize(1.0, 1.0, 1.0)],
+            result.values['slope']
+        )
+        self.assertEqual(
+            [[True, False, False], [False, False, False]],
+            result.clamped['slope']
+        )
+        self.assertEqual(
+            [[False, False, False], None],
+            result.clamped['offset']
+        )
+        self.assertEqual(
+            [False, True],
+            result.clamped['sat']
+        )
+        self.assertEqual(
+            [],
+            result.errors
+        )
+
+    def testHalt(self):
+        """Tests that negatives are errors with HALT_ON_ERROR"""
+        cdl_convert.config.HALT_ON_ERROR = True
+
+        result = utils.validate_values(
+            slope=[[-1, 1, 1], [1, 1, 1]],
+            sat=[0.5, -0.5],
+        )
+
+        self.assertEqual(
+            [None, decimalize(1.0, 1.0, 1.0)],
+            result.values['slope']
+        )
+        self.assertEqual(
+            [('slope', 0), ('sat', 1)],
+            [(error.name, error.index) for error in result.errors]
+        )
+        for error in result.errors:
+            self.assertTrue(isinstance(error.error, ValueError))
+
+    def testErrors(self):
+        """Tests that every bad value is reported, not just the first"""
+        result = utils.validate_values(
+            slope=[[1, 1], 'banana', [1, 1, float('inf')], 1],
+            power=[1, 1],
+        )
+
+        self.assertEqual(
+            [
+                ('slope', 0, ValueError),
+                ('slope', 1, TypeError),
+                ('slope', 2, TypeError),
+                ('power', None, ValueError),
+            ],
+            [
+                (error.name, error.index, type(error.error))
+                for error in result.errors
+            ]
+        )
+        self.assertEqual(
+            'banana',
+            result.errors[1].value
+        )
+        self.assertEqual(
+            [None, None, None, decimalize(1.0, 1.0, 1.0)],
+            result.values['slope']
+        )
+
+    def testCount(self):
+        """Tests the count defaults to the first column given"""
+        result = utils.validate_values(sat=[1, 2, 3])
+
+        self.assertEqual(
+            [None] * 3,
+            result.values['slope']
+        )
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def testNumpy(self):
+        """Tests that NumPy arrays give the same results as lists"""
+        slope = [[1.0, 1.25, -0.3], [2.0, 0.0, 0.1]]
+        offset = [-0.0, -0.5]
+        sat = [1, -2]
+
+        result = utils.validate_values(
+            numpy.array(slope), numpy.array(offset), None, numpy.array(sat)
+        )
+        expected = utils.validate_values(slope, offset, None, sat)
+
+        self.assertEqual(expected, result)
+        self.assertEqual(
+            '-0.0',
+            str(result.values['offset'][0][0])
+        )
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def testNumpyFloat32(self):
+        """Tests float32 arrays keep the digits of their own values"""
+        slope = [[0.1, 1.2, 0.9], [2.0, 0.3, -0.7]]
+        sat = [0.1, 1e-05]
+
+        result = utils.validate_values(
+            slope=numpy.array(slope, dtype=numpy.float32),
+            sat=numpy.array(sat, dtype=numpy.float32),
+        )
+        expected = utils.validate_values(slope=slope, sat=sat)
+
+        self.assertEqual(expected, result)
+        self.assertEqual(
+            [Decimal('0.1'), Decimal('0.00001')],
+            result.values['sat']
+        )
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def testNumpyErrors(self):
+        """Tests errors found with NumPy array operations"""
+        cdl_convert.config.HALT_ON_ERROR = True
+
+        result = utils.validate_values(
+            slope=numpy.array([[1.0, 1.0, -1.0], [1.0, numpy.nan, 1.0]]),
+            power=numpy.ones((2, 2)),
+        )
+
+        self.assertEqual(
+            [('slope', 0, ValueError), ('slope', 1, TypeError),
+             ('power', None, ValueError)],
+            [
+                (error.name, error.index, type(error.error))
+                for error in result.errors
+            ]
+        )
+        self.assertEqual(
+            [None, None],
+            result.values['slope']
+        )
+
 #==============================================================================
 # FUNCTIONS
 #==============================================================================
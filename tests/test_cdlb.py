@@ -0,0 +1,451 @@
+#!/usr/bin/env python
+"""
+Tests the binary cdlb format of cdl_convert
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+# Standard Imports
+from decimal import Decimal
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Grab our test's path and append the cdL_convert root directory
+
+# There has to be a better method than:
+# 1) Getting our current directory
+# 2) Splitting into list
+# 3) Splicing out the last 3 entries (filepath, test dir, tools dir)
+# 4) Joining
+# 5) Appending to our Python path.
+
+sys.path.append('/'.join(os.path.realpath(__file__).split('/')[:-2]))
+
+import cdl_convert
+from cdl_convert import parse, write
+
+#==============================================================================
+# TEST CLASSES
+#==============================================================================
+
+# write_cdlb & parse_cdlb =====================================================
+
+
+class TestCdlbRoundTrip(unittest.TestCase):
+    """Tests collections written to cdlb load back exactly"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'grades.cdlb')
+
+        self.col = cdl_convert.ColorCollection()
+        self.col.type = 'cdl'
+        self.col.desc = ['Show grades', u'Caf\xe9 scene']
+        self.col.input_desc = 'LogC'
+        self.col.viewing_desc = 'Rec709'
+        self.col._file_out = self.path
+
+        self.exotic = cdl_convert.ColorCorrection('exotic')
+        self.exotic.desc = ['First', 'Second']
+        self.exotic.input_desc = 'ACEScc'
+        self.exotic.slope = ['1.00', '1.13E-17', '123456789012345678901234']
+        self.exotic.offset = ['-0.0', '0.0', '-0.0125']
+        self.exotic.power = ['1', '0.9999999999999999999', Decimal('1E+200')]
+        self.exotic.sop_node.desc = 'Sop'
+        self.exotic.sat = '0.8'
+        self.exotic.sat_node.desc = 'Sat'
+
+        # Neither a SopNode nor a SatNode
+        self.virgin = cdl_convert.ColorCorrection('virgin')
+
+        self.sat_only = cdl_convert.ColorCorrection('satOnly')
+        self.sat_only.sat = 0.5
+
+        self.col.append_children([self.exotic, self.virgin])
+
+        decision = cdl_convert.ColorDecision(
+            self.sat_only, cdl_convert.MediaRef('/shots/sh010.####.dpx')
+        )
+        decision.desc = 'Held'
+        decision.viewing_desc = 'P3'
+        self.col.append_child(decision)
+        self.col.append_child(
+            cdl_convert.ColorDecision(cdl_convert.ColorCorrectionRef('exotic'))
+        )
+        self.col.append_child(
+            cdl_convert.ColorDecision(cdl_convert.ColorCorrectionRef('absent'))
+        )
+
+    #==========================================================================
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def load(self):
+        """Writes the collection, then loads it after resetting members"""
+        cdl_convert.write_cdlb(self.col)
+        cdl_convert.reset_all()
+        return cdl_convert.parse_cdlb(self.path)
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testCollection(self):
+        """Tests the collection's own fields are loaded"""
+        col = self.load()
+
+        self.assertEqual(
+            'cdl',
+            col.type
+        )
+        self.assertEqual(
+            ['Show grades', u'Caf\xe9 scene'],
+            [i.decode('UTF-8') if isinstance(i, bytes) else i
+             for i in col.desc]
+        )
+        self.assertEqual(
+            'LogC',
+            col.input_desc
+        )
+        self.assertEqual(
+            'Rec709',
+            col.viewing_desc
+        )
+        self.assertEqual(
+            self.path,
+            col.file_in
+        )
+
+    #==========================================================================
+
+    def testDecisions(self):
+        """Tests decisions, media refs and references are loaded"""
+        col = self.load()
+        held, ref, absent = col.color_decisions
+
+        self.assertEqual(
+            'satOnly',
+            held.cc.id
+        )
+        self.assertTrue(
+            held.cc.parent is held
+        )
+        self.assertEqual(
+            '/shots/sh010.####.dpx',
+            held.media_ref.ref
+        )
+        self.assertEqual(
+            ['Held'],
+            held.desc
+        )
+        self.assertEqual(
+            'P3',
+            held.viewing_desc
+        )
+        self.assertTrue(
+            ref.is_ref
+        )
+        self.assertTrue(
+            ref.cc.cc is col.color_corrections[0]
+        )
+        self.assertEqual(
+            'absent',
+            absent.cc.id
+        )
+        self.assertEqual(
+            None,
+            absent.media_ref
+        )
+
+    #==========================================================================
+
+    def testExactXml(self):
+        """Tests the loaded collection writes the same XML"""
+        xml = self.col.xml_root
+
+        self.assertEqual(
+            xml,
+            self.load().xml_root
+        )
+
+    #==========================================================================
+
+    def testRenamedReference(self):
+        """Tests references follow a correction renamed on load"""
+        cdl_convert.write_cdlb(self.col)
+
+        col = cdl_convert.parse_cdlb(self.path)
+
+        self.assertEqual(
+            'exotic001',
+            col.color_corrections[0].id
+        )
+        self.assertEqual(
+            'exotic001',
+            col.color_decisions[1].cc.id
+        )
+
+    #==========================================================================
+
+    def testValues(self):
+        """Tests every digit of every value is kept"""
+        col = self.load()
+        exotic, virgin = col.color_corrections
+
+        for attr in ['slope', 'offset', 'power', 'sat']:
+            self.assertEqual(
+                [str(i) for i in getattr(self.exotic, attr)]
+                if attr != 'sat' else str(self.exotic.sat),
+                [str(i) for i in getattr(exotic, attr)]
+                if attr != 'sat' else str(exotic.sat),
+            )
+        self.assertEqual(
+            ['Sop'],
+            exotic.sop_node.desc
+        )
+        self.assertEqual(
+            ['Sat'],
+            exotic.sat_node.desc
+        )
+        self.assertEqual(
+            'ACEScc',
+            exotic.input_desc
+        )
+        self.assertEqual(
+            self.path,
+            exotic.file_in
+        )
+
+    #==========================================================================
+
+    def testVirginNodes(self):
+        """Tests corrections without nodes are loaded without nodes"""
+        col = self.load()
+        virgin = col.color_corrections[1]
+        sat_only = col.color_decisions[0].cc
+
+        self.assertTrue(
+            virgin._sop_node is None
+        )
+        self.assertTrue(
+            virgin._sat_node is None
+        )
+        self.assertTrue(
+            sat_only._sop_node is None
+        )
+        self.assertEqual(
+            Decimal('0.5'),
+            sat_only.sat
+        )
+
+    #==========================================================================
+
+    def testWriteSingleCorrection(self):
+        """Tests a correction is written as a collection holding it"""
+        self.virgin._file_out = self.path
+        cdl_convert.write_cdlb(self.virgin)
+
+        self.assertTrue(
+            self.virgin.parent is self.col
+        )
+
+        cdl_convert.reset_all()
+        col = cdl_convert.parse_file(self.path)
+
+        self.assertEqual(
+            ['virgin'],
+            [cc.id for cc in col.color_corrections]
+        )
+
+    #==========================================================================
+
+    def testDumpMatchesWrite(self):
+        """Tests single file and archive writers get the same bytes"""
+        cdl_convert.write_cdlb(self.col)
+
+        with open(self.path, 'rb') as cdlb_f:
+            self.assertEqual(
+                cdlb_f.read(),
+                write._DUMP_FORMATS['cdlb'](self.col)
+            )
+
+# CdlbReader ==================================================================
+
+
+class TestCdlbReader(unittest.TestCase):
+    """Tests reading single corrections without loading the collection"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'grades.cdlb')
+
+        col = cdl_convert.ColorCollection.from_arrays(
+            ['sh{0:03d}'.format(i) for i in range(20)],
+            slope=[[1.0 + i / 100.0, 1.0, 0.9] for i in range(20)],
+            sat=[0.5 + i / 100.0 for i in range(20)],
+        )
+        col._file_out = self.path
+        cdl_convert.write_cdlb(col)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testBadFiles(self):
+        """Tests files that aren't cdlb raise ValueError"""
+        for contents in [b'', b'<ColorCorrection/>', b'CDLB' + b'\xff' * 200]:
+            with open(self.path, 'wb') as cdlb_f:
+                cdlb_f.write(contents)
+
+            self.assertRaises(
+                ValueError,
+                parse.CdlbReader,
+                self.path
+            )
+
+    #==========================================================================
+
+    def testClose(self):
+        """Tests the context manager unmaps the file"""
+        with cdl_convert.CdlbReader(self.path) as reader:
+            self.assertFalse(
+                reader.closed
+            )
+
+        self.assertTrue(
+            reader.closed
+        )
+
+    #==========================================================================
+
+    def testCorrection(self):
+        """Tests a single correction is built on its own"""
+        with cdl_convert.CdlbReader(self.path) as reader:
+            cc = reader.correction(7)
+
+        self.assertEqual(
+            'sh007',
+            cc.id
+        )
+        self.assertEqual(
+            (Decimal('1.07'), Decimal('1.0'), Decimal('0.9')),
+            cc.slope
+        )
+        self.assertEqual(
+            ['sh007'],
+            list(cdl_convert.ColorCorrection.members.keys())
+        )
+
+    #==========================================================================
+
+    def testCorrupt(self):
+        """Tests a record indexing past its table raises ValueError"""
+        with open(self.path, 'rb') as cdlb_f:
+            contents = bytearray(cdlb_f.read())
+        corrections_pos = parse._CDLB_HEADER.unpack_from(bytes(contents))[11]
+        # The id of the first correction
+        contents[corrections_pos:corrections_pos + 4] = b'\xfe\xff\xff\x00'
+        with open(self.path, 'wb') as cdlb_f:
+            cdlb_f.write(contents)
+
+        self.assertRaises(
+            ValueError,
+            cdl_convert.parse_cdlb,
+            self.path
+        )
+        with cdl_convert.CdlbReader(self.path) as reader:
+            self.assertRaises(
+                ValueError,
+                lambda: reader.ids
+            )
+
+    #==========================================================================
+
+    def testIds(self):
+        """Tests ids and length are read without building corrections"""
+        with cdl_convert.CdlbReader(self.path) as reader:
+            self.assertEqual(
+                ['sh{0:03d}'.format(i) for i in range(20)],
+                reader.ids
+            )
+            self.assertEqual(
+                20,
+                len(reader)
+            )
+
+        self.assertEqual(
+            {},
+            cdl_convert.ColorCorrection.members
+        )
+
+    #==========================================================================
+
+    def testTruncated(self):
+        """Tests truncated files raise ValueError"""
+        with open(self.path, 'rb') as cdlb_f:
+            contents = cdlb_f.read()
+
+        for length in [parse._CDLB_HEADER.size, len(contents) // 2,
+                       len(contents) - 1]:
+            with open(self.path, 'wb') as cdlb_f:
+                cdlb_f.write(contents[:length])
+
+            self.assertRaises(
+                ValueError,
+                cdl_convert.parse_cdlb,
+                self.path
+            )
+
+    #==========================================================================
+
+    def testValues(self):
+        """Tests values are decoded with defaults for missing nodes"""
+        with cdl_convert.CdlbReader(self.path) as reader:
+            self.assertEqual(
+                (
+                    (Decimal('1.19'), Decimal('1.0'), Decimal('0.9')),
+                    (Decimal('0.0'), ) * 3,
+                    (Decimal('1.0'), ) * 3,
+                    Decimal('0.69'),
+                ),
+                reader.values(19)
+            )
+            self.assertRaises(
+                IndexError,
+                reader.values,
+                20
+            )
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    unittest.main()
@@ -13,13 +13,19 @@ mock
 
 # Standard Imports
 from decimal import Decimal
+import gc
+import pickle
 try:
     from unittest import mock
 except ImportError:
     import mock
+from io import BytesIO
 import os
+import subprocess
 import sys
 import unittest
+from xml.dom import minidom
+from xml.etree import ElementTree
 
 # Grab our test's path and append the cdL_convert root directory
 
@@ -33,7 +39,11 @@ import unittest
 sys.path.append('/'.join(os.path.realpath(__file__).split('/')[:-2]))
 
 import cdl_convert
-from cdl_convert.base import AscColorSpaceBase, AscDescBase
+from cdl_convert.base import (
+    AscColorSpaceBase, AscDescBase, compact_xml, iter_compact_xml,
+    iter_pretty_xml, pretty_xml, WeakMemberList, WeakMemberLists,
+    XML_DECLARATION
+)
 from cdl_convert.correction import ColorNodeBase
 
 #==============================================================================
@@ -362,6 +372,501 @@ class TestAscDescBase(unittest.TestCase):
             self.node.desc
         )
 
+# AscXMLBase ==================================================================
+
+
+class TestCompactXml(unittest.TestCase):
+    """Tests the compact XML serializer behind AscXMLBase"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        self.root = ElementTree.Element('Root', {'name': 'a "b" & <c>'})
+        text = ElementTree.SubElement(self.root, 'Text')
+        text.text = 'He said hi & <bye>\n  next line'
+        ElementTree.SubElement(self.root, 'Nothing', {'id': 'x'})
+        mixed = ElementTree.SubElement(self.root, 'Mixed')
+        mixed.text = 'lead'
+        child = ElementTree.SubElement(mixed, 'Child')
+        child.text = '1.0'
+        child.tail = 'tail'
+
+    def tearDown(self):
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def assertSameTree(self, expected, actual):
+        """Asserts two elements hold the same tags, attributes and text"""
+        self.assertEqual(
+            (expected.tag, expected.attrib, expected.text, expected.tail),
+            (actual.tag, actual.attrib, actual.text, actual.tail)
+        )
+        self.assertEqual(
+            len(expected),
+            len(actual)
+        )
+        for expected_child, actual_child in zip(expected, actual):
+            self.assertSameTree(expected_child, actual_child)
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testCompact(self):
+        """Tests output has no added whitespace and parses back the same"""
+        xml = compact_xml(self.root)
+
+        self.assertEqual(
+            '<Root name="a &quot;b&quot; &amp; &lt;c&gt;">'
+            '<Text>He said hi &amp; &lt;bye&gt;\n  next line</Text>'
+            '<Nothing id="x"/>'
+            '<Mixed>lead<Child>1.0</Child>tail</Mixed>'
+            '</Root>',
+            xml
+        )
+        self.assertSameTree(
+            self.root,
+            ElementTree.fromstring(enc(xml))
+        )
+
+    #==========================================================================
+
+    def testIterChunks(self):
+        """Tests the chunks join to compact_xml with the extra children"""
+        extra = ElementTree.Element('Extra')
+        chunks = list(iter_compact_xml(self.root, children=[extra]))
+        self.root.append(extra)
+
+        self.assertEqual(
+            compact_xml(self.root),
+            ''.join(chunks)
+        )
+        self.assertEqual(
+            len(self.root) + 2,
+            len(chunks)
+        )
+        self.assertEqual(
+            ['<Extra/>'],
+            list(iter_compact_xml(extra))
+        )
+
+    #==========================================================================
+
+    def testXmlRootCompact(self):
+        """Tests compact output of a node against its pretty output"""
+        cc = cdl_convert.ColorCorrection('compact')
+        cc.slope = [1.1, 1.2, 1.3]
+        cc.sat = 0.5
+        cc.desc = 'Compact & small'
+        col = cdl_convert.ColorCollection()
+        col.append_child(cc)
+
+        stream = BytesIO()
+        col.write_xml_root(stream, pretty=False)
+
+        self.assertEqual(
+            col.xml_root_compact,
+            stream.getvalue()
+        )
+        self.assertEqual(
+            enc(XML_DECLARATION) + col.xml_compact,
+            col.xml_root_compact
+        )
+        self.assertTrue(
+            len(col.xml_root_compact) < len(col.xml_root)
+        )
+        self.assertFalse(
+            enc('\n ') in col.xml_compact
+        )
+
+
+class TestPrettyXml(unittest.TestCase):
+    """Tests the single pass XML serializer behind AscXMLBase"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        self.root = ElementTree.Element(
+            'Root', {'xmlns': 'urn:test', 'name': 'a "b" & <c>\td'}
+        )
+        text = ElementTree.SubElement(self.root, 'Text')
+        text.text = 'He said "hi" & <bye>\r\n  next line'
+        ElementTree.SubElement(self.root, 'Empty').text = ''
+        ElementTree.SubElement(self.root, 'Nothing', {'id': 'x'})
+        mixed = ElementTree.SubElement(self.root, 'Mixed')
+        mixed.text = 'lead'
+        child = ElementTree.SubElement(mixed, 'Child')
+        child.text = '1.0'
+        child.tail = 'tail'
+
+    def tearDown(self):
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testMatchesMinidom(self):
+        """Tests output is identical to the minidom round trip"""
+        xml_string = ElementTree.tostring(self.root, 'UTF-8')
+        expected = minidom.parseString(xml_string).toprettyxml(
+            indent='    ', encoding='UTF-8'
+        )
+
+        self.assertEqual(
+            expected,
+            enc(XML_DECLARATION + pretty_xml(self.root))
+        )
+
+    #==========================================================================
+
+    def testIterChunks(self):
+        """Tests the chunks join to pretty_xml, one per child"""
+        chunks = list(iter_pretty_xml(self.root))
+
+        self.assertEqual(
+            pretty_xml(self.root),
+            ''.join(chunks)
+        )
+        self.assertEqual(
+            len(self.root) + 2,
+            len(chunks)
+        )
+        self.assertEqual(
+            [pretty_xml(self.root[0])],
+            list(iter_pretty_xml(self.root[0]))
+        )
+
+    #==========================================================================
+
+    def testIterChildren(self):
+        """Tests extra children are pulled lazily and match appending"""
+        pulled = []
+
+        def children():
+            for i in range(3):
+                child = ElementTree.Element('Extra', {'n': str(i)})
+                pulled.append(child)
+                yield child
+
+        chunks = iter_pretty_xml(self.root, children=children())
+        for _ in range(len(self.root) + 1):
+            next(chunks)
+
+        self.assertEqual(
+            [],
+            pulled
+        )
+
+        text = ''.join(chunks)
+
+        self.assertEqual(
+            3,
+            len(pulled)
+        )
+
+        for child in pulled:
+            self.root.append(child)
+
+        self.assertTrue(
+            pretty_xml(self.root).endswith(text)
+        )
+
+    #==========================================================================
+
+    def testIterChildrenOnly(self):
+        """Tests an empty element gains its tags from extra children"""
+        element = ElementTree.Element('Node')
+        child = ElementTree.Element('Child')
+
+        self.assertEqual(
+            '<Node/>\n',
+            ''.join(iter_pretty_xml(element, children=iter([])))
+        )
+        self.assertEqual(
+            '<Node>\n    <Child/>\n</Node>\n',
+            ''.join(iter_pretty_xml(element, children=[child]))
+        )
+
+    #==========================================================================
+
+    def testLevel(self):
+        """Tests indenting by a starting level"""
+        element = ElementTree.Element('Node')
+        ElementTree.SubElement(element, 'Child').text = 'value'
+
+        self.assertEqual(
+            '        <Node>\n'
+            '            <Child>value</Child>\n'
+            '        </Node>\n',
+            pretty_xml(element, 2)
+        )
+
+    #==========================================================================
+
+    def testWriteXmlRoot(self):
+        """Tests writing a collection to a stream matches xml_root"""
+        cc = cdl_convert.ColorCorrection('streamed')
+        cc.slope = [1.1, 1.2, 1.3]
+        cc.desc = 'Streamed & written'
+        col = cdl_convert.ColorCollection()
+        col.desc = 'Collection desc'
+        col.append_child(cc)
+
+        stream = BytesIO()
+        col.write_xml_root(stream)
+
+        self.assertEqual(
+            col.xml_root,
+            stream.getvalue()
+        )
+        self.assertEqual(
+            col.xml_root.split(enc('\n'), 1)[1],
+            col.xml
+        )
+
+# CdlValue ====================================================================
+
+
+class TestCdlValue(unittest.TestCase):
+    """Tests the immutable CdlValue and ColorCorrection.value"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        self.cc = cdl_convert.ColorCorrection('valueTest')
+
+    def tearDown(self):
+        cdl_convert.config.HALT_ON_ERROR = False
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testDefaults(self):
+        """Tests that a default CdlValue is an identity grade"""
+        value = cdl_convert.CdlValue()
+
+        self.assertEqual(
+            (Decimal('1.0'), ) * 3 + (Decimal('0.0'), ) * 3 +
+            (Decimal('1.0'), ) * 4,
+            value.grade
+        )
+        self.assertEqual(
+            (),
+            value.desc
+        )
+
+    #==========================================================================
+
+    def testConversion(self):
+        """Tests that values are converted like the SopNode setters"""
+        value = cdl_convert.CdlValue(
+            slope=1.2, offset=['-0.1', 0, Decimal('0.1')], power=(1, 2, 3),
+            sat='0.5', desc=['first', 'second']
+        )
+
+        self.assertEqual(
+            (Decimal('1.2'), ) * 3,
+            value.slope
+        )
+        self.assertEqual(
+            (Decimal('-0.1'), Decimal('0.0'), Decimal('0.1')),
+            value.offset
+        )
+        self.assertEqual(
+            (Decimal('1.0'), Decimal('2.0'), Decimal('3.0')),
+            value.power
+        )
+        self.assertEqual(
+            Decimal('0.5'),
+            value.sat
+        )
+        self.assertEqual(
+            ('first', 'second'),
+            value.desc
+        )
+
+    #==========================================================================
+
+    def testNegative(self):
+        """Tests clamping and raising on negative values"""
+        value = cdl_convert.CdlValue(slope=-1, sat=-1)
+
+        self.assertEqual(
+            (Decimal('0.0'), ) * 3,
+            value.slope
+        )
+        self.assertEqual(
+            Decimal('0.0'),
+            value.sat
+        )
+
+        cdl_convert.config.HALT_ON_ERROR = True
+
+        self.assertRaises(
+            ValueError,
+            cdl_convert.CdlValue,
+            power=[1, 1, -1]
+        )
+
+    #==========================================================================
+
+    def testImmutable(self):
+        """Tests that attributes can't be set or deleted"""
+        value = cdl_convert.CdlValue()
+
+        def setSlope():
+            value.slope = 2
+
+        def setPrivate():
+            value._grade = ()
+
+        def delete():
+            del value._grade
+
+        self.assertRaises(AttributeError, setSlope)
+        self.assertRaises(AttributeError, setPrivate)
+        self.assertRaises(AttributeError, delete)
+
+    #==========================================================================
+
+    def testEquality(self):
+        """Tests that equal numbers give equal values and hashes"""
+        value = cdl_convert.CdlValue(slope=1, offset=0.1, sat=1, desc=['a'])
+        other = cdl_convert.CdlValue(
+            slope='1.00', offset=Decimal('0.1'), sat=1.0, desc=('a', )
+        )
+        different = cdl_convert.CdlValue(slope=1, offset=0.1, sat=0.9)
+
+        self.assertEqual(value, other)
+        self.assertFalse(value != other)
+        self.assertEqual(hash(value), hash(other))
+        self.assertNotEqual(value, different)
+        self.assertNotEqual(value, value.grade)
+
+        lookup = {value: 'found'}
+        self.assertEqual(
+            'found',
+            lookup[other]
+        )
+
+    #==========================================================================
+
+    def testDescEquality(self):
+        """Tests that descriptions matter to equality but not to grade"""
+        value = cdl_convert.CdlValue(slope=1.1, desc=['a'])
+        other = cdl_convert.CdlValue(slope=1.1)
+
+        self.assertNotEqual(value, other)
+        self.assertEqual(value.grade, other.grade)
+
+    #==========================================================================
+
+    def testPickle(self):
+        """Tests that a CdlValue pickles to an equal value"""
+        value = cdl_convert.CdlValue(slope=1.1, sat=0.7, desc=['a'])
+
+        loaded = pickle.loads(pickle.dumps(value))
+
+        self.assertEqual(value, loaded)
+        self.assertEqual(hash(value), hash(loaded))
+
+    #==========================================================================
+
+    def testCorrectionValueVirgin(self):
+        """Tests a new ColorCorrection's value without creating nodes"""
+        self.assertEqual(
+            cdl_convert.CdlValue(),
+            self.cc.value
+        )
+        self.assertFalse(self.cc.has_sop)
+        self.assertFalse(self.cc.has_sat)
+
+    #==========================================================================
+
+    def testCorrectionValueCached(self):
+        """Tests that value is only rebuilt after a change"""
+        self.cc.slope = 1.1
+        value = self.cc.value
+
+        self.assertTrue(value is self.cc.value)
+        self.assertEqual(
+            cdl_convert.CdlValue(slope=1.1),
+            value
+        )
+
+    #==========================================================================
+
+    def testCorrectionValueSetters(self):
+        """Tests that the setters invalidate the cached value"""
+        expected = {}
+        for name, setting in (
+                ('slope', [1.1, 1.2, 1.3]),
+                ('offset', -0.1),
+                ('power', [0.9, 1.0, 1.1]),
+                ('sat', 0.5),
+        ):
+            old = self.cc.value
+            setattr(self.cc, name, setting)
+            expected[name] = setting
+
+            self.assertFalse(old is self.cc.value)
+            self.assertEqual(
+                cdl_convert.CdlValue(**expected),
+                self.cc.value
+            )
+
+    #==========================================================================
+
+    def testCorrectionValueNodeSetters(self):
+        """Tests that setting values on the nodes invalidates the value"""
+        self.cc.value
+        self.cc.sop_node.slope = 2
+        self.cc.sat_node.sat = 0.5
+
+        self.assertEqual(
+            cdl_convert.CdlValue(slope=2, sat=0.5),
+            self.cc.value
+        )
+
+    #==========================================================================
+
+    def testCorrectionValueDesc(self):
+        """Tests that in place desc changes are picked up"""
+        self.cc.value
+        self.cc.desc.append('in place')
+
+        self.assertEqual(
+            ('in place', ),
+            self.cc.value.desc
+        )
+
+    #==========================================================================
+
+    def testCorrectionValuePickled(self):
+        """Tests that an unpickled correction has an equal value"""
+        self.cc.slope = 1.1
+        self.cc.sat = 0.5
+        self.cc.desc = 'pickled'
+
+        loaded = pickle.loads(pickle.dumps(self.cc))
+
+        self.assertEqual(
+            self.cc.value,
+            loaded.value
+        )
+
 # ColorCollection==============================================================
 
 
@@ -688,6 +1193,26 @@ class TestColorCollection(unittest.TestCase):
 
     #==========================================================================
 
+    @mock.patch('os.path.abspath')
+    def testDetermineDestExt(self, mockPath):
+        """Tests that a given extension is used instead of the type"""
+        mockPath.return_value = '/this/is/a/path/bananaphone.ccc'
+        self.node = cdl_convert.ColorCollection(input_file='mybestfile.ccc')
+        self.node.type = 'cdl'
+
+        self.node.determine_dest('./converted/', 'cdlb')
+
+        self.assertEqual(
+            './converted/bananaphone.cdlb',
+            self.node.file_out
+        )
+        self.assertEqual(
+            'cdl',
+            self.node.type
+        )
+
+    #==========================================================================
+
     def testDetermineDestNoFileIn(self):
         """Tests determine destination works with no file_in"""
         # Reset the members list
@@ -940,10 +1465,9 @@ class TestCollectionChildMethods(unittest.TestCase):
         """Tests setting ColorCorrection directly with a list"""
         self.node.color_corrections = self.color_corrections
 
-        # We need to convert self.color_corrections to a set then to a list
-        # so the order matches
+        # Members keep the given order
         self.assertEqual(
-            list(set(self.color_corrections)),
+            self.color_corrections,
             self.node.color_corrections
         )
 
@@ -953,10 +1477,9 @@ class TestCollectionChildMethods(unittest.TestCase):
         """Tests setting ColorCorrection directly with a tuple"""
         self.node.color_corrections = tuple(self.color_corrections)
 
-        # We need to convert self.color_corrections to a set then to a list
-        # so the order matches
+        # Members keep the given order
         self.assertEqual(
-            list(set(self.color_corrections)),
+            self.color_corrections,
             self.node.color_corrections
         )
 
@@ -964,12 +1487,12 @@ class TestCollectionChildMethods(unittest.TestCase):
 
     def testSetColorCorrectionSet(self):
         """Tests setting ColorCorrection directly with a list"""
-        self.node.color_corrections = self.color_corrections
+        values = set(self.color_corrections)
+        self.node.color_corrections = values
 
-        # We need to convert self.color_corrections to a set then to a list
-        # so the order matches
+        # Members keep the iteration order of the given set
         self.assertEqual(
-            list(set(self.color_corrections)),
+            list(values),
             self.node.color_corrections
         )
     #==========================================================================
@@ -1032,10 +1555,9 @@ class TestCollectionChildMethods(unittest.TestCase):
         """Tests setting ColorDecision directly with a list"""
         self.node.color_decisions = self.color_decisions
 
-        # We need to convert self.color_decisions to a set then to a list
-        # so the order matches
+        # Members keep the given order
         self.assertEqual(
-            list(set(self.color_decisions)),
+            self.color_decisions,
             self.node.color_decisions
         )
 
@@ -1045,10 +1567,9 @@ class TestCollectionChildMethods(unittest.TestCase):
         """Tests setting ColorDecision directly with a tuple"""
         self.node.color_decisions = tuple(self.color_decisions)
 
-        # We need to convert self.color_decisions to a set then to a list
-        # so the order matches
+        # Members keep the given order
         self.assertEqual(
-            list(set(self.color_decisions)),
+            self.color_decisions,
             self.node.color_decisions
         )
 
@@ -1056,12 +1577,12 @@ class TestCollectionChildMethods(unittest.TestCase):
 
     def testSetColorDecisionSet(self):
         """Tests setting ColorDecision directly with a list"""
-        self.node.color_decisions = self.color_decisions
+        values = set(self.color_decisions)
+        self.node.color_decisions = values
 
-        # We need to convert self.color_decisions to a set then to a list
-        # so the order matches
+        # Members keep the iteration order of the given set
         self.assertEqual(
-            list(set(self.color_decisions)),
+            list(values),
             self.node.color_decisions
         )
     #==========================================================================
@@ -1376,6 +1897,475 @@ class TestMultipleCollections(unittest.TestCase):
             merged.type
         )
 
+    #==========================================================================
+
+    def _conflicting_collections(self):
+        """Returns two collections whose corrections share the id 'shared'"""
+        first = cdl_convert.ColorCorrection(id='shared')
+        first.sat = 0.5
+        # Clearing the members is the only way to reuse an id.
+        cdl_convert.ColorCorrection.reset_members()
+        second = cdl_convert.ColorCorrection(id='shared')
+        second.sat = 1.5
+        self.node.color_corrections = [first, self.color_corrections[0]]
+        self.node2.color_corrections = [second, self.color_corrections[1]]
+        return first, second
+
+    #==========================================================================
+
+    def testMergeCollectionsOrder(self):
+        """Tests that merged children keep first seen order"""
+        self.node.append_children(self.color_corrections[2:])
+        self.node.append_children(self.color_decisions[:2])
+        self.node2.append_children(self.color_corrections[:3])
+        self.node2.append_children(self.color_decisions)
+
+        merged = self.node.merge_collections([self.node2, self.node])
+
+        self.assertEqual(
+            [
+                self.color_corrections[2],
+                self.color_corrections[3],
+                self.color_corrections[0],
+                self.color_corrections[1],
+            ],
+            merged.color_corrections
+        )
+        self.assertEqual(
+            self.color_decisions,
+            merged.color_decisions
+        )
+        for child in merged.all_children:
+            self.assertTrue(child.parent is merged)
+
+    #==========================================================================
+
+    def testMergeCollectionsConflictDefault(self):
+        """Tests that id conflicts keep the first child by default"""
+        first, second = self._conflicting_collections()
+
+        merged = self.node.merge_collections([self.node2])
+
+        self.assertEqual(
+            [first, self.color_corrections[0], self.color_corrections[1]],
+            merged.color_corrections
+        )
+
+    #==========================================================================
+
+    def testMergeCollectionsConflictLast(self):
+        """Tests that the last conflicting child takes the first's place"""
+        first, second = self._conflicting_collections()
+
+        merged = self.node.merge_collections([self.node2], conflict='last')
+
+        self.assertEqual(
+            [second, self.color_corrections[0], self.color_corrections[1]],
+            merged.color_corrections
+        )
+
+    #==========================================================================
+
+    def testMergeCollectionsConflictLastMixed(self):
+        """Tests keeping the last child when it's a ColorDecision"""
+        first, second = self._conflicting_collections()
+        self.node2.color_corrections = [self.color_corrections[1]]
+        decision = cdl_convert.ColorDecision(second)
+        self.node2.color_decisions = [decision]
+
+        merged = self.node.merge_collections([self.node2], conflict='last')
+
+        self.assertEqual(
+            [self.color_corrections[0], self.color_corrections[1]],
+            merged.color_corrections
+        )
+        self.assertEqual(
+            [decision],
+            merged.color_decisions
+        )
+
+    #==========================================================================
+
+    def testMergeCollectionsConflictError(self):
+        """Tests that id conflicts can raise ValueError"""
+        self._conflicting_collections()
+
+        self.assertRaises(
+            ValueError,
+            self.node.merge_collections,
+            [self.node2],
+            'error'
+        )
+
+    #==========================================================================
+
+    def testMergeCollectionsConflictHaltOnError(self):
+        """Tests that HALT_ON_ERROR makes id conflicts raise by default"""
+        self._conflicting_collections()
+        cdl_convert.config.HALT_ON_ERROR = True
+
+        try:
+            self.assertRaises(
+                ValueError,
+                self.node.merge_collections,
+                [self.node2]
+            )
+        finally:
+            cdl_convert.config.HALT_ON_ERROR = False
+
+    #==========================================================================
+
+    def testMergeCollectionsConflictRename(self):
+        """Tests that conflicting children can be renamed"""
+        first, second = self._conflicting_collections()
+        parent = second.parent
+
+        merged = self.node.merge_collections([self.node2], conflict='rename')
+        renamed = merged.color_corrections[2]
+
+        self.assertEqual(
+            [
+                first,
+                self.color_corrections[0],
+                renamed,
+                self.color_corrections[1]
+            ],
+            merged.color_corrections
+        )
+        self.assertEqual(
+            ['shared', 'shared001'],
+            [first.id, renamed.id]
+        )
+        self.assertEqual(
+            Decimal('1.5'),
+            renamed.sat
+        )
+        # The child merged in is a copy, the source is left alone
+        self.assertFalse(
+            renamed is second
+        )
+        self.assertEqual(
+            'shared',
+            second.id
+        )
+        self.assertTrue(
+            second.parent is parent
+        )
+
+    #==========================================================================
+
+    def testMergeCollectionsConflictRenameDecision(self):
+        """Tests that a conflicting decision is renamed as a copy"""
+        first, second = self._conflicting_collections()
+        decision = cdl_convert.ColorDecision(
+            second, cdl_convert.MediaRef('/best/path/ever.dpx')
+        )
+        decision.desc = 'Held'
+        self.node2.color_corrections = []
+        self.node2.color_decisions = [decision]
+
+        merged = self.node.merge_collections([self.node2], conflict='rename')
+        renamed = merged.color_decisions[0]
+
+        self.assertEqual(
+            ('shared001', Decimal('1.5'), '/best/path/ever.dpx', ['Held']),
+            (renamed.cc.id, renamed.cc.sat, renamed.media_ref.ref,
+             renamed.desc)
+        )
+        self.assertTrue(
+            renamed.cc.parent is renamed
+        )
+        self.assertEqual(
+            'shared',
+            second.id
+        )
+        self.assertTrue(
+            decision.cc is second and second.parent is decision
+        )
+        self.assertTrue(
+            decision.media_ref.parent is decision
+        )
+
+    #==========================================================================
+
+    def testMergeCollectionsBadConflict(self):
+        """Tests that an unknown conflict policy raises ValueError"""
+        self.assertRaises(
+            ValueError,
+            self.node.merge_collections,
+            [self.node2],
+            'newest'
+        )
+
+    #==========================================================================
+
+    def testMergeCollectionsDedupContent(self):
+        """Tests dropping corrections with identical values"""
+        for color_correct in self.color_corrections:
+            color_correct.slope = [1.1, 1.2, 1.3]
+        self.color_corrections[2].sat = 0.5
+        self.node.color_corrections = self.color_corrections[:2]
+        self.node2.color_corrections = self.color_corrections[2:]
+
+        merged = self.node.merge_collections(
+            [self.node2], dedup_content=True
+        )
+
+        self.assertEqual(
+            [self.color_corrections[0], self.color_corrections[2]],
+            merged.color_corrections
+        )
+
+        merged = self.node.merge_collections([self.node2])
+
+        self.assertEqual(
+            4,
+            len(merged.color_corrections)
+        )
+
+
+class TestCollectionBulk(unittest.TestCase):
+    """Tests the bulk constructors of ColorCollection"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def tearDown(self):
+        cdl_convert.config.HALT_ON_ERROR = False
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testFromArrays(self):
+        """Tests building corrections from parallel sequences"""
+        col = cdl_convert.ColorCollection.from_arrays(
+            ['sh010', 'sh020', 'sh030'],
+            slope=[[1.1, 1.2, 1.3], 2, None],
+            offset=[None, ('-0.1', 0, 0.1), None],
+            sat=[0.5, None, None],
+            desc=[['first', 'second'], None, []],
+        )
+
+        self.assertEqual(
+            ['sh010', 'sh020', 'sh030'],
+            [cc.id for cc in col.color_corrections]
+        )
+        self.assertEqual(
+            cdl_convert.CdlValue(
+                slope=[1.1, 1.2, 1.3], sat=0.5, desc=['first', 'second']
+            ),
+            col.color_corrections[0].value
+        )
+        self.assertEqual(
+            cdl_convert.CdlValue(slope=2, offset=['-0.1', 0, 0.1]),
+            col.color_corrections[1].value
+        )
+        self.assertTrue(col.color_corrections[0].has_sat)
+        self.assertFalse(col.color_corrections[1].has_sat)
+        self.assertFalse(col.color_corrections[2].has_sop)
+        self.assertFalse(col.color_corrections[2].has_sat)
+        for cc in col.color_corrections:
+            self.assertTrue(cc.parent is col)
+            self.assertTrue(cdl_convert.ColorCorrection.members[cc.id] is cc)
+
+    #==========================================================================
+
+    def testFromArraysStringDesc(self):
+        """Tests a single description string is kept whole"""
+        col = cdl_convert.ColorCollection.from_arrays(
+            ['a', 'b'], desc=['note', ('first', 'second')]
+        )
+
+        self.assertEqual(
+            [['note'], ['first', 'second']],
+            [cc.desc for cc in col.color_corrections]
+        )
+
+    #==========================================================================
+
+    def testFromArraysMatchesSetters(self):
+        """Tests that bulk built corrections write the same xml"""
+        col = cdl_convert.ColorCollection.from_arrays(
+            ['bulk'], slope=[[1, '1.2', 1.3]], offset=[-0.002],
+            power=[[0.9, 1, 1]], sat=[1]
+        )
+        cc = cdl_convert.ColorCorrection('slow')
+        cc.slope = [1, '1.2', 1.3]
+        cc.offset = -0.002
+        cc.power = [0.9, 1, 1]
+        cc.sat = 1
+
+        self.assertEqual(
+            cc.xml.replace(enc('slow'), enc('bulk')),
+            col.color_corrections[0].xml
+        )
+
+    #==========================================================================
+
+    def testFromArraysTolist(self):
+        """Tests that array like objects are converted with tolist"""
+
+        class Array(object):
+            """Stands in for a NumPy array"""
+            def __init__(self, values):
+                self.values = values
+
+            def tolist(self):
+                return self.values
+
+        col = cdl_convert.ColorCollection.from_arrays(
+            Array(['a', 'b']),
+            slope=Array([[1.1, 1.1, 1.1], [1.2, 1.2, 1.2]]),
+            sat=[Array(0.5), Array(0.6)],
+        )
+
+        self.assertEqual(
+            [Decimal('0.5'), Decimal('0.6')],
+            [cc.sat for cc in col.color_corrections]
+        )
+        self.assertEqual(
+            (Decimal('1.2'), ) * 3,
+            col.color_corrections[1].slope
+        )
+
+    #==========================================================================
+
+    def testFromArraysIds(self):
+        """Tests that blank and duplicate ids are renamed"""
+        existing = cdl_convert.ColorCorrection('sh010')
+
+        col = cdl_convert.ColorCollection.from_arrays(
+            ['sh010', 'sh 020', 'sh 020', '', '']
+        )
+
+        self.assertEqual(
+            ['sh010001', 'sh_020', 'sh_020001', '001', '002'],
+            [cc.id for cc in col.color_corrections]
+        )
+
+    #==========================================================================
+
+    def testFromArraysIdsHalt(self):
+        """Tests that blank and duplicate ids raise with HALT_ON_ERROR"""
+        cdl_convert.config.HALT_ON_ERROR = True
+
+        self.assertRaises(
+            ValueError,
+            cdl_convert.ColorCollection.from_arrays,
+            ['sh010', 'sh010']
+        )
+        self.assertRaises(
+            ValueError,
+            cdl_convert.ColorCollection.from_arrays,
+            ['sh010', '']
+        )
+        self.assertEqual(
+            0,
+            len(cdl_convert.ColorCorrection.members)
+        )
+
+    #==========================================================================
+
+    def testFromArraysNegative(self):
+        """Tests clamping and raising on negative values"""
+        col = cdl_convert.ColorCollection.from_arrays(
+            ['a'], slope=[[-1, 1, 1]], sat=[-0.5]
+        )
+
+        self.assertEqual(
+            (Decimal('0.0'), Decimal('1.0'), Decimal('1.0')),
+            col.color_corrections[0].slope
+        )
+        self.assertEqual(
+            Decimal('0.0'),
+            col.color_corrections[0].sat
+        )
+
+        cdl_convert.config.HALT_ON_ERROR = True
+
+        self.assertRaises(
+            ValueError,
+            cdl_convert.ColorCollection.from_arrays,
+            ['b'],
+            None,
+            None,
+            [[1, 1, -1]]
+        )
+
+    #==========================================================================
+
+    def testFromArraysBadValues(self):
+        """Tests bad lengths and bad values"""
+        self.assertRaises(
+            ValueError,
+            cdl_convert.ColorCollection.from_arrays,
+            ['a', 'b'],
+            [1.0]
+        )
+        self.assertRaises(
+            ValueError,
+            cdl_convert.ColorCollection.from_arrays,
+            ['a'],
+            [[1.0, 1.0]]
+        )
+        self.assertRaises(
+            TypeError,
+            cdl_convert.ColorCollection.from_arrays,
+            ['a'],
+            ['banana']
+        )
+        # Nothing is built if any value fails
+        self.assertEqual(
+            0,
+            len(cdl_convert.ColorCorrection.members)
+        )
+
+    #==========================================================================
+
+    def testFromRecords(self):
+        """Tests building corrections from mappings and sequences"""
+        col = cdl_convert.ColorCollection.from_records([
+            {'id': 'a', 'slope': 1.1, 'sat': 0.5, 'desc': ['note']},
+            ('b', None, [-0.1, 0, 0.1], 0.9),
+            ('c', ),
+        ])
+
+        self.assertEqual(
+            [
+                cdl_convert.CdlValue(slope=1.1, sat=0.5, desc=['note']),
+                cdl_convert.CdlValue(offset=[-0.1, 0, 0.1], power=0.9),
+                cdl_convert.CdlValue(),
+            ],
+            [cc.value for cc in col.color_corrections]
+        )
+
+    #==========================================================================
+
+    def testFromRecordsStringDesc(self):
+        """Tests a record's single description string is kept whole"""
+        col = cdl_convert.ColorCollection.from_records([
+            {'id': 'a', 'desc': 'note'},
+            ('b', None, None, None, None, 'other note'),
+        ])
+
+        self.assertEqual(
+            [['note'], ['other note']],
+            [cc.desc for cc in col.color_corrections]
+        )
+
+    #==========================================================================
+
+    def testFromRecordsTooLong(self):
+        """Tests that a sequence record can't have extra fields"""
+        self.assertRaises(
+            ValueError,
+            cdl_convert.ColorCollection.from_records,
+            [('a', 1, 0, 1, 1, [], 'extra')]
+        )
+
 # ColorCorrection =============================================================
 
 
@@ -1922,41 +2912,201 @@ class TestColorCorrection(unittest.TestCase):
             self.cc.file_out
         )
 
-# ColorCorrectionRef ====================================================
+#==============================================================================
 
 
-class TestColorCorrectionReference(unittest.TestCase):
-    """Tests the ColorCorrectionRef class"""
+class TestColorCorrectionXmlCache(unittest.TestCase):
+    """Tests the cached XML text of ColorCorrection and MediaRef"""
 
     #==========================================================================
     # SETUP & TEARDOWN
     #==========================================================================
 
     def setUp(self):
-        # Note that the file doesn't really need to exist for our test purposes
-        self.cc = cdl_convert.ColorCorrection(
-            id='uniqueId', input_file='../testcdl.cc'
-        )
-
-        self.ccr = cdl_convert.ColorCorrectionRef(id='uniqueId')
-        self.ccr_bad = cdl_convert.ColorCorrectionRef(id='oldId')
+        self.cc = cdl_convert.ColorCorrection('cached')
+        self.cc.desc = 'First'
+        self.cc.slope = [1.1, 1.2, 1.3]
+        self.cc.sat = 0.5
 
     def tearDown(self):
-        # We need to clear the ColorCorrection member dictionary so we don't
-        # have to worry about non-unique ids.
         cdl_convert.reset_all()
-        cdl_convert.config.HALT_ON_ERROR = False
 
     #==========================================================================
-    # TESTS
+    # UTILITIES
     #==========================================================================
 
-    def testCC(self):
-        """Tests that a CC is returned correctly"""
-        self.assertEqual(
-            self.cc,
-            self.ccr.cc
-        )
+    def assertFresh(self, node):
+        """Asserts cached XML matches a fresh build of the element"""
+        element = node.element
+        self.assertEqual(pretty_xml(element), node.xml_fragment())
+        self.assertEqual(pretty_xml(element, 2), node.xml_fragment(2))
+        self.assertEqual(compact_xml(element), node.xml_fragment(pretty=False))
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testBuiltOnce(self):
+        """Tests cc, ccc and cdl output all share a single build"""
+        col = cdl_convert.ColorCollection()
+        col.append_child(self.cc)
+        self.cc.xml_fragment()
+        with mock.patch.object(
+                cdl_convert.ColorCorrection, 'build_element'
+        ) as build:
+            self.cc.xml_root
+            col.set_to_ccc()
+            col.xml_root
+            col.set_to_cdl()
+            col.xml_root
+        self.assertFalse(build.called)
+
+    #==========================================================================
+
+    def testDecision(self):
+        """Tests ColorDecision fragments match their elements"""
+        media_ref = cdl_convert.MediaRef('/bobs/burgers/shot.####.dpx')
+        decision = cdl_convert.ColorDecision(self.cc, media_ref)
+        decision.desc = 'Decided'
+        decision.input_desc = 'Log'
+
+        for level in (0, 1, 3):
+            self.assertEqual(
+                pretty_xml(decision.element, level),
+                decision.xml_fragment(level)
+            )
+        self.assertEqual(
+            compact_xml(decision.element),
+            decision.xml_fragment(pretty=False)
+        )
+
+    #==========================================================================
+
+    def testDescriptionsInPlace(self):
+        """Tests descriptions changed in place invalidate the cache"""
+        self.cc.xml_fragment()
+        self.cc.desc.append('Second')
+        self.assertFresh(self.cc)
+        self.assertTrue('Second' in self.cc.xml_fragment())
+
+        self.cc.sop_node.desc.append('Sop')
+        self.assertFresh(self.cc)
+        self.assertTrue('Sop' in self.cc.xml_fragment())
+
+        self.cc.sat_node.desc.append('Sat')
+        self.assertFresh(self.cc)
+        self.assertTrue('Sat' in self.cc.xml_fragment(pretty=False))
+
+        self.cc.input_desc = 'Input'
+        self.cc.viewing_desc = 'Viewing'
+        self.assertFresh(self.cc)
+
+    #==========================================================================
+
+    def testId(self):
+        """Tests changing the id invalidates the cache"""
+        self.cc.xml_fragment(pretty=False)
+        self.cc.id = 'renamed'
+        self.assertFresh(self.cc)
+        self.assertTrue('renamed' in self.cc.xml_fragment(pretty=False))
+
+    #==========================================================================
+
+    def testMediaRef(self):
+        """Tests changing a MediaRef invalidates its cache"""
+        media_ref = cdl_convert.MediaRef('/bobs/burgers/shot.####.dpx')
+        self.assertFresh(media_ref)
+        media_ref.ref = '/bobs/fries/shot.####.dpx'
+        self.assertFresh(media_ref)
+        media_ref.filename = 'plate.####.exr'
+        self.assertFresh(media_ref)
+        self.assertTrue('plate' in media_ref.xml_fragment(1))
+
+    #==========================================================================
+
+    def testMultilineText(self):
+        """Tests descriptions holding newlines are not indented as text"""
+        self.cc.desc.append('Two\nLines')
+        self.assertFresh(self.cc)
+        self.assertEqual(
+            pretty_xml(self.cc.element, 1),
+            self.cc.xml_fragment(1)
+        )
+
+    #==========================================================================
+
+    def testPrecision(self):
+        """Tests changing config.NUMBER_PRECISION invalidates the cache"""
+        self.cc.xml_fragment()
+
+        cdl_convert.config.NUMBER_PRECISION = 3
+        try:
+            self.assertFresh(self.cc)
+            self.assertTrue(
+                '<Slope>1.100 1.200 1.300</Slope>' in self.cc.xml_fragment()
+            )
+        finally:
+            cdl_convert.config.NUMBER_PRECISION = None
+
+        self.assertFresh(self.cc)
+        self.assertTrue(
+            '<Slope>1.1 1.2 1.3</Slope>' in self.cc.xml_fragment()
+        )
+
+    #==========================================================================
+
+    def testValues(self):
+        """Tests the SOP and Sat setters invalidate the cache"""
+        self.cc.xml_fragment()
+        self.cc.xml_fragment(pretty=False)
+
+        self.cc.slope = [2.1, 2.2, 2.3]
+        self.assertFresh(self.cc)
+        self.assertTrue('2.1' in self.cc.xml_fragment())
+
+        self.cc.offset = [0.1, 0.2, 0.3]
+        self.cc.power = [0.9, 0.8, 0.7]
+        self.assertFresh(self.cc)
+
+        self.cc.sat = 0.25
+        self.assertFresh(self.cc)
+        self.assertTrue('0.25' in self.cc.xml_fragment(1, False))
+
+# ColorCorrectionRef ====================================================
+
+
+class TestColorCorrectionReference(unittest.TestCase):
+    """Tests the ColorCorrectionRef class"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        # Note that the file doesn't really need to exist for our test purposes
+        self.cc = cdl_convert.ColorCorrection(
+            id='uniqueId', input_file='../testcdl.cc'
+        )
+
+        self.ccr = cdl_convert.ColorCorrectionRef(id='uniqueId')
+        self.ccr_bad = cdl_convert.ColorCorrectionRef(id='oldId')
+
+    def tearDown(self):
+        # We need to clear the ColorCorrection member dictionary so we don't
+        # have to worry about non-unique ids.
+        cdl_convert.reset_all()
+        cdl_convert.config.HALT_ON_ERROR = False
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testCC(self):
+        """Tests that a CC is returned correctly"""
+        self.assertEqual(
+            self.cc,
+            self.ccr.cc
+        )
 
         self.assertEqual(
             None,
@@ -3242,6 +4392,247 @@ class TestMediaRefGetSequencesPercentDigitUnderscore(TestMediaRefGetSequences):
 
         self.is_seq = True
 
+# Pickling ====================================================================
+
+
+class TestPickling(unittest.TestCase):
+    """Tests that the object model survives a pickle round trip"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        self.cc = cdl_convert.ColorCorrection('uniqueId', 'bobs_file.cc')
+        self.cc.desc = ['CC description 1', 'CC description 2']
+        self.cc.input_desc = 'Input Desc Text'
+        self.cc.viewing_desc = 'Viewing Desc Text'
+        self.cc.slope = [1.014, 1.0104, 0.62]
+        self.cc.offset = [-0.00315, -0.00124, 0.3103]
+        self.cc.power = [1.0, 0.9983, 1.0]
+        self.cc.sop_node.desc = 'Sop description'
+        self.cc.sat = 1.09
+        self.cc.sat_node.desc = 'Sat description'
+
+        self.cc2 = cdl_convert.ColorCorrection('otherId')
+        self.cc2.sat = 0.5
+
+        self.cd = cdl_convert.ColorDecision(
+            self.cc2, cdl_convert.MediaRef('/best/path/ever.dpx')
+        )
+        self.cd.desc = 'CD description'
+        self.cd_ref = cdl_convert.ColorDecision(
+            cdl_convert.ColorCorrectionRef('uniqueId'),
+            cdl_convert.MediaRef('relative/path/13.jpg')
+        )
+
+        self.col = cdl_convert.ColorCollection('bobs_file.cdl')
+        self.col.desc = 'Collection description'
+        self.col.input_desc = 'Collection Input'
+        self.col.set_to_cdl()
+        self.col.append_children([self.cc, self.cd, self.cd_ref])
+
+    def tearDown(self):
+        cdl_convert.reset_all()
+        cdl_convert.config.HALT_ON_ERROR = False
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testColorCorrection(self):
+        """Tests that a ColorCorrection round trips all of its values"""
+        cdl_convert.reset_all()
+        cc = pickle.loads(pickle.dumps(self.cc, pickle.HIGHEST_PROTOCOL))
+
+        self.assertEqual(
+            'uniqueId',
+            cc.id
+        )
+        self.assertEqual(
+            cc,
+            cdl_convert.ColorCorrection.members['uniqueId']
+        )
+        self.assertEqual(
+            self.cc.xml_root,
+            cc.xml_root
+        )
+        self.assertEqual(
+            self.cc.file_in,
+            cc.file_in
+        )
+        self.assertEqual(
+            self.cc.slope,
+            cc.slope
+        )
+        self.assertEqual(
+            cc,
+            cc.sop_node.parent
+        )
+        self.assertEqual(
+            cc,
+            cc.sat_node.parent
+        )
+        self.assertEqual(
+            None,
+            cc.parent
+        )
+
+    #==========================================================================
+
+    def testColorCorrectionCollision(self):
+        """Tests that a loaded duplicate id is renamed like a new instance"""
+        cc = pickle.loads(pickle.dumps(self.cc))
+
+        self.assertEqual(
+            'uniqueId001',
+            cc.id
+        )
+        self.assertEqual(
+            self.cc.sat,
+            cc.sat
+        )
+
+        cdl_convert.config.HALT_ON_ERROR = True
+
+        self.assertRaises(
+            ValueError,
+            pickle.loads,
+            pickle.dumps(self.cc)
+        )
+
+    #==========================================================================
+
+    def testCollection(self):
+        """Tests that a collection round trips children and parentage"""
+        data = pickle.dumps(self.col, pickle.HIGHEST_PROTOCOL)
+        xml_root = self.col.xml_root
+        del self.col, self.cc, self.cc2, self.cd, self.cd_ref
+        cdl_convert.reset_all()
+
+        col = pickle.loads(data)
+
+        self.assertEqual(
+            'cdl',
+            col.type
+        )
+        for child in col.all_children:
+            self.assertEqual(
+                col,
+                child.parent
+            )
+        cd, cd_ref = col.color_decisions
+        self.assertEqual(
+            cd,
+            cd.cc.parent
+        )
+        self.assertEqual(
+            cd,
+            cd.media_ref.parent
+        )
+        self.assertEqual(
+            col.color_corrections[0],
+            cd_ref.cc.cc
+        )
+        self.assertEqual(
+            {'otherId': [cd], 'uniqueId': [cd_ref]},
+            cdl_convert.ColorDecision.members
+        )
+        self.assertEqual(
+            {'uniqueId': [cd_ref.cc]},
+            cdl_convert.ColorCorrectionRef.members
+        )
+        self.assertEqual(
+            0,
+            cdl_convert.ColorCollection.members.index(col)
+        )
+        self.assertEqual(
+            xml_root,
+            col.xml_root
+        )
+
+    #==========================================================================
+
+    def testCollectionCollision(self):
+        """Tests that references follow a correction renamed on load"""
+        col = pickle.loads(pickle.dumps(self.col))
+
+        cc = col.color_corrections[0]
+        cd_ref = col.color_decisions[1]
+
+        self.assertEqual(
+            'uniqueId001',
+            cc.id
+        )
+        self.assertEqual(
+            'uniqueId001',
+            cd_ref.cc.id
+        )
+        self.assertEqual(
+            cc,
+            cd_ref.cc.cc
+        )
+
+    #==========================================================================
+
+    def testDecisionAlone(self):
+        """Tests a reference loaded without its collection still resolves"""
+        cd_ref = pickle.loads(pickle.dumps(self.cd_ref))
+        gc.collect()
+
+        self.assertEqual(
+            'uniqueId001',
+            cd_ref.cc.id
+        )
+        self.assertEqual(
+            self.cc.slope,
+            cd_ref.cc.cc.slope
+        )
+
+        cd_ref.cc.id = 'otherId'
+
+        self.assertEqual(
+            self.cc2,
+            cd_ref.cc.cc
+        )
+
+    #==========================================================================
+
+    def testDecisionAloneNewProcess(self):
+        """Tests a lone reference resolves when loaded by a new interpreter"""
+        script = (
+            'import gc, pickle, sys\n'
+            'sys.path.insert(0, {root!r})\n'
+            'cd = pickle.loads({data!r})\n'
+            'gc.collect()\n'
+            'print(cd.cc.cc.id)\n'
+        ).format(
+            root='/'.join(os.path.realpath(__file__).split('/')[:-2]),
+            data=pickle.dumps(self.cd_ref, 2)
+        )
+
+        out = subprocess.check_output([sys.executable, '-c', script])
+
+        self.assertEqual(
+            b'uniqueId',
+            out.strip()
+        )
+
+    #==========================================================================
+
+    def testMediaRef(self):
+        """Tests that a MediaRef round trips and is registered"""
+        media_ref = pickle.loads(pickle.dumps(self.cd.media_ref))
+
+        self.assertEqual(
+            '/best/path/ever.dpx',
+            media_ref.ref
+        )
+        self.assertEqual(
+            [self.cd.media_ref, media_ref],
+            cdl_convert.MediaRef.members['/best/path/ever.dpx']
+        )
+
 # SatNode =====================================================================
 
 
@@ -4070,6 +5461,469 @@ class TestSopNode(unittest.TestCase):
             self.node.power
         )
 
+# WeakMembers =================================================================
+
+
+class TestWeakMembers(unittest.TestCase):
+    """Tests that class level member registries do not keep members alive"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+
+    def tearDown(self):
+        cdl_convert.reset_all()
+        cdl_convert.config.HALT_ON_ERROR = False
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testColorCorrectionDropped(self):
+        """Tests that a collected ColorCorrection frees up its id"""
+        cc = cdl_convert.ColorCorrection('uniqueId')
+        cc.slope = 1.2
+
+        self.assertTrue(
+            'uniqueId' in cdl_convert.ColorCorrection.members
+        )
+
+        del cc
+        gc.collect()
+
+        self.assertFalse(
+            'uniqueId' in cdl_convert.ColorCorrection.members
+        )
+
+        cc = cdl_convert.ColorCorrection('uniqueId')
+
+        self.assertEqual(
+            'uniqueId',
+            cc.id
+        )
+
+    #==========================================================================
+
+    def testColorCorrectionDroppedWithoutCollect(self):
+        """Tests that a discarded ColorCorrection frees its id at once"""
+        gc.disable()
+        self.addCleanup(gc.enable)
+
+        cc = cdl_convert.ColorCorrection('uniqueId')
+        cc.slope = [1.1, 1.2, 1.3]
+        cc.sat = 0.9
+        del cc
+
+        self.assertFalse(
+            'uniqueId' in cdl_convert.ColorCorrection.members
+        )
+
+        cc = cdl_convert.ColorCorrection('uniqueId')
+
+        self.assertEqual(
+            'uniqueId',
+            cc.id
+        )
+
+    #==========================================================================
+
+    def testDecisionDroppedWithoutCollect(self):
+        """Tests that a discarded decision and collection free ids at once"""
+        gc.disable()
+        self.addCleanup(gc.enable)
+
+        cc = cdl_convert.ColorCorrection('uniqueId')
+        cc.slope = [1.1, 1.2, 1.3]
+        cd = cdl_convert.ColorDecision(
+            cc, cdl_convert.MediaRef('/best/path/ever.dpx')
+        )
+        col = cdl_convert.ColorCollection()
+        col.append_child(cd)
+
+        self.assertEqual(
+            cd,
+            cc.parent
+        )
+
+        del cc, cd, col
+
+        self.assertEqual(
+            {},
+            dict(cdl_convert.ColorCorrection.members)
+        )
+        self.assertEqual(
+            {},
+            cdl_convert.MediaRef.members
+        )
+        self.assertEqual(
+            0,
+            len(cdl_convert.ColorCollection.members)
+        )
+
+        cc = cdl_convert.ColorCorrection('uniqueId')
+
+        self.assertEqual(
+            'uniqueId',
+            cc.id
+        )
+
+    #==========================================================================
+
+    def testParentHeldWeakly(self):
+        """Tests that a child's parent is None once the parent is freed"""
+        cc = cdl_convert.ColorCorrection('uniqueId')
+        cc.slope = 1.2
+        sop = cc.sop_node
+        cd = cdl_convert.ColorDecision(cc)
+
+        del cd
+
+        self.assertEqual(
+            None,
+            cc.parent
+        )
+
+        del cc
+
+        self.assertEqual(
+            None,
+            sop.parent
+        )
+
+    #==========================================================================
+
+    def testColorCorrectionCollisionWhileAlive(self):
+        """Tests that id collisions still rename while the original lives"""
+        cc = cdl_convert.ColorCorrection('uniqueId')
+        cc2 = cdl_convert.ColorCorrection('uniqueId')
+
+        self.assertEqual(
+            'uniqueId001',
+            cc2.id
+        )
+
+        cdl_convert.config.HALT_ON_ERROR = True
+
+        self.assertRaises(
+            ValueError,
+            cdl_convert.ColorCorrection,
+            'uniqueId'
+        )
+
+        self.assertEqual(
+            cc,
+            cdl_convert.ColorCorrection.members['uniqueId']
+        )
+
+    #==========================================================================
+
+    def testReferenceResolution(self):
+        """Tests that references keep the correction they resolve to alive"""
+        cc = cdl_convert.ColorCorrection('uniqueId')
+        ccr = cdl_convert.ColorCorrectionRef('uniqueId')
+
+        del cc
+        gc.collect()
+
+        self.assertEqual(
+            'uniqueId',
+            ccr.cc.id
+        )
+
+        del ccr
+        gc.collect()
+
+        self.assertFalse(
+            'uniqueId' in cdl_convert.ColorCorrection.members
+        )
+
+    #==========================================================================
+
+    def testReferenceResolutionLater(self):
+        """Tests that references hold a correction registered after them"""
+        ccr = cdl_convert.ColorCorrectionRef('uniqueId')
+        cdl_convert.ColorCorrection('uniqueId').slope = 1.2
+        gc.collect()
+
+        self.assertEqual(
+            (Decimal('1.2'), ) * 3,
+            ccr.cc.slope
+        )
+
+        # Renaming the correction lets the reference let go of it
+        ccr.cc.id = 'renamed'
+        gc.collect()
+
+        self.assertFalse(
+            'renamed' in cdl_convert.ColorCorrection.members
+        )
+        self.assertEqual(
+            None,
+            ccr.cc
+        )
+
+    #==========================================================================
+
+    def testRepeatedCyclesFreeIds(self):
+        """Tests that ids are freed cycle after cycle without reset_all"""
+        gc.disable()
+        self.addCleanup(gc.enable)
+
+        for i in range(2000):
+            cc = cdl_convert.ColorCorrection('soak')
+            cc.slope = [1.1, 1.2, 1.3]
+            cc.sat = 0.9
+            cd = cdl_convert.ColorDecision(
+                cdl_convert.ColorCorrectionRef('soak'),
+                cdl_convert.MediaRef('/soak/{0}.####.dpx'.format(i))
+            )
+            col = cdl_convert.ColorCollection()
+            col.append_children([cc, cd])
+            del cc, cd
+
+            # Each cycle gets the same id, so the last one was freed
+            self.assertEqual(
+                'soak',
+                col.color_corrections[0].id
+            )
+
+            del col
+
+        self.assertEqual(
+            {},
+            dict(cdl_convert.ColorCorrection.members)
+        )
+        self.assertEqual(
+            {},
+            cdl_convert.ColorCorrectionRef.members
+        )
+        self.assertEqual(
+            {},
+            cdl_convert.ColorDecision.members
+        )
+        self.assertEqual(
+            {},
+            cdl_convert.MediaRef.members
+        )
+        self.assertEqual(
+            0,
+            len(cdl_convert.ColorCollection.members)
+        )
+
+    #==========================================================================
+
+    def testDecisionsDropped(self):
+        """Tests that decisions, refs and media refs drop out when collected"""
+        cc = cdl_convert.ColorCorrection('uniqueId')
+        cd = cdl_convert.ColorDecision(
+            cdl_convert.ColorCorrectionRef('uniqueId'),
+            cdl_convert.MediaRef('/best/path/ever.dpx')
+        )
+
+        self.assertEqual(
+            {'uniqueId': [cd]},
+            cdl_convert.ColorDecision.members
+        )
+        self.assertEqual(
+            {'uniqueId': [cd.cc]},
+            cdl_convert.ColorCorrectionRef.members
+        )
+        self.assertEqual(
+            {'/best/path/ever.dpx': [cd.media_ref]},
+            cdl_convert.MediaRef.members
+        )
+
+        del cd
+        gc.collect()
+
+        self.assertEqual(
+            {},
+            cdl_convert.ColorDecision.members
+        )
+        self.assertEqual(
+            {},
+            cdl_convert.ColorCorrectionRef.members
+        )
+        self.assertEqual(
+            {},
+            cdl_convert.MediaRef.members
+        )
+        self.assertEqual(
+            ['uniqueId'],
+            list(cdl_convert.ColorCorrection.members.keys())
+        )
+
+    #==========================================================================
+
+    def testCollectionIndexStable(self):
+        """Tests that collections keep their index after others are collected"""
+        cdl_convert.ColorCollection()
+        cdl_convert.ColorCollection()
+        col = cdl_convert.ColorCollection()
+        gc.collect()
+
+        self.assertEqual(
+            1,
+            len(cdl_convert.ColorCollection.members)
+        )
+
+        self.assertEqual(
+            2,
+            cdl_convert.ColorCollection.members.index(col)
+        )
+
+    #==========================================================================
+
+    def testManyCycles(self):
+        """Tests that registries stay flat over many create/discard cycles"""
+        for i in range(5000):
+            cc = cdl_convert.ColorCorrection('cc{0}'.format(i % 10))
+            cc.slope = [1.1, 1.2, 1.3]
+            cc.sat = 0.9
+            cd = cdl_convert.ColorDecision(cc)
+            cd.media_ref = cdl_convert.MediaRef('/path/{0}.dpx'.format(i))
+            col = cdl_convert.ColorCollection()
+            col.append_child(cd)
+        del cc, cd, col
+        gc.collect()
+
+        self.assertEqual(
+            0,
+            len(cdl_convert.ColorCorrection.members)
+        )
+        self.assertEqual(
+            0,
+            len(cdl_convert.ColorDecision.members)
+        )
+        self.assertEqual(
+            0,
+            len(cdl_convert.MediaRef.members)
+        )
+        self.assertEqual(
+            0,
+            len(cdl_convert.ColorCollection.members)
+        )
+
+# WeakMemberLists =============================================================
+
+
+class TestWeakMemberLists(unittest.TestCase):
+    """Tests the weak key to list registry directly"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        self.members = WeakMemberLists()
+        self.node = AscDescBase()
+        self.node2 = AscDescBase()
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testAddDiscard(self):
+        """Tests adding and discarding members"""
+        self.members.add('hello', self.node)
+        self.members.add('hello', self.node2)
+
+        self.assertEqual(
+            {'hello': [self.node, self.node2]},
+            self.members
+        )
+
+        self.members.discard('hello', self.node)
+        # Discarding something not registered does nothing
+        self.members.discard('hello', self.node)
+        self.members.discard('goodbye', self.node)
+
+        self.assertEqual(
+            {'hello': [self.node2]},
+            self.members
+        )
+
+        self.members.discard('hello', self.node2)
+
+        self.assertFalse(
+            'hello' in self.members
+        )
+
+    #==========================================================================
+
+    def testSetItem(self):
+        """Tests setting and deleting a full list"""
+        self.members['hello'] = [self.node, self.node2]
+
+        self.assertEqual(
+            [self.node, self.node2],
+            self.members['hello']
+        )
+
+        del self.members['hello']
+
+        self.assertEqual(
+            0,
+            len(self.members)
+        )
+
+    #==========================================================================
+
+    def testPrune(self):
+        """Tests that collected members are removed along with empty keys"""
+        self.members.add('hello', self.node)
+        self.members.add('goodbye', self.node2)
+
+        del self.node2
+        gc.collect()
+
+        self.assertEqual(
+            {'hello': [self.node]},
+            self.members
+        )
+
+# WeakMemberList ==============================================================
+
+
+class TestWeakMemberList(unittest.TestCase):
+    """Tests the ordered weak registry directly"""
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testIndex(self):
+        """Tests that index and iteration follow registration order"""
+        nodes = [AscDescBase() for i in range(4)]
+        members = WeakMemberList()
+        for node in nodes:
+            members.append(node)
+
+        self.assertEqual(
+            nodes,
+            list(members)
+        )
+
+        del nodes[1]
+        gc.collect()
+
+        self.assertEqual(
+            3,
+            len(members)
+        )
+        self.assertEqual(
+            3,
+            members.index(nodes[2])
+        )
+        self.assertRaises(
+            ValueError,
+            members.index,
+            AscDescBase()
+        )
+
 #==============================================================================
 # RUNNER
 #==============================================================================
@@ -0,0 +1,442 @@
+#!/usr/bin/env python
+"""
+Tests the csv format of cdl_convert
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+# Standard Imports
+from decimal import Decimal
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Grab our test's path and append the cdL_convert root directory
+
+# There has to be a better method than:
+# 1) Getting our current directory
+# 2) Splitting into list
+# 3) Splicing out the last 3 entries (filepath, test dir, tools dir)
+# 4) Joining
+# 5) Appending to our Python path.
+
+sys.path.append('/'.join(os.path.realpath(__file__).split('/')[:-2]))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+enc = lambda x: x.encode('UTF-8')
+
+CSV_FULL = (
+    u'id,slope_r,slope_g,slope_b,offset_r,offset_g,offset_b,power_r,power_g,'
+    u'power_b,sat,desc\r\n'
+    u'sh010,1.1,1.00,0.0000000000000000113,-0.0125,0.0,0.0,1.0,1.0,1.0,0.8,'
+    u'"First\nCaf\xe9"\r\n'
+    u'virgin,,,,,,,,,,,\r\n'
+    u'held,,,,,,,,,,0.5,Held\r\n'
+)
+
+# Excel starts UTF-8 csv files with a byte order mark
+CSV_SPREADSHEET = (
+    u'\ufeffNotes,Shot,ASC_SOP,Saturation\r\n'
+    u'tweak,sh010,(1.1 1.0 0.9)(0.01 0 -0.02)(1 1 1),0.8\r\n'
+    u',,,\r\n'
+    u'keep,sh020,,1.2\r\n'
+)
+
+#==============================================================================
+# TEST CLASSES
+#==============================================================================
+
+# parse_csv ===================================================================
+
+
+class TestParseCsv(unittest.TestCase):
+    """Tests reading corrections from csv files"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'grades.csv')
+        self.write(CSV_FULL)
+
+    #==========================================================================
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def write(self, text):
+        """Writes text to the test file"""
+        with open(self.path, 'wb') as csv_f:
+            csv_f.write(enc(text))
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testBadValues(self):
+        """Tests bad values raise errors naming the row"""
+        for text, columns in [
+                (u'id,sat\nsh010,1\nsh020,abc\n', None),
+                (u'id,slope\nsh010,1\nsh020,1 2\n', {'slope': 'slope'}),
+                (u'id,sop\nsh010,(1 1 1)(0 0 0)(1 1 1)\nsh020,(1 1 1)\n',
+                 {'sop': 'sop'})]:
+            cdl_convert.reset_all()
+            self.write(text)
+
+            try:
+                cdl_convert.parse_csv(self.path, columns)
+            except (TypeError, ValueError) as err:
+                self.assertTrue(
+                    'row 3' in str(err)
+                )
+            else:
+                self.fail('No error raised for: ' + text)
+
+    #==========================================================================
+
+    def testBadColumns(self):
+        """Tests unknown fields and a missing id column raise ValueError"""
+        self.assertRaises(
+            ValueError,
+            cdl_convert.parse_csv,
+            self.path,
+            {'hue': 'Hue'}
+        )
+        self.assertRaises(
+            ValueError,
+            cdl_convert.parse_csv,
+            self.path,
+            {'id': 'Shot'}
+        )
+
+    #==========================================================================
+
+    def testCorrections(self):
+        """Tests every field of a row is read"""
+        col = cdl_convert.parse_csv(self.path)
+        sh010, virgin, held = col.color_corrections
+
+        self.assertEqual(
+            ['sh010', 'virgin', 'held'],
+            [cc.id for cc in col.color_corrections]
+        )
+        self.assertEqual(
+            (Decimal('1.1'), Decimal('1.00'), Decimal('1.13E-17')),
+            sh010.slope
+        )
+        self.assertEqual(
+            Decimal('-0.0125'),
+            sh010.offset[0]
+        )
+        self.assertEqual(
+            Decimal('0.8'),
+            sh010.sat
+        )
+        self.assertEqual(
+            ['First', u'Caf\xe9'],
+            [desc if isinstance(desc, type(u'')) else desc.decode('UTF-8')
+             for desc in sh010.desc]
+        )
+        self.assertEqual(
+            self.path,
+            sh010.file_in
+        )
+        self.assertTrue(
+            sh010.parent is col
+        )
+        self.assertTrue(
+            virgin._sop_node is None and virgin._sat_node is None
+        )
+        self.assertTrue(
+            held._sop_node is None
+        )
+        self.assertEqual(
+            ['Held'],
+            held.desc
+        )
+
+    #==========================================================================
+
+    def testChunks(self):
+        """Tests rows are yielded a chunk at a time, keeping their order"""
+        self.write(
+            u'id,sat\n' +
+            u''.join(u'sh{0:03d},0.{0}\n'.format(i) for i in range(25)) +
+            u'sh025,bad\n'
+        )
+        corrections = []
+        chunk_size = cdl_convert.parse._CSV_CHUNK_SIZE
+        cdl_convert.parse._CSV_CHUNK_SIZE = 10
+        try:
+            # The bad value is only checked with the last chunk
+            for cc in cdl_convert.iter_csv(self.path):
+                corrections.append(cc)
+        except TypeError:
+            pass
+        finally:
+            cdl_convert.parse._CSV_CHUNK_SIZE = chunk_size
+
+        self.assertEqual(
+            ['sh{0:03d}'.format(i) for i in range(20)],
+            [cc.id for cc in corrections]
+        )
+        self.assertEqual(
+            Decimal('0.19'),
+            corrections[19].sat
+        )
+
+    #==========================================================================
+
+    def testChunksDuplicateIds(self):
+        """Tests an id repeated in a later chunk is renamed"""
+        self.write(
+            u'id,sat\n' +
+            u''.join(u'sh{0:03d},0.{0}\n'.format(i % 10) for i in range(12))
+        )
+        chunk_size = cdl_convert.parse._CSV_CHUNK_SIZE
+        cdl_convert.parse._CSV_CHUNK_SIZE = 10
+        try:
+            # The corrections aren't kept, so they leave the registry
+            ids = [cc.id for cc in cdl_convert.iter_csv(self.path)]
+        finally:
+            cdl_convert.parse._CSV_CHUNK_SIZE = chunk_size
+
+        self.assertEqual(
+            ['sh{0:03d}'.format(i) for i in range(10)] +
+            ['sh000001', 'sh001001'],
+            ids
+        )
+
+    #==========================================================================
+
+    def testColumns(self):
+        """Tests a spreadsheet is read through a column mapping"""
+        self.write(CSV_SPREADSHEET)
+        col = cdl_convert.parse_csv(
+            self.path, {'id': 'Shot', 'sop': 'ASC_SOP', 'sat': 'Saturation'}
+        )
+        sh010, sh020 = col.color_corrections
+
+        self.assertEqual(
+            ['sh010', 'sh020'],
+            [cc.id for cc in col.color_corrections]
+        )
+        self.assertEqual(
+            (Decimal('0.01'), Decimal('0.0'), Decimal('-0.02')),
+            sh010.offset
+        )
+        self.assertEqual(
+            Decimal('1.2'),
+            sh020.sat
+        )
+        self.assertTrue(
+            sh020._sop_node is None
+        )
+
+    #==========================================================================
+
+    def testConfigColumns(self):
+        """Tests the mapping defaults to config.CSV_COLUMNS"""
+        self.write(CSV_SPREADSHEET)
+        cdl_convert.config.CSV_COLUMNS = {
+            'id': 'Shot', 'sop': 'ASC_SOP', 'sat': 'Saturation'
+        }
+        try:
+            col = cdl_convert.parse_file(self.path)
+        finally:
+            cdl_convert.config.CSV_COLUMNS = None
+
+        self.assertEqual(
+            ['sh010', 'sh020'],
+            [cc.id for cc in col.color_corrections]
+        )
+
+    #==========================================================================
+
+    def testPartialRgb(self):
+        """Tests an rgb value missing a channel raises ValueError"""
+        self.write(
+            u'id,slope_r,slope_g,slope_b\nsh010,1,1,1\nsh020,1.1,,0.9\n'
+        )
+
+        try:
+            cdl_convert.parse_csv(self.path)
+        except ValueError as err:
+            self.assertTrue(
+                'slope_g on row 3' in str(err)
+            )
+        else:
+            self.fail('No ValueError raised for a partial slope.')
+
+    #==========================================================================
+
+    def testHalt(self):
+        """Tests negative values are clamped unless halting on errors"""
+        self.write(u'id,slope\nsh010,-1 1 1\n')
+
+        self.assertEqual(
+            Decimal('0.0'),
+            cdl_convert.parse_csv(
+                self.path, {'slope': 'slope'}
+            ).color_corrections[0].slope[0]
+        )
+
+        cdl_convert.reset_all()
+        cdl_convert.config.HALT_ON_ERROR = True
+        try:
+            self.assertRaises(
+                ValueError,
+                cdl_convert.parse_csv,
+                self.path,
+                {'slope': 'slope'}
+            )
+        finally:
+            cdl_convert.config.HALT_ON_ERROR = False
+
+# write_csv ===================================================================
+
+
+class TestWriteCsv(unittest.TestCase):
+    """Tests writing corrections as csv"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'grades.csv')
+        with open(self.path, 'wb') as csv_f:
+            csv_f.write(enc(CSV_FULL))
+        self.col = cdl_convert.parse_csv(self.path)
+        os.remove(self.path)
+        self.col._file_out = self.path
+
+    #==========================================================================
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def read(self):
+        """Returns the bytes of the test file"""
+        with open(self.path, 'rb') as csv_f:
+            return csv_f.read()
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testColumns(self):
+        """Tests renamed and grouped columns are read back the same"""
+        columns = {'id': 'Shot', 'sop': 'ASC_SOP', 'desc': 'Notes'}
+        cdl_convert.write_csv(self.col, columns=columns)
+
+        self.assertTrue(
+            self.read().startswith(
+                b'Shot,ASC_SOP,sat,Notes\r\n'
+                b'sh010,(1.1 1.00 0.0000000000000000113)(-0.0125 0.0 0.0)'
+                b'(1.0 1.0 1.0),0.8,'
+            )
+        )
+
+        cdl_convert.reset_all()
+        col = cdl_convert.parse_csv(self.path, columns)
+
+        self.assertEqual(
+            (Decimal('1.1'), Decimal('1.00'), Decimal('1.13E-17')),
+            col.color_corrections[0].slope
+        )
+
+    #==========================================================================
+
+    def testDecisions(self):
+        """Tests decisions are written as their corrections"""
+        virgin = self.col.color_corrections.pop(1)
+        self.col.append_child(cdl_convert.ColorDecision(virgin))
+
+        cdl_convert.write_csv(self.col)
+
+        self.assertEqual(
+            [b'id', b'sh010', b'held', b'virgin'],
+            [line.split(b',')[0] for line in self.read().split(b'\r\n')
+             if line and not line.startswith(b'Caf')]
+        )
+
+    #==========================================================================
+
+    def testDumpMatchesWrite(self):
+        """Tests single file and archive writers get the same bytes"""
+        cdl_convert.write_csv(self.col)
+
+        self.assertEqual(
+            self.read(),
+            cdl_convert.write._DUMP_FORMATS['csv'](self.col)
+        )
+
+    #==========================================================================
+
+    def testPrecision(self):
+        """Tests values are rounded by NUMBER_PRECISION"""
+        cdl_convert.config.NUMBER_PRECISION = 2
+        try:
+            cdl_convert.write_csv(self.col)
+        finally:
+            cdl_convert.config.NUMBER_PRECISION = None
+
+        self.assertTrue(
+            self.read().split(b'\r\n')[1].startswith(
+                b'sh010,1.10,1.00,0.00,-0.01,0.00,0.00,1.00,1.00,1.00,0.80,'
+            )
+        )
+
+    #==========================================================================
+
+    def testRoundTrip(self):
+        """Tests the written file matches the file read, byte for byte"""
+        self.assertTrue(
+            cdl_convert.write_csv(self.col)
+        )
+
+        self.assertEqual(
+            enc(CSV_FULL),
+            self.read()
+        )
+
+    #==========================================================================
+
+    def testSkipUnchanged(self):
+        """Tests an unchanged file is skipped"""
+        cdl_convert.write_csv(self.col)
+
+        self.assertFalse(
+            cdl_convert.write_csv(self.col, skip_unchanged=True)
+        )
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+"""
+Tests writing many formats in one walk with write_fanout
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+# Standard Imports
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Grab our test's path and append the cdL_convert root directory
+
+# There has to be a better method than:
+# 1) Getting our current directory
+# 2) Splitting into list
+# 3) Splicing out the last 3 entries (filepath, test dir, tools dir)
+# 4) Joining
+# 5) Appending to our Python path.
+
+sys.path.append('/'.join(os.path.realpath(__file__).split('/')[:-2]))
+
+import cdl_convert
+
+#==============================================================================
+# TEST CLASSES
+#==============================================================================
+
+# write_fanout ================================================================
+
+
+class TestWriteFanout(unittest.TestCase):
+    """Tests every format written in one walk matches its own writer"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.directory = tempfile.mkdtemp()
+
+        self.col = cdl_convert.ColorCollection()
+        self.col.desc = 'Reel 1'
+        self.col.input_desc = 'LogC'
+        self.bare = cdl_convert.ColorCorrection('bare')
+        self.bare.slope = [1.1, 1.0, 0.9]
+        self.bare.desc = 'Bare'
+        self.held = cdl_convert.ColorCorrection('held')
+        self.held.sat = 0.5
+        self.col.append_child(self.bare)
+        self.col.append_child(
+            cdl_convert.ColorDecision(
+                self.held, cdl_convert.MediaRef('/shots/sh010.####.dpx')
+            )
+        )
+        self.col.append_child(
+            cdl_convert.ColorDecision(cdl_convert.ColorCorrectionRef('bare'))
+        )
+
+        self.outputs = dict(
+            (ext, self.path('fanout', ext))
+            for ext in cdl_convert.write.FANOUT_FORMATS
+        )
+
+    #==========================================================================
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def path(self, name, ext):
+        """Returns the path of a file in the test directory"""
+        return os.path.join(self.directory, '{0}.{1}'.format(name, ext))
+
+    #==========================================================================
+
+    def read(self, path):
+        """Returns the bytes of a file"""
+        with open(path, 'rb') as cdl_f:
+            return cdl_f.read()
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testBadFormat(self):
+        """Tests formats which can't be streamed raise ValueError"""
+        self.assertRaises(
+            ValueError,
+            cdl_convert.write_fanout,
+            self.col,
+            {'ccc': self.path('fanout', 'ccc'), 'cdlb': self.path('x', 'cdlb')}
+        )
+        self.assertFalse(
+            os.path.exists(self.path('fanout', 'ccc'))
+        )
+
+    #==========================================================================
+
+    def testCorrection(self):
+        """Tests a correction is written as a collection holding it"""
+        self.bare._file_out = self.path('single', 'ccc')
+        cdl_convert.write_ccc(self.bare)
+
+        cdl_convert.write_fanout(self.bare, {'ccc': self.outputs['ccc']})
+
+        self.assertEqual(
+            self.read(self.path('single', 'ccc')),
+            self.read(self.outputs['ccc'])
+        )
+
+    #==========================================================================
+
+    def testEach(self):
+        """Tests each is called once with every correction held"""
+        seen = []
+
+        cdl_convert.write_fanout(
+            self.col, {'cdl': self.outputs['cdl']}, each=seen.append
+        )
+
+        self.assertEqual(
+            [self.bare, self.held],
+            seen
+        )
+
+    #==========================================================================
+
+    def testError(self):
+        """Tests a failed walk leaves no temporary files behind"""
+        def fail(cdl):
+            """Raises while the files are open"""
+            raise RuntimeError(cdl.id)
+
+        for skip_unchanged in [True, False]:
+            self.assertRaises(
+                RuntimeError,
+                cdl_convert.write_fanout,
+                self.col,
+                self.outputs,
+                skip_unchanged=skip_unchanged,
+                each=fail
+            )
+
+        self.assertEqual(
+            [],
+            [name for name in os.listdir(self.directory)
+             if name.endswith('.tmp')]
+        )
+
+    #==========================================================================
+
+    def testMatchesWriters(self):
+        """Tests each file holds the bytes its own writer writes"""
+        for pretty in [True, False]:
+            self.assertEqual(
+                dict((ext, True) for ext in self.outputs),
+                cdl_convert.write_fanout(self.col, self.outputs, pretty)
+            )
+
+            for ext in self.outputs:
+                self.col._file_out = self.path('writer', ext)
+                if ext in ['ccc', 'cdl']:
+                    cdl_convert.write.OUTPUT_FORMATS[ext](self.col, pretty)
+                else:
+                    cdl_convert.write.OUTPUT_FORMATS[ext](self.col)
+
+                self.assertEqual(
+                    self.read(self.path('writer', ext)),
+                    self.read(self.outputs[ext])
+                )
+
+    #==========================================================================
+
+    def testSkipUnchanged(self):
+        """Tests unchanged files are skipped and changed ones replaced"""
+        cdl_convert.write_fanout(self.col, self.outputs)
+        self.held.sat = 0.75
+
+        written = cdl_convert.write_fanout(
+            self.col, self.outputs, skip_unchanged=True
+        )
+
+        self.assertEqual(
+            dict((ext, True) for ext in self.outputs),
+            written
+        )
+        self.assertEqual(
+            dict((ext, False) for ext in self.outputs),
+            cdl_convert.write_fanout(
+                self.col, self.outputs, skip_unchanged=True
+            )
+        )
+
+    #==========================================================================
+
+    def testType(self):
+        """Tests the collection's type is left as it was"""
+        cdl_convert.write_fanout(self.col, self.outputs)
+
+        self.assertEqual(
+            'ccc',
+            self.col.type
+        )
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    unittest.main()
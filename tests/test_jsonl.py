@@ -0,0 +1,455 @@
+#!/usr/bin/env python
+"""
+Tests the JSON Lines format of cdl_convert
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+# Standard Imports
+from decimal import Decimal
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Grab our test's path and append the cdL_convert root directory
+
+# There has to be a better method than:
+# 1) Getting our current directory
+# 2) Splitting into list
+# 3) Splicing out the last 3 entries (filepath, test dir, tools dir)
+# 4) Joining
+# 5) Appending to our Python path.
+
+sys.path.append('/'.join(os.path.realpath(__file__).split('/')[:-2]))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+if sys.version_info[0] >= 3:
+    enc = lambda x: bytes(x, 'UTF-8')
+else:
+    enc = lambda x: x
+
+JSONL_FULL = """{"type":"ColorCorrection","id":"sh010","slope":["1.1","1.00","0.0000000000000000113"],"offset":["-0.0125","0.0","0.0"],"power":["1.0","1.0","1.0"],"sop_desc":["Sop"],"sat":"0.8","sat_desc":["Sat"],"desc":["First","Caf\\u00e9"],"input_desc":"LogC","viewing_desc":"Rec709"}
+{"type":"ColorCorrection","id":"virgin"}
+{"type":"ColorDecision","cc":{"id":"held","sat":"0.5"},"media_ref":"/shots/sh020.####.dpx","desc":["Held"],"viewing_desc":"P3"}
+{"type":"ColorDecision","cc_ref":"sh010"}
+"""
+
+#==============================================================================
+# TEST CLASSES
+#==============================================================================
+
+# parse_jsonl =================================================================
+
+
+class TestParseJsonl(unittest.TestCase):
+    """Tests reading corrections and decisions from JSON Lines"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'grades.jsonl')
+        self.write(JSONL_FULL)
+
+    #==========================================================================
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def write(self, text):
+        """Writes text to the test file"""
+        with open(self.path, 'wb') as jsonl_f:
+            jsonl_f.write(enc(text))
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testBadLines(self):
+        """Tests bad lines raise ValueError naming the line"""
+        for text in [
+                '{"type":"ColorCorrection","id":"a"}\n{"type":',
+                '{"type":"ColorCorrection","id":"a"}\n[1, 2]',
+                '{"type":"ColorCorrection","id":"a"}\n{"type":"Ccc"}',
+                '{"type":"ColorCorrection","id":"a"}\n'
+                '{"type":"ColorCorrection"}',
+                '{"type":"ColorCorrection","id":"a"}\n'
+                '{"type":"ColorDecision"}']:
+            cdl_convert.reset_all()
+            self.write(text)
+
+            try:
+                cdl_convert.parse_jsonl(self.path)
+            except ValueError as err:
+                self.assertTrue(
+                    'line 2' in str(err)
+                )
+            else:
+                self.fail('No ValueError raised for: ' + text)
+
+    #==========================================================================
+
+    def testCollectionHeader(self):
+        """Tests a header gives the collection descriptions, and isn't yielded"""
+        self.write(
+            '{"type":"ColorCollection","desc":["Grades"],"input_desc":"LogC",'
+            '"viewing_desc":"Rec709"}\n' + JSONL_FULL +
+            '{"type":"ColorCollection","desc":["More grades"],'
+            '"viewing_desc":"P3"}\n'
+        )
+        col = cdl_convert.parse_jsonl(self.path)
+
+        self.assertEqual(
+            ['Grades', 'More grades'],
+            col.desc
+        )
+        self.assertEqual(
+            'LogC',
+            col.input_desc
+        )
+        self.assertEqual(
+            'P3',
+            col.viewing_desc
+        )
+
+        cdl_convert.reset_all()
+
+        self.assertEqual(
+            [
+                cdl_convert.ColorCorrection,
+                cdl_convert.ColorCorrection,
+                cdl_convert.ColorDecision,
+                cdl_convert.ColorDecision
+            ],
+            [type(node) for node in cdl_convert.iter_jsonl(self.path)]
+        )
+
+    #==========================================================================
+
+    def testCorrection(self):
+        """Tests every field of a correction is read"""
+        cc = cdl_convert.parse_jsonl(self.path).color_corrections[0]
+
+        self.assertEqual(
+            'sh010',
+            cc.id
+        )
+        self.assertEqual(
+            (Decimal('1.1'), Decimal('1.00'), Decimal('1.13E-17')),
+            cc.slope
+        )
+        self.assertEqual(
+            (Decimal('-0.0125'), Decimal('0.0'), Decimal('0.0')),
+            cc.offset
+        )
+        self.assertEqual(
+            Decimal('0.8'),
+            cc.sat
+        )
+        self.assertEqual(
+            ['First', u'Caf\xe9'],
+            cc.desc
+        )
+        self.assertEqual(
+            ['Sop'],
+            cc.sop_node.desc
+        )
+        self.assertEqual(
+            ['Sat'],
+            cc.sat_node.desc
+        )
+        self.assertEqual(
+            'LogC',
+            cc.input_desc
+        )
+        self.assertEqual(
+            'Rec709',
+            cc.viewing_desc
+        )
+        self.assertEqual(
+            self.path,
+            cc.file_in
+        )
+
+    #==========================================================================
+
+    def testDecisions(self):
+        """Tests decisions, media refs and references are read"""
+        col = cdl_convert.parse_jsonl(self.path)
+        held, ref = col.color_decisions
+
+        self.assertEqual(
+            'cdl',
+            col.type
+        )
+        self.assertEqual(
+            'held',
+            held.cc.id
+        )
+        self.assertTrue(
+            held.cc.parent is held
+        )
+        self.assertTrue(
+            held.parent is col
+        )
+        self.assertEqual(
+            '/shots/sh020.####.dpx',
+            held.media_ref.ref
+        )
+        self.assertEqual(
+            ['Held'],
+            held.desc
+        )
+        self.assertEqual(
+            'P3',
+            held.viewing_desc
+        )
+        self.assertTrue(
+            ref.cc.cc is col.color_corrections[0]
+        )
+
+    #==========================================================================
+
+    def testIter(self):
+        """Tests lines are yielded one object at a time"""
+        nodes = cdl_convert.iter_jsonl(self.path)
+        node = next(nodes)
+
+        self.assertEqual(
+            'sh010',
+            node.id
+        )
+        self.assertEqual(
+            ['sh010'],
+            list(cdl_convert.ColorCorrection.members.keys())
+        )
+        self.assertEqual(
+            [
+                cdl_convert.ColorCorrection,
+                cdl_convert.ColorDecision,
+                cdl_convert.ColorDecision
+            ],
+            [type(node) for node in nodes]
+        )
+
+    #==========================================================================
+
+    def testNumbersAndBlankLines(self):
+        """Tests JSON numbers, blank lines and no final newline are read"""
+        self.write(
+            '\n{"type":"ColorCorrection","id":"a","slope":[1.5,1,2],'
+            '"sat":0.25}\n\n{"type":"ColorCorrection","id":"b"}'
+        )
+        col = cdl_convert.parse_jsonl(self.path)
+
+        self.assertEqual(
+            'ccc',
+            col.type
+        )
+        self.assertEqual(
+            ['a', 'b'],
+            [cc.id for cc in col.color_corrections]
+        )
+        self.assertEqual(
+            (Decimal('1.5'), Decimal('1.0'), Decimal('2.0')),
+            col.color_corrections[0].slope
+        )
+        self.assertEqual(
+            Decimal('0.25'),
+            col.color_corrections[0].sat
+        )
+
+    #==========================================================================
+
+    def testParseFile(self):
+        """Tests parse_file reads jsonl by extension"""
+        col = cdl_convert.parse_file(self.path)
+
+        self.assertEqual(
+            ['sh010', 'virgin'],
+            [cc.id for cc in col.color_corrections]
+        )
+
+    #==========================================================================
+
+    def testVirginNodes(self):
+        """Tests nodes are only created for fields present"""
+        col = cdl_convert.parse_jsonl(self.path)
+        virgin = col.color_corrections[1]
+        held = col.color_decisions[0].cc
+
+        self.assertTrue(
+            virgin._sop_node is None
+        )
+        self.assertTrue(
+            virgin._sat_node is None
+        )
+        self.assertTrue(
+            held._sop_node is None
+        )
+
+# write_jsonl =================================================================
+
+
+class TestWriteJsonl(unittest.TestCase):
+    """Tests writing corrections and decisions as JSON Lines"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'grades.jsonl')
+        with open(self.path, 'wb') as jsonl_f:
+            jsonl_f.write(enc(JSONL_FULL))
+        self.col = cdl_convert.parse_jsonl(self.path)
+        os.remove(self.path)
+        self.col._file_out = self.path
+
+    #==========================================================================
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def read(self):
+        """Returns the bytes of the test file"""
+        with open(self.path, 'rb') as jsonl_f:
+            return jsonl_f.read()
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testAppend(self):
+        """Tests appending adds lines, ending an unterminated last line"""
+        cc = self.col.color_corrections[1]
+        cc._file_out = self.path
+
+        cdl_convert.write_jsonl(cc, append=True)
+        with open(self.path, 'ab') as jsonl_f:
+            jsonl_f.write(b'{"type":"ColorCorrection","id":"c"}')
+        cdl_convert.write_jsonl(cc, append=True)
+
+        self.assertEqual(
+            b'{"type":"ColorCorrection","id":"virgin"}\n'
+            b'{"type":"ColorCorrection","id":"c"}\n'
+            b'{"type":"ColorCorrection","id":"virgin"}\n',
+            self.read()
+        )
+
+    #==========================================================================
+
+    def testCollectionHeader(self):
+        """Tests collection descriptions are written first and read back"""
+        self.col.desc = ['Grades', 'Second']
+        self.col.input_desc = 'LogC'
+        self.col.viewing_desc = 'Rec709'
+
+        cdl_convert.write_jsonl(self.col)
+
+        self.assertEqual(
+            b'{"type":"ColorCollection","desc":["Grades","Second"],'
+            b'"input_desc":"LogC","viewing_desc":"Rec709"}\n' +
+            enc(JSONL_FULL),
+            self.read()
+        )
+
+        cdl_convert.reset_all()
+        col = cdl_convert.parse_jsonl(self.path)
+
+        self.assertEqual(
+            (['Grades', 'Second'], 'LogC', 'Rec709'),
+            (col.desc, col.input_desc, col.viewing_desc)
+        )
+
+    #==========================================================================
+
+    def testDecision(self):
+        """Tests a lone decision, which has no file_out, raises TypeError"""
+        self.assertRaises(
+            TypeError,
+            cdl_convert.write_jsonl,
+            self.col.color_decisions[0]
+        )
+
+    #==========================================================================
+
+    def testDumpMatchesWrite(self):
+        """Tests single file and archive writers get the same bytes"""
+        cdl_convert.write_jsonl(self.col)
+
+        self.assertEqual(
+            self.read(),
+            cdl_convert.write._DUMP_FORMATS['jsonl'](self.col)
+        )
+
+    #==========================================================================
+
+    def testPrecision(self):
+        """Tests values are rounded by NUMBER_PRECISION"""
+        cc = self.col.color_corrections[0]
+        cc._file_out = self.path
+        cdl_convert.config.NUMBER_PRECISION = 2
+        try:
+            cdl_convert.write_jsonl(cc)
+        finally:
+            cdl_convert.config.NUMBER_PRECISION = None
+
+        self.assertEqual(
+            ['1.10', '1.00', '0.00'],
+            json.loads(self.read().decode('UTF-8'))['slope']
+        )
+
+    #==========================================================================
+
+    def testRoundTrip(self):
+        """Tests the written file matches the file read, byte for byte"""
+        self.assertTrue(
+            cdl_convert.write_jsonl(self.col)
+        )
+
+        self.assertEqual(
+            enc(JSONL_FULL),
+            self.read()
+        )
+
+    #==========================================================================
+
+    def testSkipUnchanged(self):
+        """Tests an unchanged file is skipped"""
+        cdl_convert.write_jsonl(self.col)
+
+        self.assertFalse(
+            cdl_convert.write_jsonl(self.col, skip_unchanged=True)
+        )
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,546 @@
+#!/usr/bin/env python
+"""
+Tests baking corrections into lookup table files
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+# Standard Imports
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Grab our test's path and append the cdL_convert root directory
+
+# There has to be a better method than:
+# 1) Getting our current directory
+# 2) Splitting into list
+# 3) Splicing out the last 3 entries (filepath, test dir, tools dir)
+# 4) Joining
+# 5) Appending to our Python path.
+
+sys.path.append('/'.join(os.path.realpath(__file__).split('/')[:-2]))
+
+import cdl_convert
+from cdl_convert import lut
+
+#==============================================================================
+# TEST CLASSES
+#==============================================================================
+
+# bake_cube() =================================================================
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestBakeCube(unittest.TestCase):
+    """Tests 3D .cube luts hold the correction at every lattice point"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        lut._CUBE_CACHE.clear()
+        self.cdl = cdl_convert.ColorCorrection('sh010')
+        self.cdl.slope = [1.2, 0.9, 1.05]
+        self.cdl.offset = [-0.02, 0.01, 0.03]
+        self.cdl.power = [0.9, 1.1, 1.25]
+        self.cdl.sat = 0.8
+
+    #==========================================================================
+
+    def tearDown(self):
+        lut._CUBE_CACHE.clear()
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def parse(self, cube):
+        """Returns the header lines and rows of values of a .cube lut"""
+        lines = cube.decode('UTF-8').split('\n')
+        self.assertEqual('', lines.pop())
+        header = lines[:3]
+        rows = numpy.array([[float(i) for i in line.split()]
+                            for line in lines[3:]])
+        return header, rows
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testBadSize(self):
+        """Tests sizes the .cube format can't hold raise"""
+        for size in [1, 257]:
+            self.assertRaises(
+                ValueError,
+                cdl_convert.bake_cube,
+                self.cdl,
+                size
+            )
+
+    #==========================================================================
+
+    def testCache(self):
+        """Tests identical grades are only baked once"""
+        other = cdl_convert.ColorCorrection('sh020')
+        other.slope = self.cdl.slope
+        other.offset = self.cdl.offset
+        other.power = self.cdl.power
+        other.sat = self.cdl.sat
+
+        with mock.patch('cdl_convert.lut._bake_rows',
+                        wraps=lut._bake_rows) as bake:
+            first = cdl_convert.bake_cube(self.cdl, 5)
+            second = cdl_convert.bake_cube(other, 5)
+            cdl_convert.bake_cube(other, 9)
+
+        self.assertEqual(
+            2,
+            bake.call_count
+        )
+        self.assertEqual(
+            first.replace(b'sh010', b'sh020'),
+            second
+        )
+
+    #==========================================================================
+
+    def testCacheChanged(self):
+        """Tests changing a correction's values bakes it again"""
+        before = cdl_convert.bake_cube(self.cdl, 5)
+
+        self.cdl.sat = 0.5
+
+        self.assertNotEqual(
+            before,
+            cdl_convert.bake_cube(self.cdl, 5)
+        )
+
+    #==========================================================================
+
+    def testCacheSize(self):
+        """Tests the least recently baked cubes are dropped first"""
+        with mock.patch('cdl_convert.lut.CUBE_CACHE_SIZE', 2):
+            for size in [3, 4, 5, 3]:
+                cdl_convert.bake_cube(self.cdl, size)
+
+        self.assertEqual(
+            [5, 3],
+            [size for _, size in lut._CUBE_CACHE]
+        )
+
+    #==========================================================================
+
+    def testDefaultSize(self):
+        """Tests cubes are CUBE_SIZE points along each side by default"""
+        with mock.patch('cdl_convert.lut.CUBE_SIZE', 4):
+            header, rows = self.parse(cdl_convert.bake_cube(self.cdl))
+
+        self.assertEqual(
+            'LUT_3D_SIZE 4',
+            header[1]
+        )
+        self.assertEqual(
+            (64, 3),
+            rows.shape
+        )
+
+    #==========================================================================
+
+    def testHeader(self):
+        """Tests the correction's id is written as the title"""
+        header, _ = self.parse(cdl_convert.bake_cube(self.cdl, 3))
+
+        self.assertEqual(
+            ['TITLE "sh010"', 'LUT_3D_SIZE 3', ''],
+            header
+        )
+
+    #==========================================================================
+
+    def testIdentity(self):
+        """Tests an identity cube holds the lattice, red changing fastest"""
+        _, rows = self.parse(
+            cdl_convert.bake_cube(cdl_convert.ColorCorrection('bare'), 3)
+        )
+
+        steps = [0.0, 0.5, 1.0]
+        self.assertEqual(
+            [[r, g, b] for b in steps for g in steps for r in steps],
+            rows.tolist()
+        )
+
+    #==========================================================================
+
+    def testValues(self):
+        """Tests every row is the correction applied to its lattice point"""
+        _, rows = self.parse(cdl_convert.bake_cube(self.cdl, 17))
+
+        steps = numpy.linspace(0.0, 1.0, 17)
+        lattice = numpy.array(
+            [[r, g, b] for b in steps for g in steps for r in steps]
+        )
+        numpy.testing.assert_allclose(
+            cdl_convert.apply_cdl(lattice, self.cdl),
+            rows,
+            atol=5e-7
+        )
+
+    #==========================================================================
+
+    def testWriteCube(self):
+        """Tests the file written holds the baked cube"""
+        directory = tempfile.mkdtemp()
+        try:
+            self.cdl.determine_dest('cube', directory)
+
+            self.assertTrue(cdl_convert.write_cube(self.cdl, 5))
+
+            with open(self.cdl.file_out, 'rb') as cube_f:
+                self.assertEqual(
+                    cdl_convert.bake_cube(self.cdl, 5),
+                    cube_f.read()
+                )
+        finally:
+            shutil.rmtree(directory)
+
+# bake_lut_1d() ===============================================================
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestBakeLut1d(unittest.TestCase):
+    """Tests 1D luts hold the curves of corrections without saturation"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.cdl = cdl_convert.ColorCorrection('sh010')
+        self.cdl.slope = [1.2, 0.9, 1.05]
+        self.cdl.offset = [-0.02, 0.01, 0.03]
+        self.cdl.power = [0.9, 1.1, 1.25]
+
+    #==========================================================================
+
+    def tearDown(self):
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def rows(self, lines):
+        """Returns the values of lines of rgb values"""
+        return numpy.array([[float(i) for i in line.split()]
+                            for line in lines])
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testBadArgs(self):
+        """Tests unknown formats and sizes out of range raise"""
+        self.assertRaises(
+            ValueError,
+            cdl_convert.bake_lut_1d,
+            self.cdl,
+            ext='csp'
+        )
+        for size in [1, 65537]:
+            self.assertRaises(
+                ValueError,
+                cdl_convert.bake_lut_1d,
+                self.cdl,
+                size
+            )
+
+    #==========================================================================
+
+    def testCube(self):
+        """Tests a 1D cube's header and curves"""
+        lines = cdl_convert.bake_lut_1d(self.cdl, 5, 'cube').decode(
+            'UTF-8'
+        ).split('\n')
+
+        self.assertEqual(
+            ['TITLE "sh010"', 'LUT_1D_SIZE 5', ''],
+            lines[:3]
+        )
+        self.assertEqual(
+            '',
+            lines[-1]
+        )
+        steps = numpy.repeat(numpy.linspace(0.0, 1.0, 5)[:, None], 3, 1)
+        numpy.testing.assert_allclose(
+            cdl_convert.apply_cdl(steps, self.cdl),
+            self.rows(lines[3:-1]),
+            atol=5e-7
+        )
+
+    #==========================================================================
+
+    def testDefaultSize(self):
+        """Tests luts have LUT_1D_SIZE entries by default"""
+        with mock.patch('cdl_convert.lut.LUT_1D_SIZE', 7):
+            lines = cdl_convert.bake_lut_1d(self.cdl).decode(
+                'UTF-8'
+            ).split('\n')
+
+        self.assertEqual(
+            'Length 7',
+            lines[2]
+        )
+        self.assertEqual(
+            7,
+            len(lines) - 7
+        )
+
+    #==========================================================================
+
+    def testSat(self):
+        """Tests only corrections which change saturation are refused"""
+        self.cdl.sat = 1.0
+        cdl_convert.bake_lut_1d(self.cdl, 3)
+
+        self.cdl.sat = 0.9
+
+        self.assertRaises(
+            ValueError,
+            cdl_convert.bake_lut_1d,
+            self.cdl,
+            3
+        )
+
+    #==========================================================================
+
+    def testSpi1d(self):
+        """Tests an spi1d's header and curves"""
+        lines = cdl_convert.bake_lut_1d(self.cdl, 5).decode(
+            'UTF-8'
+        ).split('\n')
+
+        self.assertEqual(
+            ['Version 1', 'From 0.0 1.0', 'Length 5', 'Components 3', '{'],
+            lines[:5]
+        )
+        self.assertEqual(
+            ['}', ''],
+            lines[-2:]
+        )
+        steps = numpy.repeat(numpy.linspace(0.0, 1.0, 5)[:, None], 3, 1)
+        numpy.testing.assert_allclose(
+            cdl_convert.apply_cdl(steps, self.cdl),
+            self.rows(lines[5:-2]),
+            atol=5e-7
+        )
+        self.assertFalse(self.cdl.has_sat)
+
+    #==========================================================================
+
+    def testWriteLut1d(self):
+        """Tests the file written holds the baked lut"""
+        directory = tempfile.mkdtemp()
+        try:
+            self.cdl.determine_dest('spi1d', directory)
+
+            self.assertTrue(cdl_convert.write_lut_1d(self.cdl, 5))
+
+            with open(self.cdl.file_out, 'rb') as lut_f:
+                self.assertEqual(
+                    cdl_convert.bake_lut_1d(self.cdl, 5),
+                    lut_f.read()
+                )
+        finally:
+            shutil.rmtree(directory)
+
+# write_cubes() ===============================================================
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestWriteCubes(unittest.TestCase):
+    """Tests a collection's corrections are baked to a cube file each"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        lut._CUBE_CACHE.clear()
+        self.directory = tempfile.mkdtemp()
+
+        self.col = cdl_convert.ColorCollection()
+        self.first = cdl_convert.ColorCorrection('sh010')
+        self.first.slope = [1.1, 1.0, 0.9]
+        self.same = cdl_convert.ColorCorrection('sh020')
+        self.same.slope = [1.1, 1.0, 0.9]
+        self.held = cdl_convert.ColorCorrection('sh030')
+        self.held.sat = 0.5
+        self.col.append_children([self.first, self.same])
+        self.col.append_child(cdl_convert.ColorDecision(self.held))
+        self.col.append_child(
+            cdl_convert.ColorDecision(cdl_convert.ColorCorrectionRef('sh010'))
+        )
+
+    #==========================================================================
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        lut._CUBE_CACHE.clear()
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # UTILITIES
+    #==========================================================================
+
+    def assertBaked(self, cdls, size):
+        """Asserts each correction's file holds its baked cube"""
+        for cdl in cdls:
+            with open(cdl.file_out, 'rb') as cube_f:
+                self.assertEqual(
+                    cdl_convert.bake_cube(cdl, size),
+                    cube_f.read()
+                )
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testBadJobs(self):
+        """Tests fewer than one job raises"""
+        self.assertRaises(
+            ValueError,
+            cdl_convert.write_cubes,
+            self.col,
+            self.directory,
+            jobs=0
+        )
+
+    #==========================================================================
+
+    def testCollection(self):
+        """Tests every correction of a collection is baked once per grade"""
+        with mock.patch('cdl_convert.lut._bake_rows',
+                        wraps=lut._bake_rows) as bake:
+            self.assertEqual(
+                ([], []),
+                cdl_convert.write_cubes(
+                    self.col, self.directory, size=5, jobs=1
+                )
+            )
+
+        self.assertEqual(
+            2,
+            bake.call_count
+        )
+        self.assertEqual(
+            ['sh010.cube', 'sh020.cube', 'sh030.cube'],
+            sorted(os.listdir(self.directory))
+        )
+        self.assertBaked([self.first, self.same, self.held], 5)
+
+    #==========================================================================
+
+    def testFailures(self):
+        """Tests files which can't be written are returned with the error"""
+        self.first.determine_dest('cube', self.directory)
+        self.same._file_out = os.path.join(self.directory, 'missing', 'x')
+
+        skipped, failures = cdl_convert.write_cubes(
+            [self.first, self.same], size=3, jobs=1
+        )
+
+        self.assertEqual(
+            [],
+            skipped
+        )
+        self.assertEqual(
+            [self.same],
+            [cdl for cdl, _ in failures]
+        )
+        self.assertBaked([self.first], 3)
+
+    #==========================================================================
+
+    def testLut1d(self):
+        """Tests corrections without saturation can be written as 1D luts"""
+        for ext in cdl_convert.lut.LUT_1D_FORMATS:
+            with mock.patch('cdl_convert.lut._bake_rows',
+                            wraps=lut._bake_rows) as bake:
+                cdl_convert.write_cubes(
+                    self.col, self.directory, size=3, jobs=1, ext_1d=ext,
+                    size_1d=5
+                )
+
+            self.assertEqual(
+                1,
+                bake.call_count
+            )
+            for cdl in [self.first, self.same]:
+                self.assertEqual(
+                    os.path.join(self.directory, cdl.id + '.' + ext),
+                    cdl.file_out
+                )
+                with open(cdl.file_out, 'rb') as lut_f:
+                    self.assertEqual(
+                        cdl_convert.bake_lut_1d(cdl, 5, ext),
+                        lut_f.read()
+                    )
+            self.assertBaked([self.held], 3)
+
+        self.assertRaises(
+            ValueError,
+            cdl_convert.write_cubes,
+            self.col,
+            self.directory,
+            ext_1d='csp'
+        )
+
+    #==========================================================================
+
+    def testPool(self):
+        """Tests baking in processes writes the same files"""
+        cdl_convert.write_cubes(self.col, self.directory, size=5, jobs=2)
+
+        self.assertBaked([self.first, self.same, self.held], 5)
+
+    #==========================================================================
+
+    def testSkipUnchanged(self):
+        """Tests unchanged files are skipped and returned"""
+        cdl_convert.write_cubes(self.col, self.directory, size=3, jobs=1)
+        self.held.sat = 0.75
+
+        skipped, _ = cdl_convert.write_cubes(
+            self.col, self.directory, size=3, jobs=1, skip_unchanged=True
+        )
+
+        self.assertEqual(
+            [self.first, self.same],
+            skipped
+        )
+        self.assertBaked([self.held], 3)
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    unittest.main()
@@ -280,7 +280,7 @@ def buildCDL(slope, offset, power, sat):
     values.extend(offset)
     values.extend(power)
     values.append(sat)
-    values = [str(i) for i in values]
+    values = [cdl_convert.format_number(i, exact=True) for i in values]
 
     ss_cdl = ' '.join(values)
 
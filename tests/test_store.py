@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+"""
+Tests the SQLite collection store of cdl_convert
+"""
+
+#==============================================================================
+# IMPORTS
+#==============================================================================
+
+# Standard Imports
+import datetime
+from decimal import Decimal
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Grab our test's path and append the cdL_convert root directory
+
+# There has to be a better method than:
+# 1) Getting our current directory
+# 2) Splitting into list
+# 3) Splicing out the last 3 entries (filepath, test dir, tools dir)
+# 4) Joining
+# 5) Appending to our Python path.
+
+sys.path.append('/'.join(os.path.realpath(__file__).split('/')[:-2]))
+
+import cdl_convert
+
+#==============================================================================
+# GLOBALS
+#==============================================================================
+
+
+class FixedOffset(datetime.tzinfo):
+    """A timezone a fixed number of hours ahead of UTC"""
+
+    def __init__(self, hours):
+        super(FixedOffset, self).__init__()
+        self.offset = datetime.timedelta(hours=hours)
+
+    def utcoffset(self, dt):
+        return self.offset
+
+    def dst(self, dt):
+        return datetime.timedelta(0)
+
+#==============================================================================
+# TEST CLASSES
+#==============================================================================
+
+# CollectionStore =============================================================
+
+
+class TestCollectionStore(unittest.TestCase):
+    """Tests ingesting, querying and exporting corrections"""
+
+    #==========================================================================
+    # SETUP & TEARDOWN
+    #==========================================================================
+
+    def setUp(self):
+        cdl_convert.reset_all()
+        self.directory = tempfile.mkdtemp()
+        self.store = cdl_convert.CollectionStore(
+            os.path.join(self.directory, 'grades.db')
+        )
+
+        self.col = cdl_convert.ColorCollection()
+        self.exotic = cdl_convert.ColorCorrection('exotic')
+        self.exotic.desc = 'Exotic'
+        self.exotic.slope = ['1.00', '1.13E-17', '1.2']
+        self.exotic.power = ['1', '1', Decimal('1E+20')]
+        self.exotic.sat = 0.5
+        self.virgin = cdl_convert.ColorCorrection('virgin')
+        self.held = cdl_convert.ColorCorrection('held')
+        self.held.sat = 1.4
+        self.col.append_children([self.exotic, self.virgin])
+        self.col.append_child(
+            cdl_convert.ColorDecision(
+                self.held, cdl_convert.MediaRef('/shots/sh010.####.dpx')
+            )
+        )
+        self.col.append_child(
+            cdl_convert.ColorDecision(cdl_convert.ColorCorrectionRef('exotic'))
+        )
+
+        self.store.ingest(
+            self.col, reel='A001', date=datetime.datetime(2020, 1, 1)
+        )
+        self.store.ingest(
+            self.virgin, reel='B002', date=datetime.datetime(2021, 1, 1)
+        )
+
+    #==========================================================================
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+        cdl_convert.reset_all()
+
+    #==========================================================================
+    # TESTS
+    #==========================================================================
+
+    def testBadFilter(self):
+        """Tests unknown filters raise ValueError"""
+        self.assertRaises(
+            ValueError,
+            self.store.count,
+            hue=(0, 1)
+        )
+
+    #==========================================================================
+
+    def testCollection(self):
+        """Tests a query's collection writes the XML ingested"""
+        self.col.set_to_cdl()
+        xml = self.col.xml_root
+        cdl_convert.reset_all()
+
+        col = self.store.collection(reel='A001')
+
+        self.assertEqual(
+            'cdl',
+            col.type
+        )
+        self.assertEqual(
+            xml,
+            col.xml_root
+        )
+        self.assertEqual(
+            'ccc',
+            self.store.collection(reel='B002').type
+        )
+
+    #==========================================================================
+
+    def testCount(self):
+        """Tests ingest and count report the rows"""
+        self.assertEqual(
+            1,
+            self.store.ingest(self.virgin)
+        )
+        self.assertEqual(
+            6,
+            len(self.store)
+        )
+
+    #==========================================================================
+
+    def testDates(self):
+        """Tests rows are filtered by the date they were added"""
+        self.assertEqual(
+            4,
+            self.store.count(until=datetime.datetime(2020, 6, 1))
+        )
+        self.assertEqual(
+            1,
+            self.store.count(since=datetime.datetime(2020, 6, 1))
+        )
+
+    #==========================================================================
+
+    def testDatesAware(self):
+        """Tests datetimes with a timezone are converted from it"""
+        # 2022-01-01 00:00 UTC
+        self.store.ingest(
+            self.exotic, reel='C003',
+            date=datetime.datetime(2022, 1, 1, 2, tzinfo=FixedOffset(2))
+        )
+
+        self.assertEqual(
+            1640995200.5,
+            cdl_convert.store._timestamp(
+                datetime.datetime(
+                    2021, 12, 31, 19, 0, 0, 500000, tzinfo=FixedOffset(-5)
+                )
+            )
+        )
+        self.assertEqual(
+            1,
+            self.store.count(reel='C003', since=1640995200.0)
+        )
+        self.assertEqual(
+            0,
+            self.store.count(reel='C003', since=1640995200.5)
+        )
+
+    #==========================================================================
+
+    def testExport(self):
+        """Tests a query is written with the writer of its extension"""
+        path = os.path.join(self.directory, 'warm.ccc')
+        cdl_convert.reset_all()
+
+        self.store.export(path, sat=(1.2, None))
+        cdl_convert.reset_all()
+
+        self.assertEqual(
+            ['held'],
+            [cc.id for cc in cdl_convert.parse_ccc(path).all_children]
+        )
+        self.assertRaises(
+            ValueError,
+            self.store.export,
+            os.path.join(self.directory, 'warm.cc')
+        )
+
+    #==========================================================================
+
+    def testExportKeepsIds(self):
+        """Tests stored ids are kept while the ingested corrections live"""
+        path = os.path.join(self.directory, 'kept.ccc')
+        cdl_convert.config.HALT_ON_ERROR = True
+        try:
+            first = self.store.collection(cc_id=['exotic', 'held'])
+            self.store.export(path, cc_id=['exotic', 'held'])
+        finally:
+            cdl_convert.config.HALT_ON_ERROR = False
+
+        self.assertEqual(
+            ['exotic', 'held', 'exotic'],
+            [cc.id for cc in first.color_corrections] +
+            [cd.cc.id for cd in first.color_decisions]
+        )
+        with open(path, 'rb') as ccc_f:
+            ccc = ccc_f.read()
+        self.assertTrue(
+            b'<ColorCorrection id="exotic">' in ccc and
+            b'<ColorCorrection id="held">' in ccc
+        )
+        self.assertFalse(
+            b'exotic001' in ccc or b'held001' in ccc
+        )
+        # The ingested corrections keep their registration, even once a
+        # result is given another id
+        first.color_corrections[0].id = 'renamed'
+        self.assertTrue(
+            cdl_convert.ColorCorrection.members['exotic'] is self.exotic
+        )
+
+    #==========================================================================
+
+    def testIds(self):
+        """Tests lookups by one or many ids, including references"""
+        self.assertEqual(
+            2,
+            self.store.count(cc_id='virgin')
+        )
+        self.assertEqual(
+            3,
+            self.store.count(cc_id=['exotic', 'held'])
+        )
+
+    #==========================================================================
+
+    def testMediaRef(self):
+        """Tests lookups by media ref"""
+        cdl_convert.reset_all()
+        decisions = list(
+            self.store.select(media_ref='/shots/sh010.####.dpx')
+        )
+
+        self.assertEqual(
+            ['held'],
+            [decision.cc.id for decision in decisions]
+        )
+        self.assertEqual(
+            '/shots/sh010.####.dpx',
+            decisions[0].media_ref.ref
+        )
+
+    #==========================================================================
+
+    def testRanges(self):
+        """Tests value ranges, with defaults for missing nodes"""
+        self.assertEqual(
+            1,
+            self.store.count(sat=(None, 0.9))
+        )
+        self.assertEqual(
+            2,
+            self.store.count(sat=(0.9, 1.0))
+        )
+        self.assertEqual(
+            1,
+            self.store.count(slope_b=(1.1, 1.3), reel='A001')
+        )
+
+    #==========================================================================
+
+    def testReopen(self):
+        """Tests rows are kept and values exact after reopening"""
+        self.store.close()
+        cdl_convert.reset_all()
+        self.store = cdl_convert.CollectionStore(self.store.path)
+
+        exotic = list(self.store.select(cc_id='exotic'))[0]
+
+        self.assertEqual(
+            (Decimal('1.00'), Decimal('1.13E-17'), Decimal('1.2')),
+            exotic.slope
+        )
+        self.assertEqual(
+            Decimal('1E+20'),
+            exotic.power[2]
+        )
+        self.assertEqual(
+            ['Exotic'],
+            exotic.desc
+        )
+
+    #==========================================================================
+
+    def testSelectPrecision(self):
+        """Tests stored values ignore NUMBER_PRECISION"""
+        cdl_convert.config.NUMBER_PRECISION = 1
+        try:
+            self.store.ingest(self.exotic, reel='C003')
+        finally:
+            cdl_convert.config.NUMBER_PRECISION = None
+        cdl_convert.reset_all()
+
+        exotic = list(self.store.select(reel='C003'))[0]
+
+        self.assertEqual(
+            Decimal('1.13E-17'),
+            exotic.slope[1]
+        )
+
+#==============================================================================
+# RUNNER
+#==============================================================================
+if __name__ == '__main__':
+    unittest.main()